@@ -0,0 +1,64 @@
+"""
+Benchmark for the network analysis centrality metrics
+
+Times networkx's betweenness centrality against the sparse engine in modules.centrality,
+exact and sampled, on the relationship graph of a synthetic roadmap. It also reports how
+far the sampled values fall from the exact ones, next to the error bound the page shows.
+
+Usage:
+    python benchmarks/centrality_benchmark.py --products 2000 --pivots 100 500
+"""
+
+import os
+import sys
+import time
+import argparse
+
+import networkx as nx
+
+# Add the repository root to the path so Python can find the modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_roadmap import make_synthetic_roadmap
+from modules.roadmap_store import RoadmapStore
+from modules.centrality import (
+    betweenness_centrality, eigenvector_centrality, exact_eigenvector_centrality, power_iteration_applies,
+)
+
+def timed(func, *args, **kwargs):
+    """Return (seconds, result) of one call"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the centrality metrics")
+    parser.add_argument('--products', type=int, default=2000, help="number of products in the synthetic roadmap")
+    parser.add_argument('--pivots', type=int, nargs='+', default=[100, 500], help="pivot counts for sampled betweenness")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for the synthetic dataset")
+    args = parser.parse_args()
+
+    G = RoadmapStore(make_synthetic_roadmap(args.products, seed=args.seed)).graph('pursuit_type')
+    print(f"Relationship graph with {G.number_of_nodes()} nodes and {G.number_of_edges()} edges")
+
+    elapsed, reference = timed(nx.betweenness_centrality, G)
+    print(f"networkx exact          {elapsed:7.2f}s")
+    elapsed, (exact, _) = timed(betweenness_centrality, G)
+    worst = max(abs(exact[node] - reference[node]) for node in G)
+    print(f"sparse exact            {elapsed:7.2f}s  max difference {worst:.1e}")
+
+    for pivots in args.pivots:
+        elapsed, (sampled, bound) = timed(betweenness_centrality, G, pivots=pivots)
+        worst = max(abs(sampled[node] - reference[node]) for node in G)
+        print(f"{'sparse k=' + str(pivots):23s} {elapsed:7.2f}s  max error {worst:.4f} (bound {bound:.4f})")
+
+    if power_iteration_applies(G):
+        elapsed, (_, iterations, residual, converged) = timed(eigenvector_centrality, G)
+        state = "converged" if converged else "not converged"
+        print(f"eigenvector power iter  {elapsed:7.2f}s  {iterations} iterations, {state} (residual {residual:.1e})")
+    else:
+        elapsed, _ = timed(exact_eigenvector_centrality, G)
+        print(f"eigenvector exact       {elapsed:7.2f}s  (not strongly connected, power iteration skipped)")
+
+if __name__ == "__main__":
+    main()
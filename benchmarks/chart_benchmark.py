@@ -0,0 +1,74 @@
+"""
+Benchmark for the static relationship charts
+
+Renders the relationship pages and PNG charts of a synthetic roadmap with each DPI
+profile, sequentially and on a worker pool, and reports the time taken and the size
+of the PNG files written. A final cold and warm run measures the chart cache.
+
+Usage:
+    python benchmarks/chart_benchmark.py --products 200 --jobs 4
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+
+# Add the repository root to the path so Python can find the modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_roadmap import make_synthetic_roadmap
+from modules.roadmap_store import RoadmapStore
+from modules.build_pipeline import Stage, run_stages
+from modules.chart_renderer import DPI_PROFILES, set_dpi_profile
+from modules.chart_cache import configure_chart_cache, chart_cache
+from modules.relationship_viz import relationship_visualization_tasks
+
+def png_bytes(directory):
+    """Return the total size of the PNG files under directory"""
+    total = 0
+    for root, _, files in os.walk(directory):
+        total += sum(os.path.getsize(os.path.join(root, f)) for f in files if f.endswith('.png'))
+    return total
+
+def time_relationships(data, profile, jobs):
+    """Render the relationship visualizations once; return (seconds, PNG bytes)"""
+    set_dpi_profile(profile)
+    with tempfile.TemporaryDirectory() as output_dir, open(os.devnull, 'w') as devnull:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(devnull):
+            run_stages([Stage("relationships", relationship_visualization_tasks(data, output_dir))], data, jobs=jobs)
+        elapsed = time.perf_counter() - start
+        return elapsed, png_bytes(output_dir)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the static relationship charts")
+    parser.add_argument('--products', type=int, default=200, help="number of products in the synthetic roadmap")
+    parser.add_argument('--jobs', type=int, default=4, help="worker processes for the pooled runs")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for the synthetic dataset")
+    args = parser.parse_args()
+
+    data = RoadmapStore(make_synthetic_roadmap(args.products, seed=args.seed))
+    print(f"Synthetic roadmap with {args.products} products")
+
+    configure_chart_cache(None)
+    for profile in [None] + sorted(DPI_PROFILES):
+        for jobs in (1, args.jobs):
+            elapsed, size = time_relationships(data, profile, jobs)
+            print(f"{profile or 'default':8s} jobs={jobs:<3d} {elapsed:7.2f}s  {size / 1e6:6.2f} MB of PNG")
+    
+    # The second run finds every chart in the cache filled by the first
+    with tempfile.TemporaryDirectory() as cache_dir:
+        configure_chart_cache(cache_dir)
+        cache = chart_cache()
+        for run in ("cold", "warm"):
+            hits, misses = cache.hits, cache.misses
+            elapsed, _ = time_relationships(data, None, 1)
+            print(f"cache {run:4s} jobs=1   {elapsed:7.2f}s  {cache.hits - hits} hits, {cache.misses - misses} misses")
+        configure_chart_cache(None)
+    set_dpi_profile(None)
+
+if __name__ == "__main__":
+    main()
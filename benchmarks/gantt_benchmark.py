@@ -0,0 +1,100 @@
+"""
+Benchmark for the product page Gantt chart
+
+Builds a product with a large roadmap (2,000 tasks by default) and times the
+product detail page, reporting the page size and the number of Bokeh renderers
+and data sources it holds. For comparison it also builds the same Gantt chart
+with one data source, bar and label per task, as the pages did before the
+glyphs were batched. Browser-side document build time follows the number of
+models BokehJS has to instantiate, which is reported for both.
+
+Usage:
+    python benchmarks/gantt_benchmark.py --tasks 2000
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+# Add the repository root to the path so Python can find the modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bokeh.embed import components
+from bokeh.models import ColumnDataSource, HoverTool
+from bokeh.plotting import figure
+
+from benchmarks.synthetic_roadmap import make_synthetic_roadmap, LANES, STATUSES, FUNDING_TYPES, _random_span
+from modules.roadmap_store import RoadmapStore
+from modules.date_parsing import parse_date
+
+def make_large_product_roadmap(n_tasks, seed=0):
+    """Return a synthetic roadmap whose first product has n_tasks roadmap tasks"""
+    rng = random.Random(seed)
+    data = make_synthetic_roadmap(10, seed=seed)
+    roadmap = []
+    for t in range(n_tasks):
+        start, end = _random_span(rng)
+        roadmap.append({
+            'task': f"Task {t}",
+            'start': start,
+            'end': end,
+            'status': rng.choice(STATUSES),
+            'lane': rng.choice(LANES),
+            'fundingType': rng.choice(FUNDING_TYPES),
+        })
+    data['products'][0]['roadmap'] = roadmap
+    return data
+
+def per_task_gantt(tasks):
+    """Build the Gantt chart with one data source, bar and label per task (the old layout)"""
+    p = figure(x_axis_type="datetime", width=1200, height=600)
+    for y_pos, task in enumerate(tasks):
+        start_date = parse_date(task['start'])
+        end_date = parse_date(task['end'])
+        source = ColumnDataSource(data=dict(start=[start_date], end=[end_date], y=[-y_pos],
+                                            task=[task['task']], status=[task['status']]))
+        bar = p.hbar(y='y', left='start', right='end', height=0.8, source=source)
+        p.add_tools(HoverTool(renderers=[bar], tooltips=[("Task", "@task"), ("Status", "@status")]))
+        p.text(x=end_date, y=-y_pos, text=[task['task']], text_font_size="9pt", x_offset=5)
+    return p
+
+def count_models(text):
+    """Return (renderers, data sources) serialized in a Bokeh document"""
+    return text.count('"name":"GlyphRenderer"'), text.count('"name":"ColumnDataSource"')
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the batched product Gantt chart")
+    parser.add_argument('--tasks', type=int, default=2000, help="number of roadmap tasks on the product")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for the synthetic dataset")
+    args = parser.parse_args()
+
+    from modules.product_detail import generate_product_detail_page
+    from main import STATUS_COLORS
+
+    data = RoadmapStore(make_large_product_roadmap(args.tasks, seed=args.seed))
+    product = data['products'][0]
+    print(f"Product {product['id']} with {len(product['roadmap'])} roadmap tasks")
+
+    with tempfile.TemporaryDirectory() as product_dir:
+        start = time.perf_counter()
+        generate_product_detail_page(product, data, product_dir, STATUS_COLORS)
+        batched_time = time.perf_counter() - start
+        page_path = os.path.join(product_dir, f"product_{product['id']}.html")
+        with open(page_path, encoding='utf-8') as f:
+            page = f.read()
+    renderers, sources = count_models(page)
+    print(f"Batched page:   {batched_time:7.2f}s  {len(page) / 1e6:6.2f} MB  "
+          f"{renderers} renderers, {sources} data sources")
+
+    start = time.perf_counter()
+    script, div = components(per_task_gantt(product['roadmap']))
+    per_task_time = time.perf_counter() - start
+    renderers, sources = count_models(script)
+    print(f"Per-task chart: {per_task_time:7.2f}s  {len(script) / 1e6:6.2f} MB  "
+          f"{renderers} renderers, {sources} data sources (chart only)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark for the templated HTML pages
+
+Builds a synthetic roadmap whose first product and first funding opportunity carry
+hundreds of table rows (program combinations, M&P lane tasks, funded supplier tasks) and
+generates their pages plus the dashboard. For each page it reports the total time,
+the template render-and-write time (the page's 'save' span from build_profile) and
+the page size, with the bytes taken by the shared stylesheet the page links to.
+
+Usage:
+    python benchmarks/html_render_benchmark.py --rows 500
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+# Add the repository root to the path so Python can find the modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_roadmap import make_synthetic_roadmap, STATUSES, FUNDING_TYPES, _random_span
+from modules.roadmap_store import RoadmapStore
+from modules.bokeh_resources import SITE_CSS, write_static_resources
+from modules.build_profile import configure_profiling, collect_spans
+
+def make_large_page_roadmap(n_rows, seed=0):
+    """Return a synthetic roadmap whose first product and funding opportunity have about n_rows table rows each"""
+    rng = random.Random(seed)
+    data = make_synthetic_roadmap(20, seed=seed)
+    data['fundingOpportunities'] = data['fundingOpps']
+    product = data['products'][0]
+    funding_id = data['fundingOpportunities'][0]['id']
+
+    # Program combinations with the product's materials, one programs-table row each
+    material_ids = [entry['materialID'] for entry in product['materialSystems']]
+    for p in range(n_rows):
+        data['programs'][p % len(data['programs'])].setdefault('productMaterialCombinations', []).append({
+            'productID': product['id'],
+            'materialID': material_ids[p % len(material_ids)],
+            'partName': f"Part <{p}> & Co",
+            'partNumber': f"PN-{p:05d}",
+            'needDate': _random_span(rng)[0],
+            'adoptionStatus': rng.choice(STATUSES),
+        })
+
+    # M&P lane tasks on the product, and supplier tasks funded by the first opportunity
+    supplier = data['printingSuppliers'][0]
+    for t in range(n_rows):
+        start, end = _random_span(rng)
+        product['roadmap'].append({
+            'task': f"M&P Task {t}",
+            'start': start,
+            'end': end,
+            'status': rng.choice(STATUSES),
+            'lane': 'M&P',
+            'fundingType': rng.choice(FUNDING_TYPES),
+        })
+        supplier['supplierRoadmap']['tasks'].append({
+            'task': f"Funded Task <{t}>",
+            'start': start,
+            'end': end,
+            'status': rng.choice(STATUSES),
+            'category': 'Supplier Management',
+            'fundingType': 'CRAD',
+            'fundingID': funding_id,
+        })
+    return data
+
+def page_timings(func, args, page_path):
+    """Run a page generator; returns (total seconds, render seconds, page bytes)"""
+    collect_spans()
+    start = time.perf_counter()
+    func(*args)
+    total = time.perf_counter() - start
+    render = sum(span['wall'] for span in collect_spans()
+                 if span['kind'] == 'save' and span['name'] == os.path.basename(page_path))
+    return total, render, os.path.getsize(page_path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the templated product, funding and dashboard pages")
+    parser.add_argument('--rows', type=int, default=500, help="table rows on the product and funding pages")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for the synthetic dataset")
+    parser.add_argument('--output', help="directory to keep the generated pages in (default: a temporary one)")
+    args = parser.parse_args()
+
+    from modules.product_detail import generate_product_detail_page
+    from modules.funding_viz import generate_funding_page
+    from modules.dashboard import generate_dashboard
+    from main import STATUS_COLORS
+
+    data = RoadmapStore(make_large_page_roadmap(args.rows, seed=args.seed))
+    product = data['products'][0]
+    funding = data['fundingOpportunities'][0]
+    configure_profiling(True)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_dir = args.output or temp_dir
+        write_static_resources(output_dir)
+        for dirname in ('products', 'funding'):
+            os.makedirs(os.path.join(output_dir, dirname), exist_ok=True)
+        pages = [
+            ("Product page", generate_product_detail_page,
+             (product, data, os.path.join(output_dir, 'products'), STATUS_COLORS),
+             os.path.join(output_dir, 'products', f"product_{product['id']}.html")),
+            ("Funding page", generate_funding_page,
+             (funding, data, os.path.join(output_dir, 'funding')),
+             os.path.join(output_dir, 'funding', f"funding_{funding['id']}.html")),
+            ("Dashboard", generate_dashboard, (data, output_dir), os.path.join(output_dir, 'index.html')),
+        ]
+        print(f"{args.rows} rows per table; shared stylesheet {os.path.getsize(SITE_CSS) / 1e3:.1f} kB, loaded once per site")
+        for label, func, func_args, page_path in pages:
+            total, render, size = page_timings(func, func_args, page_path)
+            print(f"{label:13} {total:7.3f}s total  {render * 1e3:8.1f} ms render  {size / 1e3:8.1f} kB")
+    configure_profiling(False)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark for the streaming roadmap loader
+
+Writes a synthetic roadmap.json of roughly the requested size and measures the
+peak resident memory and wall time of loading it with json.load and with the
+modules.roadmap_loader functions. Each measurement runs in a fresh Python process
+so the peaks do not include each other.
+
+Usage:
+    python benchmarks/json_loader_benchmark.py --size-mb 500
+    python benchmarks/json_loader_benchmark.py --file roadmap.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+# Add the repository root to the path so Python can find the modules
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+# Serialized size of one synthetic product with its share of the other collections
+BYTES_PER_PRODUCT = 4950
+
+MODES = {
+    'json.load': "whole file with json.load",
+    'load_roadmap': "load_roadmap(path)",
+    'suppliers_only': "load_roadmap(path, collections=('printingSuppliers', 'postProcessingSuppliers'))",
+    'iter_products': "iter_collection(path, 'products'), counting items",
+}
+
+def peak_rss_mb():
+    """Return this process's peak resident set size in MB"""
+    try:
+        import resource
+    except ImportError:
+        # Windows has no resource module; psutil reports the peak working set instead
+        import psutil
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def measure(mode, file_path):
+    """Load file_path using mode and print 'peak_mb seconds items' for the parent process"""
+    from modules.roadmap_loader import load_roadmap, iter_collection
+
+    start = time.perf_counter()
+    if mode == 'json.load':
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        items = sum(len(v) for v in data.values() if isinstance(v, list))
+    elif mode == 'load_roadmap':
+        data = load_roadmap(file_path)
+        items = sum(len(v) for v in data.values() if isinstance(v, list))
+    elif mode == 'suppliers_only':
+        data = load_roadmap(file_path, collections=('printingSuppliers', 'postProcessingSuppliers'))
+        items = sum(len(v) for v in data.values() if isinstance(v, list))
+    else:
+        items = sum(1 for _ in iter_collection(file_path, 'products'))
+    elapsed = time.perf_counter() - start
+    print(f"{peak_rss_mb():.1f} {elapsed:.3f} {items}")
+
+def write_synthetic_file(file_path, size_mb, seed):
+    """Write a synthetic roadmap of about size_mb megabytes in the indent=4 layout of roadmap.json"""
+    from benchmarks.synthetic_roadmap import make_synthetic_roadmap
+
+    n_products = max(10, int(size_mb * 1024 * 1024 / BYTES_PER_PRODUCT))
+    data = make_synthetic_roadmap(n_products, seed=seed)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=4)
+    return n_products
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark peak memory of the roadmap JSON loaders")
+    parser.add_argument('--size-mb', type=float, default=500, help="approximate size of the synthetic file")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for the synthetic dataset")
+    parser.add_argument('--file', help="benchmark an existing roadmap file instead of a synthetic one")
+    parser.add_argument('--measure', choices=sorted(MODES), help=argparse.SUPPRESS)
+    parser.add_argument('--write', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure, args.file)
+        return
+    if args.write:
+        print(write_synthetic_file(args.file, args.size_mb, args.seed))
+        return
+
+    temp_path = None
+    file_path = args.file
+    if not file_path:
+        fd, temp_path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        print(f"Writing ~{args.size_mb:.0f} MB synthetic roadmap...")
+        # Generate in a child process too: on Linux a child's peak RSS starts from
+        # the RSS of the process it was forked from
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--write', '--file', temp_path,
+             '--size-mb', str(args.size_mb), '--seed', str(args.seed)],
+            cwd=ROOT_DIR, check=True, capture_output=True, text=True,
+        )
+        print(f"Synthetic roadmap: {result.stdout.strip()} products")
+        file_path = temp_path
+
+    try:
+        print(f"File size: {os.path.getsize(file_path) / (1024 * 1024):.1f} MB")
+        for mode, description in MODES.items():
+            result = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--measure', mode, '--file', file_path],
+                cwd=ROOT_DIR, check=True, capture_output=True, text=True,
+            )
+            peak, elapsed, items = result.stdout.split()
+            print(f"{mode:15} peak RSS {float(peak):9.1f} MB  {float(elapsed):8.2f}s  {int(items):8d} items  ({description})")
+    finally:
+        if temp_path:
+            os.remove(temp_path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Benchmark for the whole visualization pipeline
+
+Writes a synthetic roadmap (see synthetic_roadmap.py) for each requested size and runs
+every generation stage of main.py against it, one stage per fresh Python process so
+each stage's peak RSS is its own. The roadmap is loaded and indexed the way main.py
+does before the stage starts; that setup is timed separately. Results are printed as
+a table and appended to a CSV file, together with the change from the previous run
+of the same stage and size, so regressions show up between commits.
+
+Usage:
+    python benchmarks/pipeline_benchmark.py --sizes 100,1000
+    python benchmarks/pipeline_benchmark.py --sizes large --stages network_analysis,relationships
+"""
+
+import os
+import io
+import sys
+import csv
+import json
+import time
+import argparse
+import platform
+import tempfile
+import subprocess
+import contextlib
+from datetime import datetime
+
+# Add the repository root to the path so Python can find the modules
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+
+from benchmarks.synthetic_roadmap import SCALES, write_synthetic_roadmap
+from benchmarks.json_loader_benchmark import peak_rss_mb
+
+DEFAULT_RESULTS = "pipeline_benchmark_results.csv"
+DEFAULT_TIMEOUT = 3600
+
+RESULT_FIELDS = [
+    'timestamp', 'commit', 'python', 'products', 'seed', 'stage', 'status',
+    'tasks', 'setup_seconds', 'seconds', 'peak_rss_mb', 'rss_growth_mb',
+]
+
+def stage_names():
+    """Return the stage names of main.py in build order"""
+    import main
+    from modules.roadmap_store import ENTITY_COLLECTIONS, RoadmapStore
+    empty = RoadmapStore({name: [] for name in ENTITY_COLLECTIONS})
+    return [stage.name for stage in main.build_stages(empty, "")]
+
+def measure(stage_name, file_path):
+    """Run one stage on file_path and print its timings as JSON for the parent process"""
+    import main
+    from modules.build_pipeline import StageResult
+    from modules.chart_cache import configure_chart_cache
+    from modules.bokeh_resources import write_static_resources
+    from modules.roadmap_db import load_roadmap_file
+    from modules.roadmap_graph import FUNDING_LINKS
+    from modules.roadmap_store import RoadmapStore
+
+    log = io.StringIO()
+    with tempfile.TemporaryDirectory() as output_dir, contextlib.redirect_stdout(log):
+        # Prepare the data the way main.py does
+        start = time.perf_counter()
+        data = load_roadmap_file(file_path)
+        main.process_floating_tasks(data)
+        if 'fundingOpps' in data and 'fundingOpportunities' not in data:
+            data['fundingOpportunities'] = data['fundingOpps']
+        data = RoadmapStore(data)
+        data.task_table()
+        data.milestone_table()
+        for funding_links in FUNDING_LINKS:
+            data.graph(funding_links)
+        write_static_resources(output_dir)
+        configure_chart_cache(None)
+        setup_seconds = time.perf_counter() - start
+        setup_rss = peak_rss_mb()
+
+        # Run the stage's tasks in order; results of other stages are not needed for timing
+        stage = next(stage for stage in main.build_stages(data, output_dir) if stage.name == stage_name)
+        start = time.perf_counter()
+        for _, func, args, _ in stage.tasks:
+            func(*(None if isinstance(arg, StageResult) else arg for arg in args))
+        seconds = time.perf_counter() - start
+
+    print(json.dumps({
+        'tasks': len(stage.tasks),
+        'setup_seconds': round(setup_seconds, 3),
+        'seconds': round(seconds, 3),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'rss_growth_mb': round(peak_rss_mb() - setup_rss, 1),
+    }))
+
+def run_stage(stage_name, file_path, timeout):
+    """Measure one stage in a child process; returns the result fields"""
+    try:
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--measure', stage_name, '--file', file_path],
+            cwd=ROOT_DIR, capture_output=True, text=True, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return {'status': 'timeout'}
+    if result.returncode != 0:
+        print(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "failed")
+        return {'status': 'failed'}
+    return dict(json.loads(result.stdout.strip().splitlines()[-1]), status='ok')
+
+def git_commit():
+    """Return the short hash of the checked-out commit, or '' outside a git checkout"""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+    return result.stdout.strip()
+
+def previous_results(path):
+    """Return {(products, seed, stage): row} of the latest successful earlier runs in the results CSV"""
+    latest = {}
+    if not os.path.exists(path):
+        return latest
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            if row.get('status') == 'ok':
+                latest[(row['products'], row['seed'], row['stage'])] = row
+    return latest
+
+def append_results(path, rows):
+    """Append result rows to the CSV, writing the header for a new file"""
+    is_new = not os.path.exists(path)
+    with open(path, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS, extrasaction='ignore')
+        if is_new:
+            writer.writeheader()
+        writer.writerows(rows)
+
+def change(current, previous, field):
+    """Return the relative change of a field against the previous run, e.g. '+12%'"""
+    if previous is None or not float(previous[field]):
+        return "-"
+    return f"{100.0 * (current[field] - float(previous[field])) / float(previous[field]):+.0f}%"
+
+def parse_sizes(value):
+    """Parse '100,1000' or 'small,large' into product counts"""
+    return [SCALES[size] if size in SCALES else int(size) for size in value.split(',') if size]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every generation stage on synthetic roadmaps")
+    parser.add_argument('--sizes', default="100,1000",
+                        help=f"comma-separated product counts or scale names ({', '.join(SCALES)})")
+    parser.add_argument('--stages', help="comma-separated stage names (default: every stage)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for the synthetic datasets")
+    parser.add_argument('--results', default=DEFAULT_RESULTS, help=f"CSV file the results are appended to (default: {DEFAULT_RESULTS})")
+    parser.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT, help="seconds allowed per stage")
+    parser.add_argument('--measure', help=argparse.SUPPRESS)
+    parser.add_argument('--file', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure, args.file)
+        return
+
+    stages = args.stages.split(',') if args.stages else stage_names()
+    unknown = set(stages) - set(stage_names())
+    if unknown:
+        parser.error(f"unknown stages: {', '.join(sorted(unknown))}")
+
+    previous = previous_results(args.results)
+    run_info = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'seed': args.seed,
+    }
+    print(f"{'products':>8}  {'stage':16} {'tasks':>5} {'setup':>8} {'time':>9} {'change':>7} "
+          f"{'peak RSS':>10} {'growth':>9} {'change':>7}")
+    rows = []
+    with tempfile.TemporaryDirectory() as data_dir:
+        for n_products in parse_sizes(args.sizes):
+            file_path = os.path.join(data_dir, f"roadmap_{n_products}.json")
+            write_synthetic_roadmap(file_path, n_products, seed=args.seed)
+            for stage_name in stages:
+                row = dict(run_info, products=n_products, stage=stage_name, **run_stage(stage_name, file_path, args.timeout))
+                rows.append(row)
+                if row['status'] != 'ok':
+                    print(f"{n_products:>8}  {stage_name:16} {row['status']}")
+                    continue
+                before = previous.get((str(n_products), str(args.seed), stage_name))
+                print(f"{n_products:>8}  {stage_name:16} {row['tasks']:>5} {row['setup_seconds']:>7.2f}s "
+                      f"{row['seconds']:>8.2f}s {change(row, before, 'seconds'):>7} "
+                      f"{row['peak_rss_mb']:>7.1f} MB {row['rss_growth_mb']:>6.1f} MB {change(row, before, 'peak_rss_mb'):>7}")
+    append_results(args.results, rows)
+    print(f"Results appended to {args.results}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark for the RoadmapStore indexes
+
+Times the entity cross-referencing done by the page generators on a synthetic
+dataset, once with the linear ``next(...)`` scans the generators used before the
+store existed and once through RoadmapStore lookups.
+
+Usage:
+    python benchmarks/roadmap_store_benchmark.py --products 5000
+    python benchmarks/roadmap_store_benchmark.py --products 200 --full
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+# Add the repository root to the path so Python can find the modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_roadmap import make_synthetic_roadmap
+from modules.roadmap_store import RoadmapStore
+
+def resolve_linear(data):
+    """Resolve every page's references with linear scans, as the generators used to"""
+    resolved = 0
+
+    # Product pages: material systems, program need dates and program/material table
+    for product in data['products']:
+        for material_entry in product.get('materialSystems', []):
+            material_id = material_entry['materialID'] if isinstance(material_entry, dict) else material_entry
+            if next((m for m in data['materialSystems'] if m['id'] == material_id), None):
+                resolved += 1
+        for program in data['programs']:
+            for combo in program.get('productMaterialCombinations', []):
+                if combo.get('productID') == product['id']:
+                    material = next((m for m in data['materialSystems'] if m['id'] == combo.get('materialID')), None)
+                    resolved += 1 if material else 0
+
+    # Material pages: related products
+    for material in data['materialSystems']:
+        for product in data['products']:
+            for material_entry in product.get('materialSystems', []):
+                material_id = material_entry['materialID'] if isinstance(material_entry, dict) else material_entry
+                if material_id == material['id']:
+                    resolved += 1
+
+    # Printing supplier pages: material systems and related products
+    for supplier in data['printingSuppliers']:
+        related_products = set()
+        for material_entry in supplier.get('materialSystems', []):
+            material_id = material_entry.get('materialID')
+            if next((m for m in data['materialSystems'] if m['id'] == material_id), None):
+                resolved += 1
+            for product in data['products']:
+                for product_material in product.get('materialSystems', []):
+                    if isinstance(product_material, dict) and product_material.get('materialID') == material_id:
+                        related_products.add(product['id'])
+        for product_id in related_products:
+            if next((p for p in data['products'] if p['id'] == product_id), None):
+                resolved += 1
+
+    return resolved
+
+def resolve_indexed(store):
+    """Resolve the same references through the RoadmapStore indexes"""
+    resolved = 0
+
+    for product in store['products']:
+        resolved += len(store.materials_for_product(product))
+        for program, combo in store.combinations_for_product(product['id']):
+            resolved += 1 if store.material(combo.get('materialID')) else 0
+
+    for material in store['materialSystems']:
+        resolved += len(store.products_for_material(material['id']))
+
+    for supplier in store['printingSuppliers']:
+        related_products = set()
+        for material_entry in supplier.get('materialSystems', []):
+            material_id = material_entry.get('materialID')
+            if store.material(material_id):
+                resolved += 1
+            for product in store.products_for_material(material_id):
+                related_products.add(product['id'])
+        for product_id in related_products:
+            if store.product(product_id):
+                resolved += 1
+
+    return resolved
+
+def run_full_site(data, output_dir):
+    """Run the main generators against data and return the elapsed wall time"""
+    from main import STATUS_COLORS
+    from modules.program_viz import generate_program_visualizations
+    from modules.product_viz import generate_product_visualizations
+    from modules.material_viz import generate_material_visualizations
+    from modules.supplier_viz import generate_supplier_visualizations
+    from modules.relationship_viz import generate_relationship_visualizations
+
+    start = time.perf_counter()
+    generate_program_visualizations(data, output_dir)
+    generate_product_visualizations(data, output_dir, STATUS_COLORS)
+    generate_material_visualizations(data, output_dir, STATUS_COLORS)
+    generate_supplier_visualizations(data, output_dir)
+    generate_relationship_visualizations(data, output_dir)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RoadmapStore lookups against linear scans")
+    parser.add_argument('--products', type=int, default=5000, help="number of synthetic products")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for the synthetic dataset")
+    parser.add_argument('--full', action='store_true', help="also time the page generators end to end")
+    args = parser.parse_args()
+
+    data = make_synthetic_roadmap(args.products, seed=args.seed)
+    data['fundingOpportunities'] = data['fundingOpps']
+    print(f"Synthetic roadmap: {len(data['products'])} products, {len(data['materialSystems'])} materials, "
+          f"{len(data['programs'])} programs, {len(data['printingSuppliers'])} printing suppliers")
+
+    start = time.perf_counter()
+    linear_count = resolve_linear(data)
+    linear_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    store = RoadmapStore(data)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed_count = resolve_indexed(store)
+    indexed_time = time.perf_counter() - start
+
+    if linear_count != indexed_count:
+        print(f"WARNING: resolved {linear_count} references with scans but {indexed_count} with the store")
+
+    print(f"Linear scans:      {linear_time:8.3f}s ({linear_count} references)")
+    print(f"Store build:       {build_time:8.3f}s")
+    print(f"Store lookups:     {indexed_time:8.3f}s ({indexed_count} references)")
+    print(f"Speedup:           {linear_time / max(build_time + indexed_time, 1e-9):8.1f}x")
+
+    if args.full:
+        with tempfile.TemporaryDirectory() as output_dir:
+            os.chdir(output_dir)
+            elapsed = run_full_site(store, output_dir)
+        print(f"Full site (store): {elapsed:8.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark for the roadmap manager's search index
+
+Times building the product search index on a synthetic dataset and a set of
+typical queries against it, and checks every query returns the same products as
+a plain substring scan over the same fields.
+
+Usage:
+    python benchmarks/search_index_benchmark.py --products 50000
+"""
+
+import os
+import sys
+import time
+import argparse
+
+# Add the repository root to the path so Python can find the modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_roadmap import make_synthetic_roadmap
+from roadmap_manager.search_index import SearchIndex, parse_query
+
+QUERIES = ['P1234', '12345', 'prod', 'product 99', 'material:MS12', 'ms1*',
+           'trl:5 material:ms1*', 'x', 'zzz']
+
+def entry_ids(entries, key):
+    """Return the IDs of a product's program or material entries"""
+    return [entry.get(key, '') if isinstance(entry, dict) else entry for entry in entries]
+
+PRODUCT_FIELDS = {
+    'id': lambda p: p.get('id', ''),
+    'name': lambda p: p.get('name', ''),
+    'trl': lambda p: p.get('trl', ''),
+    'program': lambda p: entry_ids(p.get('programs', []), 'programID'),
+    'material': lambda p: entry_ids(p.get('materialSystems', []), 'materialID'),
+}
+
+def field_text(product, field):
+    """Return the lowercased text a query term is matched against"""
+    names = [field] if field in PRODUCT_FIELDS else list(PRODUCT_FIELDS)
+    texts = []
+    for name in names:
+        value = PRODUCT_FIELDS[name](product)
+        texts.append("\n".join(map(str, value)) if isinstance(value, list) else str(value))
+    return "\x1f".join(texts).lower()
+
+def search_linear(products, query):
+    """Match a query with a substring scan over every product, as the search boxes used to"""
+    matches = []
+    for product in products:
+        for field, term, prefix in parse_query(query):
+            if field is not None and field not in PRODUCT_FIELDS:
+                field, term = None, f"{field}:{term}"
+            text = field_text(product, field)
+            position = text.find(term)
+            # Prefix terms must start a word
+            while prefix and position > 0 and (text[position - 1].isalnum() or text[position - 1] == '_'):
+                position = text.find(term, position + 1)
+            if position < 0:
+                break
+        else:
+            matches.append(product)
+    return matches
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the search index against substring scans")
+    parser.add_argument('--products', type=int, default=50000, help="number of synthetic products")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for the synthetic dataset")
+    args = parser.parse_args()
+
+    products = make_synthetic_roadmap(args.products, seed=args.seed)['products']
+    print(f"Synthetic roadmap: {len(products)} products")
+
+    index = SearchIndex(PRODUCT_FIELDS)
+    start = time.perf_counter()
+    index.sync(products)
+    print(f"Index build:  {time.perf_counter() - start:8.3f}s")
+
+    for query in QUERIES:
+        start = time.perf_counter()
+        indexed = index.search(query)
+        indexed_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        linear = search_linear(products, query)
+        linear_time = time.perf_counter() - start
+
+        status = "" if [id(p) for p in indexed] == [id(p) for p in linear] else "  MISMATCH"
+        print(f"{query!r:24} {len(indexed):6} matches  index {indexed_time * 1000:8.2f}ms  "
+              f"scan {linear_time * 1000:8.1f}ms{status}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+Synthetic roadmap data for benchmarks
+
+Builds a deterministic roadmap.json-shaped dict at a configurable scale so the
+visualization pipeline can be timed on datasets much larger than the sample data.
+Every collection scales with the product count: products use 1-3 material systems
+and list the programs that adopt them, programs carry productMaterialCombinations,
+suppliers are qualified on the materials they print, and funding opportunities hold
+1-3 pursuits whose products carry roadmap tasks with the opportunity's fundingID.
+The same size and seed always give the same data.
+
+Usage:
+    python benchmarks/synthetic_roadmap.py --products 1000 --output roadmap_1k.json
+    python benchmarks/synthetic_roadmap.py --scale large --output roadmap_10k.json
+"""
+
+import os
+import json
+import random
+import argparse
+from datetime import date, timedelta
+
+LANES = ['Design', 'Manufacturing', 'M&P', 'Quality', 'Other']
+STATUSES = ['Complete', 'In Progress', 'Planned', 'Not Started']
+FUNDING_TYPES = ['Division IRAD', 'Sector IRAD', 'CRAD', 'Planned', 'Customer']
+PRINTERS = ['SLM 280', 'EOS M290', 'Concept Laser M2', 'Arcam Q20+']
+FISCAL_YEARS = ['FY25', 'FY26', 'FY27', 'FY28', 'FY29', 'FY30']
+
+# Named dataset sizes (number of products)
+SCALES = {
+    'small': 100,
+    'medium': 1000,
+    'large': 10000,
+}
+
+def _random_span(rng, start=date(2024, 1, 1), days=1460):
+    """Return a (start, end) pair of ISO date strings within the planning window"""
+    begin = start + timedelta(days=rng.randrange(days))
+    end = begin + timedelta(days=rng.randint(14, 240))
+    return begin.isoformat(), end.isoformat()
+
+def make_synthetic_roadmap(n_products, seed=0):
+    """Build a roadmap dict with n_products products and proportional fan-out"""
+    rng = random.Random(seed)
+    n_materials = max(4, n_products // 5)
+    n_programs = max(3, n_products // 10)
+    n_printing = max(2, n_products // 50)
+    n_postproc = max(2, n_products // 100)
+    n_funding = max(2, n_products // 25)
+
+    materials = []
+    for i in range(n_materials):
+        roadmap = []
+        for t in range(4):
+            start, end = _random_span(rng)
+            roadmap.append({
+                'task': f"Material Task {t}",
+                'startDate': start,
+                'endDate': end,
+                'status': rng.choice(STATUSES),
+                'lane': 'Parameter Development',
+                'floatOnRoadmap': False,
+                'floatDate': '',
+                'fundingType': rng.choice(FUNDING_TYPES),
+            })
+        materials.append({
+            'id': f"MS{i + 1}",
+            'name': f"Material System {i + 1}",
+            'process': rng.choice(['Laser Powder Bed Fusion', 'Directed Energy Deposition', 'Binder Jet']),
+            'material': rng.choice(['Ti-6Al-4V', 'Inconel 718', 'AlSi10Mg', '316L']),
+            'mrl': rng.randint(3, 9),
+            'roadmap': roadmap,
+            'milestones': [{
+                'name': f"MRL {rng.randint(4, 9)} QRB",
+                'date': _random_span(rng)[0],
+                'description': '',
+                'floatOnRoadmap': False,
+                'floatDate': '',
+            }],
+            'postProcessing': [{'name': 'Hot Isostatic Pressing (HIP)', 'Supplier': []}],
+            'qualifiedMachines': [],
+            'standardNDT': ['Visual inspection'],
+            'relatedFundingOpps': [],
+            'qualifications': [{
+                'qualificationClass': rng.choice(['Class 1', 'Class 2', 'Class 4']),
+                'qualification': rng.choice(['Qualified', 'In Progress', 'Planned']),
+                'statisticalBasis': rng.choice(['S', 'A-Basis', 'B-Basis']),
+            }],
+        })
+
+    printing_suppliers = []
+    for i in range(n_printing):
+        material_ids = rng.sample(range(n_materials), min(n_materials, rng.randint(2, 8)))
+        supplier_tasks = []
+        for t in range(3):
+            start, end = _random_span(rng)
+            supplier_tasks.append({
+                'task': f"Supplier Task {t}",
+                'start': start,
+                'end': end,
+                'status': rng.choice(STATUSES),
+                'category': rng.choice(['Material System Vendor Qual', 'Supplier Management']),
+                'fundingType': rng.choice(FUNDING_TYPES),
+            })
+        printer = rng.choice(PRINTERS)
+        for m in material_ids:
+            materials[m]['qualifiedMachines'].append({
+                'machine': printer,
+                'Supplier': [{'id': f"SUP{i + 1}", 'qualStatus': rng.choice(['Qualified', 'Planned', 'In-Development'])}],
+            })
+        printing_suppliers.append({
+            'id': f"SUP{i + 1}",
+            'name': f"Printing Supplier {i + 1}",
+            'supplierNumber': str(1000000000 + i),
+            'ndaStatus': {'status': 'Signed', 'date': '2025-01-01'},
+            'materialSystems': [
+                {'materialID': f"MS{m + 1}", 'printer': [{'name': printer, 'qualStatus': 'Qualified'}]}
+                for m in material_ids
+            ],
+            'additionalCapabilities': [],
+            'supplierRoadmap': {'tasks': supplier_tasks},
+        })
+
+    postproc_suppliers = [{
+        'id': f"PSUP{i + 1}",
+        'name': f"Post-Processing Supplier {i + 1}",
+        'supplierNumber': str(2000000000 + i),
+        'ndaStatus': {'status': 'Signed', 'date': '2025-01-01'},
+        'processs': ['HIP', 'Surface finishing'],
+    } for i in range(n_postproc)]
+
+    products = []
+    for i in range(n_products):
+        material_ids = rng.sample(range(n_materials), rng.randint(1, 3))
+        roadmap = []
+        for t in range(8):
+            start, end = _random_span(rng)
+            roadmap.append({
+                'task': f"Task {t}",
+                'start': start,
+                'end': end,
+                'status': rng.choice(STATUSES),
+                'lane': rng.choice(LANES),
+                'fundingType': rng.choice(FUNDING_TYPES),
+            })
+        products.append({
+            'id': f"P{i + 1}",
+            'name': f"Product {i + 1}",
+            'requirements': {},
+            'businessCase': {},
+            'materialSystems': [
+                {'materialID': f"MS{m + 1}", 'printer': [rng.choice(PRINTERS)]} for m in material_ids
+            ],
+            'postProcessingSuppliers': [
+                {'process': 'HIP', 'supplier': [f"PSUP{rng.randrange(n_postproc) + 1}"]}
+            ],
+            'designTools': [],
+            'documentation': [],
+            'specialNDT': [],
+            'partAcceptance': [],
+            'trl': rng.randint(1, 9),
+            'roadmap': roadmap,
+            'milestones': [
+                {'name': name, 'date': _random_span(rng)[0], 'description': description}
+                for name, description in (('PDR', 'Preliminary Design Review'), ('CDR', 'Critical Design Review'))
+            ],
+            'trlHistory': [],
+            'programs': [],
+        })
+
+    programs = []
+    for i in range(n_programs):
+        combos = []
+        for _ in range(rng.randint(5, 15)):
+            product = products[rng.randrange(n_products)]
+            material_entry = rng.choice(product['materialSystems'])
+            if f"PRG{i + 1}" not in product['programs']:
+                product['programs'].append(f"PRG{i + 1}")
+            combos.append({
+                'productID': product['id'],
+                'materialID': material_entry['materialID'],
+                'partName': f"Part {rng.randrange(10000)}",
+                'partNumber': f"PN-{rng.randrange(100000)}",
+                'lifetimeDemand': str(rng.randint(1, 500)),
+                'unitCostSavings': str(rng.randint(0, 50)),
+                'unitScheduleSavings': str(rng.randint(0, 30)),
+                'needDate': _random_span(rng)[1],
+                'adoptionStatus': rng.choice(['Baselined', 'Complete', 'Prototyping', 'Developing']),
+                'statusHistory': [],
+            })
+        programs.append({
+            'id': f"PRG{i + 1}",
+            'name': f"Program {i + 1}",
+            'sector': 'Sector N/A',
+            'division': 'S',
+            'customerName': 'N/A',
+            'missionClass': rng.choice(['Class A', 'Class B', 'Class C']),
+            'productMaterialCombinations': combos,
+        })
+
+    funding_opps = []
+    for i in range(n_funding):
+        pursuits = []
+        for p in range(rng.randint(1, 3)):
+            related = [products[rng.randrange(n_products)] for _ in range(rng.randint(1, 3))]
+            for product in related:
+                # The funded work shows up as a product roadmap task carrying the opportunity's ID
+                start, end = _random_span(rng)
+                product['roadmap'].append({
+                    'task': f"Funded Task OPP{i + 1}",
+                    'start': start,
+                    'end': end,
+                    'status': rng.choice(STATUSES),
+                    'lane': rng.choice(LANES),
+                    'fundingType': 'CRAD',
+                    'fundingID': f"OPP{i + 1}",
+                })
+            first_year = rng.randrange(len(FISCAL_YEARS) - 1)
+            pursuits.append({
+                'pursuitID': f"PUR{i + 1}-{p + 1}",
+                'pursuitName': f"Pursuit {i + 1}.{p + 1}",
+                'relatedProducts': ", ".join(
+                    f"{product['id']} | {product['materialSystems'][0]['materialID']}" for product in related
+                ),
+                'potentialValue': [{
+                    year: rng.randint(1, 10) * 10000
+                    for year in FISCAL_YEARS[first_year:first_year + rng.randint(2, 4)]
+                }],
+            })
+        funding_opps.append({
+            'id': f"OPP{i + 1}",
+            'announcementName': f"Funding Opportunity {i + 1}",
+            'pursuitType': rng.choice(['CRAD', 'IRAD']),
+            'customer': 'N/A',
+            'closeDate': _random_span(rng)[0],
+            'fundingAmount': f"${rng.randint(1, 50) * 100000}",
+            'pursuits': pursuits,
+            'status': rng.choice(['Pursuing', 'Awarded', 'Submitted']),
+        })
+
+    return {
+        'programs': programs,
+        'products': products,
+        'materialSystems': materials,
+        'printingSuppliers': printing_suppliers,
+        'postProcessingSuppliers': postproc_suppliers,
+        'fundingOpps': funding_opps,
+    }
+
+def write_synthetic_roadmap(path, n_products, seed=0):
+    """Write a synthetic roadmap to path in the indent=4 layout of roadmap.json; returns the data"""
+    data = make_synthetic_roadmap(n_products, seed=seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=4)
+    return data
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a deterministic synthetic roadmap.json")
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument('--products', type=int, help="number of products")
+    size.add_argument('--scale', choices=sorted(SCALES, key=SCALES.get),
+                      help=f"named size ({', '.join(f'{name}: {n}' for name, n in SCALES.items())} products)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed")
+    parser.add_argument('--output', '-o', default="synthetic_roadmap.json", help="file to write")
+    args = parser.parse_args()
+
+    n_products = args.products or SCALES[args.scale or 'small']
+    data = write_synthetic_roadmap(args.output, n_products, seed=args.seed)
+    counts = ", ".join(f"{len(items)} {name}" for name, items in data.items())
+    print(f"Wrote {args.output} ({os.path.getsize(args.output) / 1e6:.1f} MB): {counts}")
+
+if __name__ == "__main__":
+    main()
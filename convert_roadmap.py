@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""
+Convert roadmap data between roadmap.json and the SQLite backend
+
+The direction follows the file extensions:
+    python convert_roadmap.py roadmap.json roadmap.db    (import JSON into SQLite)
+    python convert_roadmap.py roadmap.db roadmap.json    (export SQLite to JSON)
+
+--verify reads the written file back and checks it matches the source exactly.
+"""
+
+import os
+import sys
+import json
+import argparse
+
+# Add the current directory to the path so Python can find the modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from modules.roadmap_db import is_sqlite_path, load_roadmap_file, save_roadmap_db
+from roadmap_manager.utils import write_text_atomic
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert roadmap data between JSON and SQLite")
+    parser.add_argument("source", help="roadmap file to read (.json, or .db/.sqlite)")
+    parser.add_argument("target", help="roadmap file to write (.json, or .db/.sqlite)")
+    parser.add_argument("--indent", type=int, default=4, help="indentation of exported JSON")
+    parser.add_argument("--verify", action="store_true", help="check the written file round-trips to the source")
+    args = parser.parse_args(argv)
+
+    if is_sqlite_path(args.source) == is_sqlite_path(args.target):
+        parser.error("one file must be JSON and the other a SQLite database")
+
+    data = load_roadmap_file(args.source)
+    print(f"Read {args.source}: " + ", ".join(
+        f"{len(value)} {key}" for key, value in data.items() if isinstance(value, list)))
+
+    if is_sqlite_path(args.target):
+        save_roadmap_db(args.target, data)
+    else:
+        write_text_atomic(os.path.abspath(args.target), json.dumps(data, indent=args.indent))
+    print(f"Wrote {args.target}")
+
+    if args.verify:
+        written = load_roadmap_file(args.target)
+        # Compare serialised text so key order and value types must match too
+        if json.dumps(written) != json.dumps(data):
+            print("Verification failed: the written file differs from the source")
+            return 1
+        print("Verified: the written file matches the source")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
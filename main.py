@@ -1,6 +1,7 @@
 import os
 import json
 import sys
+import argparse
 from datetime import datetime, timedelta
 import random
 
@@ -8,16 +9,33 @@ import random
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Import visualization modules
-from modules.program_viz import generate_program_visualizations
-from modules.product_viz import generate_product_visualizations
-from modules.material_viz import generate_material_visualizations
-from modules.supplier_viz import generate_supplier_visualizations
-from modules.funding_viz import generate_funding_visualizations
-from modules.relationship_viz import generate_relationship_visualizations
+from modules.program_viz import program_visualization_tasks
+from modules.product_viz import product_visualization_tasks
+from modules.material_viz import material_visualization_tasks
+from modules.supplier_viz import supplier_visualization_tasks
+from modules.funding_viz import funding_visualization_tasks
+from modules.relationship_viz import relationship_visualization_tasks
 from modules.network_analysis import generate_advanced_network_analysis
 from modules.progress_tracking import generate_progress_tracking
 from modules.dashboard import generate_dashboard
 from modules.implementation_metrics.metrics import generate_implementation_metrics
+from modules.roadmap_store import RoadmapStore
+from modules.roadmap_db import load_roadmap_file, is_sqlite_path, save_roadmap_db
+from modules.floating_tasks import shift_floating_tasks, SHIFTED_TO_KEY
+from modules.date_parsing import date_parse_stats
+from modules.chart_renderer import DPI_PROFILES, set_dpi_profile, render_stats
+from modules.chart_cache import DEFAULT_CACHE_DIR, configure_chart_cache, chart_cache
+from modules.roadmap_graph import FUNDING_LINKS, configure_graph_cache, graph_stats
+from modules.centrality import CENTRALITY_MODES, DEFAULT_PIVOTS, APPROXIMATE_ABOVE_NODES, set_centrality_mode
+from roadmap_manager.utils import write_text_atomic
+from modules.build_profile import (
+    PROFILE_JSON, PROFILE_HTML, CPROFILE_DIRNAME, configure_profiling, profile_span, collect_spans,
+    write_profile_report,
+)
+from modules.build_pipeline import Stage, StageResult, single_task_stage, run_stages, default_jobs
+from modules.build_manifest import BuildManifest, MANIFEST_FILENAME
+from modules.bokeh_resources import write_static_resources
+from modules.app_bundle import APP_DIRNAME, write_app
 
 # Define status colors for consistency
 STATUS_COLORS = {
@@ -29,48 +47,234 @@ STATUS_COLORS = {
     'Delayed': '#e53935'   # Red
 }
 
-def main():
+def build_stages(data, output_dir):
+    """Build the site generation stage graph; the dashboard depends on the linked summary pages"""
+    return [
+        Stage("programs", program_visualization_tasks(data, output_dir)),
+        Stage("products", product_visualization_tasks(data, output_dir, STATUS_COLORS)),
+        Stage("materials", material_visualization_tasks(data, output_dir, STATUS_COLORS)),
+        Stage("suppliers", supplier_visualization_tasks(data, output_dir)),
+        Stage("funding", funding_visualization_tasks(data, output_dir)),
+        Stage("relationships", relationship_visualization_tasks(data, output_dir)),
+        single_task_stage("network_analysis", generate_advanced_network_analysis, data, output_dir),
+        single_task_stage("progress", generate_progress_tracking, data, output_dir),
+        single_task_stage("implementation", generate_implementation_metrics, data, output_dir),
+        single_task_stage(
+            "dashboard", generate_dashboard, data, output_dir,
+            StageResult("network_analysis"), StageResult("progress"), StageResult("implementation"),
+            depends_on=("programs", "products", "materials", "suppliers", "funding", "relationships"),
+        ),
+    ]
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Generate the roadmap visualization site")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="number of worker processes (1 runs sequentially, 0 uses one per CPU)"
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="skip pages whose roadmap entities are unchanged since the last run"
+    )
+    parser.add_argument(
+        "--data", default="roadmap.json",
+        help="roadmap data file: a JSON file or a SQLite database (.db, .sqlite)"
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="print a run summary with the shared date parsing cache counters and time every stage task, "
+             f"chart and page save; the timings are written to {PROFILE_JSON} and {PROFILE_HTML} in the output directory"
+    )
+    parser.add_argument(
+        "--profile-memory", action="store_true",
+        help="with --profile, also record each span's peak Python memory with tracemalloc (slows the build)"
+    )
+    parser.add_argument(
+        "--cprofile", action="store_true",
+        help=f"with --profile, also run every stage task under cProfile and save the stats to {CPROFILE_DIRNAME}/"
+    )
+    parser.add_argument(
+        "--chart-dpi", choices=sorted(DPI_PROFILES),
+        help="render every static PNG chart at one DPI profile (preview: 100 dpi, print: 300 dpi); "
+             "by default each chart keeps its own DPI"
+    )
+    parser.add_argument(
+        "--chart-cache", metavar="DIR", default=DEFAULT_CACHE_DIR,
+        help="directory of rendered static charts reused when their inputs are unchanged "
+             f"(default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--no-chart-cache", action="store_true",
+        help="render every static chart without reading or filling the chart cache"
+    )
+    parser.add_argument(
+        "--graph-cache", metavar="DIR",
+        help="keep the built relationship graphs as pickles in DIR, keyed by the roadmap data hash, "
+             "and load them on later runs over the same data"
+    )
+    parser.add_argument(
+        "--centrality", choices=CENTRALITY_MODES, default="auto",
+        help="betweenness centrality on the network analysis page: exact, approximate (sampled pivot "
+             f"sources, with an error bound on the page) or auto (approximate above {APPROXIMATE_ABOVE_NODES} nodes)"
+    )
+    parser.add_argument(
+        "--centrality-pivots", type=int, default=DEFAULT_PIVOTS, metavar="K",
+        help=f"pivot sources sampled for approximate betweenness (default: {DEFAULT_PIVOTS})"
+    )
+    parser.add_argument(
+        "--write-shifted", metavar="PATH",
+        help="only shift the floating tasks and write the result to PATH (JSON or SQLite); "
+             "later runs with --data PATH skip the days already shifted"
+    )
+    parser.add_argument(
+        "--app", nargs="?", const=APP_DIRNAME, metavar="DIR",
+        help="instead of the static site, write one compressed data bundle and a single-page viewer "
+             f"that renders the product, material, program, supplier and funding pages in the browser (default DIR: {APP_DIRNAME})"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main function to generate all visualizations"""
+    args = parse_args(argv)
+    jobs = default_jobs() if args.jobs == 0 else args.jobs
+    output_dir = "roadmap_visualizations"
+    
+    # Time the run for --profile (worker processes inherit the setting)
+    profiling = args.profile or args.profile_memory or args.cprofile
+    configure_profiling(profiling, memory=args.profile_memory,
+                        cprofile_dir=os.path.join(output_dir, CPROFILE_DIRNAME) if args.cprofile else None)
+    started = datetime.now()
+    
     print("Generating roadmap visualizations...")
     
     # Load the roadmap data
-    with open('roadmap.json', 'r') as f:
-        data = json.load(f)
+    with profile_span('setup', 'load_roadmap_file'):
+        data = load_roadmap_file(args.data)
+    
+    # Process floating tasks if needed
+    shifted_to = process_floating_tasks(data)
+    if args.write_shifted:
+        write_shifted_data(data, args.write_shifted, shifted_to)
+        return
     
     # Map fundingOpps to fundingOpportunities for compatibility
     if 'fundingOpps' in data and 'fundingOpportunities' not in data:
         data['fundingOpportunities'] = data['fundingOpps']
     
+    # Single-page app mode: export the data bundle and viewer instead of generating pages
+    if args.app:
+        write_app_bundle(data, args.app, started)
+        if profiling:
+            write_build_profile(args.app, collect_spans(), 1, started)
+        return
+    
     # Create output directory if it doesn't exist
-    output_dir = "roadmap_visualizations"
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
     
-    # Process floating tasks if needed
-    process_floating_tasks(data)
+    # Copy BokehJS once into the site so every page can load it offline
+    write_static_resources(output_dir)
+    
+    # Build the ID and reverse indexes once and share them with every generator
+    with profile_span('setup', 'RoadmapStore'):
+        data = RoadmapStore(data)
     
-    # Generate visualizations for each module
-    generate_program_visualizations(data, output_dir)
-    generate_product_visualizations(data, output_dir, STATUS_COLORS)
-    generate_material_visualizations(data, output_dir, STATUS_COLORS)
-    generate_supplier_visualizations(data, output_dir)
-    generate_funding_visualizations(data, output_dir)
-    generate_relationship_visualizations(data, output_dir)
+    # Normalize the tasks and milestones once; generators (and worker processes) share the tables
+    with profile_span('setup', 'task_tables'):
+        data.task_table()
+        data.milestone_table()
     
-    # Generate advanced network analysis
-    network_analysis_path = generate_advanced_network_analysis(data, output_dir)
+    # Build the relationship graphs once too; the network pages share them instead of rebuilding
+    configure_graph_cache(args.graph_cache)
+    for funding_links in FUNDING_LINKS:
+        with profile_span('setup', f"graph:{funding_links}"):
+            data.graph(funding_links)
     
-    # Generate progress tracking visualizations
-    progress_path = generate_progress_tracking(data, output_dir)
+    # Static charts are rendered at the selected DPI profile (worker processes inherit it)
+    set_dpi_profile(args.chart_dpi)
     
-    # Generate implementation metrics visualizations
-    implementation_path = generate_implementation_metrics(data, output_dir)
+    # Centrality settings for the network analysis page (worker processes inherit them)
+    set_centrality_mode(args.centrality, args.centrality_pivots)
     
-    # Generate the main dashboard
-    generate_dashboard(data, output_dir, network_analysis_path, progress_path, implementation_path)
+    # Reuse static charts rendered by earlier runs from identical inputs (worker processes share the cache)
+    configure_chart_cache(None if args.no_chart_cache else args.chart_cache)
     
+    # Record what each page is built from so the next --incremental run can skip unchanged pages
+    manifest = BuildManifest(os.path.join(output_dir, MANIFEST_FILENAME), data, skip_unchanged=args.incremental)
+    
+    # Generate visualizations for each module, then the main dashboard
+    if jobs > 1:
+        print(f"Running generation stages on {jobs} worker processes...")
+    worker_spans = []
+    run_stages(build_stages(data, output_dir), data, jobs=jobs, manifest=manifest, spans=worker_spans)
+    manifest.save()
+    
+    # Keep the chart cache within its size and age limits
+    cache = chart_cache()
+    evicted = cache.prune() if cache is not None else 0
+    
+    if args.incremental:
+        print(f"Incremental build: {manifest.built} tasks rebuilt, {manifest.skipped} unchanged tasks skipped.")
     print(f"All visualizations generated in the '{output_dir}' directory.")
     print(f"Open '{output_dir}/index.html' in your browser to view the dashboard.")
+    
+    if profiling:
+        print_profile_summary(jobs, evicted)
+        write_build_profile(output_dir, collect_spans() + worker_spans, jobs, started)
+
+def write_app_bundle(data, app_dir, started):
+    """Write the single-page app (data bundle and viewer shell) requested with --app"""
+    with profile_span('setup', 'RoadmapStore'):
+        data = RoadmapStore(data)
+    bundle_path, bundle_bytes, json_bytes = write_app(data, app_dir, STATUS_COLORS)
+    print(f"Wrote the data bundle '{bundle_path}' ({bundle_bytes / 1e3:.1f} kB, "
+          f"{json_bytes / 1e3:.1f} kB of minified JSON) in {(datetime.now() - started).total_seconds():.2f}s.")
+    print(f"Open '{os.path.join(app_dir, 'index.html')}' in your browser to view the roadmap.")
+
+def write_build_profile(output_dir, spans, jobs, started):
+    """Write build_profile.json/.html and print the slowest stages"""
+    # os.times() covers the same user and system CPU time as getrusage() and also works on Windows
+    usage = os.times()
+    run = {
+        'started': started.isoformat(timespec='seconds'),
+        'finished': datetime.now().isoformat(timespec='seconds'),
+        'wall': (datetime.now() - started).total_seconds(),
+        'cpu': usage.user + usage.system,
+        'peak_rss_mb': max((span['peak_rss_mb'] for span in spans), default=0.0),
+        'jobs': jobs,
+        'argv': sys.argv[1:],
+    }
+    stages, kinds = write_profile_report(output_dir, spans, run)
+    print(f"  Stages by wall time ({len(spans)} spans recorded):")
+    for name, totals in sorted(stages.items(), key=lambda item: item[1]['wall'], reverse=True)[:10]:
+        print(f"    {name:<16} {totals['tasks']:>4} tasks {totals['wall']:>8.2f}s wall {totals['cpu']:>8.2f}s CPU")
+    for kind in ('chart', 'savefig', 'save'):
+        if kind in kinds:
+            print(f"  {kind} spans: {kinds[kind]['count']}, {kinds[kind]['wall']:.2f}s wall")
+    print(f"  Build profile written to {os.path.join(output_dir, PROFILE_JSON)} and {os.path.join(output_dir, PROFILE_HTML)}")
+
+def print_profile_summary(jobs, evicted=0):
+    """Print the run summary requested with --profile"""
+    stats = date_parse_stats()
+    lookups = stats['hits'] + stats['misses']
+    hit_rate = 100.0 * stats['hits'] / lookups if lookups else 0.0
+    print("Profile summary:")
+    scope = " (main process only)" if jobs > 1 else ""
+    print(f"  Date parsing{scope}: {lookups} lookups, {stats['hits']} hits, {stats['misses']} misses "
+          f"({hit_rate:.1f}% hit rate), {stats['cached']} dates cached")
+    if stats['invalid']:
+        samples = ", ".join(repr(value) for value in stats['invalid_samples'])
+        print(f"  Invalid dates: {stats['invalid']} (e.g. {samples})")
+    graphs = graph_stats()
+    print(f"  Relationship graphs: {graphs['built']} built, {graphs['loaded']} loaded from the graph cache")
+    charts = render_stats()
+    print(f"  Static charts{scope}: {charts['charts']} rendered on {charts['figures']} reusable figures")
+    cache = chart_cache()
+    if cache is not None:
+        cached = cache.stats()
+        print(f"  Chart cache{scope}: {cached['hits']} hits, {cached['misses']} misses; "
+              f"{cached['entries']} entries ({cached['bytes'] / 1e6:.1f} MB), {evicted} evicted")
 
 def process_floating_tasks(data):
     """Process floating tasks to adjust dates based on time elapsed since float date"""
@@ -78,45 +282,28 @@ def process_floating_tasks(data):
     
     today = datetime.now()
     
-    # Process products
+    # Shift every floating task in one batch
+    counts, skipped = shift_floating_tasks(data, today.date())
+    if counts:
+        details = ", ".join(f"{section}: {count}" for section, count in counts.items())
+        print(f"Shifted {sum(counts.values())} floating tasks ({details})")
+    if skipped:
+        print(f"Skipped {skipped} floating tasks with invalid dates")
+    
+    # Update lastSaveDate to today
     for product in data.get('products', []):
-        # Process all sections that might contain floating tasks
-        sections = [
-            {'key': 'designTools', 'date_keys': ('start', 'end')},
-            {'key': 'documentation', 'date_keys': ('start', 'end')},
-            {'key': 'specialNDT', 'date_keys': ('startDate', 'endDate')},
-            {'key': 'partAcceptance', 'date_keys': ('startDate', 'endDate')},
-            {'key': 'roadmap', 'date_keys': ('start', 'end')}
-        ]
-        
-        for section in sections:
-            if section['key'] in product:
-                items = product[section['key']]
-                start_key, end_key = section['date_keys']
-                
-                for item in items:
-                    if isinstance(item, dict) and item.get('float', False) and item.get('floatDate'):
-                        try:
-                            # Calculate days elapsed since float date
-                            float_dt = datetime.strptime(item['floatDate'], "%Y-%m-%d")
-                            days_elapsed = (today - float_dt).days
-                            
-                            if days_elapsed > 0 and item.get(start_key):
-                                # Adjust start date
-                                start_dt = datetime.strptime(item[start_key], "%Y-%m-%d")
-                                start_dt = start_dt + timedelta(days=days_elapsed)
-                                item[start_key] = start_dt.strftime("%Y-%m-%d")
-                                
-                                # Adjust end date if it exists
-                                if item.get(end_key):
-                                    end_dt = datetime.strptime(item[end_key], "%Y-%m-%d")
-                                    end_dt = end_dt + timedelta(days=days_elapsed)
-                                    item[end_key] = end_dt.strftime("%Y-%m-%d")
-                        except Exception as e:
-                            print(f"Error adjusting floating dates: {str(e)}")
-        
-        # Update lastSaveDate to today
         product['lastSaveDate'] = today.strftime("%Y-%m-%d")
+    
+    return today.date()
+
+def write_shifted_data(data, file_path, shifted_to):
+    """Write the floating-task-shifted roadmap so later runs can load it instead of shifting again"""
+    data[SHIFTED_TO_KEY] = shifted_to.isoformat()
+    if is_sqlite_path(file_path):
+        save_roadmap_db(file_path, data)
+    else:
+        write_text_atomic(os.path.abspath(file_path), json.dumps(data, indent=4))
+    print(f"Wrote the shifted roadmap data to '{file_path}'")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,197 @@
+"""
+App Bundle Module for Roadmap Visualizations
+
+This module exports the roadmap as a single-page viewer app instead of a static site including:
+1. One data bundle: the entities, the store's precomputed indexes and the chart series of every page
+2. Minified JSON, gzip-compressed and base64-wrapped in a <script> file, so the app also works from file://
+3. One static viewer shell (templates/app.html) that decodes the bundle and renders pages on demand
+4. The page generators' own data-prep functions, so the app shows the same tasks, dates and rows
+"""
+
+import os
+import gzip
+import json
+import base64
+from datetime import datetime
+
+from modules.roadmap_store import as_store
+from modules.html_templates import STATUS_CLASSES, inline_stylesheet, render_template
+from modules.product_detail import (
+    FUNDING_COLORS, PRODUCT_LANES, BUSINESS_CASE_GROUPS, MATERIAL_FIELDS,
+    product_gantt_tasks, product_need_dates, product_program_materials,
+)
+from modules.material_viz import material_gantt_tasks, material_milestones
+from modules.supplier_viz import SUPPLIER_STATUS_COLORS, supplier_gantt_tasks
+from modules.funding_viz import (
+    FUNDING_STATUS_CLASSES, TASK_STATUS_CLASSES, funding_details, funding_period, funding_related_tasks,
+)
+from modules.pursuit_viz import PURSUIT_FIELDS, related_product_rows, potential_value_series
+from modules.build_profile import profile_span
+
+# Default directory of the app and the names of its two files
+APP_DIRNAME = "roadmap_app"
+APP_PAGE = "index.html"
+BUNDLE_FILENAME = "roadmap_bundle.js"
+
+# Bumped whenever the bundle layout changes; the viewer refuses bundles it does not know
+BUNDLE_FORMAT = 1
+
+# The global the bundle script assigns the encoded data to
+BUNDLE_GLOBAL = "ROADMAP_BUNDLE"
+
+def _day(value):
+    """Return a datetime as 'YYYY-MM-DD', or None"""
+    return value.strftime('%Y-%m-%d') if value else None
+
+def gantt_rows(tasks):
+    """Return normalized Gantt tasks as compact [start, end, label, group, lane, status] rows"""
+    return [[_day(task['start']), _day(task['end']), task['label'], task['group'], task['lane'], task.get('status')]
+            for task in tasks]
+
+def dated_rows(items):
+    """Return (date, label) pairs such as need dates or milestones as [day, label] rows"""
+    return [[_day(item_date), label] for item_date, label in items]
+
+def product_indexes(data):
+    """Return the product page indexes: material IDs and program/material combination rows per product"""
+    materials = {}
+    programs = {}
+    for product in data.get('products', []):
+        product_id = product['id']
+        materials[product_id] = [material['id'] for material in data.materials_for_product(product)]
+        programs[product_id] = [
+            [program['program_id'], program['program_name'],
+             [[m['material_id'], m['material_name'], m['part_name'], m['part_number'], m['need_date'],
+               m['adoption_status']] for m in program['materials']]]
+            for program in product_program_materials(product_id, data)
+        ]
+    return materials, programs
+
+def funding_indexes(data):
+    """Return the funding page indexes: details rows, funded tasks and pursuit products per opportunity"""
+    details = {}
+    tasks = {}
+    pursuit_products = {}
+    for funding in data.get('fundingOpportunities', []):
+        funding_id = funding['id']
+        details[funding_id] = [[label, str(value)] for label, value in funding_details(funding)]
+        tasks[funding_id] = [[task['owner_type'], task['owner_id'], task['owner'], task['task'], task['start'],
+                              task['end'], task['status']] for task in funding_related_tasks(funding_id, data)]
+        pursuit_products[funding_id] = {}
+        for pursuit in funding.get('pursuits') or []:
+            rows = related_product_rows(pursuit, data)
+            pursuit_products[funding_id][pursuit['pursuitID']] = None if rows is None else [
+                [row['product_id'], row['product_name'], row['material_id'], row['material_name']] for row in rows
+            ]
+    return details, tasks, pursuit_products
+
+def build_bundle(data, status_colors):
+    """Return the app's data bundle: entities, precomputed indexes and chart series"""
+    data = as_store(data)
+    product_materials, product_programs = product_indexes(data)
+    funding_details_rows, funding_tasks, pursuit_products = funding_indexes(data)
+
+    # Chart series, keyed by entity ID
+    product_gantt = {}
+    product_need = {}
+    for product in data.get('products', []):
+        product_gantt[product['id']] = gantt_rows(product_gantt_tasks(product, data.materials_for_product(product)))
+        product_need[product['id']] = dated_rows(product_need_dates(product['id'], data))
+    funding_timeline = {}
+    pursuit_values = {}
+    for funding in data.get('fundingOpportunities', []):
+        start_date, end_date = funding_period(funding)
+        funding_timeline[funding['id']] = [_day(start_date), _day(end_date)] if start_date else None
+        pursuit_values[funding['id']] = {pursuit['pursuitID']: list(potential_value_series(pursuit))
+                                         for pursuit in funding.get('pursuits') or []}
+
+    return {
+        'format': BUNDLE_FORMAT,
+        'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'entities': {
+            'programs': data.get('programs', []),
+            'products': data.get('products', []),
+            'materialSystems': data.get('materialSystems', []),
+            'printingSuppliers': data.get('printingSuppliers', []),
+            'postProcessingSuppliers': data.get('postProcessingSuppliers', []),
+            'fundingOpportunities': data.get('fundingOpportunities', []),
+        },
+        'indexes': {
+            'productMaterials': product_materials,
+            'productPrograms': product_programs,
+            'materialProducts': {material['id']: [product['id'] for product in data.products_for_material(material['id'])]
+                                 for material in data.get('materialSystems', [])},
+            'materialSuppliers': {material['id']: [supplier['id'] for supplier in data.suppliers_for_material(material['id'])]
+                                  for material in data.get('materialSystems', [])},
+            'postProcessingSupplierProducts': {
+                supplier['id']: [product['id'] for product in data.products_for_post_processing_supplier(supplier['id'])]
+                for supplier in data.get('postProcessingSuppliers', [])
+            },
+            'fundingDetails': funding_details_rows,
+            'fundingTasks': funding_tasks,
+            'pursuitProducts': pursuit_products,
+        },
+        'series': {
+            'productGantt': product_gantt,
+            'productNeedDates': product_need,
+            'materialGantt': {material['id']: gantt_rows(material_gantt_tasks(material))
+                              for material in data.get('materialSystems', [])},
+            'materialMilestones': {material['id']: dated_rows(material_milestones(material))
+                                   for material in data.get('materialSystems', [])},
+            'supplierGantt': {supplier['id']: gantt_rows(supplier_gantt_tasks(supplier))
+                              for supplier in data.get('printingSuppliers', [])
+                              if 'tasks' in (supplier.get('supplierRoadmap') or {})},
+            'fundingTimeline': funding_timeline,
+            'pursuitValues': pursuit_values,
+        },
+        'meta': {
+            'productLanes': PRODUCT_LANES,
+            'fundingColors': FUNDING_COLORS,
+            'statusColors': status_colors,
+            'supplierStatusColors': SUPPLIER_STATUS_COLORS,
+            'businessCaseGroups': BUSINESS_CASE_GROUPS,
+            'materialFields': MATERIAL_FIELDS,
+            'pursuitFields': PURSUIT_FIELDS,
+            'statusClasses': STATUS_CLASSES,
+            'fundingStatusClasses': FUNDING_STATUS_CLASSES,
+            'taskStatusClasses': TASK_STATUS_CLASSES,
+        },
+    }
+
+def minify_bundle(bundle):
+    """Return the bundle as minified UTF-8 JSON"""
+    return json.dumps(bundle, separators=(',', ':'), ensure_ascii=False, default=str).encode('utf-8')
+
+def read_bundle(bundle_path):
+    """Return the data bundle stored in a bundle script written by write_app()"""
+    with open(bundle_path, encoding='ascii') as f:
+        script = f.read()
+    encoded = script[script.index('"') + 1:script.rindex('"')]
+    return json.loads(gzip.decompress(base64.b64decode(encoded)).decode('utf-8'))
+
+def write_app(data, app_dir, status_colors):
+    """Write the data bundle and the viewer shell into app_dir; returns (bundle path, bundle bytes, JSON bytes)"""
+    os.makedirs(app_dir, exist_ok=True)
+
+    with profile_span('app', 'build_bundle'):
+        bundle = build_bundle(data, status_colors)
+    with profile_span('app', 'compress_bundle'):
+        minified = minify_bundle(bundle)
+        # mtime=0 keeps the output identical across runs over the same data
+        compressed = gzip.compress(minified, compresslevel=9, mtime=0)
+
+    # A script file (not a fetched .json.gz) so the app also opens straight from disk
+    bundle_path = os.path.join(app_dir, BUNDLE_FILENAME)
+    with profile_span('save', BUNDLE_FILENAME):
+        with open(bundle_path, 'w', encoding='ascii') as f:
+            f.write(f'window.{BUNDLE_GLOBAL}="{base64.b64encode(compressed).decode("ascii")}";\n')
+
+    # The viewer shell carries its stylesheet inline, so the app directory can be copied anywhere
+    with profile_span('save', APP_PAGE):
+        page = render_template("app.html", stylesheet=inline_stylesheet(),
+                               bundle_src=BUNDLE_FILENAME, bundle_global=BUNDLE_GLOBAL,
+                               bundle_format=BUNDLE_FORMAT)
+        with open(os.path.join(app_dir, APP_PAGE), 'w', encoding='utf-8') as f:
+            f.write(page)
+
+    return bundle_path, os.path.getsize(bundle_path), len(minified)
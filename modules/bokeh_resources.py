@@ -0,0 +1,110 @@
+"""
+Bokeh Resources Module for Roadmap Visualizations
+
+This module lets every generated page share one local copy of BokehJS including:
+1. Copying the BokehJS bundles (and the templated pages' stylesheet) once into the site's static/ directory
+2. Resources that reference that copy by a path relative to each page (no CDN needed)
+3. A save() wrapper and <script> tags for pages built with output_file/save or components()
+"""
+
+import os
+import shutil
+from functools import lru_cache
+
+from bokeh.io import save
+from bokeh.io.state import curstate
+from bokeh.resources import Resources
+from bokeh.util.paths import bokehjs_path
+
+from modules.build_profile import profile_span
+from modules.build_manifest import declare_output
+
+# Directory under the output directory that holds the shared BokehJS copy. Bokeh's
+# "server" resource mode builds its URLs as <root_url>static/js/<bundle>, so the
+# pages can reference it with a relative root_url.
+STATIC_DIRNAME = "static"
+
+# BokehJS bundles copied to static/js; save() only references the ones a page uses
+BOKEH_JS_FILES = (
+    'bokeh.min.js',
+    'bokeh-gl.min.js',
+    'bokeh-widgets.min.js',
+    'bokeh-tables.min.js',
+    'bokeh-mathjax.min.js',
+)
+
+# Components loaded by the hand-written templates around components() output
+TEMPLATE_COMPONENTS = ['bokeh', 'bokeh-widgets', 'bokeh-tables']
+
+# Stylesheet of the templated pages (see html_templates.py), copied to static/css
+SITE_CSS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates", "site.css")
+
+def _copy_if_changed(source, target):
+    """Copy source to target unless target is already an up-to-date copy"""
+    if os.path.exists(target) and os.path.getsize(target) == os.path.getsize(source) \
+            and os.path.getmtime(target) >= os.path.getmtime(source):
+        return
+    shutil.copy2(source, target)
+
+def write_static_resources(output_dir):
+    """Copy the installed BokehJS bundles to <output_dir>/static/js and the site stylesheet to static/css, skipping unchanged files"""
+    source_dir = os.path.join(bokehjs_path(), "js")
+    target_dir = os.path.join(output_dir, STATIC_DIRNAME, "js")
+    os.makedirs(target_dir, exist_ok=True)
+
+    for filename in BOKEH_JS_FILES:
+        _copy_if_changed(os.path.join(source_dir, filename), os.path.join(target_dir, filename))
+
+    css_dir = os.path.join(output_dir, STATIC_DIRNAME, "css")
+    os.makedirs(css_dir, exist_ok=True)
+    _copy_if_changed(SITE_CSS, os.path.join(css_dir, os.path.basename(SITE_CSS)))
+
+    _find_site_root.cache_clear()
+    return target_dir
+
+@lru_cache(maxsize=None)
+def _find_site_root(page_dir):
+    """Return the nearest directory at or above page_dir holding the shared BokehJS copy"""
+    directory = page_dir
+    while True:
+        if os.path.isfile(os.path.join(directory, STATIC_DIRNAME, "js", BOKEH_JS_FILES[0])):
+            return directory
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+def site_root_url(page_path):
+    """Return the relative URL prefix from a page to its site root, or None without a static copy"""
+    page_dir = os.path.dirname(os.path.abspath(page_path))
+    site_root = _find_site_root(page_dir)
+    if site_root is None:
+        return None
+    relative = os.path.relpath(site_root, page_dir)
+    return "" if relative == "." else relative.replace(os.sep, "/") + "/"
+
+def page_resources(page_path):
+    """Return Bokeh resources loading BokehJS from the shared static copy, or None to use Bokeh's default"""
+    root_url = site_root_url(page_path)
+    if root_url is None:
+        return None
+    return Resources(mode="server", root_url=root_url)
+
+def save_page(obj, filename=None, title=None):
+    """Save like bokeh's save(), loading BokehJS from the site's static directory when it exists"""
+    if filename is None:
+        filename = curstate().file.filename if curstate().file else None
+    resources = page_resources(filename) if filename else None
+    if filename:
+        declare_output(filename)
+    with profile_span('save', os.path.basename(filename) if filename else 'page'):
+        return save(obj, filename=filename, resources=resources, title=title)
+
+def bokeh_script_tags(page_path):
+    """Return the <script> tags a components() page needs to load BokehJS"""
+    root_url = site_root_url(page_path)
+    if root_url is None:
+        resources = Resources(mode="cdn", components=TEMPLATE_COMPONENTS)
+    else:
+        resources = Resources(mode="server", root_url=root_url, components=TEMPLATE_COMPONENTS)
+    return "\n        ".join(f'<script src="{url}"></script>' for url in resources.js_files)
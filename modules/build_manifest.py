@@ -0,0 +1,201 @@
+"""
+Build Manifest Module for Roadmap Visualizations
+
+This module records what each generated page was built from including:
+1. Content hashes of roadmap entities and whole collections
+2. A dependency key per task (its arguments, referenced entities, generator code and build date)
+3. A JSON manifest under the output directory so unchanged pages can be skipped on the next run
+4. The files each task declares it writes (declare_output/open_output), so a task whose pages were
+   deleted is rebuilt even if its inputs are unchanged
+"""
+
+import os
+import json
+import hashlib
+from contextlib import contextmanager
+from datetime import datetime
+
+# Bump when the manifest layout changes so old manifests are ignored
+MANIFEST_VERSION = 2
+MANIFEST_FILENAME = "build_manifest.json"
+
+# Hashed in place of the roadmap data when a task receives it as an argument;
+# what the task reads from it is covered by its declared sources instead
+_DATA_MARKER = "<roadmap data>"
+
+def _hash_json(value):
+    """Return a stable SHA-1 hex digest of a JSON-serialisable value"""
+    text = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+# Output paths declared by the task running in this process, or None outside collect_outputs()
+_declared = None
+
+def declare_output(path):
+    """Declare path as a file written by the running task and return it.
+
+    The site writers (save_page, write_page, chart_figure, cached charts and
+    open_output) declare their files, so a generator only calls this for files
+    it writes some other way.
+    """
+    if _declared is not None:
+        _declared.add(os.path.abspath(path))
+    return path
+
+def open_output(path, mode='w', **kwargs):
+    """Open a page file for writing like open(), declaring it as an output of the running task"""
+    return open(declare_output(path), mode, **kwargs)
+
+@contextmanager
+def collect_outputs():
+    """Collect the absolute paths declared with declare_output() in the block"""
+    global _declared
+    previous = _declared
+    _declared = declared = set()
+    try:
+        yield declared
+    finally:
+        _declared = previous
+
+# Files under modules/ that shape the generated pages: generator code, Jinja templates,
+# the shared stylesheet and the viewer script
+FINGERPRINT_EXTENSIONS = ('.py', '.html', '.css', '.js')
+
+def code_fingerprint(directory=None):
+    """Hash the generator sources and templates so any change to them invalidates every cached task"""
+    directory = directory or os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha1()
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if d != '__pycache__')
+        for filename in sorted(files):
+            if filename.endswith(FINGERPRINT_EXTENSIONS):
+                path = os.path.join(root, filename)
+                digest.update(os.path.relpath(path, directory).encode('utf-8'))
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
+
+class BuildManifest:
+    """Dependency keys and results of the tasks built from a roadmap.
+
+    A task's sources say which parts of the roadmap it reads: a collection name
+    such as 'products', or a (collection, id) pair for a single entity. Sources of
+    None mean the task depends on the whole roadmap. The key also covers the
+    task's own arguments (e.g. the entity a page is for), the generator code and
+    today's date, since pages draw a 'today' marker and floating tasks move daily.
+    """
+
+    def __init__(self, path, data, skip_unchanged=True):
+        self.path = path
+        self.data = data
+        self.skip_unchanged = skip_unchanged
+        self.salt = _hash_json({
+            'version': MANIFEST_VERSION,
+            'code': code_fingerprint(),
+            'date': datetime.now().strftime("%Y-%m-%d"),
+        })
+        self.previous = self._load()
+        self.tasks = {}
+        self.built = 0
+        self.skipped = 0
+        self._entity_hashes = {}
+        self._collection_hashes = {}
+
+    def _load(self):
+        """Read the manifest from the last run, ignoring missing or outdated files"""
+        try:
+            with open(self.path, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get('version') != MANIFEST_VERSION:
+            return {}
+        return manifest.get('tasks', {})
+
+    # Content hashes
+
+    def _entity_hashes_for(self, collection):
+        """Return {entity ID: hash} for a collection, keeping the first occurrence of each ID"""
+        if collection not in self._entity_hashes:
+            hashes = {}
+            for entity in self.data.get(collection, []):
+                if isinstance(entity, dict) and 'id' in entity:
+                    hashes.setdefault(entity['id'], _hash_json(entity))
+            self._entity_hashes[collection] = hashes
+        return self._entity_hashes[collection]
+
+    def entity_hash(self, collection, entity_id):
+        """Return the content hash of one entity, or None if it does not exist"""
+        return self._entity_hashes_for(collection).get(entity_id)
+
+    def collection_hash(self, collection):
+        """Return the content hash of a whole top-level collection"""
+        if collection not in self._collection_hashes:
+            self._collection_hashes[collection] = _hash_json(self.data.get(collection))
+        return self._collection_hashes[collection]
+
+    def roadmap_hash(self):
+        """Return the content hash of every top-level collection"""
+        return _hash_json({name: self.collection_hash(name) for name in sorted(self.data.keys())})
+
+    # Task keys
+
+    def task_key(self, task_id, args, sources=None):
+        """Return the dependency key of a task from its arguments and declared sources"""
+        parts = [self.salt, task_id, [_DATA_MARKER if arg is self.data else arg for arg in args]]
+        if sources is None:
+            parts.append(self.roadmap_hash())
+        else:
+            for source in sources:
+                if isinstance(source, str):
+                    parts.append([source, self.collection_hash(source)])
+                else:
+                    collection, entity_id = source
+                    parts.append([collection, entity_id, self.entity_hash(collection, entity_id)])
+        return _hash_json(parts)
+
+    def is_fresh(self, task_id, key):
+        """Return True if the task was built from the same inputs last time"""
+        if not self.skip_unchanged:
+            return False
+        previous = self.previous.get(task_id)
+        if previous is None or previous.get('key') != key:
+            return False
+        # Pages deleted since the last run have to be written again
+        output_dir = os.path.dirname(os.path.abspath(self.path))
+        return all(os.path.exists(os.path.join(output_dir, path)) for path in previous.get('outputs', []))
+
+    def reuse(self, task_id, key):
+        """Carry an unchanged task over to the new manifest and return its cached result"""
+        entry = self.previous[task_id]
+        self.tasks[task_id] = entry
+        self.skipped += 1
+        return entry.get('result')
+
+    def record(self, task_id, key, result, outputs=()):
+        """Record a task that was just built, with the absolute paths of the files it declared"""
+        self.built += 1
+        try:
+            json.dumps(result)
+        except (TypeError, ValueError):
+            # Results that cannot be cached are rebuilt every time
+            return
+        self.tasks[task_id] = {'key': key, 'result': result, 'outputs': self.output_paths(outputs)}
+
+    def output_paths(self, outputs):
+        """Return the declared files that exist inside the output directory, relative to it"""
+        output_dir = os.path.dirname(os.path.abspath(self.path))
+        paths = []
+        for path in outputs:
+            relative = os.path.relpath(path, output_dir)
+            # Caches and other files outside the site are not outputs of the page
+            if not relative.startswith(os.pardir) and os.path.isfile(path):
+                paths.append(relative.replace(os.sep, '/'))
+        return sorted(paths)
+
+    def save(self):
+        """Write the manifest, replacing the previous one in a single step"""
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': MANIFEST_VERSION, 'tasks': self.tasks}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
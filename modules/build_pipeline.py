@@ -0,0 +1,191 @@
+"""
+Build Pipeline Module for Roadmap Visualizations
+
+This module schedules the site generation stages including:
+1. A stage dependency graph so dependent stages (the dashboard) run last
+2. Sequential execution in the main process (the default)
+3. Parallel execution of stages and their per-entity page tasks on a process pool
+4. Skipping tasks whose inputs are unchanged since the last run (see build_manifest)
+5. Timing every task under --profile (see build_profile), including tasks run in pool workers
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from modules.build_profile import run_task, collect_spans, profiling_enabled
+from modules.build_manifest import collect_outputs
+
+# Roadmap data shared with pool workers, set once per worker by _init_worker
+_WORKER_DATA = None
+
+class StageResult:
+    """Placeholder argument that is replaced by the result of another stage"""
+
+    def __init__(self, stage_name):
+        self.stage_name = stage_name
+
+class _DataRef:
+    """Placeholder argument that is replaced by the worker's copy of the roadmap data"""
+
+class Stage:
+    """A named group of (name, func, args, sources) tasks.
+
+    Tasks within a stage are independent of each other. A stage starts once every
+    stage it depends on has finished, and its result is the result of its last task.
+    Dependencies are taken from depends_on plus any StageResult found in task args.
+    A task's sources list the roadmap collections or (collection, id) entities it
+    reads, or None for the whole roadmap; they are only used by the build manifest.
+    """
+
+    def __init__(self, name, tasks, depends_on=()):
+        self.name = name
+        self.tasks = list(tasks)
+        self.depends_on = set(depends_on)
+        for _, _, args, _ in self.tasks:
+            for arg in args:
+                if isinstance(arg, StageResult):
+                    self.depends_on.add(arg.stage_name)
+
+def single_task_stage(name, func, *args, depends_on=(), sources=None):
+    """Create a stage that runs one function call"""
+    return Stage(name, [(name, func, args, sources)], depends_on=depends_on)
+
+def _check_graph(stages):
+    """Validate stage names and dependencies, returning the stages in a runnable order"""
+    by_name = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"Duplicate stage name: {stage.name}")
+        by_name[stage.name] = stage
+
+    ordered = []
+    done = set()
+    pending = list(stages)
+    while pending:
+        ready = [stage for stage in pending if stage.depends_on <= done]
+        if not ready:
+            missing = {dep for stage in pending for dep in stage.depends_on if dep not in by_name}
+            if missing:
+                raise ValueError(f"Unknown stage dependencies: {', '.join(sorted(missing))}")
+            raise ValueError(f"Stage dependency cycle between: {', '.join(stage.name for stage in pending)}")
+        for stage in ready:
+            ordered.append(stage)
+            done.add(stage.name)
+            pending.remove(stage)
+    return ordered
+
+def _resolve_args(args, results):
+    """Replace StageResult placeholders with the finished stage results"""
+    return tuple(results[arg.stage_name] if isinstance(arg, StageResult) else arg for arg in args)
+
+def _init_worker(data):
+    """Pool initializer: keep one copy of the roadmap data per worker process"""
+    global _WORKER_DATA
+    _WORKER_DATA = data
+
+def _run_in_worker(task_id, func, args):
+    """Run a task in a pool worker, swapping the data placeholder for the worker's copy.
+
+    Returns (result, profile spans recorded by the task, files the task declared it wrote).
+    """
+    args = tuple(_WORKER_DATA if isinstance(arg, _DataRef) else arg for arg in args)
+    with collect_outputs() as outputs:
+        result = run_task(task_id, func, args)
+    return result, collect_spans() if profiling_enabled() else [], outputs
+
+def run_stages(stages, data, jobs=1, manifest=None, spans=None):
+    """Run the stages respecting their dependencies and return {stage name: result}.
+
+    With jobs <= 1 every task runs in the main process in stage order. Otherwise
+    tasks are submitted to a ProcessPoolExecutor with `jobs` workers as soon as
+    their stage is ready; the roadmap data is sent to each worker once instead of
+    with every task. With a BuildManifest, tasks whose key is unchanged since the
+    last run, and whose output files all still exist, are skipped and their
+    cached result is used instead. Profile spans
+    recorded by pool workers are appended to the spans list when one is given.
+    """
+    ordered = _check_graph(stages)
+    results = {}
+
+    if jobs <= 1:
+        for stage in ordered:
+            result = None
+            for task_name, func, args, sources in stage.tasks:
+                args = _resolve_args(args, results)
+                task_id = f"{stage.name}/{task_name}"
+                if manifest is None:
+                    result = run_task(task_id, func, args)
+                    continue
+                key = manifest.task_key(task_id, args, sources)
+                if manifest.is_fresh(task_id, key):
+                    result = manifest.reuse(task_id, key)
+                else:
+                    with collect_outputs() as outputs:
+                        result = run_task(task_id, func, args)
+                    manifest.record(task_id, key, result, outputs)
+            results[stage.name] = result
+        return results
+
+    data_ref = _DataRef()
+    pending = list(ordered)
+    remaining = {}
+    last_task = {}
+    futures = {}
+
+    def finish_task(stage_name, is_last, result):
+        if is_last:
+            last_task[stage_name] = result
+        remaining[stage_name] -= 1
+        if remaining[stage_name] == 0:
+            results[stage_name] = last_task.get(stage_name)
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(data,)) as executor:
+        def submit_ready():
+            ready = [s for s in pending if s.depends_on <= results.keys()]
+            while ready:
+                for stage in ready:
+                    pending.remove(stage)
+                    if not stage.tasks:
+                        # Empty stages complete immediately and may unblock others
+                        results[stage.name] = None
+                        continue
+                    remaining[stage.name] = len(stage.tasks)
+                    for index, (task_name, func, args, sources) in enumerate(stage.tasks):
+                        is_last = index == len(stage.tasks) - 1
+                        args = _resolve_args(args, results)
+                        task_id = f"{stage.name}/{task_name}"
+                        key = None
+                        if manifest is not None:
+                            key = manifest.task_key(task_id, args, sources)
+                            if manifest.is_fresh(task_id, key):
+                                finish_task(stage.name, is_last, manifest.reuse(task_id, key))
+                                continue
+                        args = tuple(data_ref if arg is data else arg for arg in args)
+                        future = executor.submit(_run_in_worker, task_id, func, args)
+                        futures[future] = (stage.name, task_name, is_last, task_id, key)
+                ready = [s for s in pending if s.depends_on <= results.keys()]
+
+        submit_ready()
+        while futures:
+            finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage_name, task_name, is_last, task_id, key = futures.pop(future)
+                try:
+                    result, task_spans, outputs = future.result()
+                except Exception:
+                    print(f"Task '{task_name}' in stage '{stage_name}' failed")
+                    for other in futures:
+                        other.cancel()
+                    raise
+                if spans is not None:
+                    spans.extend(task_spans)
+                if manifest is not None:
+                    manifest.record(task_id, key, result, outputs)
+                finish_task(stage_name, is_last, result)
+            submit_ready()
+
+    return results
+
+def default_jobs():
+    """Number of worker processes to use for --jobs 0 (one per CPU)"""
+    return os.cpu_count() or 1
@@ -0,0 +1,213 @@
+"""
+Build Profile Module for Roadmap Visualizations
+
+This module times the site generation for main.py --profile including:
+1. Nested spans (stage task, chart, savefig, page save) with wall time, CPU time and peak memory
+2. Span collection from pool worker processes, returned to the main process with each task result
+3. Optional tracemalloc peaks per span (--profile-memory) and cProfile per stage task (--cprofile)
+4. build_profile.json (machine readable) and build_profile.html (a per-process timeline) in the output directory
+
+Profiling is switched on through the environment so pool worker processes pick it up too.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import pstats
+import cProfile
+import tracemalloc
+from contextlib import contextmanager
+
+# Windows has no resource module; _peak_rss_mb() falls back to psutil there
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Both are kept in the environment so pool worker processes pick them up too
+PROFILE_ENV = "ROADMAP_PROFILE"
+CPROFILE_DIR_ENV = "ROADMAP_PROFILE_CPROFILE_DIR"
+
+PROFILE_JSON = "build_profile.json"
+PROFILE_HTML = "build_profile.html"
+
+# Directory under the output directory that holds the per-task cProfile dumps
+CPROFILE_DIRNAME = "build_profile"
+
+# Functions listed per task from its cProfile run
+HOTSPOTS_PER_TASK = 15
+
+_spans = []
+_stack = []
+
+def configure_profiling(enabled, memory=False, cprofile_dir=None):
+    """Turn span timing on or off for this run; cprofile_dir also runs every stage task under cProfile"""
+    os.environ.pop(PROFILE_ENV, None)
+    os.environ.pop(CPROFILE_DIR_ENV, None)
+    if not enabled:
+        return
+    os.environ[PROFILE_ENV] = "memory" if memory else "timing"
+    if cprofile_dir:
+        os.environ[CPROFILE_DIR_ENV] = os.path.abspath(cprofile_dir)
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+def profiling_enabled():
+    """Return True when spans are being recorded"""
+    return bool(os.environ.get(PROFILE_ENV))
+
+def _start_memory_tracing():
+    """Start tracemalloc in a worker process of a --profile-memory run"""
+    if os.environ.get(PROFILE_ENV) == "memory" and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+def _peak_rss_mb():
+    """Return this process's peak resident set size in MB"""
+    if resource is None:
+        try:
+            import psutil
+        except ImportError:
+            # Without psutil only Python's own allocations are known (and only while tracemalloc runs)
+            return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+@contextmanager
+def profile_span(kind, name):
+    """Record the block as a span of the given kind ('task', 'chart', 'savefig', 'save', ...)"""
+    if not profiling_enabled():
+        yield
+        return
+
+    _start_memory_tracing()
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        # Keep the enclosing span's peak so far before resetting the counter for this one
+        if _stack:
+            _stack[-1]['child_peak'] = max(_stack[-1]['child_peak'], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+    entry = {'child_peak': 0}
+    _stack.append(entry)
+    start = time.time()
+    cpu_start = time.process_time()
+    try:
+        yield
+    finally:
+        wall = time.time() - start
+        cpu = time.process_time() - cpu_start
+        _stack.pop()
+        span = {
+            'kind': kind,
+            'name': name,
+            'pid': os.getpid(),
+            'depth': len(_stack),
+            'start': start,
+            'wall': wall,
+            'cpu': cpu,
+            'peak_rss_mb': round(_peak_rss_mb(), 1),
+        }
+        if tracing:
+            # The peak since the last reset, or a peak recorded before one of the children reset it
+            peak = max(tracemalloc.get_traced_memory()[1], entry['child_peak'])
+            span['peak_traced_mb'] = round(peak / (1024 * 1024), 2)
+            if _stack:
+                _stack[-1]['child_peak'] = max(_stack[-1]['child_peak'], peak)
+        _spans.append(span)
+
+def _hotspots(profiler):
+    """Return the functions with the largest cumulative time in a cProfile run"""
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, function), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        rows.append({
+            'function': f"{os.path.basename(filename)}:{line}({function})",
+            'calls': ncalls,
+            'tottime': round(tottime, 4),
+            'cumtime': round(cumtime, 4),
+        })
+    rows.sort(key=lambda row: row['cumtime'], reverse=True)
+    return rows[:HOTSPOTS_PER_TASK]
+
+def _cprofile_path(task_id):
+    """Return the .prof file for a task's cProfile run"""
+    filename = re.sub(r'[^A-Za-z0-9_.-]+', '_', task_id) + ".prof"
+    return os.path.join(os.environ[CPROFILE_DIR_ENV], filename)
+
+def run_task(task_id, func, args):
+    """Run one stage task inside a 'task' span, under cProfile when requested"""
+    if not profiling_enabled():
+        return func(*args)
+
+    if not os.environ.get(CPROFILE_DIR_ENV):
+        with profile_span('task', task_id):
+            return func(*args)
+
+    profiler = cProfile.Profile()
+    try:
+        with profile_span('task', task_id):
+            profiler.enable()
+            try:
+                return func(*args)
+            finally:
+                profiler.disable()
+    finally:
+        # The task span is the last one to close, so it is the newest span
+        path = _cprofile_path(task_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        profiler.dump_stats(path)
+        _spans[-1]['hotspots'] = _hotspots(profiler)
+        _spans[-1]['cprofile'] = path
+
+def collect_spans():
+    """Return and clear the spans recorded by this process since the last call"""
+    spans = list(_spans)
+    _spans.clear()
+    return spans
+
+def summarize(spans):
+    """Return per-stage and per-kind totals of the recorded spans"""
+    stages = {}
+    kinds = {}
+    for span in spans:
+        totals = kinds.setdefault(span['kind'], {'count': 0, 'wall': 0.0, 'cpu': 0.0})
+        totals['count'] += 1
+        totals['wall'] += span['wall']
+        totals['cpu'] += span['cpu']
+        if span['kind'] == 'task':
+            stage = span['name'].split('/', 1)[0]
+            totals = stages.setdefault(stage, {'tasks': 0, 'wall': 0.0, 'cpu': 0.0, 'peak_rss_mb': 0.0})
+            totals['tasks'] += 1
+            totals['wall'] += span['wall']
+            totals['cpu'] += span['cpu']
+            totals['peak_rss_mb'] = max(totals['peak_rss_mb'], span['peak_rss_mb'])
+    return stages, kinds
+
+def write_profile_report(output_dir, spans, run):
+    """Write build_profile.json and build_profile.html; returns (stage totals, kind totals)"""
+    spans.sort(key=lambda span: span['start'])
+    started = min((span['start'] for span in spans), default=time.time())
+    for span in spans:
+        span['offset'] = round(span['start'] - started, 4)
+        span['wall'] = round(span['wall'], 4)
+        span['cpu'] = round(span['cpu'], 4)
+        if 'cprofile' in span:
+            span['cprofile'] = os.path.relpath(span['cprofile'], output_dir)
+    stages, kinds = summarize(spans)
+
+    report = {
+        'run': run,
+        'stages': stages,
+        'kinds': kinds,
+        'spans': spans,
+    }
+    with open(os.path.join(output_dir, PROFILE_JSON), 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=1, default=str)
+
+    # Render the timeline page (imported here so worker processes never load it)
+    from modules.build_profile_page import generate_profile_page
+    generate_profile_page(report, os.path.join(output_dir, PROFILE_HTML))
+    return stages, kinds
@@ -0,0 +1,149 @@
+"""
+Build Profile Page Module for Roadmap Visualizations
+
+This module renders the --profile report as build_profile.html including:
+1. A timeline of every span, one lane per process, nested spans stacked below their parent
+2. Per-stage totals (tasks, wall time, CPU time, peak memory)
+3. Per-kind totals and the slowest charts and page saves
+4. The top cProfile functions of the slowest tasks (--cprofile runs only)
+"""
+
+import os
+from bokeh.plotting import figure, output_file
+from bokeh.models import ColumnDataSource, HoverTool, Range1d, Div
+from bokeh.layouts import column
+from modules.bokeh_resources import save_page
+
+# Span colors by kind; other kinds are drawn grey
+KIND_COLORS = {
+    'task': '#1f77b4',  # Blue
+    'chart': '#ff7f0e',  # Orange
+    'savefig': '#2ca02c',  # Green
+    'save': '#9467bd',  # Purple
+}
+
+# Rows listed in the slowest-spans and hotspot tables
+SLOWEST_SPANS = 20
+HOTSPOT_TASKS = 5
+
+TABLE_STYLE = 'border="1" cellpadding="5" style="border-collapse: collapse; width: 100%;"'
+HEADER_STYLE = 'style="background-color: #f2f2f2;"'
+
+def _table(headers, rows):
+    """Return an HTML table with the page's table styling"""
+    header = "".join(f"<th>{name}</th>" for name in headers)
+    body = "".join("<tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>" for row in rows)
+    return f'<table {TABLE_STYLE}><tr {HEADER_STYLE}>{header}</tr>{body}</table>'
+
+def _timeline(spans):
+    """Return the timeline figure: one lane per process, one row per nesting depth"""
+    # Lanes in order of each process's first span
+    lanes = {}
+    for span in spans:
+        lane = lanes.setdefault(span['pid'], {'depth': 0})
+        lane['depth'] = max(lane['depth'], span['depth'])
+    row = 0
+    for pid in lanes:
+        lanes[pid]['row'] = row
+        row += lanes[pid]['depth'] + 2
+
+    source = ColumnDataSource({
+        'left': [span['offset'] for span in spans],
+        'right': [span['offset'] + span['wall'] for span in spans],
+        'top': [lanes[span['pid']]['row'] + span['depth'] for span in spans],
+        'bottom': [lanes[span['pid']]['row'] + span['depth'] + 0.9 for span in spans],
+        'color': [KIND_COLORS.get(span['kind'], '#7f7f7f') for span in spans],
+        'name': [span['name'] for span in spans],
+        'kind': [span['kind'] for span in spans],
+        'pid': [span['pid'] for span in spans],
+        'wall': [span['wall'] for span in spans],
+        'cpu': [span['cpu'] for span in spans],
+        'rss': [span['peak_rss_mb'] for span in spans],
+        'traced': [span.get('peak_traced_mb', float('nan')) for span in spans],
+    })
+    end = max((span['offset'] + span['wall'] for span in spans), default=1.0)
+
+    p = figure(width=1200, height=max(200, 40 * row + 80), title="Build Timeline",
+               x_range=Range1d(start=0, end=end * 1.01), y_range=Range1d(start=max(row, 1), end=-0.5),
+               x_axis_label="Seconds since the first span", tools="xpan,xwheel_zoom,reset,save")
+    p.quad(left='left', right='right', top='top', bottom='bottom', color='color',
+           line_color='white', line_width=0.5, source=source)
+    p.add_tools(HoverTool(tooltips=[
+        ("Span", "@name"),
+        ("Kind", "@kind"),
+        ("Process", "@pid"),
+        ("Wall (s)", "@wall{0.000}"),
+        ("CPU (s)", "@cpu{0.000}"),
+        ("Peak RSS (MB)", "@rss{0.0}"),
+        ("Peak traced (MB)", "@traced{0.00}"),
+    ]))
+    p.yaxis.ticker = [lanes[pid]['row'] + 0.45 for pid in lanes]
+    p.yaxis.major_label_overrides = {lanes[pid]['row'] + 0.45: f"pid {pid}" for pid in lanes}
+    p.ygrid.grid_line_color = None
+    return p
+
+def generate_profile_page(report, path):
+    """Write the profile report as an HTML page with a timeline and summary tables"""
+    run = report['run']
+    spans = report['spans']
+    output_file(path, title="Build Profile")
+
+    # Run summary and the color legend
+    legend = " ".join(
+        f'<span style="background-color: {color}; color: white; padding: 2px 6px;">{kind}</span>'
+        for kind, color in KIND_COLORS.items()
+    )
+    summary_html = f"""
+    <div style="margin: 20px 0;">
+        <h1>Build Profile</h1>
+        <p>Generated {run['finished']} &middot; {run['jobs']} job(s) &middot;
+           total {run['wall']:.2f}s wall, {run['cpu']:.2f}s CPU in the main process &middot;
+           peak RSS {run['peak_rss_mb']:.1f} MB &middot; {len(spans)} spans</p>
+        <p>{legend}</p>
+    </div>
+    """
+
+    # Per-stage totals, slowest first
+    stages = sorted(report['stages'].items(), key=lambda item: item[1]['wall'], reverse=True)
+    stage_rows = [
+        (name, totals['tasks'], f"{totals['wall']:.3f}", f"{totals['cpu']:.3f}", f"{totals['peak_rss_mb']:.1f}")
+        for name, totals in stages
+    ]
+    kind_rows = [
+        (kind, totals['count'], f"{totals['wall']:.3f}", f"{totals['cpu']:.3f}")
+        for kind, totals in sorted(report['kinds'].items())
+    ]
+    slowest = sorted((span for span in spans if span['kind'] != 'task'), key=lambda span: span['wall'], reverse=True)
+    slowest_rows = [
+        (span['name'], span['kind'], f"{span['wall']:.3f}", f"{span['cpu']:.3f}", span.get('peak_traced_mb', '-'))
+        for span in slowest[:SLOWEST_SPANS]
+    ]
+    tables_html = f"""
+    <div style="margin-top: 20px;">
+        <h2>Stages</h2>
+        {_table(('Stage', 'Tasks', 'Wall (s)', 'CPU (s)', 'Peak RSS (MB)'), stage_rows)}
+        <h2>Span Kinds</h2>
+        {_table(('Kind', 'Count', 'Wall (s)', 'CPU (s)'), kind_rows)}
+        <h2>Slowest Charts and Saves</h2>
+        {_table(('Span', 'Kind', 'Wall (s)', 'CPU (s)', 'Peak traced (MB)'), slowest_rows)}
+    </div>
+    """
+
+    # cProfile hotspots of the slowest profiled tasks
+    profiled = sorted((span for span in spans if span.get('hotspots')), key=lambda span: span['wall'], reverse=True)
+    hotspots_html = ""
+    for span in profiled[:HOTSPOT_TASKS]:
+        rows = [(row['function'], row['calls'], row['tottime'], row['cumtime']) for row in span['hotspots']]
+        hotspots_html += f"""
+        <h3>{span['name']} ({span['wall']:.3f}s) &middot; <a href="{span['cprofile']}">{os.path.basename(span['cprofile'])}</a></h3>
+        {_table(('Function', 'Calls', 'Own time (s)', 'Cumulative (s)'), rows)}
+        """
+    if hotspots_html:
+        hotspots_html = f'<div style="margin-top: 20px;"><h2>cProfile Hotspots</h2>{hotspots_html}</div>'
+
+    layout = column(
+        Div(text=summary_html, width=1200),
+        _timeline(spans),
+        Div(text=tables_html + hotspots_html, width=1200),
+    )
+    save_page(layout)
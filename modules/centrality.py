@@ -0,0 +1,224 @@
+"""
+Centrality Module for Roadmap Visualizations
+
+This module computes the network analysis centrality metrics on scipy.sparse matrices including:
+1. Betweenness centrality by Brandes' algorithm, run as batched sparse BFS sweeps over many sources at once
+2. Sampled (k-pivot) betweenness with a Hoeffding error bound for large graphs
+3. Eigenvector centrality by power iteration, warm-started from the previous run's converged vector,
+   on strongly connected graphs; other graphs (e.g. acyclic ones) are solved exactly per component
+4. A run-wide mode switch ("exact", "approximate" or "auto") selected with --centrality
+
+Values match networkx's normalized betweenness_centrality and eigenvector_centrality,
+which the metrics page used before.
+"""
+
+import os
+import json
+import math
+import random
+
+import numpy as np
+import scipy.sparse as sp
+import networkx as nx
+
+CENTRALITY_MODES = ('auto', 'exact', 'approximate')
+
+# The mode and pivot count are kept in the environment so pool worker processes pick them up too
+CENTRALITY_MODE_ENV = "ROADMAP_CENTRALITY"
+CENTRALITY_PIVOTS_ENV = "ROADMAP_CENTRALITY_PIVOTS"
+
+# "auto" switches to sampled betweenness above this many nodes
+APPROXIMATE_ABOVE_NODES = 5000
+DEFAULT_PIVOTS = 500
+PIVOT_SEED = 0
+
+# Confidence level of the reported betweenness error bound
+ERROR_CONFIDENCE = 0.95
+
+# Power iteration settings (networkx's eigenvector_centrality defaults)
+EIGENVECTOR_MAX_ITER = 100
+EIGENVECTOR_TOL = 1.0e-6
+
+# The previous run's converged eigenvector, kept with the other build caches (not in the published site)
+WARM_START_PATH = os.path.join(".centrality_cache", "eigenvector_warm_start.json")
+
+# Dense (nodes x sources) cells held per BFS batch
+BATCH_CELLS = 4_000_000
+
+def set_centrality_mode(mode, pivots=None):
+    """Select exact or sampled betweenness for the run; None restores the defaults"""
+    if mode is None:
+        os.environ.pop(CENTRALITY_MODE_ENV, None)
+    elif mode not in CENTRALITY_MODES:
+        raise ValueError(f"Unknown centrality mode {mode!r}; expected one of {', '.join(CENTRALITY_MODES)}")
+    else:
+        os.environ[CENTRALITY_MODE_ENV] = mode
+    if pivots is None:
+        os.environ.pop(CENTRALITY_PIVOTS_ENV, None)
+    else:
+        os.environ[CENTRALITY_PIVOTS_ENV] = str(int(pivots))
+
+def centrality_pivots(n):
+    """Return the number of pivot sources to sample for a graph of n nodes, or None for exact betweenness"""
+    mode = os.environ.get(CENTRALITY_MODE_ENV, 'auto')
+    pivots = int(os.environ.get(CENTRALITY_PIVOTS_ENV, DEFAULT_PIVOTS))
+    if mode == 'exact' or pivots >= n:
+        return None
+    if mode == 'auto' and n <= APPROXIMATE_ABOVE_NODES:
+        return None
+    return pivots
+
+def adjacency_matrix(G):
+    """Return (node list, CSR matrix with A[u, v] = 1 for every edge u -> v) in G's node order"""
+    nodes = list(G.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    rows = [index[u] for u, _ in G.edges()]
+    cols = [index[v] for _, v in G.edges()]
+    A = sp.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(nodes), len(nodes)))
+    return nodes, A
+
+def _dependencies(A, AT, sources):
+    """Return the summed Brandes dependencies of every node on a batch of sources"""
+    n = A.shape[0]
+    batch = np.arange(len(sources))
+    sigma = np.zeros((n, len(sources)))
+    sigma[sources, batch] = 1.0
+    visited = sigma > 0
+    levels = [visited.copy()]
+
+    # Forward sweep: count shortest paths level by level
+    frontier = sigma.copy()
+    while True:
+        reached = AT @ frontier
+        reached[visited] = 0.0
+        level = reached > 0
+        if not level.any():
+            break
+        sigma += reached
+        visited |= level
+        levels.append(level)
+        frontier = reached
+
+    # Backward sweep: accumulate dependencies from the deepest level up
+    delta = np.zeros_like(sigma)
+    safe_sigma = np.where(sigma > 0, sigma, 1.0)
+    for depth in range(len(levels) - 1, 0, -1):
+        weights = np.where(levels[depth], (1.0 + delta) / safe_sigma, 0.0)
+        delta += np.where(levels[depth - 1], sigma * (A @ weights), 0.0)
+
+    # A source has no dependency on itself
+    delta[sources, batch] = 0.0
+    return delta.sum(axis=1)
+
+def betweenness_centrality(G, pivots=None, seed=PIVOT_SEED):
+    """Return ({node: betweenness}, error bound) for a directed graph.
+
+    With pivots set, only that many randomly chosen sources are swept and the result is
+    scaled up; the bound is the largest deviation from the exact value at ERROR_CONFIDENCE.
+    Exact results carry a bound of 0.0.
+    """
+    nodes, A = adjacency_matrix(G)
+    n = len(nodes)
+    if n == 0:
+        return {}, 0.0
+
+    if pivots is None or pivots >= n:
+        sources = list(range(n))
+    else:
+        sources = sorted(random.Random(seed).sample(range(n), pivots))
+
+    AT = A.T.tocsr()
+    totals = np.zeros(n)
+    batch_size = max(1, BATCH_CELLS // n)
+    for start in range(0, len(sources), batch_size):
+        totals += _dependencies(A, AT, sources[start:start + batch_size])
+
+    # Normalize like networkx: by the (n-1)(n-2) ordered pairs, scaled up by n/k when sampling
+    scale = 1.0 / ((n - 1) * (n - 2)) if n > 2 else 1.0
+    scale *= n / len(sources)
+    values = totals * scale
+
+    error_bound = 0.0
+    if len(sources) < n and n > 2:
+        # Each sampled source contributes a value in [0, n/(n-1)] to the mean (Hoeffding's inequality)
+        spread = n / (n - 1)
+        error_bound = spread * math.sqrt(math.log(2 / (1 - ERROR_CONFIDENCE)) / (2 * len(sources)))
+    return dict(zip(nodes, values.tolist())), error_bound
+
+def power_iteration_applies(G):
+    """Return True if power iteration on A^T + I converges to a unique eigenvector for G.
+
+    By Perron-Frobenius that needs a strongly connected graph. Otherwise, e.g. on an
+    acyclic graph, the dominant eigenvalue 1 is repeated and the iteration drifts without
+    converging, so callers should go straight to exact_eigenvector_centrality.
+    """
+    return G.number_of_nodes() > 0 and nx.is_strongly_connected(G)
+
+def eigenvector_centrality(G, start=None, max_iter=EIGENVECTOR_MAX_ITER, tol=EIGENVECTOR_TOL):
+    """Return ({node: value}, iterations, residual, converged) by power iteration on A^T + I.
+
+    start optionally maps nodes to a previous solution; nodes it does not cover start at
+    the uniform value. The residual is the L1 change of the last iteration.
+    """
+    nodes, A = adjacency_matrix(G)
+    n = len(nodes)
+    if n == 0:
+        return {}, 0, 0.0, True
+
+    AT = A.T.tocsr()
+    x = np.full(n, 1.0 / n)
+    if start:
+        x = np.array([start.get(node, 1.0 / n) for node in nodes], dtype=float)
+        if not x.any():
+            x = np.full(n, 1.0 / n)
+    x /= x.sum()
+
+    residual = 0.0
+    for iteration in range(1, max_iter + 1):
+        previous = x
+        x = previous + AT @ previous
+        x /= np.linalg.norm(x) or 1.0
+        residual = float(np.abs(x - previous).sum())
+        if residual < n * tol:
+            return dict(zip(nodes, x.tolist())), iteration, residual, True
+    return dict(zip(nodes, x.tolist())), max_iter, residual, False
+
+def exact_eigenvector_centrality(G):
+    """Return {node: value} solved exactly (scipy eigs via networkx) per weakly connected component.
+
+    This is the metrics page's original computation, used when power iteration does not
+    apply or does not converge: single nodes get 1.0, components without a unique solution get 0.01, and
+    the values of a disconnected graph are scaled so the largest is 1.
+    """
+    try:
+        return nx.eigenvector_centrality_numpy(G)
+    except nx.NetworkXException:
+        pass
+    values = {}
+    for component in nx.weakly_connected_components(G):
+        if len(component) == 1:
+            values[next(iter(component))] = 1.0
+            continue
+        try:
+            values.update(nx.eigenvector_centrality_numpy(G.subgraph(component)))
+        except (nx.NetworkXException, RuntimeError, TypeError, ValueError, ArithmeticError):
+            # Not strongly connected, ARPACK did not converge, or too small for eigs
+            values.update((node, 0.01) for node in component)
+    largest = max(values.values(), default=0.0)
+    if largest > 0:
+        values = {node: value / largest for node, value in values.items()}
+    return values
+
+def load_warm_start(path):
+    """Return the eigenvector saved by the previous run at path, or None"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('eigenvector')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def save_warm_start(path, vector):
+    """Save a converged eigenvector for the next run's warm start"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'eigenvector': vector}, f, sort_keys=True)
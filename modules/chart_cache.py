@@ -0,0 +1,203 @@
+"""
+Chart Cache Module for Roadmap Visualizations
+
+This module skips re-rendering static charts whose inputs are unchanged including:
+1. The @cached_chart decorator for chart functions that take the output path first
+2. Keys hashed from the generator code (every module and template, so helpers and color tables count too),
+   the chart's input series and rendering parameters (DPI profile)
+3. A content-addressed store of rendered files, linked or copied into place on a hit
+4. Hit/miss statistics and eviction by total size and age
+
+The cache directory is kept in the environment (like the DPI profile) so pool
+worker processes use the same cache as the main process.
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import functools
+from datetime import date, datetime
+
+import matplotlib
+
+from modules.chart_renderer import DPI_PROFILE_ENV
+from modules.build_profile import profile_span
+from modules.build_manifest import code_fingerprint, declare_output
+
+# Bump when the key layout changes so older cache entries are never reused
+CACHE_VERSION = 2
+
+CACHE_DIR_ENV = "ROADMAP_CHART_CACHE"
+DEFAULT_CACHE_DIR = ".chart_cache"
+
+# Eviction limits applied by prune()
+MAX_CACHE_BYTES = 200 * 1024 * 1024
+MAX_CACHE_AGE_DAYS = 30
+
+_caches = {}
+_code_fingerprint = None
+
+def _normalize(value):
+    """Return a JSON-serialisable, order-stable form of a chart input"""
+    if isinstance(value, dict):
+        return [[_normalize(k), _normalize(v)] for k, v in value.items()]
+    if isinstance(value, (list, tuple, set, frozenset, range)) or type(value).__name__ in ('dict_keys', 'dict_values'):
+        items = [_normalize(item) for item in value]
+        return sorted(items, key=repr) if isinstance(value, (set, frozenset)) else items
+    if hasattr(value, 'tolist'):
+        # numpy arrays and scalars
+        return _normalize(value.tolist())
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return repr(value)
+
+def _code_hash():
+    """Hash the generator code once per process; a chart depends on its function and everything it calls"""
+    global _code_fingerprint
+    if _code_fingerprint is None:
+        _code_fingerprint = code_fingerprint()
+    return _code_fingerprint
+
+def chart_key(func, args, kwargs, suffix=""):
+    """Return the content hash of a chart: its function, inputs and rendering parameters"""
+    parts = [
+        CACHE_VERSION,
+        f"{func.__module__}.{func.__qualname__}",
+        _code_hash(),
+        _normalize(args),
+        _normalize(sorted(kwargs.items())),
+        os.environ.get(DPI_PROFILE_ENV),
+        matplotlib.__version__,
+        suffix,
+    ]
+    text = json.dumps(parts, sort_keys=True)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+class ChartCache:
+    """Rendered chart files stored by key under a cache directory"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+
+    def _entry_path(self, key, suffix):
+        """Return where the file for key is stored (fanned out by the first two hex digits)"""
+        return os.path.join(self.directory, key[:2], key + suffix)
+
+    def fetch(self, key, path):
+        """Place the cached file for key at path; returns False on a miss"""
+        entry = self._entry_path(key, os.path.splitext(path)[1])
+        if not os.path.exists(entry):
+            self.misses += 1
+            return False
+        _place(entry, path)
+        # Refresh the entry's age so eviction drops the least recently used charts first
+        os.utime(entry)
+        self.hits += 1
+        return True
+
+    def store(self, key, path):
+        """Copy a freshly rendered file into the cache"""
+        entry = self._entry_path(key, os.path.splitext(path)[1])
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        tmp_path = f"{entry}.{os.getpid()}.tmp"
+        shutil.copyfile(path, tmp_path)
+        os.replace(tmp_path, entry)
+        self.stored += 1
+
+    def entries(self):
+        """Return (path, size, modification time) for every cached file"""
+        found = []
+        for root, _, files in os.walk(self.directory):
+            for filename in files:
+                if filename.endswith('.tmp'):
+                    continue
+                path = os.path.join(root, filename)
+                stat = os.stat(path)
+                found.append((path, stat.st_size, stat.st_mtime))
+        return found
+
+    def prune(self, max_bytes=MAX_CACHE_BYTES, max_age_days=MAX_CACHE_AGE_DAYS):
+        """Evict entries older than max_age_days, then the least recently used until under max_bytes.
+
+        Returns the number of entries evicted.
+        """
+        entries = sorted(self.entries(), key=lambda entry: entry[2])
+        cutoff = time.time() - max_age_days * 86400
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for path, size, mtime in entries:
+            if mtime >= cutoff and total <= max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            evicted += 1
+        return evicted
+
+    def stats(self):
+        """Return the hit/miss counters and the size of the cache directory"""
+        entries = self.entries()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'stored': self.stored,
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+        }
+
+def _place(entry, path):
+    """Hard-link the cached file to path, copying when links are not possible"""
+    if os.path.lexists(path):
+        os.remove(path)
+    try:
+        os.link(entry, path)
+    except OSError:
+        shutil.copyfile(entry, path)
+
+def configure_chart_cache(directory):
+    """Use directory as the chart cache for this run (and its worker processes); None disables it"""
+    if directory is None:
+        os.environ.pop(CACHE_DIR_ENV, None)
+    else:
+        os.environ[CACHE_DIR_ENV] = os.path.abspath(directory)
+
+def chart_cache():
+    """Return this process's cache for the configured directory, or None when caching is off"""
+    directory = os.environ.get(CACHE_DIR_ENV)
+    if not directory:
+        return None
+    if directory not in _caches:
+        _caches[directory] = ChartCache(directory)
+    return _caches[directory]
+
+def cached_chart(func):
+    """Decorate a chart function called as func(path, *inputs, **params) that writes one file at path.
+
+    On a hit the cached file is placed at path and func is not called.
+    """
+    @functools.wraps(func)
+    def wrapper(path, *args, **kwargs):
+        with profile_span('chart', f"{func.__name__}:{os.path.basename(path)}"):
+            return _render_cached(func, path, args, kwargs)
+    return wrapper
+
+def _render_cached(func, path, args, kwargs):
+    """Place the cached chart at path, or render it with func and cache it"""
+    cache = chart_cache()
+    key = chart_key(func, args, kwargs) if cache is not None else None
+    if cache is not None and cache.fetch(key, declare_output(path)):
+        return None
+
+    # Never render into a file that may be a link to a cache entry
+    if os.path.lexists(path):
+        os.remove(path)
+    result = func(path, *args, **kwargs)
+    if cache is not None and os.path.exists(path):
+        cache.store(key, path)
+    return result
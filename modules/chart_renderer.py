@@ -0,0 +1,81 @@
+"""
+Chart Renderer Module for Roadmap Visualizations
+
+This module renders the static Matplotlib charts (PNG files) including:
+1. Forcing the non-interactive Agg backend, so no chart ever needs a display
+2. Reusable figures (one per size and process) drawn through the object-oriented API
+   instead of the pyplot state machine
+3. DPI profiles ("preview" at 100 dpi, "print" at 300 dpi) selected once per run with --chart-dpi
+4. A render counter for the --profile summary
+
+Charts are rendered in whichever process runs their page task, so with --jobs the
+build pipeline's worker pool renders them in parallel.
+"""
+
+import os
+from contextlib import contextmanager
+
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from modules.build_profile import profile_span
+from modules.build_manifest import declare_output
+
+DPI_PROFILES = {
+    'preview': 100,
+    'print': 300,
+}
+
+# The profile is kept in the environment so pool worker processes pick it up too
+DPI_PROFILE_ENV = "ROADMAP_CHART_DPI"
+
+_figures = {}
+_rendered = 0
+
+def set_dpi_profile(profile):
+    """Select a DPI profile for every chart of the run; None keeps each chart's own DPI"""
+    if profile is None:
+        os.environ.pop(DPI_PROFILE_ENV, None)
+        return
+    if profile not in DPI_PROFILES:
+        raise ValueError(f"Unknown DPI profile {profile!r}; expected one of {', '.join(DPI_PROFILES)}")
+    os.environ[DPI_PROFILE_ENV] = profile
+
+def chart_dpi(default):
+    """Return the DPI to save a chart at: the run's profile, or the chart's default without one"""
+    return DPI_PROFILES.get(os.environ.get(DPI_PROFILE_ENV), default)
+
+def reusable_figure(figsize):
+    """Return this process's cleared figure of the given size, creating it on first use"""
+    fig = _figures.get(figsize)
+    if fig is None:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        _figures[figsize] = fig
+    fig.clf()
+    fig.subplotpars.reset()
+    fig.set_facecolor('white')
+    return fig
+
+@contextmanager
+def chart_figure(path, figsize, dpi=300):
+    """Yield a cleared reusable figure and save it to path when the block completes.
+
+    The block draws on the figure with the object-oriented API (fig.subplots(), ax.bar(), ...).
+    The PNG is saved with a tight bounding box at chart_dpi(dpi).
+    """
+    global _rendered
+    fig = reusable_figure(figsize)
+    try:
+        yield fig
+        with profile_span('savefig', os.path.basename(path)):
+            fig.savefig(declare_output(path), dpi=chart_dpi(dpi), bbox_inches='tight')
+        _rendered += 1
+    finally:
+        fig.clf()
+
+def render_stats():
+    """Return the charts rendered and figures held by this process"""
+    return {'charts': _rendered, 'figures': len(_figures)}
@@ -0,0 +1,93 @@
+"""
+Date Parsing Module for Roadmap Visualizations
+
+This module provides the shared date parser used across the codebase including:
+1. A bounded LRU cache of parsed date strings
+2. A fast path for ISO dates (YYYY-MM-DD) that skips datetime.strptime
+3. Counting (and sampling) invalid date strings instead of silently replacing them
+4. Hit/miss counters for the --profile run summary
+"""
+
+from datetime import datetime
+from functools import lru_cache
+
+DATE_FORMAT = "%Y-%m-%d"
+
+# Distinct date strings kept parsed; roadmaps reuse a small set of dates across many tasks
+CACHE_SIZE = 4096
+
+# Number of distinct invalid date strings kept for reporting
+INVALID_SAMPLE_SIZE = 20
+
+_invalid_count = 0
+_invalid_samples = []
+
+def _parse_iso(text):
+    """Parse a YYYY-MM-DD string without strptime, or return None if it is not in that exact shape"""
+    if len(text) == 10 and text[4] == '-' and text[7] == '-':
+        year, month, day = text[:4], text[5:7], text[8:]
+        if year.isdigit() and month.isdigit() and day.isdigit():
+            return datetime(int(year), int(month), int(day))
+    return None
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_cached(text, fmt):
+    """Parse a date string; raises ValueError or TypeError like datetime.strptime (errors are not cached)"""
+    if fmt == DATE_FORMAT and isinstance(text, str):
+        parsed = _parse_iso(text)
+        if parsed is not None:
+            return parsed
+    return datetime.strptime(text, fmt)
+
+def _record_invalid(text):
+    """Count an invalid date string and keep a sample of the distinct ones"""
+    global _invalid_count
+    # Blank dates are "not set" rather than invalid
+    if isinstance(text, str) and not text.strip():
+        return
+    _invalid_count += 1
+    if len(_invalid_samples) < INVALID_SAMPLE_SIZE and text not in _invalid_samples:
+        _invalid_samples.append(text)
+
+def parse_date(text, fmt=DATE_FORMAT):
+    """Parse a date string through the shared cache.
+
+    Behaves like datetime.strptime(text, fmt): invalid or non-string values raise
+    ValueError or TypeError, and are counted in date_parse_stats().
+    """
+    try:
+        return _parse_cached(text, fmt)
+    except TypeError:
+        # Not a string (None, numbers, lists); strptime raises its usual error
+        _record_invalid(repr(text))
+        return datetime.strptime(text, fmt)
+    except ValueError:
+        _record_invalid(text)
+        raise
+
+def parse_date_or_none(text, fmt=DATE_FORMAT):
+    """Parse a date string, returning None for blank or invalid values (invalid ones are counted)"""
+    if not text:
+        return None
+    try:
+        return parse_date(text, fmt)
+    except (ValueError, TypeError):
+        return None
+
+def date_parse_stats():
+    """Return the cache counters: hits, misses, cached entries, invalid values and a sample of them"""
+    info = _parse_cached.cache_info()
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'cached': info.currsize,
+        'invalid': _invalid_count,
+        'invalid_samples': list(_invalid_samples),
+    }
+
+def clear_date_cache():
+    """Empty the cache and reset the counters"""
+    global _invalid_count
+    _parse_cached.cache_clear()
+    _invalid_count = 0
+    _invalid_samples.clear()
@@ -0,0 +1,76 @@
+"""
+Dependency Chains Module for Roadmap Visualizations
+
+This module finds the program -> product -> material -> supplier chains of the roadmap network including:
+1. A dynamic program over the graph's layers (each chain step moves to a higher 'layer' attribute)
+2. Exact chain counts for every program-supplier pair, without enumerating the chains
+3. The k shortest chains per pair, ties broken in the graph's adjacency order, so output is deterministic
+
+Funding links point back into the programs (a lower layer), so they never form part of a chain.
+"""
+
+import heapq
+
+# Longest chain considered, in edges (program -> product -> material -> supplier is 3)
+CHAIN_MAX_EDGES = 4
+
+# Chains listed per program-supplier pair
+CHAINS_PER_PAIR = 5
+
+def _forward_successors(G, node, layers):
+    """Return the successors of node on a higher layer, in adjacency order"""
+    layer = layers[node]
+    if layer is None:
+        return []
+    return [succ for succ in G.successors(node) if layers[succ] is not None and layers[succ] > layer]
+
+def dependency_chains(G, sources, targets, max_edges=CHAIN_MAX_EDGES, k=CHAINS_PER_PAIR):
+    """Return {(source, target): (chain count, [chains])} for every connected source-target pair.
+
+    Counts include every chain of 1 to max_edges edges. The chains listed are the k shortest
+    as node tuples; chains of equal length keep the order a depth-first search would find them in.
+    Pairs follow the order of sources, then targets.
+    """
+    layers = {node: G.nodes[node].get('layer') for node in G.nodes()}
+    targets = list(targets)
+    target_set = set(targets)
+
+    # Per node: {target: (chain counts by edge count, k best (edges, successor ranks, chain) entries)}
+    table = {}
+    order = sorted((node for node in G.nodes() if layers[node] is not None), key=lambda node: -layers[node])
+    for node in order:
+        reach = {}
+        if node in target_set:
+            counts = [0] * (max_edges + 1)
+            counts[0] = 1
+            reach[node] = (counts, [(0, (), (node,))])
+
+        # Extend every successor's chains by one step back to this node
+        candidates = {}
+        for rank, succ in enumerate(_forward_successors(G, node, layers)):
+            for target, (succ_counts, succ_best) in table.get(succ, {}).items():
+                if target == node:
+                    continue
+                counts, _ = reach.setdefault(target, ([0] * (max_edges + 1), []))
+                for edges in range(max_edges):
+                    counts[edges + 1] += succ_counts[edges]
+                candidates.setdefault(target, []).extend(
+                    (edges + 1, (rank,) + ranks, (node,) + chain)
+                    for edges, ranks, chain in succ_best if edges < max_edges
+                )
+        for target, entries in candidates.items():
+            reach[target] = (reach[target][0], heapq.nsmallest(k, entries, key=lambda entry: entry[:2]))
+        table[node] = reach
+
+    # Report each source-target pair with at least one chain
+    chains = {}
+    for source in sources:
+        reach = table.get(source, {})
+        for target in targets:
+            if target == source or target not in reach:
+                continue
+            counts, best = reach[target]
+            total = sum(counts[1:])
+            if total:
+                chains[(source, target)] = (total, [chain for _, _, chain in best])
+    return chains
@@ -0,0 +1,107 @@
+"""
+Floating Tasks Module for Roadmap Visualizations
+
+This module shifts floating tasks forward in time including:
+1. Collecting the floating tasks of programs, products, material systems and supplier roadmaps
+2. Shifting all of their dates in one batch with datetime64 arithmetic
+3. Per-section counts of the shifted tasks
+4. Marking a written dataset as shifted so later runs only shift by the days since
+"""
+
+from datetime import date
+
+import numpy as np
+
+from modules.task_table import parse_dates
+
+# Top-level key recording the day a written dataset was shifted to
+SHIFTED_TO_KEY = 'floatingTasksShiftedTo'
+
+# Task lists that can hold floating tasks: (collection, path to the list, start key, end key)
+FLOATING_SECTIONS = (
+    ('programs', ('roadmap', 'tasks'), 'start', 'end'),
+    ('products', ('designTools',), 'start', 'end'),
+    ('products', ('documentation',), 'start', 'end'),
+    ('products', ('specialNDT',), 'startDate', 'endDate'),
+    ('products', ('partAcceptance',), 'startDate', 'endDate'),
+    ('products', ('roadmap',), 'start', 'end'),
+    ('materialSystems', ('roadmap',), 'startDate', 'endDate'),
+    ('printingSuppliers', ('supplierRoadmap', 'tasks'), 'start', 'end'),
+    ('postProcessingSuppliers', ('supplierRoadmap', 'tasks'), 'start', 'end'),
+)
+
+def section_name(collection, path):
+    """Return the name floating task counts are reported under, e.g. 'products.roadmap'"""
+    return '.'.join((collection,) + path)
+
+def _task_list(entity, path):
+    """Return the list at path inside an entity, or an empty list"""
+    value = entity
+    for key in path:
+        if not isinstance(value, dict):
+            return []
+        value = value.get(key)
+    return value if isinstance(value, list) else []
+
+def is_floating(task):
+    """Return whether a task floats (material tasks use 'floatOnRoadmap', the others 'float')"""
+    return bool(task.get('float', False) or task.get('floatOnRoadmap', False)) and bool(task.get('floatDate'))
+
+def collect_floating_tasks(data):
+    """Return (task, section, start key, end key) for every floating task with a float date"""
+    floating = []
+    for collection, path, start_key, end_key in FLOATING_SECTIONS:
+        section = section_name(collection, path)
+        for entity in data.get(collection, []):
+            if not isinstance(entity, dict):
+                continue
+            for task in _task_list(entity, path):
+                if isinstance(task, dict) and is_floating(task):
+                    floating.append((task, section, start_key, end_key))
+    return floating
+
+def _to_days(values):
+    """Parse date strings into a datetime64[D] array (NaT where blank or invalid)"""
+    return parse_dates(values).to_numpy().astype('datetime64[D]')
+
+def shift_floating_tasks(data, today=None):
+    """Shift every floating task by the days elapsed since its float date.
+
+    A dataset already shifted to an earlier day (see SHIFTED_TO_KEY) is only
+    shifted by the days since then. Returns (shifted counts per section, number
+    of floating tasks skipped for invalid dates).
+    """
+    today = np.datetime64(today or date.today(), 'D')
+    floating = collect_floating_tasks(data)
+    if not floating:
+        return {}, 0
+
+    tasks, sections, start_keys, end_keys = zip(*floating)
+    float_dates = _to_days([task['floatDate'] for task in tasks])
+    starts = _to_days([task.get(start_key) or '' for task, start_key in zip(tasks, start_keys)])
+    ends = _to_days([task.get(end_key) or '' for task, end_key in zip(tasks, end_keys)])
+
+    # Days to shift: since the float date, or since the day the dataset was already shifted to
+    shifted_to = data.get(SHIFTED_TO_KEY)
+    if shifted_to:
+        float_dates = np.maximum(float_dates, np.datetime64(shifted_to, 'D'))
+    days = today - float_dates
+
+    # Tasks with a start date move; their end date moves with them when there is one
+    has_start = np.array([bool(task.get(start_key)) for task, start_key in zip(tasks, start_keys)])
+    shift = (days > np.timedelta64(0, 'D')) & ~np.isnat(starts)
+    new_starts = np.datetime_as_string(np.where(shift, starts + days, starts), unit='D')
+    new_ends = np.datetime_as_string(np.where(shift, ends + days, ends), unit='D')
+    has_end = ~np.isnat(ends)
+
+    counts = {}
+    for i in np.flatnonzero(shift):
+        task = tasks[i]
+        task[start_keys[i]] = str(new_starts[i])
+        if has_end[i]:
+            task[end_keys[i]] = str(new_ends[i])
+        counts[sections[i]] = counts.get(sections[i], 0) + 1
+
+    # Floating tasks whose float date or start date could not be parsed are left alone
+    skipped = int(np.count_nonzero(has_start & (np.isnat(float_dates) | np.isnat(starts))))
+    return counts, skipped
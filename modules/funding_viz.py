@@ -1,483 +1,276 @@
 import os
 from datetime import datetime, timedelta
-from bokeh.plotting import figure, save, output_file
+from bokeh.plotting import figure, output_file
 from bokeh.models import ColumnDataSource, HoverTool, Label, Range1d, Span, Legend, LegendItem, Div, Tabs, Panel
 from bokeh.layouts import column, row, layout, gridplot
 from bokeh.palettes import Category10, Spectral6
 from bokeh.transform import factor_cmap
-import matplotlib.pyplot as plt
 import numpy as np
-from .pursuit_viz import generate_pursuit_section, generate_pursuits_summary
+from .pursuit_viz import generate_pursuit_section, generate_pursuits_summary, parse_related_products
+from .roadmap_store import as_store
+from .bokeh_resources import save_page
+from .build_manifest import open_output
+from .html_templates import format_rows, write_page
+from .date_parsing import parse_date
+from .chart_renderer import chart_figure
+from .chart_cache import cached_chart
+from .gantt import gantt_task, gantt_figure, gantt_layout, draw_gantt
+
+# CSS classes (see templates/site.css) of the funding status badge and the related task status cells
+FUNDING_STATUS_CLASSES = {
+    'Awarded': 'funding-status-awarded',
+    'Closed': 'funding-status-closed',
+    'Pursuing': 'funding-status-pursuing',
+    'Reshaping': 'funding-status-reshaping',
+}
+TASK_STATUS_CLASSES = {
+    'Complete': 'task-status-complete',
+    'In Progress': 'task-status-inprogress',
+    'Planned': 'task-status-planned',
+}
+
+# Row pattern of the related tasks table (format_rows escapes the values)
+RELATED_TASK_ROW = ('<tr><td>{0}</td><td>{1}</td><td><a href="{2}">{3}</a></td><td>{4}</td><td>{5}</td>'
+                    '<td class="status-cell {6}">{7}</td></tr>\n')
+
+# Page of each related task's owner, relative to the site root
+OWNER_PAGES = {
+    'program': 'programs/program_',
+    'product': 'products/product_',
+    'supplier': 'suppliers/supplier_',
+}
+
+FUNDING_TOOLTIPS = [
+    ("Name", "@name"),
+    ("Type", "@type"),
+    ("Start", "@start{%F}"),
+    ("End", "@end{%F}"),
+    ("Amount", "@amount")
+]
 
 def generate_funding_visualizations(data, output_dir):
     """Generate visualizations for funding opportunities"""
     print("Generating funding opportunity visualizations...")
     
+    for _, func, args, _ in funding_visualization_tasks(as_store(data), output_dir):
+        func(*args)
+    
+    print(f"Funding opportunity visualizations generated in '{os.path.join(output_dir, 'funding')}'")
+
+def funding_visualization_tasks(data, output_dir):
+    """Return the independent (name, func, args, sources) tasks that make up the funding visualizations"""
     # Create funding directory if it doesn't exist
     funding_dir = os.path.join(output_dir, "funding")
     if not os.path.exists(funding_dir):
         os.makedirs(funding_dir)
     
-    # Generate individual funding opportunity pages
+    tasks = []
+    
+    # Individual funding opportunity pages
     if 'fundingOpportunities' in data:
         for funding in data['fundingOpportunities']:
-            generate_funding_page(funding, data, funding_dir)
-    
-    # Generate funding summary page
-    generate_funding_summary(data, funding_dir)
+            tasks.append((f"funding_{funding['id']}", generate_funding_page, (funding, data, funding_dir),
+                          funding_page_sources(funding, data)))
     
-    # Generate funding distribution charts
-    generate_funding_distribution_charts(data, funding_dir)
+    # Funding summary page and distribution charts
+    tasks.append(("funding_summary", generate_funding_summary, (data, funding_dir), ('fundingOpportunities',)))
+    tasks.append(("funding_distribution", generate_funding_distribution_charts, (data, funding_dir),
+                  ('fundingOpportunities',)))
     
-    # Generate pursuits summary page
+    # Pursuits summary page (built from the opportunities passed to it)
     if 'fundingOpportunities' in data:
-        generate_pursuits_summary(data['fundingOpportunities'], data, funding_dir)
+        tasks.append(("pursuits_summary", generate_pursuits_summary,
+                      (data['fundingOpportunities'], data, funding_dir), ()))
     
-    print(f"Funding opportunity visualizations generated in '{funding_dir}'")
+    return tasks
 
-def generate_funding_page(funding, data, funding_dir):
-    """Generate a detailed page for a single funding opportunity"""
-    funding_id = funding['id']
-    
-    # Map field names from the actual data structure to the expected structure
-    funding_name = funding.get('name', funding.get('announcementName', 'Unknown'))
-    funding_type = funding.get('type', funding.get('pursuitType', 'N/A'))
-    funding_source = funding.get('source', funding.get('customer', 'N/A'))
-    funding_amount = funding.get('amount', funding.get('fundingAmount', 'N/A'))
-    
-    # Create funding info section
-    funding_info = f"""
-    <div style="margin-bottom: 20px; padding: 15px; background-color: #f0f0f0; border-radius: 5px; box-shadow: 0 2px 5px rgba(0,0,0,0.1);">
-        <h2 style="color: #2c3e50; border-bottom: 2px solid #3498db; padding-bottom: 10px;">Funding Opportunity Details: {funding_name}</h2>
-        <table style="width: 100%; border-collapse: collapse;">
-            <tr>
-                <td style="padding: 12px; border-bottom: 1px solid #ddd; width: 30%;"><strong>ID:</strong></td>
-                <td style="padding: 12px; border-bottom: 1px solid #ddd;">{funding_id}</td>
-            </tr>
-            <tr>
-                <td style="padding: 12px; border-bottom: 1px solid #ddd;"><strong>Type:</strong></td>
-                <td style="padding: 12px; border-bottom: 1px solid #ddd;">{funding_type}</td>
-            </tr>
-            <tr>
-                <td style="padding: 12px; border-bottom: 1px solid #ddd;"><strong>Source:</strong></td>
-                <td style="padding: 12px; border-bottom: 1px solid #ddd;">{funding_source}</td>
-            </tr>
-    """
+def funding_page_sources(funding, data):
+    """Return the entities a funding page reads: owners of funded tasks and pursuit products/materials"""
+    owner_collections = {'program': 'programs', 'product': 'products', 'supplier': 'printingSuppliers'}
+    sources = [(owner_collections[owner_type], owner['id'])
+               for owner_type, owner, _ in data.tasks_for_funding(funding['id'])]
+    for pursuit in funding.get('pursuits', []):
+        for item in parse_related_products(pursuit):
+            sources.append(('products', item['product_id']))
+            sources.append(('materialSystems', item['material_id']))
+    return sources
+
+def funding_details(funding):
+    """Return the (label, value) rows of a funding opportunity's details table"""
+    details = [('ID', funding['id']),
+               ('Type', funding.get('type', funding.get('pursuitType', 'N/A'))),
+               ('Source', funding.get('source', funding.get('customer', 'N/A')))]
     
     # Add dates if available
     if 'startDate' in funding:
-        funding_info += f"""
-        <tr>
-            <td style="padding: 12px; border-bottom: 1px solid #ddd;"><strong>Start Date:</strong></td>
-            <td style="padding: 12px; border-bottom: 1px solid #ddd;">{funding['startDate']}</td>
-        </tr>
-        """
+        details.append(('Start Date', funding['startDate']))
     elif 'closeDate' in funding:
-        funding_info += f"""
-        <tr>
-            <td style="padding: 12px; border-bottom: 1px solid #ddd;"><strong>Close Date:</strong></td>
-            <td style="padding: 12px; border-bottom: 1px solid #ddd;">{funding['closeDate']}</td>
-        </tr>
-        """
+        details.append(('Close Date', funding['closeDate']))
     
     # Add amount if available
     if 'amount' in funding:
-        funding_info += f"""
-        <tr>
-            <td style="padding: 12px; border-bottom: 1px solid #ddd;"><strong>Amount:</strong></td>
-            <td style="padding: 12px; border-bottom: 1px solid #ddd;">${funding['amount']:,}</td>
-        </tr>
-        """
+        details.append(('Amount', f"${funding['amount']:,}"))
     elif 'fundingAmount' in funding:
         try:
-            amount = int(funding['fundingAmount'])
-            funding_info += f"""
-            <tr>
-                <td style="padding: 12px; border-bottom: 1px solid #ddd;"><strong>Amount:</strong></td>
-                <td style="padding: 12px; border-bottom: 1px solid #ddd;">${amount:,}</td>
-            </tr>
-            """
+            details.append(('Amount', f"${int(funding['fundingAmount']):,}"))
         except (ValueError, TypeError):
-            funding_info += f"""
-            <tr>
-                <td style="padding: 12px; border-bottom: 1px solid #ddd;"><strong>Amount:</strong></td>
-                <td style="padding: 12px; border-bottom: 1px solid #ddd;">{funding['fundingAmount']}</td>
-            </tr>
-            """
+            details.append(('Amount', funding['fundingAmount']))
     
-    # Add cost share if available
+    # Add cost share and solicitation number if available
     if 'costSharePercentage' in funding:
-        funding_info += f"""
-        <tr>
-            <td style="padding: 12px; border-bottom: 1px solid #ddd;"><strong>Cost Share:</strong></td>
-            <td style="padding: 12px; border-bottom: 1px solid #ddd;">{funding['costSharePercentage']}</td>
-        </tr>
-        """
-    
-    # Add solicitation number if available
+        details.append(('Cost Share', funding['costSharePercentage']))
     if 'solicitationNumber' in funding:
-        funding_info += f"""
-        <tr>
-            <td style="padding: 12px; border-bottom: 1px solid #ddd;"><strong>Solicitation Number:</strong></td>
-            <td style="padding: 12px; border-bottom: 1px solid #ddd;">{funding['solicitationNumber']}</td>
-        </tr>
-        """
-    
-    # Add status if available
-    if 'status' in funding:
-        status_value = funding['status']
-        status_color = "#4a89ff"  # Default blue
-        if status_value == "Awarded":
-            status_color = "#43a047"  # Green
-        elif status_value == "Closed":
-            status_color = "#e53935"  # Red
-        elif status_value == "Pursuing":
-            status_color = "#ff9800"  # Orange
-        elif status_value == "Reshaping":
-            status_color = "#9c27b0"  # Purple
-            
-        funding_info += f"""
-        <tr>
-            <td style="padding: 12px; border-bottom: 1px solid #ddd;"><strong>Status:</strong></td>
-            <td style="padding: 12px; border-bottom: 1px solid #ddd;">
-                <span style="display: inline-block; padding: 4px 8px; background-color: {status_color}; color: white; border-radius: 4px;">{status_value}</span>
-            </td>
-        </tr>
-        """
-    
-    # Add period of performance if available
-    if 'periodOfPerformance' in funding and funding['periodOfPerformance']:
-        funding_info += f"""
-        <tr>
-            <td style="padding: 12px; border-bottom: 1px solid #ddd;"><strong>Period of Performance:</strong></td>
-            <td style="padding: 12px; border-bottom: 1px solid #ddd;">{funding['periodOfPerformance']}</td>
-        </tr>
-        """
-    
-    # Close the table
-    funding_info += """
-        </table>
-    </div>
-    """
-    
-    # Add description section if available
-    description_section = ""
-    if 'description' in funding and funding['description']:
-        description_section = f"""
-        <div style="margin-top: 20px; padding: 15px; background-color: #e8f4f8; border-radius: 5px;">
-            <h3>Description</h3>
-            <p>{funding['description']}</p>
-        </div>
-        """
-    
-    # Add timeline visualization if dates are available
-    timeline_section = ""
+        details.append(('Solicitation Number', funding['solicitationNumber']))
+    return details
+
+def funding_period(funding):
+    """Return the (start, end) datetimes of a funding opportunity's timeline, or (None, None) without dates"""
     start_date = None
     end_date = None
     
     # Try to get start and end dates from various fields
     if 'startDate' in funding:
         try:
-            start_date = datetime.strptime(funding['startDate'], "%Y-%m-%d")
+            start_date = parse_date(funding['startDate'])
         except (ValueError, TypeError):
             pass
     
     if 'endDate' in funding:
         try:
-            end_date = datetime.strptime(funding['endDate'], "%Y-%m-%d")
+            end_date = parse_date(funding['endDate'])
         except (ValueError, TypeError):
             pass
     elif 'closeDate' in funding:
         try:
-            end_date = datetime.strptime(funding['closeDate'], "%Y-%m-%d")
+            end_date = parse_date(funding['closeDate'])
         except (ValueError, TypeError):
             pass
     
-    # If we have at least one date, create a timeline
-    if start_date or end_date:
-        # If we only have one date, use it for both start and end
-        if start_date and not end_date:
-            end_date = start_date + timedelta(days=90)  # Default to 3 months duration
-        elif end_date and not start_date:
-            start_date = end_date - timedelta(days=90)  # Default to 3 months duration
-        
+    # If we only have one date, use it for both start and end
+    if start_date and not end_date:
+        end_date = start_date + timedelta(days=90)  # Default to 3 months duration
+    elif end_date and not start_date:
+        start_date = end_date - timedelta(days=90)  # Default to 3 months duration
+    return start_date, end_date
+
+def funding_related_tasks(funding_id, data):
+    """Return the program, product and supplier tasks funded by an opportunity as dicts"""
+    return [{
+        'task': task['task'],
+        'owner_type': owner_type,
+        'owner_id': owner['id'],
+        'owner': owner['name'],
+        'start': task.get('start', 'N/A'),
+        'end': task.get('end', 'N/A'),
+        'status': task.get('status', 'N/A'),
+    } for owner_type, owner, task in as_store(data).tasks_for_funding(funding_id)]
+
+def generate_funding_page(funding, data, funding_dir):
+    """Generate a detailed page for a single funding opportunity"""
+    funding_id = funding['id']
+    data = as_store(data)
+    
+    # Map field names from the actual data structure to the expected structure
+    funding_name = funding.get('name', funding.get('announcementName', 'Unknown'))
+    funding_type = funding.get('type', funding.get('pursuitType', 'N/A'))
+    funding_source = funding.get('source', funding.get('customer', 'N/A'))
+    funding_amount = funding.get('amount', funding.get('fundingAmount', 'N/A'))
+    
+    # Funding details table rows
+    details = funding_details(funding)
+    
+    # Add timeline visualization if dates are available
+    timeline_page = None
+    start_date, end_date = funding_period(funding)
+    if start_date:
         # Create a figure for the funding timeline
-        p = figure(
-            title=f"Timeline for {funding_name}",
-            x_axis_type="datetime",
-            width=1000,
-            height=200,
-            toolbar_location="above",
-            tools="pan,wheel_zoom,box_zoom,reset,save",
-        )
-        
-        # Customize appearance
-        p.title.text_font_size = '14pt'
-        p.xaxis.axis_label = "Timeline"
-        p.yaxis.axis_label = ""
-        p.grid.grid_line_alpha = 0.3
-        p.background_fill_color = "#f8f9fa"
+        p = gantt_figure(title=f"Timeline for {funding_name}", width=1000, height=200, title_size='14pt', y_label="")
         
         # Add funding period bar
-        source = ColumnDataSource(data=dict(
-            y=[0],
-            left=[start_date],
-            right=[end_date],
-            name=[funding_name],
-            start=[start_date],
-            end=[end_date],
-            type=[funding_type],
-            amount=[f"${funding_amount}" if funding_amount != 'N/A' else 'N/A']
-        ))
-        
-        p.hbar(y='y', left='left', right='right', height=0.4, 
-               color=Category10[10][0], alpha=0.8, source=source)
-        
-        # Add hover tool
-        hover = HoverTool()
-        hover.tooltips = [
-            ("Name", "@name"),
-            ("Type", "@type"),
-            ("Start", "@start{%F}"),
-            ("End", "@end{%F}"),
-            ("Amount", "@amount")
-        ]
-        hover.formatters = {
-            "@start": "datetime",
-            "@end": "datetime"
-        }
-        p.add_tools(hover)
-        
-        # Set y-range
-        p.y_range = Range1d(-0.5, 0.5)
-        
-        # Set x-range with padding (3 months before and after)
-        min_date = start_date - timedelta(days=90)
-        max_date = end_date + timedelta(days=90)
-        p.x_range.start = min_date
-        p.x_range.end = max_date
+        amount = f"${funding_amount}" if funding_amount != 'N/A' else 'N/A'
+        tasks = [gantt_task(start_date, end_date, funding_name, funding_type,
+                            name=funding_name, type=funding_type, amount=amount)]
+        draw_gantt(p, gantt_layout(tasks, labels=None), {}, FUNDING_TOOLTIPS, bar_height=0.4,
+                   default_color=Category10[10][0], y_range=(-1.5, -0.5))
         
         # Output to file
-        output_file(os.path.join(funding_dir, f"funding_timeline_{funding_id}.html"))
-        save(p)
-        
-        timeline_section = f"""
-        <div style="margin-top: 20px;">
-            <h3>Funding Timeline</h3>
-            <p><a href="funding_timeline_{funding_id}.html" target="_blank">View detailed timeline</a></p>
-            <iframe src="funding_timeline_{funding_id}.html" width="100%" height="250px" frameborder="0"></iframe>
-        </div>
-        """
-    
-    # Find related tasks that use this funding
-    related_tasks = []
-    
-    # Check program tasks
-    for program in data.get('programs', []):
-        if 'roadmap' in program and 'tasks' in program['roadmap']:
-            for task in program['roadmap']['tasks']:
-                if 'fundingID' in task and task['fundingID'] == funding_id:
-                    related_tasks.append({
-                        'task': task['task'],
-                        'program': program['name'],
-                        'program_id': program['id'],
-                        'start': task.get('start', 'N/A'),
-                        'end': task.get('end', 'N/A'),
-                        'status': task.get('status', 'N/A'),
-                        'type': 'Program Task'
-                    })
-    
-    # Check product tasks
-    for product in data.get('products', []):
-        if 'roadmap' in product and 'tasks' in product['roadmap']:
-            for task in product['roadmap']['tasks']:
-                if 'fundingID' in task and task['fundingID'] == funding_id:
-                    related_tasks.append({
-                        'task': task['task'],
-                        'product': product['name'],
-                        'product_id': product['id'],
-                        'start': task.get('start', 'N/A'),
-                        'end': task.get('end', 'N/A'),
-                        'status': task.get('status', 'N/A'),
-                        'type': 'Product Task'
-                    })
-    
-    # Check supplier tasks
-    for supplier in data.get('printingSuppliers', []):
-        if 'supplierRoadmap' in supplier and 'tasks' in supplier['supplierRoadmap']:
-            for task in supplier['supplierRoadmap']['tasks']:
-                if 'fundingID' in task and task['fundingID'] == funding_id:
-                    related_tasks.append({
-                        'task': task['task'],
-                        'supplier': supplier['name'],
-                        'supplier_id': supplier['id'],
-                        'start': task.get('start', 'N/A'),
-                        'end': task.get('end', 'N/A'),
-                        'status': task.get('status', 'N/A'),
-                        'type': 'Supplier Task'
-                    })
-    
-    # Add related tasks section
-    tasks_section = """
-    <div style="margin-top: 20px; padding: 15px; background-color: #f5f5f5; border-radius: 5px;">
-        <h3>Related Tasks</h3>
-    """
-    
-    if related_tasks:
-        tasks_section += """
-        <table style="width: 100%; border-collapse: collapse;">
-            <tr style="background-color: #e0e0e0;">
-                <th style="padding: 8px; text-align: left; border-bottom: 2px solid #ddd;">Task</th>
-                <th style="padding: 8px; text-align: left; border-bottom: 2px solid #ddd;">Type</th>
-                <th style="padding: 8px; text-align: left; border-bottom: 2px solid #ddd;">Related To</th>
-                <th style="padding: 8px; text-align: left; border-bottom: 2px solid #ddd;">Start Date</th>
-                <th style="padding: 8px; text-align: left; border-bottom: 2px solid #ddd;">End Date</th>
-                <th style="padding: 8px; text-align: left; border-bottom: 2px solid #ddd;">Status</th>
-            </tr>
-        """
+        timeline_page = f"funding_timeline_{funding_id}.html"
+        output_file(os.path.join(funding_dir, timeline_page))
+        save_page(p)
+    
+    # Find related program, product and supplier tasks that use this funding
+    related_tasks = [dict(task,
+                          href=f"../{OWNER_PAGES[task['owner_type']]}{task['owner_id']}.html",
+                          status_class=TASK_STATUS_CLASSES.get(task['status'], 'task-status-other'),
+                          type=f"{task['owner_type'].capitalize()} Task")
+                     for task in funding_related_tasks(funding_id, data)]
+    
+    # Create a visualization of tasks by status
+    status_chart_page = None
+    status_counts = {}
+    for task in related_tasks:
+        status = task['status']
+        status_counts[status] = status_counts.get(status, 0) + 1
+    
+    if status_counts:
+        # Create a figure for task status distribution
+        p = figure(
+            title="Tasks by Status",
+            x_range=list(status_counts.keys()),
+            width=400,
+            height=300,
+            toolbar_location=None,
+            tools=""
+        )
         
-        for task in related_tasks:
-            # Determine the related entity link
-            if 'program' in task:
-                related_link = f"<a href='../programs/program_{task['program_id']}.html'>{task['program']}</a>"
-            elif 'product' in task:
-                related_link = f"<a href='../products/product_{task['product_id']}.html'>{task['product']}</a>"
-            elif 'supplier' in task:
-                related_link = f"<a href='../suppliers/supplier_{task['supplier_id']}.html'>{task['supplier']}</a>"
-            else:
-                related_link = "N/A"
-            
-            # Determine status color
-            status_colors = {
-                'Complete': '#43a047',
-                'In Progress': '#ff9800',
-                'Planned': '#4a89ff'
-            }
-            status_color = status_colors.get(task['status'], '#95a5a6')
-            
-            tasks_section += f"""
-            <tr>
-                <td style="padding: 8px; border-bottom: 1px solid #ddd;">{task['task']}</td>
-                <td style="padding: 8px; border-bottom: 1px solid #ddd;">{task['type']}</td>
-                <td style="padding: 8px; border-bottom: 1px solid #ddd;">{related_link}</td>
-                <td style="padding: 8px; border-bottom: 1px solid #ddd;">{task['start']}</td>
-                <td style="padding: 8px; border-bottom: 1px solid #ddd;">{task['end']}</td>
-                <td style="padding: 8px; border-bottom: 1px solid #ddd; background-color: {status_color}; color: white;">{task['status']}</td>
-            </tr>
-            """
+        # Add bars
+        status_colors = {
+            'Complete': '#43a047',
+            'In Progress': '#ff9800',
+            'Planned': '#4a89ff'
+        }
         
-        tasks_section += "</table>"
-        
-        # Create a visualization of tasks by status
-        status_counts = {}
-        for task in related_tasks:
-            status = task['status']
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
-        if status_counts:
-            # Create a figure for task status distribution
-            p = figure(
-                title="Tasks by Status",
-                x_range=list(status_counts.keys()),
-                width=400,
-                height=300,
-                toolbar_location=None,
-                tools=""
-            )
-            
-            # Add bars
-            status_colors = {
-                'Complete': '#43a047',
-                'In Progress': '#ff9800',
-                'Planned': '#4a89ff'
-            }
-            
-            colors = [status_colors.get(status, '#95a5a6') for status in status_counts.keys()]
-            
-            p.vbar(
-                x=list(status_counts.keys()),
-                top=list(status_counts.values()),
-                width=0.5,
-                color=colors,
-                alpha=0.8
-            )
-            
-            # Customize appearance
-            p.title.text_font_size = '12pt'
-            p.xaxis.axis_label = "Status"
-            p.yaxis.axis_label = "Number of Tasks"
-            p.xgrid.grid_line_color = None
-            
-            # Output to file
-            output_file(os.path.join(funding_dir, f"funding_tasks_status_{funding_id}.html"))
-            save(p)
-            
-            tasks_section += f"""
-            <div style="margin-top: 20px;">
-                <h4>Tasks by Status</h4>
-                <iframe src="funding_tasks_status_{funding_id}.html" width="100%" height="350px" frameborder="0"></iframe>
-            </div>
-            """
-    else:
-        tasks_section += "<p>No related tasks found for this funding opportunity.</p>"
-    
-    tasks_section += """
-    </div>
-    """
-    
-    # Add pursuits section if available
-    pursuits_section = ""
-    if 'pursuits' in funding and funding['pursuits']:
-        pursuits_section = f"""
-        <div style="margin-top: 20px;">
-            <h2>Pursuits for this Funding Opportunity</h2>
-            <p>This section shows the pursuits associated with this funding opportunity.</p>
-        """
+        colors = [status_colors.get(status, '#95a5a6') for status in status_counts.keys()]
         
-        for pursuit in funding['pursuits']:
-            pursuits_section += generate_pursuit_section(pursuit, data, funding_dir, funding_id)
+        p.vbar(
+            x=list(status_counts.keys()),
+            top=list(status_counts.values()),
+            width=0.5,
+            color=colors,
+            alpha=0.8
+        )
         
-        pursuits_section += """
-        </div>
-        """
-    
-    # Create header
-    header = f"""
-    <div style="margin-bottom: 20px;">
-        <h1>Funding Opportunity: {funding_name}</h1>
-        <p><a href="../index.html">Back to Dashboard</a> | <a href="funding_summary.html">Back to Funding Summary</a> | <a href="pursuits_summary.html">View All Pursuits</a></p>
-    </div>
-    """
-    
-    # Combine all elements
-    full_content = header + funding_info + description_section + timeline_section + pursuits_section + tasks_section
-    
-    # Create the HTML page
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Funding: {funding_name}</title>
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 20px; line-height: 1.6; }}
-            h1 {{ color: #333; }}
-            h2, h3, h4 {{ color: #0066cc; }}
-            a {{ color: #0066cc; text-decoration: none; }}
-            a:hover {{ text-decoration: underline; }}
-            .container {{ max-width: 1200px; margin: 0 auto; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            {full_content}
-        </div>
-    </body>
-    </html>
-    """
-    
-    # Write to file
-    with open(os.path.join(funding_dir, f"funding_{funding_id}.html"), 'w') as f:
-        f.write(html_content)
+        # Customize appearance
+        p.title.text_font_size = '12pt'
+        p.xaxis.axis_label = "Status"
+        p.yaxis.axis_label = "Number of Tasks"
+        p.xgrid.grid_line_color = None
+        
+        # Output to file
+        status_chart_page = f"funding_tasks_status_{funding_id}.html"
+        output_file(os.path.join(funding_dir, status_chart_page))
+        save_page(p)
+    
+    # Add pursuits sections if available
+    pursuit_sections = [generate_pursuit_section(pursuit, data, funding_dir, funding_id)
+                        for pursuit in funding.get('pursuits') or []]
+    
+    # Render the page
+    write_page(os.path.join(funding_dir, f"funding_{funding_id}.html"), "funding_page.html",
+               funding_name=funding_name,
+               details=details,
+               status=funding.get('status'),
+               status_class=FUNDING_STATUS_CLASSES.get(funding.get('status'), 'funding-status-other'),
+               period_of_performance=funding.get('periodOfPerformance'),
+               description=funding.get('description'),
+               timeline_page=timeline_page,
+               pursuit_sections=pursuit_sections,
+               related_tasks=format_rows(RELATED_TASK_ROW, [
+                   (task['task'], task['type'], task['href'], task['owner'], task['start'], task['end'],
+                    task['status_class'], task['status'])
+                   for task in related_tasks
+               ]),
+               status_chart_page=status_chart_page)
 
 def generate_funding_summary(data, funding_dir):
     """Generate a summary page for all funding opportunities"""
@@ -630,7 +423,7 @@ def generate_funding_summary(data, funding_dir):
             
             if close_date_str:
                 try:
-                    close_date = datetime.strptime(close_date_str, "%Y-%m-%d")
+                    close_date = parse_date(close_date_str)
                     is_upcoming = close_date > current_date
                 except (ValueError, TypeError):
                     pass
@@ -815,7 +608,7 @@ def generate_funding_summary(data, funding_dir):
         
         # Output to file
         output_file(os.path.join(funding_dir, "funding_summary.html"))
-        save(layout_obj)
+        save_page(layout_obj)
     else:
         # Create a simple page if no funding opportunities
         html_content = """
@@ -842,9 +635,49 @@ def generate_funding_summary(data, funding_dir):
         """
         
         # Write to file
-        with open(os.path.join(funding_dir, "funding_summary.html"), 'w') as f:
+        with open_output(os.path.join(funding_dir, "funding_summary.html"), 'w') as f:
             f.write(html_content)
 
+@cached_chart
+def save_funding_distribution_chart(chart_path, funding_types, funding_statuses, funding_sources):
+    """Save bar charts of funding opportunity counts by type, status and source as one PNG"""
+    with chart_figure(chart_path, (18, 6), dpi=100) as fig:
+        axs = fig.subplots(1, 3)
+        
+        # Plot funding types
+        axs[0].bar(funding_types.keys(), funding_types.values(), color='skyblue')
+        axs[0].set_title('Funding Opportunities by Type')
+        axs[0].set_xlabel('Type')
+        axs[0].set_ylabel('Count')
+        axs[0].tick_params(axis='x', rotation=45)
+        
+        # Plot funding statuses
+        status_colors = {
+            "Considering": "#4a89ff",  # Blue
+            "Pursuing": "#ff9800",     # Orange
+            "Closed": "#e53935",       # Red
+            "Awarded": "#43a047",      # Green
+            "Reshaping": "#9c27b0",    # Purple
+            "Unknown": "#9e9e9e"       # Gray
+        }
+        
+        status_colors_list = [status_colors.get(status, "#9e9e9e") for status in funding_statuses.keys()]
+        axs[1].bar(funding_statuses.keys(), funding_statuses.values(), color=status_colors_list)
+        axs[1].set_title('Funding Opportunities by Status')
+        axs[1].set_xlabel('Status')
+        axs[1].set_ylabel('Count')
+        axs[1].tick_params(axis='x', rotation=45)
+        
+        # Plot funding sources
+        axs[2].bar(funding_sources.keys(), funding_sources.values(), color='lightgreen')
+        axs[2].set_title('Funding Opportunities by Source')
+        axs[2].set_xlabel('Source')
+        axs[2].set_ylabel('Count')
+        axs[2].tick_params(axis='x', rotation=45)
+        
+        # Adjust layout
+        fig.tight_layout()
+
 def generate_funding_distribution_charts(data, funding_dir):
     """Generate charts showing the distribution of funding opportunities"""
     print("Generating funding distribution charts...")
@@ -871,46 +704,8 @@ def generate_funding_distribution_charts(data, funding_dir):
         funding_sources[funding_source] = funding_sources.get(funding_source, 0) + 1
     
     # Create figures
-    fig, axs = plt.subplots(1, 3, figsize=(18, 6))
-    
-    # Plot funding types
-    axs[0].bar(funding_types.keys(), funding_types.values(), color='skyblue')
-    axs[0].set_title('Funding Opportunities by Type')
-    axs[0].set_xlabel('Type')
-    axs[0].set_ylabel('Count')
-    axs[0].tick_params(axis='x', rotation=45)
-    
-    # Plot funding statuses
-    status_colors = {
-        "Considering": "#4a89ff",  # Blue
-        "Pursuing": "#ff9800",     # Orange
-        "Closed": "#e53935",       # Red
-        "Awarded": "#43a047",      # Green
-        "Reshaping": "#9c27b0",    # Purple
-        "Unknown": "#9e9e9e"       # Gray
-    }
-    
-    status_colors_list = [status_colors.get(status, "#9e9e9e") for status in funding_statuses.keys()]
-    axs[1].bar(funding_statuses.keys(), funding_statuses.values(), color=status_colors_list)
-    axs[1].set_title('Funding Opportunities by Status')
-    axs[1].set_xlabel('Status')
-    axs[1].set_ylabel('Count')
-    axs[1].tick_params(axis='x', rotation=45)
-    
-    # Plot funding sources
-    axs[2].bar(funding_sources.keys(), funding_sources.values(), color='lightgreen')
-    axs[2].set_title('Funding Opportunities by Source')
-    axs[2].set_xlabel('Source')
-    axs[2].set_ylabel('Count')
-    axs[2].tick_params(axis='x', rotation=45)
-    
-    # Adjust layout
-    plt.tight_layout()
-    
-    # Save the figure
     chart_path = os.path.join(funding_dir, 'funding_distribution.png')
-    plt.savefig(chart_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    save_funding_distribution_chart(chart_path, funding_types, funding_statuses, funding_sources)
     
     # Create HTML page
     html_content = f"""
@@ -940,5 +735,5 @@ def generate_funding_distribution_charts(data, funding_dir):
     """
     
     # Write to file
-    with open(os.path.join(funding_dir, "funding_distribution.html"), 'w') as f:
+    with open_output(os.path.join(funding_dir, "funding_distribution.html"), 'w') as f:
         f.write(html_content) 
\ No newline at end of file
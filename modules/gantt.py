@@ -0,0 +1,245 @@
+"""
+Gantt Module for Roadmap Visualizations
+
+This module provides the shared Gantt chart engine used by the entity pages including:
+1. A normalized task array (one dict per task row) built by each page from its own data
+2. Lane layout computed once per chart from the task array
+3. Batched drawing: one bar renderer per color group, one renderer per label style and one hover tool
+4. Milestone, need-date and today markers and the padded date range shared by all timelines
+"""
+
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from bokeh.plotting import figure
+from bokeh.models import ColumnDataSource, HoverTool, Label, Range1d, Span, Legend, LegendItem
+
+GANTT_TOOLS = "pan,wheel_zoom,box_zoom,reset,save"
+
+# Hover tooltips of the status-colored task timelines
+TASK_TOOLTIPS = [
+    ("Task", "@task"),
+    ("Start", "@start{%F}"),
+    ("End", "@end{%F}"),
+    ("Status", "@status")
+]
+
+# Keys of a normalized task that drive the layout; every other key becomes a hover column
+LAYOUT_KEYS = ('start', 'end', 'label', 'group', 'lane')
+
+# Bars longer than this many days carry their label inside ("fit" label mode)
+INSIDE_LABEL_DAYS = 60
+
+def gantt_task(start, end, label, group, lane=None, **fields):
+    """Return a normalized Gantt task; start/end are datetimes (a row without both is laid out but not drawn)"""
+    task = dict(start=start, end=end, label=label, group=group, lane=lane)
+    task.update(fields)
+    return task
+
+def gantt_figure(title="", height=400, width=1200, title_size='16pt', y_label="Tasks", **kwargs):
+    """Create a datetime-axis figure styled like the roadmap pages"""
+    p = figure(
+        title=title,
+        x_axis_type="datetime",
+        width=width,
+        height=height,
+        toolbar_location="above",
+        tools=GANTT_TOOLS,
+        **kwargs
+    )
+
+    # Customize appearance according to style guide
+    p.title.text_font_size = title_size
+    p.title.text_color = "#2c3e50"
+    p.xaxis.axis_label = "Timeline"
+    p.yaxis.axis_label = y_label
+    p.grid.grid_line_alpha = 0.3
+    p.background_fill_color = "#f8f9fa"
+    return p
+
+def _lane_rows(tasks, lanes):
+    """Yield (lane, sorted tasks) in lane order; tasks are sorted by start date, undated ones at today"""
+    now = datetime.now()
+    by_lane = {lane: [] for lane in lanes}
+    for task in tasks:
+        if task.get('lane') in by_lane:
+            by_lane[task['lane']].append(task)
+    for lane in lanes:
+        yield lane, sorted(by_lane[lane], key=lambda task: task['start'] or now)
+
+def gantt_layout(tasks, lanes=None, labels='start'):
+    """Lay out a normalized task array.
+
+    Without lanes the tasks take one row each, in order. With lanes, each lane gets a
+    label row followed by its tasks sorted by start date; tasks in other lanes are left out.
+    labels is 'start' (label at the bar start), 'fit' (inside long bars, after short ones) or None.
+    """
+    fields = []
+    for task in tasks:
+        for key in task:
+            if key not in LAYOUT_KEYS and key not in fields:
+                fields.append(key)
+
+    y_pos = 0
+    lane_labels = dict(y=[], text=[])
+    bars = OrderedDict()
+    inside_labels = dict(x=[], y=[], text=[])
+    outside_labels = dict(x=[], y=[], text=[])
+    dates = []
+    rows = 0
+
+    lane_groups = _lane_rows(tasks, lanes) if lanes else [(None, tasks)]
+    for lane, lane_tasks in lane_groups:
+        # Lane label on the row above the lane's first task
+        if lane is not None:
+            lane_labels['y'].append(y_pos)
+            lane_labels['text'].append(f"--- {lane} ---")
+
+        for task in lane_tasks:
+            y_pos -= 1
+            rows += 1
+            start_date, end_date = task['start'], task['end']
+            if not start_date or not end_date:
+                continue
+            dates.extend([start_date, end_date])
+
+            # Add the bar to its group's columns
+            columns = bars.get(task['group'])
+            if columns is None:
+                columns = bars[task['group']] = dict(start=[], end=[], y=[], **{field: [] for field in fields})
+            columns['start'].append(start_date)
+            columns['end'].append(end_date)
+            columns['y'].append(y_pos)
+            for field in fields:
+                columns[field].append(task.get(field, ''))
+
+            # Add the label
+            if labels == 'fit' and (end_date - start_date).days > INSIDE_LABEL_DAYS:
+                inside_labels['x'].append(start_date + (end_date - start_date) / 2)
+                inside_labels['y'].append(y_pos)
+                inside_labels['text'].append(task['label'])
+            elif labels == 'fit':
+                outside_labels['x'].append(end_date)
+                outside_labels['y'].append(y_pos)
+                outside_labels['text'].append(task['label'])
+            elif labels == 'start':
+                outside_labels['x'].append(start_date)
+                outside_labels['y'].append(y_pos)
+                outside_labels['text'].append(task['label'])
+
+    return {
+        'lane_labels': lane_labels,
+        'bars': bars,
+        'inside_labels': inside_labels,
+        'outside_labels': outside_labels,
+        'dates': [min(dates), max(dates)] if dates else [],
+        'bottom': y_pos,
+        'rows': rows,
+    }
+
+def draw_gantt(p, layout, colors, tooltips, bar_height=0.6, default_color='#95a5a6', legend=None,
+               legend_title=None, extra_dates=(), padding_days=90, y_range=None):
+    """Draw a computed layout on a figure and set its ranges; returns the bar renderers.
+
+    Bars are colored by group through colors. legend is 'groups' (one entry per group drawn,
+    beside the plot), 'colors' (one entry per color, inside the plot) or None.
+    """
+    # Lane labels at today's date
+    lane_labels = layout['lane_labels']
+    if lane_labels['y']:
+        source = ColumnDataSource(data=dict(lane_labels, x=[datetime.now()] * len(lane_labels['y'])))
+        p.text(x='x', y='y', text='text', source=source,
+               text_font_style="bold", text_align="right", text_baseline="middle")
+
+    # One bar renderer per group, in order of first appearance
+    renderers = OrderedDict()
+    for group, columns in layout['bars'].items():
+        renderers[group] = p.hbar(y='y', left='start', right='end', height=bar_height,
+                                  source=ColumnDataSource(data=dict(columns)),
+                                  color=colors.get(group, default_color), alpha=0.8)
+
+    # One hover tool for all bars
+    if renderers:
+        p.add_tools(HoverTool(renderers=list(renderers.values()), tooltips=tooltips,
+                              formatters={"@start": "datetime", "@end": "datetime"}))
+
+    # Task labels inside long bars and beside the others
+    if layout['inside_labels']['x']:
+        p.text(x='x', y='y', text='text', source=ColumnDataSource(data=dict(layout['inside_labels'])),
+               text_font_size="9pt", text_align="center", text_baseline="middle",
+               text_color="white", text_font_style="bold")
+    if layout['outside_labels']['x']:
+        p.text(x='x', y='y', text='text', source=ColumnDataSource(data=dict(layout['outside_labels'])),
+               text_font_size="9pt", text_align="left", text_baseline="middle", x_offset=5)
+
+    # Legend for the groups drawn, or for every color (with an empty glyph for colors not drawn)
+    if legend == 'groups' and renderers:
+        items = [LegendItem(label=group, renderers=[renderer]) for group, renderer in renderers.items()]
+        p.add_layout(Legend(items=items, location="top_right", title=legend_title), 'right')
+    elif legend == 'colors':
+        items = []
+        for group, color in colors.items():
+            renderer = renderers.get(group) or p.hbar(y=0, left=0, right=0, height=0, color=color)
+            items.append(LegendItem(label=group, renderers=[renderer]))
+        p.add_layout(Legend(items=items, location="top_right", title=legend_title))
+
+    # Ranges: the task rows, and the task and marker dates padded on both sides
+    p.y_range = Range1d(*y_range) if y_range else Range1d(layout['bottom'] - 1, 1)
+    dates = list(layout['dates']) + list(extra_dates)
+    if dates:
+        p.x_range = Range1d(min(dates) - timedelta(days=padding_days), max(dates) + timedelta(days=padding_days))
+
+    return list(renderers.values())
+
+def add_milestone_markers(p, milestones, color='red', line_dash='dashed', font_style='bold', x_offset=10):
+    """Add a vertical line and rotated label for each (date, text) milestone"""
+    for milestone_date, text in milestones:
+        p.add_layout(Span(location=milestone_date, dimension='height',
+                          line_color=color, line_dash=line_dash, line_width=2))
+        p.add_layout(Label(x=milestone_date, y=0, text=text,
+                           text_color=color,
+                           text_font_style=font_style,
+                           text_font_size='10pt',
+                           angle=90,
+                           angle_units='deg',
+                           x_offset=x_offset))
+
+def add_need_date_markers(p, need_dates):
+    """Add a line and a boxed, vertically staggered label for each (date, text) program need date"""
+    y_offset = 0
+    for need_date, text in sorted(need_dates, key=lambda need: need[0]):
+        p.add_layout(Span(location=need_date, dimension='height',
+                          line_color='#e74c3c', line_width=2, line_dash='solid'))
+
+        # Stagger the labels vertically to avoid overlap, restarting after six
+        p.add_layout(Label(
+            x=need_date,
+            y=y_offset * 0.7,
+            text=text,
+            text_color='#e74c3c',
+            text_font_style='bold',
+            text_font_size='9pt',
+            border_line_color='#e74c3c',
+            border_line_alpha=0.5,
+            background_fill_color="white",
+            background_fill_alpha=0.9,
+            angle=90,
+            angle_units='deg',
+            x_offset=5,
+            y_offset=0
+        ))
+        y_offset = y_offset + 1 if y_offset < 5 else 0
+
+def add_today_marker(p):
+    """Add a dashed line and label at today's date"""
+    today = datetime.now()
+    p.add_layout(Span(location=today, dimension='height', line_color='#3498db', line_dash='dashed', line_width=2))
+    p.add_layout(Label(
+        x=today,
+        y=0.5,
+        text="Today",
+        text_color="#3498db",
+        text_font_style="bold",
+        text_align="center",
+        background_fill_color="white",
+        background_fill_alpha=0.7
+    ))
@@ -0,0 +1,82 @@
+"""
+HTML Templates Module for Roadmap Visualizations
+
+This module renders the hand-written HTML pages from Jinja2 templates including:
+1. One template environment per process, so each template is compiled once per run
+2. Autoescaping of every value; trusted fragments (Bokeh components, nested sections) are passed as Markup
+3. The shared stylesheet (templates/site.css), linked from the site's static copy or inlined without one
+4. write_page() to render a template straight into a page file
+5. format_rows() for tables with hundreds of rows: one str.format pattern per row, joined once
+"""
+
+import os
+import html
+from functools import lru_cache
+
+from jinja2 import Environment, FileSystemLoader
+from markupsafe import Markup
+
+from modules.bokeh_resources import SITE_CSS, STATIC_DIRNAME, site_root_url
+from modules.build_profile import profile_span
+from modules.build_manifest import open_output
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+# CSS classes of the status badges (see templates/site.css); other statuses use 'status-planned'
+STATUS_CLASSES = {
+    'in progress': 'status-inprogress',
+    'complete': 'status-complete',
+    'blocked': 'status-blocked',
+    'deferred': 'status-deferred',
+}
+
+def status_class(status):
+    """Return the CSS class of a task or adoption status badge"""
+    return STATUS_CLASSES.get(str(status).lower(), 'status-planned')
+
+@lru_cache(maxsize=None)
+def template_environment():
+    """Return the shared Jinja2 environment; templates are compiled on first use and cached"""
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=True,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+    )
+    env.filters['status_class'] = status_class
+    return env
+
+@lru_cache(maxsize=None)
+def _site_css():
+    """Return the shared stylesheet's text"""
+    with open(SITE_CSS, encoding='utf-8') as f:
+        return f.read()
+
+def inline_stylesheet():
+    """Return the site stylesheet as an inline <style> block"""
+    return Markup(f"<style>\n{_site_css()}</style>")
+
+def stylesheet_tag(page_path):
+    """Return the <link> to the site stylesheet for a page, or an inline <style> without a static copy"""
+    root_url = site_root_url(page_path)
+    if root_url is None:
+        return inline_stylesheet()
+    return Markup(f'<link rel="stylesheet" href="{root_url}{STATIC_DIRNAME}/css/{os.path.basename(SITE_CSS)}">')
+
+def format_rows(row_format, rows):
+    """Render rows (tuples of values) through a str.format pattern, escaping every value, as one Markup block"""
+    # Escaping plain strings with html.escape and joining once is far cheaper than a template
+    # loop (or markupsafe.escape), which wraps every value in Markup
+    return Markup("".join([row_format.format(*[html.escape(str(value)) for value in row]) for row in rows]))
+
+def render_template(name, **context):
+    """Render a template to a string; the result is Markup so it can be nested in another template"""
+    return Markup(template_environment().get_template(name).render(**context))
+
+def write_page(page_path, name, **context):
+    """Render a page template into page_path, linking the site stylesheet relative to the page"""
+    with profile_span('save', os.path.basename(page_path)):
+        page = template_environment().get_template(name).render(stylesheet=stylesheet_tag(page_path), **context)
+        with open_output(page_path, 'w', encoding='utf-8') as f:
+            f.write(page)
@@ -4,7 +4,11 @@ from datetime import datetime
 from collections import defaultdict, Counter
 import pandas as pd
 import numpy as np
-from bokeh.plotting import figure, output_file, save
+from bokeh.plotting import figure, output_file
+from modules.bokeh_resources import save_page
+from modules.build_manifest import open_output
+from modules.roadmap_store import as_store
+from modules.date_parsing import parse_date
 from bokeh.models import ColumnDataSource, HoverTool, Legend, LabelSet, DatetimeTickFormatter, NumeralTickFormatter
 from bokeh.layouts import column, row, layout, gridplot
 from bokeh.palettes import Category10, Category20, Spectral6
@@ -12,8 +16,10 @@ from bokeh.transform import cumsum, factor_cmap
 from bokeh.embed import components
 from bokeh.models.widgets import DataTable, TableColumn, HTMLTemplateFormatter, NumberFormatter, DateFormatter
 from math import pi
-import matplotlib.pyplot as plt
+from matplotlib import colormaps
 import matplotlib.dates as mdates
+from modules.chart_renderer import chart_figure
+from modules.chart_cache import cached_chart
 from PIL import Image
 import io
 import base64
@@ -21,6 +27,7 @@ import base64
 def extract_implementation_data(data):
     """Extract implementation data from the roadmap data"""
     implementation_data = []
+    store = as_store(data)
     
     for program in data.get('programs', []):
         program_id = program.get('id', '')
@@ -42,18 +49,10 @@ def extract_implementation_data(data):
             total_schedule_savings = lifetime_demand * unit_schedule_savings
             
             # Get product and material names
-            product_name = ''
-            material_name = ''
-            
-            for product in data.get('products', []):
-                if product.get('id', '') == product_id:
-                    product_name = product.get('name', '')
-                    break
-            
-            for material in data.get('materialSystems', []):
-                if material.get('id', '') == material_id:
-                    material_name = material.get('name', '')
-                    break
+            product = store.product(product_id)
+            material = store.material(material_id)
+            product_name = product.get('name', '') if product else ''
+            material_name = material.get('name', '') if material else ''
             
             # Process status history
             status_history = pmc.get('statusHistory', [])
@@ -63,12 +62,12 @@ def extract_implementation_data(data):
             for status in status_history:
                 if status.get('status', '') == 'Baselined':
                     try:
-                        baselined_date = datetime.strptime(status.get('date', ''), '%Y-%m-%d')
+                        baselined_date = parse_date(status.get('date', ''))
                     except (ValueError, TypeError):
                         pass
                 elif status.get('status', '') == 'Complete':
                     try:
-                        completed_date = datetime.strptime(status.get('date', ''), '%Y-%m-%d')
+                        completed_date = parse_date(status.get('date', ''))
                     except (ValueError, TypeError):
                         pass
             
@@ -94,6 +93,23 @@ def extract_implementation_data(data):
     
     return implementation_data
 
+@cached_chart
+def save_cumulative_chart(plot_path, dates, values, color, title, ylabel):
+    """Save a cumulative line chart over dates as a PNG"""
+    with chart_figure(plot_path, (10, 5), dpi=100) as fig:
+        ax = fig.subplots()
+        ax.plot(dates, values, marker='o', linewidth=2, color=color)
+        
+        # Style the plot
+        ax.set_title(title, fontsize=14, fontweight='bold', color="#2c3e50")
+        ax.set_xlabel("Date", fontsize=12, color="#2c3e50")
+        ax.set_ylabel(ylabel, fontsize=12, color="#2c3e50")
+        ax.grid(True, linestyle='--', alpha=0.7)
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
+        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=3))
+        fig.autofmt_xdate()
+        fig.tight_layout()
+
 def generate_adoption_over_time_image(implementation_data, output_dir):
     """Generate adoption over time chart as an image and save to file"""
     print("Generating adoption over time visualization...")
@@ -112,24 +128,9 @@ def generate_adoption_over_time_image(implementation_data, output_dir):
     dates = [item['baselined_date'] for item in filtered_data]
     cumulative_count = list(range(1, len(filtered_data) + 1))
     
-    # Create the matplotlib figure
-    plt.figure(figsize=(10, 5))
-    plt.plot(dates, cumulative_count, marker='o', linewidth=2, color="#3498db")
-    
-    # Style the plot
-    plt.title("Adoption Over Time", fontsize=14, fontweight='bold', color="#2c3e50")
-    plt.xlabel("Date", fontsize=12, color="#2c3e50")
-    plt.ylabel("Cumulative Number of Parts", fontsize=12, color="#2c3e50")
-    plt.grid(True, linestyle='--', alpha=0.7)
-    plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
-    plt.gca().xaxis.set_major_locator(mdates.MonthLocator(interval=3))
-    plt.gcf().autofmt_xdate()
-    plt.tight_layout()
-    
-    # Save the plot to file
+    # Save the matplotlib chart to file
     plot_path = os.path.join(output_dir, "adoption_over_time.png")
-    plt.savefig(plot_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    save_cumulative_chart(plot_path, dates, cumulative_count, "#3498db", "Adoption Over Time", "Cumulative Number of Parts")
     
     # Also save the HTML version for standalone viewing
     output_file(os.path.join(output_dir, "adoption_over_time.html"))
@@ -168,7 +169,7 @@ def generate_adoption_over_time_image(implementation_data, output_dir):
     )
     p.add_tools(hover)
     
-    save(p)
+    save_page(p)
     
     return "adoption_over_time.png"
 
@@ -196,24 +197,9 @@ def generate_cost_savings_over_time_image(implementation_data, output_dir):
         running_total += item['total_cost_savings']
         cumulative_savings.append(running_total)
     
-    # Create the matplotlib figure
-    plt.figure(figsize=(10, 5))
-    plt.plot(dates, cumulative_savings, marker='o', linewidth=2, color="#27ae60")
-    
-    # Style the plot
-    plt.title("Cumulative Cost Savings Over Time", fontsize=14, fontweight='bold', color="#2c3e50")
-    plt.xlabel("Date", fontsize=12, color="#2c3e50")
-    plt.ylabel("Cumulative Cost Savings ($)", fontsize=12, color="#2c3e50")
-    plt.grid(True, linestyle='--', alpha=0.7)
-    plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
-    plt.gca().xaxis.set_major_locator(mdates.MonthLocator(interval=3))
-    plt.gcf().autofmt_xdate()
-    plt.tight_layout()
-    
-    # Save the plot to file
+    # Save the matplotlib chart to file
     plot_path = os.path.join(output_dir, "cost_savings_over_time.png")
-    plt.savefig(plot_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    save_cumulative_chart(plot_path, dates, cumulative_savings, "#27ae60", "Cumulative Cost Savings Over Time", "Cumulative Cost Savings ($)")
     
     # Also save the HTML version for standalone viewing
     output_file(os.path.join(output_dir, "cost_savings_over_time.html"))
@@ -254,7 +240,7 @@ def generate_cost_savings_over_time_image(implementation_data, output_dir):
     )
     p.add_tools(hover)
     
-    save(p)
+    save_page(p)
     
     return "cost_savings_over_time.png"
 
@@ -282,24 +268,9 @@ def generate_schedule_savings_over_time_image(implementation_data, output_dir):
         running_total += item['total_schedule_savings']
         cumulative_savings.append(running_total)
     
-    # Create the matplotlib figure
-    plt.figure(figsize=(10, 5))
-    plt.plot(dates, cumulative_savings, marker='o', linewidth=2, color="#f39c12")
-    
-    # Style the plot
-    plt.title("Cumulative Schedule Savings Over Time", fontsize=14, fontweight='bold', color="#2c3e50")
-    plt.xlabel("Date", fontsize=12, color="#2c3e50")
-    plt.ylabel("Cumulative Schedule Savings (Days)", fontsize=12, color="#2c3e50")
-    plt.grid(True, linestyle='--', alpha=0.7)
-    plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
-    plt.gca().xaxis.set_major_locator(mdates.MonthLocator(interval=3))
-    plt.gcf().autofmt_xdate()
-    plt.tight_layout()
-    
-    # Save the plot to file
+    # Save the matplotlib chart to file
     plot_path = os.path.join(output_dir, "schedule_savings_over_time.png")
-    plt.savefig(plot_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    save_cumulative_chart(plot_path, dates, cumulative_savings, "#f39c12", "Cumulative Schedule Savings Over Time", "Cumulative Schedule Savings (Days)")
     
     # Also save the HTML version for standalone viewing
     output_file(os.path.join(output_dir, "schedule_savings_over_time.html"))
@@ -340,10 +311,42 @@ def generate_schedule_savings_over_time_image(implementation_data, output_dir):
     )
     p.add_tools(hover)
     
-    save(p)
+    save_page(p)
     
     return "schedule_savings_over_time.png"
 
+@cached_chart
+def save_material_pie(plot_path, labels, sizes):
+    """Save the parts-per-material-system pie chart as a PNG"""
+    # Create color palette
+    colors = colormaps['tab10'].colors[:len(labels)]
+    
+    with chart_figure(plot_path, (8, 6), dpi=100) as fig:
+        ax = fig.subplots()
+        patches, texts, autotexts = ax.pie(
+            sizes, 
+            labels=labels, 
+            colors=colors,
+            autopct='%1.1f%%', 
+            startangle=90,
+            shadow=False,
+            wedgeprops={'edgecolor': 'white', 'linewidth': 1}
+        )
+        
+        # Style the plot
+        ax.set_title("Material System Distribution", fontsize=14, fontweight='bold', color="#2c3e50")
+        ax.axis('equal')  # Equal aspect ratio ensures the pie chart is circular
+        
+        # Improve label visibility
+        for text in texts:
+            text.set_fontsize(10)
+        for autotext in autotexts:
+            autotext.set_fontsize(9)
+            autotext.set_color('white')
+            autotext.set_fontweight('bold')
+        
+        fig.tight_layout()
+
 def generate_material_pie_chart_image(implementation_data, output_dir):
     """Generate material pie chart as an image and save to file"""
     print("Generating material system pie chart...")
@@ -362,39 +365,9 @@ def generate_material_pie_chart_image(implementation_data, output_dir):
     labels = list(material_counts.keys())
     sizes = list(material_counts.values())
     
-    # Create color palette
-    colors = plt.cm.tab10.colors[:len(labels)]
-    
-    # Create the matplotlib figure
-    plt.figure(figsize=(8, 6))
-    patches, texts, autotexts = plt.pie(
-        sizes, 
-        labels=labels, 
-        colors=colors,
-        autopct='%1.1f%%', 
-        startangle=90,
-        shadow=False,
-        wedgeprops={'edgecolor': 'white', 'linewidth': 1}
-    )
-    
-    # Style the plot
-    plt.title("Material System Distribution", fontsize=14, fontweight='bold', color="#2c3e50")
-    plt.axis('equal')  # Equal aspect ratio ensures the pie chart is circular
-    
-    # Improve label visibility
-    for text in texts:
-        text.set_fontsize(10)
-    for autotext in autotexts:
-        autotext.set_fontsize(9)
-        autotext.set_color('white')
-        autotext.set_fontweight('bold')
-    
-    plt.tight_layout()
-    
-    # Save the plot to file
+    # Create the matplotlib chart and save it to file
     plot_path = os.path.join(output_dir, "material_system_pie.png")
-    plt.savefig(plot_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    save_material_pie(plot_path, labels, sizes)
     
     # Also save an interactive version with Bokeh
     output_file(os.path.join(output_dir, "adoption_by_material.html"))
@@ -441,7 +414,7 @@ def generate_material_pie_chart_image(implementation_data, output_dir):
     p.axis.visible = False
     p.grid.grid_line_color = None
     
-    save(p)
+    save_page(p)
     
     return "material_system_pie.png"
 
@@ -817,7 +790,7 @@ def generate_implementation_summary(implementation_data, output_dir):
     """
     
     # Write the HTML to a file
-    with open(os.path.join(output_dir, "index.html"), "w") as f:
+    with open_output(os.path.join(output_dir, "index.html"), "w") as f:
         f.write(html)
     
     return "index.html"
@@ -1,166 +1,88 @@
 import os
 from datetime import datetime, timedelta
-from bokeh.plotting import figure, save, output_file
+from bokeh.plotting import figure, output_file
 from bokeh.models import ColumnDataSource, HoverTool, Label, Range1d, Span, Legend, LegendItem, Div, Tabs, Panel
 from bokeh.layouts import column, row, layout, gridplot
 from bokeh.palettes import Category10, Spectral6
 from bokeh.transform import factor_cmap
 import matplotlib.pyplot as plt
 import numpy as np
+from modules.roadmap_store import as_store
+from modules.bokeh_resources import save_page, bokeh_script_tags
+from modules.date_parsing import parse_date
+from modules.gantt import TASK_TOOLTIPS, gantt_task, gantt_figure, gantt_layout, draw_gantt, add_milestone_markers
 
 def generate_material_visualizations(data, output_dir, status_colors):
     """Generate visualizations for material systems"""
     print("Generating material system visualizations...")
     
+    for _, func, args, _ in material_visualization_tasks(as_store(data), output_dir, status_colors):
+        func(*args)
+    
+    print(f"Material system visualizations generated in '{os.path.join('roadmap_visualizations', 'materials')}'")
+
+def material_visualization_tasks(data, output_dir, status_colors):
+    """Return the independent (name, func, args, sources) tasks that make up the material system visualizations"""
     # Create materials directory if it doesn't exist
     material_dir = os.path.join('roadmap_visualizations', "materials")
     if not os.path.exists(material_dir):
         os.makedirs(material_dir)
     
-    # Generate individual material pages
+    # Individual material pages
+    tasks = []
     for material in data['materialSystems']:
-        generate_material_page(material, data, material_dir, status_colors)
-    
-    # Generate material summary page
-    generate_material_summary(data, material_dir)
+        # The page lists the products that use the material
+        related = [('products', product['id']) for product in data.products_for_material(material['id'])]
+        tasks.append((f"material_{material['id']}", generate_material_page,
+                      (material, data, material_dir, status_colors), related))
     
-    # Generate material distribution charts
-    generate_material_distribution_charts(data, material_dir)
+    # Material summary page and distribution charts
+    tasks.append(("material_summary", generate_material_summary, (data, material_dir), ('materialSystems',)))
+    tasks.append(("material_distribution", generate_material_distribution_charts, (data, material_dir),
+                  ('materialSystems', 'products')))
     
-    print(f"Material system visualizations generated in '{material_dir}'")
+    return tasks
+
+def material_gantt_tasks(material):
+    """Return the normalized Gantt tasks of a material system roadmap, grouped by status"""
+    tasks = []
+    for task in material.get('roadmap', []):
+        # Handle different date field names
+        start_key = 'start' if 'start' in task else 'startDate'
+        end_key = 'end' if 'end' in task else 'endDate'
+        if not task.get(start_key) or not task.get(end_key):
+            tasks.append(gantt_task(None, None, task.get('task', ''), task.get('status')))
+            continue
+        
+        # Add funding type if available
+        funding = f" ({task.get('fundingType', '')})" if 'fundingType' in task else ""
+        task_name = f"{task['task']}{funding}"
+        tasks.append(gantt_task(parse_date(task[start_key]), parse_date(task[end_key]), task_name, task['status'],
+                                task=task_name, status=task['status']))
+    return tasks
+
+def material_milestones(material):
+    """Return (date, name) for each dated milestone of a material system"""
+    return [(parse_date(milestone['date']), milestone['name'])
+            for milestone in material.get('milestones', []) if milestone.get('date')]
 
 def generate_material_page(material, data, material_dir, status_colors):
     """Generate a detailed page for a single material system"""
     material_id = material['id']
+    data = as_store(data)
     
     # Create a figure for the material roadmap
-    p = figure(
-        title=f"Roadmap for {material['name']} ({material_id})",
-        x_axis_type="datetime",
-        width=1200,
-        height=400,
-        toolbar_location="above",
-        tools="pan,wheel_zoom,box_zoom,reset,save",
-    )
+    p = gantt_figure(title=f"Roadmap for {material['name']} ({material_id})")
     
-    # Customize appearance based on styling guide
-    p.title.text_font_size = '16pt'
-    p.title.text_color = "#2c3e50"
-    p.xaxis.axis_label = "Timeline"
-    p.yaxis.axis_label = "Tasks"
-    p.grid.grid_line_alpha = 0.3
-    p.background_fill_color = "#f8f9fa"
+    # Roadmap task bars colored by status, labelled at their start
+    tasks = material_gantt_tasks(material)
     
-    # Process roadmap tasks
-    y_pos = 0
-    legend_items = []
-    all_dates = []
+    # Milestones as vertical lines
+    milestones = material_milestones(material)
+    add_milestone_markers(p, milestones)
     
-    # Add roadmap tasks
-    if 'roadmap' in material:
-        for task in material['roadmap']:
-            y_pos -= 1
-            
-            # Handle different date field names
-            start_key = 'start' if 'start' in task else 'startDate'
-            end_key = 'end' if 'end' in task else 'endDate'
-            
-            if not task.get(start_key) or not task.get(end_key):
-                continue
-                
-            start_date = datetime.strptime(task[start_key], "%Y-%m-%d")
-            end_date = datetime.strptime(task[end_key], "%Y-%m-%d")
-            all_dates.extend([start_date, end_date])
-            
-            # Add funding type if available
-            funding = f" ({task.get('fundingType', '')})" if 'fundingType' in task else ""
-            task_name = f"{task['task']}{funding}"
-            
-            # Create data source for the task bar
-            bar_source = ColumnDataSource(data=dict(
-                y=[y_pos],
-                left=[start_date],
-                right=[end_date],
-                task=[task_name],
-                start=[start_date],
-                end=[end_date],
-                status=[task['status']]
-            ))
-            
-            # Add task bar
-            color = status_colors.get(task['status'], '#95a5a6')
-            p.hbar(y='y', left='left', right='right', height=0.6, 
-                   color=color, alpha=0.8, source=bar_source)
-            
-            # Create data source for the task label
-            label_source = ColumnDataSource(data=dict(
-                x=[start_date],
-                y=[y_pos],
-                text=[task_name]
-            ))
-            
-            # Add task label with offset to prevent overlap
-            p.text(x='x', y='y', text='text', source=label_source,
-                   text_font_size="9pt", text_baseline="middle", 
-                   x_offset=5, text_align="left")
-    
-    # Add hover tool
-    hover = HoverTool()
-    hover.tooltips = [
-        ("Task", "@task"),
-        ("Start", "@start{%F}"),
-        ("End", "@end{%F}"),
-        ("Status", "@status")
-    ]
-    hover.formatters = {
-        "@start": "datetime",
-        "@end": "datetime"
-    }
-    p.add_tools(hover)
-    
-    # Add milestones as vertical lines
-    if 'milestones' in material:
-        for milestone in material['milestones']:
-            if not milestone.get('date'):
-                continue
-                
-            milestone_date = datetime.strptime(milestone['date'], "%Y-%m-%d")
-            all_dates.append(milestone_date)
-            
-            milestone_line = Span(location=milestone_date, dimension='height', 
-                                 line_color='red', line_dash='dashed', line_width=2)
-            p.add_layout(milestone_line)
-            
-            # Add milestone label
-            milestone_label = Label(x=milestone_date, y=0, 
-                                   text=milestone['name'],
-                                   text_color='red',
-                                   text_font_style='bold',
-                                   text_font_size='10pt',
-                                   angle=90,
-                                   angle_units='deg',
-                                   x_offset=10)
-            p.add_layout(milestone_label)
-    
-    # Add legend for status colors
-    for status, color in status_colors.items():
-        legend_items.append(LegendItem(label=status, renderers=[p.hbar(y=0, left=0, right=0, height=0, color=color)]))
-    
-    legend = Legend(items=legend_items, location="top_right")
-    p.add_layout(legend)
-    
-    # Set y-range with padding
-    p.y_range = Range1d(y_pos - 1, 1)
-    
-    # Set x-range based on all dates
-    if all_dates:
-        min_date = min(all_dates)
-        max_date = max(all_dates)
-        # Add some padding (3 months before and after)
-        min_date = min_date - timedelta(days=90)
-        max_date = max_date + timedelta(days=90)
-        p.x_range.start = min_date
-        p.x_range.end = max_date
+    draw_gantt(p, gantt_layout(tasks), status_colors, TASK_TOOLTIPS, legend='colors',
+               extra_dates=[milestone_date for milestone_date, _ in milestones])
     
     # Create page header
     header = f"""
@@ -429,13 +351,7 @@ def generate_material_page(material, data, material_dir, status_colors):
         <h2>Related Products</h2>
     """
     
-    related_products = []
-    for product in data['products']:
-        for material_entry in product.get('materialSystems', []):
-            if isinstance(material_entry, str) and material_entry == material_id:
-                related_products.append(product)
-            elif isinstance(material_entry, dict) and material_entry.get('materialID') == material_id:
-                related_products.append(product)
+    related_products = data.products_for_material(material_id)
     
     if related_products:
         products_section += """
@@ -592,6 +508,9 @@ def generate_material_page(material, data, material_dir, status_colors):
     </style>
     """
     
+    # Load BokehJS from the site's shared static copy
+    bokeh_scripts = bokeh_script_tags(os.path.join(material_dir, f"material_{material_id}.html"))
+    
     # Combine all elements
     page_html = f"""
     <!DOCTYPE html>
@@ -602,9 +521,7 @@ def generate_material_page(material, data, material_dir, status_colors):
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         
         <!-- Include Bokeh scripts -->
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-3.6.3.min.js"></script>
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-widgets-3.6.3.min.js"></script>
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-tables-3.6.3.min.js"></script>
+        {bokeh_scripts}
         
         {css_styles}
     </head>
@@ -639,7 +556,7 @@ def generate_material_page(material, data, material_dir, status_colors):
     
     # Output to file
     output_file(os.path.join(material_dir, f"material_{material_id}.html"))
-    save(layout([template_div, roadmap_div, p]))
+    save_page(layout([template_div, roadmap_div, p]))
 
 def generate_material_summary(data, material_dir):
     """Generate a summary page for all material systems"""
@@ -1049,6 +966,9 @@ def generate_material_summary(data, material_dir):
     </style>
     """
     
+    # Load BokehJS from the site's shared static copy
+    bokeh_scripts = bokeh_script_tags(os.path.join(material_dir, "material_summary.html"))
+    
     # Combine all elements into HTML page
     page_html = f"""
     <!DOCTYPE html>
@@ -1059,9 +979,7 @@ def generate_material_summary(data, material_dir):
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         
         <!-- Include Bokeh scripts -->
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-3.6.3.min.js"></script>
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-widgets-3.6.3.min.js"></script>
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-tables-3.6.3.min.js"></script>
+        {bokeh_scripts}
         
         {css_styles}
     </head>
@@ -1086,29 +1004,24 @@ def generate_material_summary(data, material_dir):
     
     # Output to file
     output_file(os.path.join(material_dir, "material_summary.html"))
-    save(layout([template_div, process_div, p1, mrl_div, p2, qual_div, p3]))
+    save_page(layout([template_div, process_div, p1, mrl_div, p2, qual_div, p3]))
 
 def generate_material_distribution_charts(data, material_dir):
     """Generate distribution charts for material systems"""
+    data = as_store(data)
+    
     # Count products per material system
     products_per_material = {}
     for material in data['materialSystems']:
         material_id = material['id']
-        products_per_material[material_id] = 0
-    
-    for product in data['products']:
-        for material_entry in product.get('materialSystems', []):
-            if isinstance(material_entry, str) and material_entry in products_per_material:
-                products_per_material[material_entry] += 1
-            elif isinstance(material_entry, dict) and material_entry.get('materialID') in products_per_material:
-                products_per_material[material_entry.get('materialID')] += 1
+        products_per_material[material_id] = len(data.products_for_material(material_id))
     
     # Create a figure for products per material
     material_names = []
     product_counts = []
     
     for material_id, count in products_per_material.items():
-        material = next((m for m in data['materialSystems'] if m['id'] == material_id), None)
+        material = data.material(material_id)
         if material:
             material_names.append(f"{material['name']} ({material_id})")
             product_counts.append(count)
@@ -1292,6 +1205,9 @@ def generate_material_distribution_charts(data, material_dir):
     </style>
     """
     
+    # Load BokehJS from the site's shared static copy
+    bokeh_scripts = bokeh_script_tags(os.path.join(material_dir, "material_product_distribution.html"))
+    
     # Combine all elements into HTML page
     page_html = f"""
     <!DOCTYPE html>
@@ -1302,9 +1218,7 @@ def generate_material_distribution_charts(data, material_dir):
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         
         <!-- Include Bokeh scripts -->
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-3.6.3.min.js"></script>
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-widgets-3.6.3.min.js"></script>
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-tables-3.6.3.min.js"></script>
+        {bokeh_scripts}
         
         {css_styles}
     </head>
@@ -1330,4 +1244,4 @@ def generate_material_distribution_charts(data, material_dir):
     
     # Output to file
     output_file(os.path.join(material_dir, "material_product_distribution.html"))
-    save(layout([template_div, chart_div, p])) 
\ No newline at end of file
+    save_page(layout([template_div, chart_div, p])) 
\ No newline at end of file
@@ -3,20 +3,34 @@ Advanced Network Analysis Module for Roadmap Visualizations
 
 This module provides advanced network analysis features including:
 1. Centrality metrics
-2. Dependency chains visualization
+2. Dependency chains visualization (counted and listed layer by layer, see modules.dependency_chains)
 3. Impact analysis for changes or delays
+4. An interactive what-if page listing everything up- and downstream of a chosen component
 """
 
 import os
+import json
 import networkx as nx
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
-from bokeh.plotting import figure, save, output_file
+from bokeh.plotting import figure, output_file
+from modules.bokeh_resources import save_page
+from modules.build_manifest import open_output
+from modules.roadmap_store import as_store
+from modules.reachability import ReachabilityIndex, IMPACT_GROUPS
+from modules.dependency_chains import dependency_chains as dependency_chain_table, CHAINS_PER_PAIR
+from modules.centrality import (
+    betweenness_centrality as sparse_betweenness, eigenvector_centrality as sparse_eigenvector,
+    centrality_pivots, exact_eigenvector_centrality, load_warm_start, save_warm_start, power_iteration_applies,
+    ERROR_CONFIDENCE,
+    WARM_START_PATH,
+)
 from bokeh.models import ColumnDataSource, HoverTool, Range1d, Label, Div, Tabs, Panel
 from bokeh.layouts import column, row, gridplot
 from bokeh.palettes import Spectral5, Category10
 
+
 def generate_advanced_network_analysis(data, output_dir):
     """Generate advanced network analysis visualizations"""
     print("Generating advanced network analysis visualizations...")
@@ -35,8 +49,14 @@ def generate_advanced_network_analysis(data, output_dir):
     # Generate dependency chains visualization
     generate_dependency_chains(G, data, network_dir)
     
+    # Build the reachability index once for the impact analysis and what-if pages
+    index = ReachabilityIndex(G)
+    
     # Generate impact analysis visualization
-    generate_impact_analysis(G, data, network_dir)
+    generate_impact_analysis(G, data, network_dir, index)
+    
+    # Generate the interactive what-if page
+    generate_what_if_page(G, index, network_dir)
     
     # Generate summary page
     generate_network_analysis_summary(G, data, network_dir)
@@ -47,135 +67,8 @@ def generate_advanced_network_analysis(data, output_dir):
     return os.path.join("network_analysis", "index.html")
 
 def build_network_graph(data):
-    """Build a comprehensive network graph from the roadmap data"""
-    # Create a directed graph
-    G = nx.DiGraph()
-    
-    # Add program nodes
-    for program in data.get('programs', []):
-        G.add_node(program['id'], 
-                   label=program['name'], 
-                   type='program',
-                   layer=0,
-                   details=program)
-    
-    # Add product nodes
-    for product in data.get('products', []):
-        G.add_node(product['id'], 
-                   label=product['name'], 
-                   type='product',
-                   layer=1,
-                   details=product)
-        
-        # Add edges from programs to products
-        for program_entry in product.get('programs', []):
-            if isinstance(program_entry, str):
-                program_id = program_entry
-            elif isinstance(program_entry, dict) and 'programID' in program_entry:
-                program_id = program_entry['programID']
-            else:
-                continue
-                
-            G.add_edge(program_id, product['id'], 
-                      weight=2, 
-                      relationship_type='uses')
-    
-    # Add material system nodes
-    for material in data.get('materialSystems', []):
-        G.add_node(material['id'], 
-                   label=material['name'], 
-                   type='material',
-                   layer=2,
-                   details=material)
-        
-        # Add edges from products to materials
-        for product in data.get('products', []):
-            for material_entry in product.get('materialSystems', []):
-                if isinstance(material_entry, str) and material_entry == material['id']:
-                    G.add_edge(product['id'], material['id'], 
-                              weight=2, 
-                              relationship_type='uses_material')
-                elif isinstance(material_entry, dict) and material_entry.get('materialID') == material['id']:
-                    G.add_edge(product['id'], material['id'], 
-                              weight=2, 
-                              relationship_type='uses_material')
-    
-    # Add supplier nodes (printing suppliers)
-    for supplier in data.get('printingSuppliers', []):
-        G.add_node(supplier['id'], 
-                   label=supplier['name'], 
-                   type='supplier',
-                   layer=3,
-                   details=supplier)
-        
-        # Add edges from materials to suppliers
-        if 'materialSystems' in supplier:
-            for material_entry in supplier['materialSystems']:
-                material_id = material_entry.get('materialID')
-                if material_id:
-                    G.add_edge(material_id, supplier['id'], 
-                              weight=2, 
-                              relationship_type='supplied_by')
-    
-    # Add supplier nodes (post-processing suppliers)
-    for supplier in data.get('postProcessingSuppliers', []):
-        G.add_node(supplier['id'], 
-                   label=supplier['name'], 
-                   type='post-supplier',
-                   layer=3,
-                   details=supplier)
-        
-        # Add edges from products to post-processing suppliers
-        for product in data.get('products', []):
-            if 'postProcessingSuppliers' in product:
-                for pp in product['postProcessingSuppliers']:
-                    if 'supplier' in pp and supplier['id'] in pp['supplier']:
-                        G.add_edge(product['id'], supplier['id'], 
-                                  weight=1, 
-                                  style='dashed',
-                                  relationship_type='post_processed_by')
-    
-    # Add funding opportunity nodes
-    if 'fundingOpportunities' in data:
-        for funding in data['fundingOpportunities']:
-            funding_name = funding.get('name', funding.get('announcementName', 'Unknown'))
-            G.add_node(funding['id'], 
-                       label=funding_name, 
-                       type='funding',
-                       layer=4,
-                       details=funding)
-            
-            # Add edges from funding to tasks with fundingID
-            # Check program tasks
-            for program in data.get('programs', []):
-                if 'roadmap' in program and isinstance(program['roadmap'], list):
-                    for task in program['roadmap']:
-                        if task.get('fundingType') == funding['pursuitType']:
-                            G.add_edge(funding['id'], program['id'], 
-                                      weight=1, 
-                                      style='dotted',
-                                      relationship_type='funds')
-                
-                # Also check if roadmap has a tasks list (different structure)
-                if 'roadmap' in program and isinstance(program['roadmap'], dict) and 'tasks' in program['roadmap']:
-                    for task in program['roadmap']['tasks']:
-                        if task.get('fundingType') == funding['pursuitType']:
-                            G.add_edge(funding['id'], program['id'], 
-                                      weight=1, 
-                                      style='dotted',
-                                      relationship_type='funds')
-            
-            # Check product tasks
-            for product in data.get('products', []):
-                if 'roadmap' in product and isinstance(product['roadmap'], list):
-                    for task in product['roadmap']:
-                        if task.get('fundingType') == funding['pursuitType']:
-                            G.add_edge(funding['id'], product['id'], 
-                                      weight=1, 
-                                      style='dotted',
-                                      relationship_type='funds')
-    
-    return G
+    """Return the shared roadmap network graph; funding opportunities link to tasks of their pursuit type"""
+    return as_store(data).graph('pursuit_type')
 
 def generate_centrality_metrics(G, data, network_dir):
     """Generate visualization of centrality metrics for the network"""
@@ -185,38 +78,26 @@ def generate_centrality_metrics(G, data, network_dir):
     degree_centrality = nx.degree_centrality(G)
     in_degree_centrality = nx.in_degree_centrality(G)
     out_degree_centrality = nx.out_degree_centrality(G)
-    betweenness_centrality = nx.betweenness_centrality(G)
     
-    # Try to calculate eigenvector centrality, but handle disconnected graphs
-    try:
-        eigenvector_centrality = nx.eigenvector_centrality_numpy(G)
-    except nx.NetworkXException:
-        print("Network is disconnected. Calculating eigenvector centrality per component...")
-        eigenvector_centrality = {}
-        
-        # Calculate for each weakly connected component
-        for component in nx.weakly_connected_components(G):
-            subgraph = G.subgraph(component)
-            # If component has only one node, assign a value of 1
-            if len(component) == 1:
-                node = list(component)[0]
-                eigenvector_centrality[node] = 1.0
-            else:
-                try:
-                    # Try to calculate eigenvector centrality for the component
-                    component_centrality = nx.eigenvector_centrality_numpy(subgraph)
-                    eigenvector_centrality.update(component_centrality)
-                except:
-                    # If still fails, assign default values
-                    for node in component:
-                        eigenvector_centrality[node] = 0.01
-        
-        # Normalize values
-        if eigenvector_centrality:
-            max_val = max(eigenvector_centrality.values())
-            if max_val > 0:
-                for node in eigenvector_centrality:
-                    eigenvector_centrality[node] /= max_val
+    # Betweenness on the sparse engine: exact, or sampled from pivot sources on large graphs
+    pivots = centrality_pivots(G.number_of_nodes())
+    betweenness_centrality, betweenness_error = sparse_betweenness(G, pivots=pivots)
+    
+    # Eigenvector centrality by power iteration, warm-started from the last converged run, on strongly
+    # connected networks only; other networks, and an unconverged iterate, get the exact per-component solution
+    iterative = power_iteration_applies(G)
+    warm_start = None
+    converged = False
+    if iterative:
+        warm_start = load_warm_start(WARM_START_PATH)
+        eigenvector_centrality, iterations, residual, converged = sparse_eigenvector(G, start=warm_start)
+        if converged:
+            save_warm_start(WARM_START_PATH, eigenvector_centrality)
+        else:
+            print(f"Eigenvector centrality did not converge within {iterations} iterations (residual {residual:.2e}); "
+                  "solving each component exactly instead")
+    if not converged:
+        eigenvector_centrality = exact_eigenvector_centrality(G)
     
     # Prepare data for visualization
     centrality_data = []
@@ -406,17 +287,45 @@ def generate_centrality_metrics(G, data, network_dir):
     # Create Div element with the explanation HTML
     explanation_div = Div(text=explanation_html, width=800)
     
+    # Describe how the betweenness and eigenvector values were computed
+    if pivots is None:
+        betweenness_note = f"exact, from shortest paths out of all {G.number_of_nodes()} nodes."
+    else:
+        betweenness_note = (f"approximate, sampled from {pivots} of {G.number_of_nodes()} source nodes; "
+                            f"each value is within &plusmn;{betweenness_error:.4f} of the exact value "
+                            f"with {ERROR_CONFIDENCE:.0%} confidence.")
+    if converged:
+        eigenvector_note = (f"power iteration converged after {iterations} iterations "
+                            f"(last change {residual:.2e}{', warm-started from the previous run' if warm_start else ''}).")
+    elif iterative:
+        eigenvector_note = (f"power iteration did not converge within {iterations} iterations "
+                            f"(last change {residual:.2e}), so each weakly connected component was solved "
+                            f"exactly instead (scaled so the largest value is 1).")
+    else:
+        eigenvector_note = ("solved exactly for each weakly connected component (scaled so the largest value is 1); "
+                            "power iteration was skipped because the network is not strongly connected, "
+                            "so it has no unique dominant eigenvector to converge to.")
+    computation_html = f"""
+    <div style="margin: 20px 0; padding: 15px; background-color: #f8f9fa; border-left: 5px solid #6c757d;">
+        <h3>How These Values Were Computed</h3>
+        <p><strong>Betweenness Centrality:</strong> {betweenness_note}</p>
+        <p><strong>Eigenvector Centrality:</strong> {eigenvector_note}</p>
+    </div>
+    """
+    computation_div = Div(text=computation_html, width=800)
+    
     # Combine everything into a layout
     layout_elements = [
         explanation_div,
         gridplot([[p1], [p2]], width=800, height=500),
+        computation_div,
         critical_nodes_div
     ]
     
     layout_obj = column(layout_elements)
     
     # Save to an HTML file
-    save(layout_obj)
+    save_page(layout_obj)
     
     print(f"Centrality metrics visualization saved to '{network_dir}/centrality_metrics.html'")
 
@@ -436,50 +345,23 @@ def generate_dependency_chains(G, data, network_dir):
     # Get all supplier nodes (both printing and post-processing)
     supplier_nodes = [node for node in G.nodes() if G.nodes[node]['type'] in ['supplier', 'post-supplier']]
     
-    # For each program, find paths to suppliers
-    # Limit the number of combinations to avoid excessive computation
-    max_combinations = 100  # Set a reasonable limit
-    program_supplier_pairs = []
-    
-    for program in program_nodes:
-        for supplier in supplier_nodes:
-            program_supplier_pairs.append((program, supplier))
-    
-    # If there are too many combinations, sample them
-    if len(program_supplier_pairs) > max_combinations:
-        import random
-        random.shuffle(program_supplier_pairs)
-        program_supplier_pairs = program_supplier_pairs[:max_combinations]
-        print(f"Too many program-supplier combinations. Limited to {max_combinations} random pairs.")
-    
-    # Find paths for the selected pairs
-    for program, supplier in program_supplier_pairs:
-        try:
-            # Find all simple paths (no cycles) from program to supplier
-            # Limit the path length to avoid excessive computation
-            paths = list(nx.all_simple_paths(G, program, supplier, cutoff=4))
-            
-            # Limit the number of paths per pair to avoid excessive output
-            if len(paths) > 5:
-                # Keep the shortest paths if there are too many
-                paths.sort(key=len)
-                paths = paths[:5]
-                
-            for path in paths:
-                # Construct chain details
-                chain = {
-                    'program': {'id': program, 'name': G.nodes[program]['label']},
-                    'supplier': {'id': supplier, 'name': G.nodes[supplier]['label']},
-                    'path': [{'id': node, 'name': G.nodes[node]['label'], 'type': G.nodes[node]['type']} for node in path],
-                    'length': len(path)
-                }
-                dependency_chains.append(chain)
-        except (nx.NetworkXNoPath, nx.NodeNotFound):
-            # No path exists between these nodes
-            continue
-        except Exception as e:
-            print(f"Error finding paths from {program} to {supplier}: {str(e)}")
-            continue
+    # Count every program-to-supplier chain and list the shortest few per pair
+    # (layer by layer over the whole graph, so no pair is ever sampled away)
+    chain_counts = dependency_chain_table(G, program_nodes, supplier_nodes)
+    total_chains = 0
+    program_totals = {}
+    for (program, supplier), (count, paths) in chain_counts.items():
+        total_chains += count
+        program_totals[program] = program_totals.get(program, 0) + count
+        for path in paths:
+            # Construct chain details
+            chain = {
+                'program': {'id': program, 'name': G.nodes[program]['label']},
+                'supplier': {'id': supplier, 'name': G.nodes[supplier]['label']},
+                'path': [{'id': node, 'name': G.nodes[node]['label'], 'type': G.nodes[node]['type']} for node in path],
+                'length': len(path)
+            }
+            dependency_chains.append(chain)
     
     # Create visualization
     # Prepare data for visualization
@@ -488,7 +370,8 @@ def generate_dependency_chains(G, data, network_dir):
         <h2>Dependency Chains Analysis</h2>
         <p>This analysis shows the chains of dependencies from Programs to Suppliers through Products and Materials.</p>
         
-        <h3>Total Dependency Chains: {len(dependency_chains)}</h3>
+        <h3>Total Dependency Chains: {total_chains}</h3>
+        <p>Showing {len(dependency_chains)} chains: up to the {CHAINS_PER_PAIR} shortest for each of the {len(chain_counts)} connected program-supplier pairs.</p>
         
         <div style="margin: 20px 0; padding: 15px; background-color: #f8f9fa; border-left: 5px solid #0275d8;">
             <h4>Why Dependency Chains Matter</h4>
@@ -516,7 +399,7 @@ def generate_dependency_chains(G, data, network_dir):
         
         chain_html += f"""
         <h3>Program: {program_name} ({program_id})</h3>
-        <p>Number of dependency chains: {len(chains)}</p>
+        <p>Number of dependency chains: {program_totals[program_id]} ({len(chains)} shown)</p>
         <table border="1" cellpadding="5" style="border-collapse: collapse; width: 100%; margin-bottom: 20px;">
             <tr style="background-color: #f2f2f2;">
                 <th>Supplier</th>
@@ -550,70 +433,36 @@ def generate_dependency_chains(G, data, network_dir):
     chain_div = Div(text=chain_html, width=1000)
     
     # Save to an HTML file
-    save(chain_div)
+    save_page(chain_div)
     
     print(f"Dependency chains visualization saved to '{network_dir}/dependency_chains.html'")
 
-def generate_impact_analysis(G, data, network_dir):
+def generate_impact_analysis(G, data, network_dir, index=None):
     """Generate visualization of impact analysis for changes or delays"""
     print("Generating impact analysis visualization...")
     
     # Set up the output file
     output_file(os.path.join(network_dir, "impact_analysis.html"))
     
-    # Create impact analysis for each node type
+    # Answer every up- and downstream query from one transitive-closure index
+    if index is None:
+        index = ReachabilityIndex(G)
+    empty_impact = {group: [] for group in IMPACT_GROUPS}
+    empty_impact['total'] = 0
     
     # Function to calculate downstream impact of a node
     def get_downstream_impact(node_id):
-        # Get all nodes that can be reached from this node
-        try:
-            # Check if node exists in graph
-            if node_id not in G:
-                return {'programs': [], 'products': [], 'materials': [], 'suppliers': [], 'funding': [], 'total': 0}
-                
-            descendants = list(nx.descendants(G, node_id))
-            
-            # Group by type
-            impact = {
-                'programs': [n for n in descendants if G.nodes[n]['type'] == 'program'],
-                'products': [n for n in descendants if G.nodes[n]['type'] == 'product'],
-                'materials': [n for n in descendants if G.nodes[n]['type'] == 'material'],
-                'suppliers': [n for n in descendants if G.nodes[n]['type'] in ['supplier', 'post-supplier']],
-                'funding': [n for n in descendants if G.nodes[n]['type'] == 'funding'],
-                'total': len(descendants)
-            }
-            return impact
-            
-        except (nx.NetworkXError, KeyError) as e:
-            # Node not in graph or other NetworkX error
-            print(f"Error calculating downstream impact for {node_id}: {str(e)}")
-            return {'programs': [], 'products': [], 'materials': [], 'suppliers': [], 'funding': [], 'total': 0}
+        # Nodes reachable from this node, grouped by type
+        if node_id not in index:
+            return dict(empty_impact)
+        return index.impact(node_id)
     
     # Function to calculate upstream dependencies of a node
     def get_upstream_dependencies(node_id):
-        # Get all nodes that can reach this node
-        try:
-            # Check if node exists in graph
-            if node_id not in G:
-                return {'programs': [], 'products': [], 'materials': [], 'suppliers': [], 'funding': [], 'total': 0}
-                
-            ancestors = list(nx.ancestors(G, node_id))
-            
-            # Group by type
-            dependencies = {
-                'programs': [n for n in ancestors if G.nodes[n]['type'] == 'program'],
-                'products': [n for n in ancestors if G.nodes[n]['type'] == 'product'],
-                'materials': [n for n in ancestors if G.nodes[n]['type'] == 'material'],
-                'suppliers': [n for n in ancestors if G.nodes[n]['type'] in ['supplier', 'post-supplier']],
-                'funding': [n for n in ancestors if G.nodes[n]['type'] == 'funding'],
-                'total': len(ancestors)
-            }
-            return dependencies
-            
-        except (nx.NetworkXError, KeyError) as e:
-            # Node not in graph or other NetworkX error
-            print(f"Error calculating upstream dependencies for {node_id}: {str(e)}")
-            return {'programs': [], 'products': [], 'materials': [], 'suppliers': [], 'funding': [], 'total': 0}
+        # Nodes that can reach this node, grouped by type
+        if node_id not in index:
+            return dict(empty_impact)
+        return index.impact(node_id, upstream=True)
     
     # Calculate impact and dependencies for all nodes
     impact_data = []
@@ -650,7 +499,7 @@ def generate_impact_analysis(G, data, network_dir):
         </div>
         """
         impact_div = Div(text=impact_html, width=1000)
-        save(impact_div)
+        save_page(impact_div)
         return
         
     impact_df = pd.DataFrame(impact_data)
@@ -664,6 +513,7 @@ def generate_impact_analysis(G, data, network_dir):
     <div style="margin: 20px 0;">
         <h2>Impact Analysis</h2>
         <p>This analysis shows the potential impact of delays or changes to different components in the roadmap.</p>
+        <p><a href="what_if.html">Explore the impact of any single component on the What-If page</a></p>
         
         <div style="margin: 20px 0; padding: 15px; background-color: #f8f9fa; border-left: 5px solid #0275d8;">
             <h3>How to Use This Analysis</h3>
@@ -777,10 +627,126 @@ def generate_impact_analysis(G, data, network_dir):
     impact_div = Div(text=impact_html, width=1000)
     
     # Save to an HTML file
-    save(impact_div)
+    save_page(impact_div)
     
     print(f"Impact analysis visualization saved to '{network_dir}/impact_analysis.html'")
 
+def generate_what_if_page(G, index, network_dir):
+    """Generate the interactive what-if page from every node's precomputed impact sets"""
+    print("Generating what-if impact page...")
+    
+    # Every node's downstream and upstream sets as node positions, embedded once as compact JSON
+    labels = {node: G.nodes[node].get('label', node) for node in G.nodes()}
+    payload = json.dumps(index.payload(labels), separators=(',', ':')).replace('</', '<\\/')
+    
+    html_content = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>What-If Impact Explorer</title>
+        <style>
+            body {{ font-family: Arial, sans-serif; margin: 20px; line-height: 1.6; }}
+            h1 {{ color: #333; }}
+            h2, h3, h4 {{ color: #0066cc; }}
+            a {{ color: #0066cc; text-decoration: none; }}
+            a:hover {{ text-decoration: underline; }}
+            .container {{ max-width: 1200px; margin: 0 auto; }}
+            .card {{ border: 1px solid #ddd; border-radius: 8px; padding: 15px; margin-bottom: 20px; }}
+            .card h3 {{ margin-top: 0; }}
+            .card-grid {{ display: grid; grid-template-columns: repeat(auto-fill, minmax(350px, 1fr)); gap: 20px; }}
+            .metric {{ font-weight: bold; color: #333; }}
+            select, input {{ font-size: 14px; padding: 4px; margin-right: 10px; }}
+            ul {{ margin-top: 5px; }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <h1>What-If Impact Explorer</h1>
+            <p><a href="index.html">Back to Network Analysis</a> | <a href="impact_analysis.html">Impact Analysis</a> | <a href="../index.html">Back to Dashboard</a></p>
+            
+            <div class="card">
+                <p>Choose a component to see everything a delay or change to it would affect downstream, and everything it depends on upstream.</p>
+                <input id="filter" type="search" placeholder="Filter components...">
+                <select id="component"></select>
+            </div>
+            
+            <div class="card-grid">
+                <div class="card">
+                    <h3>Downstream Impact (<span id="down-total" class="metric">0</span>)</h3>
+                    <div id="down"></div>
+                </div>
+                <div class="card">
+                    <h3>Upstream Dependencies (<span id="up-total" class="metric">0</span>)</h3>
+                    <div id="up"></div>
+                </div>
+            </div>
+        </div>
+        
+        <script>
+            const impact = {payload};
+            const select = document.getElementById('component');
+            const filter = document.getElementById('filter');
+            
+            function fillOptions() {{
+                const text = filter.value.toLowerCase();
+                const current = select.value;
+                select.innerHTML = '';
+                impact.nodes.forEach(function (node, i) {{
+                    const name = node[1] + ' (' + node[0] + ', ' + impact.types[node[2]] + ')';
+                    if (text && name.toLowerCase().indexOf(text) < 0) return;
+                    const option = document.createElement('option');
+                    option.value = i;
+                    option.textContent = name;
+                    select.appendChild(option);
+                }});
+                if (current !== '' && select.querySelector('option[value="' + current + '"]')) select.value = current;
+                show();
+            }}
+            
+            function render(target, positions) {{
+                const box = document.getElementById(target);
+                document.getElementById(target + '-total').textContent = positions.length;
+                box.innerHTML = '';
+                const groups = {{}};
+                positions.forEach(function (i) {{
+                    const type = impact.types[impact.nodes[i][2]];
+                    (groups[type] = groups[type] || []).push(impact.nodes[i]);
+                }});
+                Object.keys(groups).sort().forEach(function (type) {{
+                    const heading = document.createElement('h4');
+                    heading.textContent = type + ' (' + groups[type].length + ')';
+                    const list = document.createElement('ul');
+                    groups[type].forEach(function (node) {{
+                        const item = document.createElement('li');
+                        item.textContent = node[1] + ' (' + node[0] + ')';
+                        list.appendChild(item);
+                    }});
+                    box.appendChild(heading);
+                    box.appendChild(list);
+                }});
+                if (!positions.length) box.textContent = 'None';
+            }}
+            
+            function show() {{
+                const i = parseInt(select.value, 10);
+                render('down', isNaN(i) ? [] : impact.down[i]);
+                render('up', isNaN(i) ? [] : impact.up[i]);
+            }}
+            
+            filter.addEventListener('input', fillOptions);
+            select.addEventListener('change', show);
+            fillOptions();
+        </script>
+    </body>
+    </html>
+    """
+    
+    # Write the HTML content to a file
+    with open_output(os.path.join(network_dir, "what_if.html"), 'w', encoding='utf-8') as f:
+        f.write(html_content)
+    
+    print(f"What-if impact page generated in '{network_dir}/what_if.html'")
+
 def generate_network_analysis_summary(G, data, network_dir):
     """Generate a summary page for network analysis"""
     print("Generating network analysis summary page...")
@@ -859,6 +825,12 @@ def generate_network_analysis_summary(G, data, network_dir):
                     <p>Evaluate the potential impact of delays or changes to different components in the roadmap.</p>
                     <p><a href="impact_analysis.html">View Impact Analysis</a></p>
                 </div>
+                
+                <div class="card">
+                    <h3>What-If Explorer</h3>
+                    <p>Pick any component to list everything downstream that a delay would affect and everything upstream it depends on.</p>
+                    <p><a href="what_if.html">Open the What-If Explorer</a></p>
+                </div>
             </div>
             
             <div class="card">
@@ -875,7 +847,7 @@ def generate_network_analysis_summary(G, data, network_dir):
     """
     
     # Write the HTML content to a file
-    with open(os.path.join(network_dir, "index.html"), 'w') as f:
+    with open_output(os.path.join(network_dir, "index.html"), 'w') as f:
         f.write(html_content)
     
     print(f"Network analysis summary page generated in '{network_dir}/index.html'") 
\ No newline at end of file
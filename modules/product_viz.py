@@ -1,6 +1,6 @@
 import os
 from datetime import datetime, timedelta
-from bokeh.plotting import figure, save, output_file
+from bokeh.plotting import figure, output_file
 from bokeh.models import ColumnDataSource, HoverTool, Label, Range1d, Span, Legend, LegendItem, Div, Tabs, Panel, CheckboxGroup, CustomJS, RadioButtonGroup
 from bokeh.layouts import column, row, layout, gridplot
 from bokeh.palettes import Category10, Spectral6, Turbo256
@@ -8,6 +8,10 @@ from bokeh.transform import factor_cmap
 import matplotlib.pyplot as plt
 import numpy as np
 from bokeh.embed import components
+from modules.roadmap_store import as_store, entry_id
+from modules.bokeh_resources import save_page, bokeh_script_tags
+from modules.build_manifest import open_output
+from modules.date_parsing import parse_date
 
 # Define funding type colors
 FUNDING_COLORS = {
@@ -138,6 +142,13 @@ def generate_product_visualizations(data, output_dir, status_colors):
     """Generate visualizations for products"""
     print("Generating product visualizations...")
     
+    for _, func, args, _ in product_visualization_tasks(as_store(data), output_dir, status_colors):
+        func(*args)
+    
+    print(f"Product visualizations generated in '{os.path.join(output_dir, 'products')}'")
+
+def product_visualization_tasks(data, output_dir, status_colors):
+    """Return the independent (name, func, args, sources) tasks that make up the product visualizations"""
     # Create product directory if it doesn't exist
     product_dir = os.path.join(output_dir, "products")
     if not os.path.exists(product_dir):
@@ -146,331 +157,39 @@ def generate_product_visualizations(data, output_dir, status_colors):
     # Import the new product detail module
     from modules.product_detail import generate_product_detail_page
     
-    # Generate individual product pages using the new detailed layout
+    # Individual product pages using the new detailed layout
+    tasks = []
     for product in data['products']:
-        generate_product_detail_page(product, data, product_dir, status_colors)
+        tasks.append((f"product_{product['id']}", generate_product_detail_page,
+                      (product, data, product_dir, status_colors), product_page_sources(product, data)))
     
-    # Generate product summary page
-    generate_product_summary(data, product_dir)
+    # Product summary page and distribution charts
+    tasks.append(("product_summary", generate_product_summary, (data, product_dir),
+                  ('products', 'materialSystems', 'programs')))
+    tasks.append(("product_distribution", generate_product_distribution_charts, (data, product_dir),
+                  ('products', 'materialSystems')))
     
-    # Generate product distribution charts
-    generate_product_distribution_charts(data, product_dir)
-    
-    print(f"Product visualizations generated in '{product_dir}'")
+    return tasks
+
+def product_page_sources(product, data):
+    """Return the entities a product page reads: its material systems and the programs using it"""
+    sources = [('materialSystems', entry_id(entry, 'materialID')) for entry in product.get('materialSystems', [])]
+    for program, combo in data.combinations_for_product(product['id']):
+        sources.append(('programs', program['id']))
+        sources.append(('materialSystems', combo.get('materialID')))
+    return sources
 
 def generate_product_page(product, data, product_dir, status_colors):
     """Generate a detailed page for a single product"""
     product_id = product['id']
-    
-    # Create a figure for the product roadmap
-    p = figure(
-        x_axis_type="datetime",
-        width=1200,
-        height=600,
-        toolbar_location="above",
-        tools="pan,wheel_zoom,box_zoom,reset,save",
-        background_fill_color="#f8f9fa",
-        sizing_mode="stretch_width"
-    )
-    
-    # Customize appearance according to style guide
-    p.title.text_font_size = '22px'
-    p.title.text_color = '#2c3e50'
-    p.xaxis.axis_label = "Timeline"
-    p.yaxis.axis_label = "Tasks"
-    p.grid.grid_line_alpha = 0.3
+    data = as_store(data)
     
     # Get all material systems for this product
-    material_systems = []
-    for material_id in product.get('materialSystems', []):
-        if isinstance(material_id, str):
-            material = next((m for m in data['materialSystems'] if m['id'] == material_id), None)
-        elif isinstance(material_id, dict) and 'materialID' in material_id:
-            material = next((m for m in data['materialSystems'] if m['id'] == material_id['materialID']), None)
-        else:
-            continue
-            
-        if material:
-            material_systems.append(material)
+    material_systems = data.materials_for_product(product)
     
-    # Create material system toggle if there are multiple materials
-    selected_material = None
-    if len(material_systems) > 1:
-        # We'll implement this in the HTML directly
-        # Default to all materials
-        selected_material = "all"
-    
-    # Process tasks by lane
-    lanes = ['Design', 'Manufacturing', 'M&P', 'Quality', 'Other']
-    y_pos = 0
-    legend_items = []
-    all_dates = []
-    all_tasks = []
-    
-    # Collect program need dates first to organize them better
-    program_need_dates = []
-    for program in data['programs']:
-        for combo in program.get('productMaterialCombinations', []):
-            if combo.get('productID') == product_id and 'needDate' in combo:
-                try:
-                    need_date = datetime.strptime(combo['needDate'], "%Y-%m-%d")
-                    all_dates.append(need_date)
-                    
-                    # Get part name and number
-                    part_name = combo.get('partName', 'N/A')
-                    part_number = combo.get('partNumber', 'N/A')
-                    
-                    program_need_dates.append({
-                        'date': need_date,
-                        'program_name': program['name'],
-                        'program_id': program['id'],
-                        'part_name': part_name,
-                        'part_number': part_number
-                    })
-                except (ValueError, TypeError):
-                    # Skip if date can't be parsed
-                    pass
-    
-    # Sort program need dates by date
-    program_need_dates.sort(key=lambda x: x['date'])
-    
-    # Add program need dates as vertical lines with better positioning
-    y_offset = 0
-    for need_date_info in program_need_dates:
-        need_date = need_date_info['date']
-        
-        # Add program line
-        program_line = Span(location=need_date, dimension='height', 
-                           line_color='#e74c3c', line_width=2, line_dash='solid')
-        p.add_layout(program_line)
-        
-        # Calculate y position for staggered labels to avoid overlap
-        y_position = 0 + (y_offset * 0.7)  # Stagger the labels vertically
-        
-        # Add program label with improved formatting and positioning
-        program_label = Label(
-            x=need_date, 
-            y=y_position, 
-            text=f"{need_date_info['program_name']} ({need_date_info['program_id']})\nPart: {need_date_info['part_name']}\nPN: {need_date_info['part_number']}",
-            text_color='#e74c3c',
-            text_font_style='bold',
-            text_font_size='9pt',
-            border_line_color='#e74c3c',
-            border_line_alpha=0.5,
-            background_fill_color="white",
-            background_fill_alpha=0.9,
-            angle=90,
-            angle_units='deg',
-            x_offset=5,
-            y_offset=0
-        )
-        p.add_layout(program_label)
-        
-        # Increment offset for next label
-        y_offset += 1
-        # Reset if we've gone too far
-        if y_offset > 5:
-            y_offset = 0
-    
-    for lane in lanes:
-        # Add lane label using ColumnDataSource
-        lane_source = ColumnDataSource(data=dict(
-            x=[datetime.now()],
-            y=[y_pos],
-            text=[f"--- {lane} ---"]
-        ))
-        
-        # Add lane label
-        p.text(x='x', y='y', text='text', source=lane_source,
-               text_font_style="bold", text_align="right", text_baseline="middle")
-        
-        # Add lane tasks from product roadmap
-        lane_tasks = [t for t in product.get('roadmap', []) if t.get('lane', 'Other') == lane]
-        
-        # Add design tools and documentation to Design lane
-        if lane == 'Design':
-            # Add design tools
-            if 'designTools' in product:
-                for tool in product.get('designTools', []):
-                    if isinstance(tool, dict):
-                        tool_copy = tool.copy()
-                        tool_copy['task'] = tool.get('name', 'Unknown Tool')
-                        tool_copy['start'] = tool.get('start', '')
-                        tool_copy['end'] = tool.get('end', '')
-                        tool_copy['fundingType'] = tool.get('funding', 'None')
-                        lane_tasks.append(tool_copy)
-            
-            # Add documentation
-            if 'documentation' in product:
-                for doc in product.get('documentation', []):
-                    if isinstance(doc, dict):
-                        doc_copy = doc.copy()
-                        doc_copy['task'] = doc.get('name', 'Unknown Document')
-                        doc_copy['start'] = doc.get('start', '')
-                        doc_copy['end'] = doc.get('end', '')
-                        doc_copy['fundingType'] = doc.get('funding', 'None')
-                        lane_tasks.append(doc_copy)
-        
-        # Add special NDT and part acceptance to Quality lane
-        if lane == 'Quality':
-            # Add special NDT
-            if 'specialNDT' in product:
-                for ndt in product.get('specialNDT', []):
-                    if isinstance(ndt, dict):
-                        ndt_copy = ndt.copy()
-                        ndt_copy['task'] = ndt.get('name', 'Unknown NDT')
-                        ndt_copy['start'] = ndt.get('startDate', '')
-                        ndt_copy['end'] = ndt.get('endDate', '')
-                        ndt_copy['fundingType'] = ndt.get('funding', 'None')
-                        lane_tasks.append(ndt_copy)
-            
-            # Add part acceptance
-            if 'partAcceptance' in product:
-                for acceptance in product.get('partAcceptance', []):
-                    if isinstance(acceptance, dict):
-                        acceptance_copy = acceptance.copy()
-                        acceptance_copy['task'] = acceptance.get('name', 'Unknown Acceptance')
-                        acceptance_copy['start'] = acceptance.get('startDate', '')
-                        acceptance_copy['end'] = acceptance.get('endDate', '')
-                        acceptance_copy['fundingType'] = acceptance.get('funding', 'None')
-                        lane_tasks.append(acceptance_copy)
-        
-        # Add material system tasks
-        for material in material_systems:
-            # Skip if a specific material is selected and this is not it
-            if selected_material and selected_material != 'all' and material['id'] != selected_material:
-                continue
-                
-            if 'roadmap' in material:
-                for task in material['roadmap']:
-                    if task.get('lane', 'M&P') == lane:
-                        task_copy = task.copy()
-                        task_copy['material'] = material['name']
-                        task_copy['materialID'] = material['id']
-                        lane_tasks.append(task_copy)
-        
-        # Sort tasks by start date
-        lane_tasks.sort(key=lambda x: datetime.strptime(x.get('start', x.get('startDate', '2025-01-01')), "%Y-%m-%d") if x.get('start') or x.get('startDate') else datetime.now())
-        
-        for task in lane_tasks:
-            y_pos -= 1
-            all_tasks.append(task)  # Store all tasks for reference
-            
-            # Handle different date field names
-            start_key = 'start' if 'start' in task else 'startDate'
-            end_key = 'end' if 'end' in task else 'endDate'
-            
-            if not task.get(start_key) or not task.get(end_key):
-                continue
-                
-            start_date = datetime.strptime(task[start_key], "%Y-%m-%d")
-            end_date = datetime.strptime(task[end_key], "%Y-%m-%d")
-            all_dates.extend([start_date, end_date])
-            
-            # Get task funding type and color
-            funding_type = task.get('fundingType', 'None')
-            color = FUNDING_COLORS.get(funding_type, '#999999')
-            
-            # Get task status
-            status = task.get('status', 'Planned')
-            
-            # Check if task is floating
-            is_floating = task.get('float', False)
-            float_indicator = " (Floating)" if is_floating else ""
-            
-            # Get additional details if available
-            additional_details = task.get('additionalDetails', '')
-            
-            # Get material info if available
-            material_info = f" [{task.get('material', '')}]" if 'material' in task else ""
-            material_id = task.get('materialID', '')
-            
-            # Create data source for the task
-            task_source = ColumnDataSource(data=dict(
-                start=[start_date],
-                end=[end_date],
-                y=[y_pos],
-                task=[task.get('task', '')],
-                status=[status],
-                funding=[funding_type],
-                floating=[is_floating],
-                details=[additional_details],
-                material=[task.get('material', '')],
-                material_id=[material_id]
-            ))
-            
-            # Add task rectangle with a unique name for identification in the callback
-            task_rect = p.hbar(y='y', left='start', right='end', height=0.8, source=task_source,
-                   color=color, alpha=0.8, name=f"task_{y_pos}")
-            
-            # Add hover tool for task
-            hover = HoverTool(renderers=[task_rect], tooltips=[
-                ("Task", "@task"),
-                ("Status", "@status"),
-                ("Timeline", "@start{%F} to @end{%F}"),
-                ("Funding", "@funding"),
-                ("Floating", "@floating"),
-                ("Material", "@material"),
-                ("Details", "@details")
-            ], formatters={"@start": "datetime", "@end": "datetime"})
-            p.add_tools(hover)
-            
-            # Add task label - place inside the box if there's enough space
-            task_label = task.get('task', '') + float_indicator + material_info
-            task_duration = (end_date - start_date).days
-            
-            # Place text inside the box if duration is long enough (more than 60 days)
-            if task_duration > 60:
-                # Place text inside the box
-                text_x = start_date + (end_date - start_date) / 2  # Center of the bar
-                p.text(x=text_x, y=y_pos, text=[task_label],
-                       text_font_size="9pt", text_align="center", text_baseline="middle",
-                       text_color="white", text_font_style="bold")
-            else:
-                # Place text outside the box (to the right)
-                p.text(x=end_date, y=y_pos, text=[task_label],
-                       text_font_size="9pt", text_align="left", text_baseline="middle",
-                       x_offset=5)  # Add a small offset
-            
-            # Add to legend if not already there
-            if funding_type not in [item.label for item in legend_items]:
-                legend_items.append(LegendItem(label=funding_type, renderers=[task_rect]))
-    
-    # Add legend for funding types
-    if legend_items:
-        legend = Legend(items=legend_items, location="top_right", title="Funding Types")
-        p.add_layout(legend, 'right')
-    
-    # Set x-axis range based on all dates
-    if all_dates:
-        min_date = min(all_dates) - timedelta(days=30)
-        max_date = max(all_dates) + timedelta(days=30)
-        p.x_range = Range1d(min_date, max_date)
-    
-    # Set y-axis range
-    p.y_range = Range1d(y_pos - 1, 1)
-    
-    # Add today line
-    today_line = Span(location=datetime.now(), dimension='height', line_color='#3498db', line_dash='dashed', line_width=2)
-    p.add_layout(today_line)
-    
-    # Add today label
-    today_label = Label(
-        x=datetime.now(),
-        y=0.5,
-        text="Today",
-        text_color="#3498db",
-        text_font_style="bold",
-        text_align="center",
-        background_fill_color="white",
-        background_fill_alpha=0.7
-    )
-    p.add_layout(today_label)
-    
-    # Import the components function for embedding Bokeh plots
-    from bokeh.embed import components
-    
-    # Generate script and div components for the Bokeh plot
+    # Create the product roadmap (shared with the product detail page) and generate its components
+    from modules.product_detail import product_roadmap_figure
+    p, all_tasks = product_roadmap_figure(product, data, material_systems)
     script, div = components(p)
     
     # Count materials and associated programs
@@ -479,17 +198,18 @@ def generate_product_page(product, data, product_dir, status_colors):
     # Count associated programs
     associated_programs = set()
     program_names = []
-    for program in data['programs']:
-        for combo in program.get('productMaterialCombinations', []):
-            if combo.get('productID') == product_id:
-                associated_programs.add(program['id'])
-                program_names.append(f"{program['name']} ({program['id']})")
+    for program, combo in data.combinations_for_product(product_id):
+        associated_programs.add(program['id'])
+        program_names.append(f"{program['name']} ({program['id']})")
     
     programs_count = len(associated_programs)
     
     # Count total tasks
     total_tasks = len(all_tasks)
     
+    # Load BokehJS from the site's shared static copy
+    bokeh_scripts = bokeh_script_tags(os.path.join(product_dir, f"product_{product_id}.html"))
+    
     # Create HTML content for the page
     html_content = f"""
     <!DOCTYPE html>
@@ -500,9 +220,7 @@ def generate_product_page(product, data, product_dir, status_colors):
         <title>{product['name']} ({product_id})</title>
         
         <!-- Include Bokeh scripts -->
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-3.6.3.min.js"></script>
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-widgets-3.6.3.min.js"></script>
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-tables-3.6.3.min.js"></script>
+        {bokeh_scripts}
         
         <style>
             body {{
@@ -854,7 +572,7 @@ def generate_product_page(product, data, product_dir, status_colors):
     """
     
     # Write the HTML to the file
-    with open(os.path.join(product_dir, f"product_{product_id}.html"), "w") as f:
+    with open_output(os.path.join(product_dir, f"product_{product_id}.html"), "w") as f:
         f.write(html_content)
     
     print(f"Generated product page for {product['name']} ({product_id})")
@@ -862,6 +580,7 @@ def generate_product_page(product, data, product_dir, status_colors):
 def generate_product_summary(data, product_dir):
     """Generate a summary page for all products with styling matching implementation metrics page"""
     print("Generating product summary page...")
+    data = as_store(data)
     
     # Calculate key metrics
     total_products = len(data['products'])
@@ -1095,6 +814,9 @@ def generate_product_summary(data, product_dir):
     script_program, div_program = components(p_program)
     script_funding, div_funding = components(p_funding)
     
+    # Load BokehJS from the site's shared static copy
+    bokeh_scripts = bokeh_script_tags(os.path.join(product_dir, "product_summary.html"))
+    
     # Create HTML content with embedded scripts and divs
     html_content = f"""
     <!DOCTYPE html>
@@ -1105,9 +827,7 @@ def generate_product_summary(data, product_dir):
         <title>Product Summary</title>
         
         <!-- Include Bokeh scripts -->
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-3.6.3.min.js"></script>
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-widgets-3.6.3.min.js"></script>
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-tables-3.6.3.min.js"></script>
+        {bokeh_scripts}
         
         <style>
             body {{
@@ -1353,26 +1073,12 @@ def generate_product_summary(data, product_dir):
     # Add product rows
     for product in sorted(data['products'], key=lambda x: x['name']):
         # Get associated programs
-        associated_programs = []
-        for program in data['programs']:
-            for combo in program.get('productMaterialCombinations', []):
-                if combo.get('productID') == product['id']:
-                    associated_programs.append(f"{program['name']} ({program['id']})")
-                    break  # Only count each program once per product
+        associated_programs = [f"{program['name']} ({program['id']})"
+                               for program in data.programs_for_product(product['id'])]
         
         # Get material systems
-        material_systems = []
-        for material_entry in product.get('materialSystems', []):
-            if isinstance(material_entry, str):
-                material_id = material_entry
-            elif isinstance(material_entry, dict) and 'materialID' in material_entry:
-                material_id = material_entry['materialID']
-            else:
-                continue
-                
-            material = next((m for m in data['materialSystems'] if m['id'] == material_id), None)
-            if material:
-                material_systems.append(f"{material['name']} ({material_id})")
+        material_systems = [f"{material['name']} ({material['id']})"
+                            for material in data.materials_for_product(product)]
         
         # Format lists for display
         programs_display = ", ".join(associated_programs) if associated_programs else "None"
@@ -1410,13 +1116,14 @@ def generate_product_summary(data, product_dir):
     """
     
     # Write the HTML to the file
-    with open(os.path.join(product_dir, "product_summary.html"), "w") as f:
+    with open_output(os.path.join(product_dir, "product_summary.html"), "w") as f:
         f.write(html_content)
     
     print("Product summary page generated successfully.")
 
 def generate_product_distribution_charts(data, product_dir):
     """Generate distribution charts for products"""
+    data = as_store(data)
     # Count material systems per product
     materials_per_product = {}
     for product in data['products']:
@@ -1428,7 +1135,7 @@ def generate_product_distribution_charts(data, product_dir):
     material_counts = []
     
     for product_id, count in materials_per_product.items():
-        product = next((p for p in data['products'] if p['id'] == product_id), None)
+        product = data.product(product_id)
         if product:
             product_names.append(f"{product['name']} ({product_id})")
             material_counts.append(count)
@@ -1694,4 +1401,4 @@ def generate_product_distribution_charts(data, product_dir):
     
     # Output to file
     output_file(os.path.join(product_dir, "product_material_distribution.html"))
-    save(layout_obj) 
\ No newline at end of file
+    save_page(layout_obj) 
\ No newline at end of file
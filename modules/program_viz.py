@@ -1,54 +1,61 @@
 import os
 from datetime import datetime, timedelta
-from bokeh.plotting import figure, save, output_file
+from bokeh.plotting import figure, output_file
 from bokeh.models import ColumnDataSource, HoverTool, Label, Range1d, Span, Legend, LegendItem, Div, Tabs, Panel
 from bokeh.layouts import column, row, layout
 from bokeh.palettes import Category10, Spectral6
 import matplotlib.pyplot as plt
 import numpy as np
+from modules.roadmap_store import as_store
+from modules.bokeh_resources import save_page
+from modules.date_parsing import parse_date_or_none
+from modules.gantt import gantt_figure, gantt_layout, draw_gantt, add_need_date_markers
 
 def generate_program_visualizations(data, output_dir):
     """Generate visualizations for programs"""
     print("Generating program visualizations...")
     
+    for _, func, args, _ in program_visualization_tasks(as_store(data), output_dir):
+        func(*args)
+    
+    print(f"Program visualizations generated in '{os.path.join(output_dir, 'programs')}'")
+
+def program_visualization_tasks(data, output_dir):
+    """Return the independent (name, func, args, sources) tasks that make up the program visualizations"""
     # Create program directory if it doesn't exist
     program_dir = os.path.join(output_dir, "programs")
     if not os.path.exists(program_dir):
         os.makedirs(program_dir)
     
-    # Generate program summary page
-    generate_program_summary(data, program_dir)
-    
-    # Generate program distribution charts
-    generate_program_distribution_charts(data, program_dir)
+    # Program summary page and distribution charts
+    tasks = [
+        ("program_summary", generate_program_summary, (data, program_dir), ('programs',)),
+        ("program_distribution", generate_program_distribution_charts, (data, program_dir), ('programs', 'products')),
+    ]
     
-    # Generate individual program pages
+    # Individual program pages (built from the program alone)
     for program in data['programs']:
-        generate_program_page(program, data, program_dir)
+        tasks.append((f"program_{program['id']}", generate_program_page, (program, data, program_dir), ()))
     
-    print(f"Program visualizations generated in '{program_dir}'")
+    return tasks
 
 def generate_program_page(program, data, program_dir):
     """Generate a detailed page for a single program"""
     program_id = program['id']
     
     # Create a figure for the program timeline
-    p = figure(
-        title=f"Program: {program['name']} ({program_id})",
-        x_axis_type="datetime",
-        width=1200,
-        height=600,
-        toolbar_location="above",
-        tools="pan,wheel_zoom,box_zoom,reset,save",
-        sizing_mode="fixed",
-    )
-    
-    # Customize appearance
-    p.title.text_font_size = '16pt'
-    p.xaxis.axis_label = "Timeline"
-    p.yaxis.axis_label = "Products"
-    p.grid.grid_line_alpha = 0.3
-    p.background_fill_color = "#f8f9fa"
+    p = gantt_figure(title=f"Program: {program['name']} ({program_id})", height=600, y_label="Products",
+                     sizing_mode="fixed")
+    
+    # Need date of each product/material combination on the timeline
+    need_dates = []
+    for combo in program.get('productMaterialCombinations', []):
+        need_date = parse_date_or_none(combo.get('needDate'))
+        if need_date:
+            need_dates.append((need_date, f"{combo.get('productID', 'N/A')} ({combo.get('materialID', 'N/A')})\n"
+                                          f"Part: {combo.get('partName', 'N/A')}\nPN: {combo.get('partNumber', 'N/A')}"))
+    add_need_date_markers(p, need_dates)
+    draw_gantt(p, gantt_layout([]), {}, [], extra_dates=[need_date for need_date, _ in need_dates])
     
     # Create header with modern styling
     header = Div(
@@ -101,7 +108,7 @@ def generate_program_page(program, data, program_dir):
     
     # Output to file
     output_file(os.path.join(program_dir, f"program_{program_id}.html"))
-    save(final_layout)
+    save_page(final_layout)
     
     print(f"Generated program page for {program_id}")
 
@@ -189,13 +196,14 @@ def generate_program_summary(data, program_dir):
     
     # Output to file
     output_file(os.path.join(program_dir, "program_summary.html"))
-    save(final_layout)
+    save_page(final_layout)
     
     print("Generated program summary page")
 
 def generate_program_distribution_charts(data, program_dir):
     """Generate distribution charts for programs"""
     print("Generating program distribution charts...")
+    data = as_store(data)
     
     # Count products per program
     products_per_program = {}
@@ -214,7 +222,7 @@ def generate_program_distribution_charts(data, program_dir):
     product_counts = []
     
     for program_id, count in products_per_program.items():
-        program = next((p for p in data['programs'] if p['id'] == program_id), None)
+        program = data.program(program_id)
         if program:
             program_names.append(f"{program['name']} ({program_id})")
             product_counts.append(count)
@@ -321,6 +329,6 @@ def generate_program_distribution_charts(data, program_dir):
     
     # Output to file
     output_file(os.path.join(program_dir, "program_distribution.html"))
-    save(final_layout)
+    save_page(final_layout)
     
     print("Generated program distribution charts") 
\ No newline at end of file
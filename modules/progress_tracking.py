@@ -11,11 +11,36 @@ import os
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from bokeh.plotting import figure, save, output_file
+from bokeh.plotting import figure, output_file
+from modules.bokeh_resources import save_page
+from modules.build_manifest import open_output
 from bokeh.models import ColumnDataSource, HoverTool, Label, Div, Tabs, Panel, DataTable, TableColumn, DateFormatter, Span
 from bokeh.transform import dodge
 from bokeh.layouts import column, row, gridplot
 from bokeh.palettes import Category10, Spectral6
+from modules.roadmap_store import as_store
+
+# Task table columns shown in the burndown task details table, in order
+BURNDOWN_COLUMNS = ['id', 'name', 'entity_type', 'entity_name', 'entity_id', 'start', 'end',
+                    'status', 'float', 'additionalDetails', 'start_date', 'end_date']
+
+# Planned vs. actual category of each (owner, section) of the task table; product
+# roadmap tasks are categorized by lane instead
+SECTION_CATEGORIES = {
+    ('product', 'designTools'): "Design Tasks",
+    ('product', 'documentation'): "Documentation Tasks",
+    ('product', 'specialNDT'): "Testing Tasks",
+    ('product', 'partAcceptance'): "Qualification Tasks",
+    ('material', 'roadmap'): "Testing Tasks",  # Assume material tasks are testing/qualification
+}
+LANE_CATEGORIES = {
+    'Design': "Design Tasks",
+    'Manufacturing': "Manufacturing Tasks",
+    'Testing': "Testing Tasks",
+    'Test': "Testing Tasks",
+    'Qualification': "Qualification Tasks",
+    'Quality': "Qualification Tasks",
+}
 
 def generate_progress_tracking(data, output_dir):
     """Generate progress tracking visualizations"""
@@ -50,166 +75,29 @@ def generate_burndown_charts(data, progress_dir):
     # Set up the output file
     output_file(os.path.join(progress_dir, "burndown_charts.html"))
     
-    # Collect all tasks from programs and products
-    all_tasks = []
-    
-    # Process program tasks
-    for program in data.get('programs', []):
-        if 'roadmap' in program and 'tasks' in program['roadmap']:
-            for task in program['roadmap']['tasks']:
-                task_info = {
-                    'id': f"P{program['id']}_T{task.get('task', 'Unknown')}",
-                    'name': task.get('task', 'Unknown'),
-                    'entity_type': 'Program',
-                    'entity_name': program.get('name', 'Unknown'),
-                    'entity_id': program.get('id', 'Unknown'),
-                    'start': task.get('start', ''),
-                    'end': task.get('end', ''),
-                    'status': task.get('status', 'Unknown'),
-                    'float': task.get('float', False),
-                    'additionalDetails': task.get('additionalDetails', '')
-                }
-                all_tasks.append(task_info)
-    
-    # Process product tasks
-    for product in data.get('products', []):
-        # Process roadmap tasks
-        if 'roadmap' in product:
-            for task in product.get('roadmap', []):
-                task_info = {
-                    'id': f"P{product['id']}_T{task.get('task', 'Unknown')}",
-                    'name': task.get('task', 'Unknown'),
-                    'entity_type': 'Product',
-                    'entity_name': product.get('name', 'Unknown'),
-                    'entity_id': product.get('id', 'Unknown'),
-                    'start': task.get('start', ''),
-                    'end': task.get('end', ''),
-                    'status': task.get('status', 'Unknown'),
-                    'float': task.get('float', False),
-                    'additionalDetails': task.get('additionalDetails', '')
-                }
-                all_tasks.append(task_info)
-        
-        # Process design tools tasks
-        if 'designTools' in product:
-            for tool in product.get('designTools', []):
-                if isinstance(tool, dict):
-                    task_info = {
-                        'id': f"P{product['id']}_DT_{tool.get('name', 'Unknown')}",
-                        'name': tool.get('name', 'Unknown'),
-                        'entity_type': 'Design Tool',
-                        'entity_name': product.get('name', 'Unknown'),
-                        'entity_id': product.get('id', 'Unknown'),
-                        'start': tool.get('start', ''),
-                        'end': tool.get('end', ''),
-                        'status': tool.get('status', 'Unknown'),
-                        'float': tool.get('float', False),
-                        'additionalDetails': tool.get('additionalDetails', '')
-                    }
-                    all_tasks.append(task_info)
-        
-        # Process documentation tasks
-        if 'documentation' in product:
-            for doc in product.get('documentation', []):
-                if isinstance(doc, dict):
-                    task_info = {
-                        'id': f"P{product['id']}_DOC_{doc.get('name', 'Unknown')}",
-                        'name': doc.get('name', 'Unknown'),
-                        'entity_type': 'Documentation',
-                        'entity_name': product.get('name', 'Unknown'),
-                        'entity_id': product.get('id', 'Unknown'),
-                        'start': doc.get('start', ''),
-                        'end': doc.get('end', ''),
-                        'status': doc.get('status', 'Unknown'),
-                        'float': doc.get('float', False),
-                        'additionalDetails': doc.get('additionalDetails', '')
-                    }
-                    all_tasks.append(task_info)
-        
-        # Process special NDT tasks
-        if 'specialNDT' in product:
-            for ndt in product.get('specialNDT', []):
-                if isinstance(ndt, dict):
-                    task_info = {
-                        'id': f"P{product['id']}_NDT_{ndt.get('name', 'Unknown')}",
-                        'name': ndt.get('name', 'Unknown'),
-                        'entity_type': 'Special NDT',
-                        'entity_name': product.get('name', 'Unknown'),
-                        'entity_id': product.get('id', 'Unknown'),
-                        'start': ndt.get('startDate', ''),
-                        'end': ndt.get('endDate', ''),
-                        'status': ndt.get('status', 'Unknown'),
-                        'float': ndt.get('float', False),
-                        'additionalDetails': ndt.get('additionalDetails', '')
-                    }
-                    all_tasks.append(task_info)
-        
-        # Process part acceptance tasks
-        if 'partAcceptance' in product:
-            for acceptance in product.get('partAcceptance', []):
-                if isinstance(acceptance, dict):
-                    task_info = {
-                        'id': f"P{product['id']}_PA_{acceptance.get('name', 'Unknown')}",
-                        'name': acceptance.get('name', 'Unknown'),
-                        'entity_type': 'Part Acceptance',
-                        'entity_name': product.get('name', 'Unknown'),
-                        'entity_id': product.get('id', 'Unknown'),
-                        'start': acceptance.get('startDate', ''),
-                        'end': acceptance.get('endDate', ''),
-                        'status': acceptance.get('status', 'Unknown'),
-                        'float': acceptance.get('float', False),
-                        'additionalDetails': acceptance.get('additionalDetails', '')
-                }
-                all_tasks.append(task_info)
-    
-    # Process material system tasks
-    for material in data.get('materialSystems', []):
-        if 'roadmap' in material:
-            for task in material.get('roadmap', []):
-                task_info = {
-                    'id': f"M{material['id']}_T{task.get('task', 'Unknown')}",
-                    'name': task.get('task', 'Unknown'),
-                    'entity_type': 'Material',
-                    'entity_name': material.get('name', 'Unknown'),
-                    'entity_id': material.get('id', 'Unknown'),
-                    'start': task.get('startDate', ''),
-                    'end': task.get('endDate', ''),
-                    'status': task.get('status', 'Unknown'),
-                    'float': task.get('float', False),
-                    'additionalDetails': task.get('additionalDetails', '')
-                }
-                all_tasks.append(task_info)
-    
-    # Filter out tasks without dates
-    valid_tasks = [t for t in all_tasks if t['start'] and t['end']]
-    
-    if not valid_tasks:
+    # Tasks with both dates, from the task table shared by every generator
+    table = as_store(data).task_table()
+    dated = table[(table['start'] != '') & (table['end'] != '')
+                  & table['start_date'].notna() & table['end_date'].notna()]
+    
+    if dated.empty:
         print("No valid tasks with dates found for burndown chart")
         return
     
-    # Convert dates to datetime objects
-    for task in valid_tasks:
-        task['start_date'] = datetime.strptime(task['start'], "%Y-%m-%d")
-        task['end_date'] = datetime.strptime(task['end'], "%Y-%m-%d")
-    
-    # Create a DataFrame for analysis
-    df = pd.DataFrame(valid_tasks)
+    # Columns shown in the task details table
+    df = dated[BURNDOWN_COLUMNS].reset_index(drop=True)
     
     # Calculate overall date range
     min_date = df['start_date'].min()
     max_date = df['end_date'].max()
     date_range = pd.date_range(start=min_date, end=max_date, freq='MS')  # Monthly
     
-    # Count tasks by status and date
+    # For each month, count tasks of each status that should be complete by that time
+    # (a binary search of each month in the sorted end dates of the status)
     status_counts = {}
-    for status in df['status'].unique():
-        status_counts[status] = []
-        
-    # For each month, count tasks that should be complete by that time
-    for date in date_range:
-        for status in status_counts.keys():
-            count = len(df[(df['end_date'] <= date) & (df['status'] == status)])
-            status_counts[status].append(count)
+    for status, end_dates in df.groupby('status', sort=False)['end_date']:
+        sorted_ends = np.sort(end_dates.to_numpy())
+        status_counts[status] = np.searchsorted(sorted_ends, date_range.to_numpy(), side='right').tolist()
     
     # Create a stacked area chart
     p = figure(
@@ -319,7 +207,7 @@ def generate_burndown_charts(data, progress_dir):
     layout_obj = column(p, data_table)
     
     # Save the visualization
-    save(layout_obj)
+    save_page(layout_obj)
 
 def generate_milestone_tracking(data, progress_dir):
     """Generate milestone achievement tracking"""
@@ -328,56 +216,23 @@ def generate_milestone_tracking(data, progress_dir):
     # Set up the output file
     output_file(os.path.join(progress_dir, "milestone_tracking.html"))
     
-    # Collect all milestones from programs and products
+    # Milestones from the milestone table shared by every generator (dates already parsed)
+    milestones = as_store(data).milestone_table()
+    now = datetime.now()
     all_milestones = []
-    
-    # Process program milestones
-    for program in data.get('programs', []):
-        if 'milestones' in program:
-            for milestone in program['milestones']:
-                milestone_info = {
-                    'id': f"P{program['id']}_M{milestone.get('name', 'Unknown')}",
-                    'name': milestone.get('name', 'Unknown'),
-                    'entity_type': 'Program',
-                    'entity_name': program.get('name', 'Unknown'),
-                    'entity_id': program.get('id', 'Unknown'),
-                    'date': milestone.get('date', ''),
-                    'description': milestone.get('description', ''),
-                    'status': 'Complete' if milestone.get('date', '') and datetime.strptime(milestone.get('date', '2099-12-31'), '%Y-%m-%d') < datetime.now() else 'Planned'
-                }
-                all_milestones.append(milestone_info)
-    
-    # Process product milestones
-    for product in data.get('products', []):
-        if 'milestones' in product:
-            for milestone in product['milestones']:
-                milestone_info = {
-                    'id': f"P{product['id']}_M{milestone.get('name', 'Unknown')}",
-                    'name': milestone.get('name', 'Unknown'),
-                    'entity_type': 'Product',
-                    'entity_name': product.get('name', 'Unknown'),
-                    'entity_id': product.get('id', 'Unknown'),
-                    'date': milestone.get('date', ''),
-                    'description': milestone.get('description', ''),
-                    'status': 'Complete' if milestone.get('date', '') and datetime.strptime(milestone.get('date', '2099-12-31'), '%Y-%m-%d') < datetime.now() else 'Planned'
-                }
-                all_milestones.append(milestone_info)
-    
-    # Process material system milestones
-    for material in data.get('materialSystems', []):
-        if 'milestones' in material:
-            for milestone in material['milestones']:
-                milestone_info = {
-                    'id': f"M{material['id']}_M{milestone.get('name', 'Unknown')}",
-                    'name': milestone.get('name', 'Unknown'),
-                    'entity_type': 'Material',
-                    'entity_name': material.get('name', 'Unknown'),
-                    'entity_id': material.get('id', 'Unknown'),
-                    'date': milestone.get('date', ''),
-                    'description': milestone.get('description', ''),
-                    'status': 'Complete' if milestone.get('date', '') and datetime.strptime(milestone.get('date', '2099-12-31'), '%Y-%m-%d') < datetime.now() else 'Planned'
-                }
-                all_milestones.append(milestone_info)
+    for row in milestones.itertuples(index=False):
+        milestone_info = {
+            'id': row.id,
+            'name': row.name,
+            'entity_type': row.entity_type,
+            'entity_name': row.entity_name,
+            'entity_id': row.entity_id,
+            'date': row.date,
+            'date_value': row.date_value,
+            'description': row.description,
+            'status': 'Complete' if row.date and row.date_value < now else 'Planned'
+        }
+        all_milestones.append(milestone_info)
     
     # Create a milestone table
     if all_milestones:
@@ -424,20 +279,13 @@ def generate_milestone_tracking(data, progress_dir):
         earliest_date = today - timedelta(days=180)  # 6 months ago
         latest_date = today + timedelta(days=365)  # 1 year ahead
         
-        timeline_milestones = []
-        for m in all_milestones:
-            if m['date']:
-                try:
-                    date = datetime.strptime(m['date'], '%Y-%m-%d')
-                    if earliest_date <= date <= latest_date:
-                        timeline_milestones.append(m)
-                except ValueError:
-                    # Skip milestones with invalid dates
-                    pass
+        # Milestones with invalid dates have a NaT date_value, which is never in range
+        timeline_milestones = [m for m in all_milestones
+                               if m['date'] and earliest_date <= m['date_value'] <= latest_date]
         
         if timeline_milestones:
             # Sort by date
-            timeline_milestones = sorted(timeline_milestones, key=lambda x: datetime.strptime(x['date'], '%Y-%m-%d'))
+            timeline_milestones = sorted(timeline_milestones, key=lambda x: x['date_value'])
             
             # Create timeline visualization
             p = figure(
@@ -474,7 +322,7 @@ def generate_milestone_tracking(data, progress_dir):
             
             # Plot milestones
             source = ColumnDataSource(data=dict(
-                x=[datetime.strptime(m['date'], '%Y-%m-%d').strftime('%Y-%m-%d') for m in timeline_milestones],
+                x=[m['date_value'].strftime('%Y-%m-%d') for m in timeline_milestones],
                 y=list(range(len(timeline_milestones))),
                 name=[m['name'] for m in timeline_milestones],
                 entity=[m['entity_name'] for m in timeline_milestones],
@@ -499,7 +347,7 @@ def generate_milestone_tracking(data, progress_dir):
             # Add milestone names
             for i, milestone in enumerate(timeline_milestones):
                 milestone_name = Label(
-                    x=datetime.strptime(milestone['date'], '%Y-%m-%d').strftime('%Y-%m-%d'),
+                    x=milestone['date_value'].strftime('%Y-%m-%d'),
                     y=i,
                     text=f"{milestone['name']} ({milestone['entity_name']})",
                     text_font_size="9pt",
@@ -530,7 +378,7 @@ def generate_milestone_tracking(data, progress_dir):
         layout = column(placeholder_div)
     
     # Save the milestone tracking
-    save(layout)
+    save_page(layout)
 
 def generate_planned_vs_actual(data, progress_dir):
     """Generate planned vs actual progress visualization"""
@@ -549,65 +397,19 @@ def generate_planned_vs_actual(data, progress_dir):
         "Documentation Tasks": {"total": 0, "complete": 0}
     }
     
-    # Process all products
-    for product in data.get('products', []):
-        # Process roadmap tasks
-        for task in product.get('roadmap', []):
-            lane = task.get('lane', 'Other')
-            status = task.get('status', '')
-            
-            if lane == 'Design':
-                categories["Design Tasks"]["total"] += 1
-                if status == 'Complete':
-                    categories["Design Tasks"]["complete"] += 1
-            elif lane == 'Manufacturing':
-                categories["Manufacturing Tasks"]["total"] += 1
-                if status == 'Complete':
-                    categories["Manufacturing Tasks"]["complete"] += 1
-            elif lane in ['Testing', 'Test']:
-                categories["Testing Tasks"]["total"] += 1
-                if status == 'Complete':
-                    categories["Testing Tasks"]["complete"] += 1
-            elif lane in ['Qualification', 'Quality']:
-                categories["Qualification Tasks"]["total"] += 1
-                if status == 'Complete':
-                    categories["Qualification Tasks"]["complete"] += 1
-        
-        # Process design tools
-        for tool in product.get('designTools', []):
-            if isinstance(tool, dict):
-                categories["Design Tasks"]["total"] += 1
-                if tool.get('status') == 'Complete':
-                    categories["Design Tasks"]["complete"] += 1
-        
-        # Process documentation
-        for doc in product.get('documentation', []):
-            if isinstance(doc, dict):
-                categories["Documentation Tasks"]["total"] += 1
-                if doc.get('status') == 'Complete':
-                    categories["Documentation Tasks"]["complete"] += 1
-        
-        # Process special NDT (counts as testing)
-        for ndt in product.get('specialNDT', []):
-            if isinstance(ndt, dict):
-                categories["Testing Tasks"]["total"] += 1
-                if ndt.get('status') == 'Complete':
-                    categories["Testing Tasks"]["complete"] += 1
-        
-        # Process part acceptance (counts as qualification)
-        for acceptance in product.get('partAcceptance', []):
-            if isinstance(acceptance, dict):
-                categories["Qualification Tasks"]["total"] += 1
-                if acceptance.get('status') == 'Complete':
-                    categories["Qualification Tasks"]["complete"] += 1
-    
-    # Process material systems
-    for material in data.get('materialSystems', []):
-        for task in material.get('roadmap', []):
-            # Assume material tasks are testing/qualification
-            categories["Testing Tasks"]["total"] += 1
-            if task.get('status') == 'Complete':
-                categories["Testing Tasks"]["complete"] += 1
+    # Categorize every task of the task table, then count totals and completions per category
+    table = as_store(data).task_table()
+    section_category = pd.Series(
+        [SECTION_CATEGORIES.get(key) for key in zip(table['owner'], table['section'])],
+        index=table.index, dtype=object)
+    is_product_roadmap = (table['owner'] == 'product') & (table['section'] == 'roadmap')
+    lane_category = table['lane'].map(LANE_CATEGORIES).where(is_product_roadmap)
+    category = section_category.where(section_category.notna(), lane_category)
+    complete = table['status'] == 'Complete'
+    counts = pd.DataFrame({'category': category, 'complete': complete}).dropna().groupby('category')['complete'].agg(['size', 'sum'])
+    for name, row in counts.iterrows():
+        categories[name]["total"] = int(row['size'])
+        categories[name]["complete"] = int(row['sum'])
     
     # Calculate percentages
     category_names = list(categories.keys())
@@ -730,7 +532,7 @@ def generate_planned_vs_actual(data, progress_dir):
     layout = column(explanation_div, p, summary_table)
     
     # Save the visualization
-    save(layout)
+    save_page(layout)
 
 def generate_progress_dashboard(data, progress_dir):
     """Generate the progress tracking dashboard"""
@@ -916,5 +718,5 @@ def generate_progress_dashboard(data, progress_dir):
     """
     
     # Write the HTML to file
-    with open(os.path.join(progress_dir, "progress_dashboard.html"), 'w') as f:
+    with open_output(os.path.join(progress_dir, "progress_dashboard.html"), 'w') as f:
         f.write(dashboard_html) 
\ No newline at end of file
@@ -5,114 +5,43 @@ from bokeh.models import ColumnDataSource, HoverTool, Label, Range1d, Span, Lege
 from bokeh.layouts import column, row, layout, gridplot
 from bokeh.palettes import Category10, Spectral6
 from bokeh.transform import factor_cmap
-import matplotlib.pyplot as plt
 import numpy as np
+from .roadmap_store import as_store
+from .chart_renderer import chart_figure
+from .chart_cache import cached_chart
+from .html_templates import format_rows, render_template, write_page
+
+# Pursuit fields listed in a pursuit's details table, when set
+PURSUIT_FIELDS = [
+    ('targetedSubmissionDate', 'Targeted Submission Date'),
+    ('pointOfContact', 'Point of Contact'),
+    ('Pcap', 'Probability of Capture (Pcap)'),
+    ('Pgo', 'Probability of Go (Pgo)'),
+    ('otherRelevance', 'Other Relevance'),
+    ('details', 'Details'),
+]
+
+# Row pattern of the pursuits summary table (format_rows escapes the values)
+PURSUIT_SUMMARY_ROW = ('<tr><td>{0}</td><td>{1}</td><td><a href="funding_{2}.html">{3} ({2})</a></td>'
+                       '<td>{4}</td><td>{5}</td><td>{6}</td><td>{7}</td></tr>\n')
 
 def generate_pursuit_section(pursuit, data, funding_dir, funding_id):
     """Generate HTML section for a single pursuit within a funding opportunity"""
     pursuit_id = pursuit['pursuitID']
-    pursuit_name = pursuit.get('pursuitName', 'Unnamed Pursuit')
-    
-    # Create pursuit info section
-    pursuit_section = f"""
-    <div style="margin-top: 20px; padding: 15px; background-color: #f5f5f5; border-radius: 5px;">
-        <h3>Pursuit: {pursuit_name} ({pursuit_id})</h3>
-        <table style="width: 100%; border-collapse: collapse;">
-    """
-    
-    # Add submission date if available
-    if 'targetedSubmissionDate' in pursuit and pursuit['targetedSubmissionDate']:
-        pursuit_section += f"""
-        <tr>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;"><strong>Targeted Submission Date:</strong></td>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;">{pursuit['targetedSubmissionDate']}</td>
-        </tr>
-        """
-    
-    # Add point of contact if available
-    if 'pointOfContact' in pursuit and pursuit['pointOfContact']:
-        pursuit_section += f"""
-        <tr>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;"><strong>Point of Contact:</strong></td>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;">{pursuit['pointOfContact']}</td>
-        </tr>
-        """
-    
-    # Add Pcap and Pgo if available
-    if 'Pcap' in pursuit and pursuit['Pcap']:
-        pursuit_section += f"""
-        <tr>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;"><strong>Probability of Capture (Pcap):</strong></td>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;">{pursuit['Pcap']}</td>
-        </tr>
-        """
-    
-    if 'Pgo' in pursuit and pursuit['Pgo']:
-        pursuit_section += f"""
-        <tr>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;"><strong>Probability of Go (Pgo):</strong></td>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;">{pursuit['Pgo']}</td>
-        </tr>
-        """
-    
-    # Add other relevance if available
-    if 'otherRelevance' in pursuit and pursuit['otherRelevance']:
-        pursuit_section += f"""
-        <tr>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;"><strong>Other Relevance:</strong></td>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;">{pursuit['otherRelevance']}</td>
-        </tr>
-        """
-    
-    # Add details if available
-    if 'details' in pursuit and pursuit['details']:
-        pursuit_section += f"""
-        <tr>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;"><strong>Details:</strong></td>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;">{pursuit['details']}</td>
-        </tr>
-        """
-    
-    # Close the table
-    pursuit_section += """
-        </table>
-    """
-    
-    # Add related products and materials section
-    related_products_section = generate_related_products_section(pursuit, data)
-    if related_products_section:
-        pursuit_section += related_products_section
-    
-    # Add potential value visualization if available
-    potential_value_section = generate_potential_value_visualization(pursuit, funding_dir, funding_id, pursuit_id)
-    if potential_value_section:
-        pursuit_section += potential_value_section
-    
-    # Close the pursuit section div
-    pursuit_section += """
-    </div>
-    """
-    
-    return pursuit_section
+    return render_template(
+        "pursuit_section.html",
+        pursuit_id=pursuit_id,
+        pursuit_name=pursuit.get('pursuitName', 'Unnamed Pursuit'),
+        details=[(label, pursuit[key]) for key, label in PURSUIT_FIELDS if pursuit.get(key)],
+        related_products=related_product_rows(pursuit, data),
+        value_chart=generate_potential_value_visualization(pursuit, funding_dir, funding_id, pursuit_id),
+    )
 
-def generate_related_products_section(pursuit, data):
-    """Generate HTML section for related products and materials"""
-    # Check if there are related products
-    if 'relatedProducts' not in pursuit or not pursuit['relatedProducts']:
-        return ""
-    
-    related_products_section = """
-    <div style="margin-top: 15px;">
-        <h4>Related Products and Materials</h4>
-        <table style="width: 100%; border-collapse: collapse;">
-            <tr style="background-color: #e0e0e0;">
-                <th style="padding: 8px; text-align: left; border-bottom: 2px solid #ddd;">Product</th>
-                <th style="padding: 8px; text-align: left; border-bottom: 2px solid #ddd;">Material System</th>
-            </tr>
-    """
-    
-    # Process related products based on format
+def parse_related_products(pursuit):
+    """Return the pursuit's related products as [{'product_id': ..., 'material_id': ...}]"""
     related_items = []
+    if 'relatedProducts' not in pursuit or not pursuit['relatedProducts']:
+        return related_items
     
     # Handle string format like "P1 | MS1, P3 | MS2"
     if isinstance(pursuit['relatedProducts'], str):
@@ -138,59 +67,56 @@ def generate_related_products_section(pursuit, data):
                         'material_id': material_id
                     })
     
-    # Add rows for each related product and material
-    for item in related_items:
-        product_id = item['product_id']
-        material_id = item['material_id']
-        
+    return related_items
+
+def related_product_rows(pursuit, data):
+    """Return the pursuit's related products and materials with their names, or None if it lists none"""
+    if 'relatedProducts' not in pursuit or not pursuit['relatedProducts']:
+        return None
+    data = as_store(data)
+    rows = []
+    for item in parse_related_products(pursuit):
         # Find product and material names
-        product_name = "Unknown"
-        material_name = "Unknown"
-        
-        # Look up product name
-        for product in data.get('products', []):
-            if product['id'] == product_id:
-                product_name = product['name']
-                break
+        product = data.product(item['product_id'])
+        material = data.material(item['material_id'])
+        rows.append(dict(item,
+                         product_name=product['name'] if product else "Unknown",
+                         material_name=material['name'] if material else "Unknown"))
+    return rows
+
+@cached_chart
+def save_potential_value_chart(path, fiscal_years, values, pursuit_id):
+    """Save a bar chart of a pursuit's potential value by fiscal year as a PNG"""
+    with chart_figure(path, (10, 6)) as fig:
+        ax = fig.subplots()
+        bars = ax.bar(fiscal_years, values, color=Category10[10][0])
         
-        # Look up material name
-        for material in data.get('materialSystems', []):
-            if material['id'] == material_id:
-                material_name = material['name']
-                break
+        # Add value labels on top of bars
+        for bar in bars:
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                    f'${height:,.0f}', ha='center', va='bottom')
         
-        related_products_section += f"""
-        <tr>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;">
-                <a href="../products/product_{product_id}.html">{product_name} ({product_id})</a>
-            </td>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;">
-                <a href="../materials/material_{material_id}.html">{material_name} ({material_id})</a>
-            </td>
-        </tr>
-        """
-    
-    related_products_section += """
-        </table>
-    </div>
-    """
-    
-    return related_products_section
+        # Add labels and title
+        ax.set_title(f'Potential Value by Fiscal Year for {pursuit_id}')
+        ax.set_xlabel('Fiscal Year')
+        ax.set_ylabel('Value ($)')
+        ax.grid(axis='y', linestyle='--', alpha=0.7)
 
-def generate_potential_value_visualization(pursuit, funding_dir, funding_id, pursuit_id):
-    """Generate visualization for potential value over fiscal years"""
+def potential_value_series(pursuit):
+    """Return a pursuit's potential value as (fiscal years, values) sorted by year, or ([], []) without value data"""
     if 'potentialValue' not in pursuit or not pursuit['potentialValue']:
-        return ""
+        return [], []
     
     # Extract potential value data
     potential_value = pursuit['potentialValue']
     if not isinstance(potential_value, list) or not potential_value:
-        return ""
+        return [], []
     
     # Get the first (and typically only) potential value object
     value_data = potential_value[0]
     if not isinstance(value_data, dict):
-        return ""
+        return [], []
     
     # Extract fiscal years and values
     fiscal_years = []
@@ -213,47 +139,27 @@ def generate_potential_value_visualization(pursuit, funding_dir, funding_id, pur
             else:
                 values.append(0)
     
-    # If no valid data, return empty string
+    # No valid data
     if not fiscal_years or not values:
-        return ""
+        return [], []
     
     # Sort by fiscal year
     sorted_data = sorted(zip(fiscal_years, values), key=lambda x: x[0])
     fiscal_years = [item[0] for item in sorted_data]
     values = [item[1] for item in sorted_data]
+    return fiscal_years, values
+
+def generate_potential_value_visualization(pursuit, funding_dir, funding_id, pursuit_id):
+    """Save the potential value chart of a pursuit; returns its filename, or "" without value data"""
+    fiscal_years, values = potential_value_series(pursuit)
+    if not fiscal_years:
+        return ""
     
     # Create a bar chart for potential value
-    plt.figure(figsize=(10, 6))
-    bars = plt.bar(fiscal_years, values, color=Category10[10][0])
-    
-    # Add value labels on top of bars
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                 f'${height:,.0f}', ha='center', va='bottom')
-    
-    # Add labels and title
-    plt.title(f'Potential Value by Fiscal Year for {pursuit_id}')
-    plt.xlabel('Fiscal Year')
-    plt.ylabel('Value ($)')
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
-    
-    # Save the figure
     chart_filename = f"pursuit_value_{funding_id}_{pursuit_id}.png"
-    plt.savefig(os.path.join(funding_dir, chart_filename), dpi=300, bbox_inches='tight')
-    plt.close()
-    
-    # Create HTML section for the visualization
-    potential_value_section = f"""
-    <div style="margin-top: 15px;">
-        <h4>Potential Value by Fiscal Year</h4>
-        <div style="text-align: center;">
-            <img src="{chart_filename}" alt="Potential Value Chart" style="max-width: 100%; border: 1px solid #ddd;">
-        </div>
-    </div>
-    """
+    save_potential_value_chart(os.path.join(funding_dir, chart_filename), fiscal_years, values, pursuit_id)
     
-    return potential_value_section
+    return chart_filename
 
 def generate_pursuits_summary(funding_opportunities, data, funding_dir):
     """Generate a summary page for all pursuits across all funding opportunities"""
@@ -278,104 +184,10 @@ def generate_pursuits_summary(funding_opportunities, data, funding_dir):
                 'pursuit': pursuit
             })
     
-    # If no pursuits, create a simple message
-    if not all_pursuits:
-        html_content = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Pursuits Summary</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 20px; line-height: 1.6; }
-                h1 { color: #333; }
-                a { color: #0066cc; text-decoration: none; }
-                a:hover { text-decoration: underline; }
-                .container { max-width: 1200px; margin: 0 auto; }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>Pursuits Summary</h1>
-                <p>No pursuits found in the data.</p>
-                <p><a href="../index.html">Back to Dashboard</a> | <a href="funding_summary.html">Back to Funding Summary</a></p>
-            </div>
-        </body>
-        </html>
-        """
-        
-        with open(os.path.join(funding_dir, "pursuits_summary.html"), 'w') as f:
-            f.write(html_content)
-        
-        return
-    
-    # Create HTML content for the summary page
-    html_content = """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Pursuits Summary</title>
-        <style>
-            body { font-family: Arial, sans-serif; margin: 20px; line-height: 1.6; }
-            h1 { color: #333; }
-            h2, h3, h4 { color: #0066cc; }
-            a { color: #0066cc; text-decoration: none; }
-            a:hover { text-decoration: underline; }
-            .container { max-width: 1200px; margin: 0 auto; }
-            .card { 
-                border: 1px solid #ddd; 
-                border-radius: 5px; 
-                padding: 15px; 
-                margin-bottom: 20px;
-                background-color: #f9f9f9;
-            }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>Pursuits Summary</h1>
-            <p>This page provides an overview of all pursuits across all funding opportunities.</p>
-            <p><a href="../index.html">Back to Dashboard</a> | <a href="funding_summary.html">Back to Funding Summary</a></p>
-            
-            <div class="card">
-                <h2>All Pursuits</h2>
-                <table style="width: 100%; border-collapse: collapse;">
-                    <tr style="background-color: #e0e0e0;">
-                        <th style="padding: 8px; text-align: left; border-bottom: 2px solid #ddd;">Pursuit ID</th>
-                        <th style="padding: 8px; text-align: left; border-bottom: 2px solid #ddd;">Pursuit Name</th>
-                        <th style="padding: 8px; text-align: left; border-bottom: 2px solid #ddd;">Funding Opportunity</th>
-                        <th style="padding: 8px; text-align: left; border-bottom: 2px solid #ddd;">Submission Date</th>
-                        <th style="padding: 8px; text-align: left; border-bottom: 2px solid #ddd;">Point of Contact</th>
-                        <th style="padding: 8px; text-align: left; border-bottom: 2px solid #ddd;">Pcap</th>
-                        <th style="padding: 8px; text-align: left; border-bottom: 2px solid #ddd;">Pgo</th>
-                    </tr>
-    """
-    
-    # Add rows for each pursuit
-    for pursuit in all_pursuits:
-        html_content += f"""
-        <tr>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;">{pursuit['pursuit_id']}</td>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;">{pursuit['pursuit_name']}</td>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;">
-                <a href="funding_{pursuit['funding_id']}.html">{pursuit['funding_name']} ({pursuit['funding_id']})</a>
-            </td>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;">{pursuit['submission_date']}</td>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;">{pursuit['point_of_contact']}</td>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;">{pursuit['pcap']}</td>
-            <td style="padding: 8px; border-bottom: 1px solid #ddd;">{pursuit['pgo']}</td>
-        </tr>
-        """
-    
-    html_content += """
-                </table>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-    
-    # Write to file
-    with open(os.path.join(funding_dir, "pursuits_summary.html"), 'w') as f:
-        f.write(html_content)
-    
-    print(f"Pursuits summary page generated in '{funding_dir}/pursuits_summary.html'") 
\ No newline at end of file
+    # Render the summary table, or a short message without pursuits
+    write_page(os.path.join(funding_dir, "pursuits_summary.html"), "pursuits_summary.html",
+               pursuit_rows=format_rows(PURSUIT_SUMMARY_ROW, [
+                   (p['pursuit_id'], p['pursuit_name'], p['funding_id'], p['funding_name'],
+                    p['submission_date'], p['point_of_contact'], p['pcap'], p['pgo'])
+                   for p in all_pursuits
+               ]))
@@ -0,0 +1,151 @@
+"""
+Reachability Module for Roadmap Visualizations
+
+This module answers "what is downstream / upstream of X" on the roadmap network including:
+1. A transitive-closure index built once per graph: strongly connected components are condensed
+   to a DAG, then each component's reachable set is folded in topological order as an integer bitset
+2. Constant-time reachability tests and per-type downstream/upstream sets from bitset masks
+3. A compact JSON payload of every node's impact sets for the interactive what-if page
+
+Results match nx.descendants / nx.ancestors (the node itself is never included).
+"""
+
+import networkx as nx
+
+# Node types grouped the way the impact pages report them
+IMPACT_GROUPS = {
+    'programs': ('program',),
+    'products': ('product',),
+    'materials': ('material',),
+    'suppliers': ('supplier', 'post-supplier'),
+    'funding': ('funding',),
+}
+
+def _bits(indices):
+    """Return the bitset with the given bit positions set"""
+    value = 0
+    for index in indices:
+        value |= 1 << index
+    return value
+
+def _count(bitset):
+    """Return the number of set bits"""
+    return bin(bitset).count('1')
+
+def _positions(bitset):
+    """Return the set bit positions of a bitset in ascending order"""
+    positions = []
+    while bitset:
+        low = bitset & -bitset
+        positions.append(low.bit_length() - 1)
+        bitset ^= low
+    return positions
+
+class ReachabilityIndex:
+    """Transitive closure of a directed graph, stored as one bitset per node in each direction"""
+
+    def __init__(self, G):
+        self.nodes = list(G.nodes())
+        self.position = {node: i for i, node in enumerate(self.nodes)}
+        self.types = [G.nodes[node].get('type') for node in self.nodes]
+
+        # Condense cycles so the closure can be folded over a DAG
+        condensed = nx.condensation(G)
+        mapping = condensed.graph['mapping']
+        members = {
+            component: _bits(self.position[node] for node in data['members'])
+            for component, data in condensed.nodes(data=True)
+        }
+        order = list(nx.topological_sort(condensed))
+
+        # Components reachable from each component (excluding itself), deepest components first
+        below = {}
+        for component in reversed(order):
+            reach = 0
+            for successor in condensed.successors(component):
+                reach |= members[successor] | below[successor]
+            below[component] = reach
+
+        # Components that reach each component, sources first
+        above = {}
+        for component in order:
+            reach = 0
+            for predecessor in condensed.predecessors(component):
+                reach |= members[predecessor] | above[predecessor]
+            above[component] = reach
+
+        # Per node: a node on a cycle reaches the rest of its component, but never counts itself
+        self._down = []
+        self._up = []
+        for i, node in enumerate(self.nodes):
+            component = mapping[node]
+            cycle = members[component] if len(condensed.nodes[component]['members']) > 1 else 0
+            self_bit = 1 << i
+            self._down.append((below[component] | cycle) & ~self_bit)
+            self._up.append((above[component] | cycle) & ~self_bit)
+
+        # One mask per node type for the per-type lookups
+        self._type_masks = {}
+        for i, node_type in enumerate(self.types):
+            self._type_masks[node_type] = self._type_masks.get(node_type, 0) | (1 << i)
+
+    def _mask(self, types):
+        """Return the bitset of every node whose type is in types (None means all)"""
+        if types is None:
+            return -1
+        mask = 0
+        for node_type in types:
+            mask |= self._type_masks.get(node_type, 0)
+        return mask
+
+    def _nodes(self, bitset):
+        """Return the nodes of a bitset in graph order"""
+        return [self.nodes[i] for i in _positions(bitset)]
+
+    def __contains__(self, node):
+        return node in self.position
+
+    def reaches(self, source, target):
+        """Return True if there is a path from source to target"""
+        return bool(self._down[self.position[source]] >> self.position[target] & 1)
+
+    def descendants(self, node, types=None):
+        """Return the nodes reachable from node, optionally only those of the given types"""
+        return self._nodes(self._down[self.position[node]] & self._mask(types))
+
+    def ancestors(self, node, types=None):
+        """Return the nodes that reach node, optionally only those of the given types"""
+        return self._nodes(self._up[self.position[node]] & self._mask(types))
+
+    def count_descendants(self, node, types=None):
+        """Return how many nodes (of the given types) are reachable from node"""
+        return _count(self._down[self.position[node]] & self._mask(types))
+
+    def count_ancestors(self, node, types=None):
+        """Return how many nodes (of the given types) reach node"""
+        return _count(self._up[self.position[node]] & self._mask(types))
+
+    def impact(self, node, upstream=False):
+        """Return {group: [nodes]} for every IMPACT_GROUPS entry plus the 'total' count"""
+        bitset = self._up[self.position[node]] if upstream else self._down[self.position[node]]
+        grouped = {group: self._nodes(bitset & self._mask(types)) for group, types in IMPACT_GROUPS.items()}
+        grouped['total'] = _count(bitset)
+        return grouped
+
+    def payload(self, labels):
+        """Return a JSON-serialisable dict of every node with its downstream and upstream node positions.
+
+        labels maps nodes to display names. Node types are stored once in a 'types' list
+        and referenced by position, and impact sets are lists of node positions.
+        """
+        type_names = sorted({node_type or '' for node_type in self.types})
+        type_index = {name: i for i, name in enumerate(type_names)}
+        return {
+            'types': type_names,
+            'nodes': [
+                [node, labels.get(node, node), type_index[node_type or '']]
+                for node, node_type in zip(self.nodes, self.types)
+            ],
+            'down': [_positions(bitset) for bitset in self._down],
+            'up': [_positions(bitset) for bitset in self._up],
+        }
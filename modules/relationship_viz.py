@@ -1,14 +1,18 @@
 import os
 import networkx as nx
-import matplotlib.pyplot as plt
-from matplotlib.sankey import Sankey
-from bokeh.plotting import figure, save, output_file
+from matplotlib import colormaps
+from bokeh.plotting import figure, output_file
 from bokeh.models import ColumnDataSource, HoverTool, Label, Range1d, Span, Legend, LegendItem, Div, Tabs, Panel
 from bokeh.layouts import column, row, layout, gridplot
 from bokeh.palettes import Category10, Spectral6
 from bokeh.transform import factor_cmap
 import numpy as np
 import json
+from modules.roadmap_store import as_store, entry_id
+from modules.bokeh_resources import save_page
+from modules.build_manifest import open_output
+from modules.chart_renderer import chart_figure
+from modules.chart_cache import cached_chart
 
 # Import the aligned Sankey diagram generator
 from modules.relationship_viz_aligned import generate_sankey_diagram
@@ -17,108 +21,114 @@ def generate_relationship_visualizations(data, output_dir):
     """Generate visualizations for relationships between different entities"""
     print("Generating relationship visualizations...")
     
+    for _, func, args, _ in relationship_visualization_tasks(as_store(data), output_dir):
+        func(*args)
+    
+    print(f"Relationship visualizations generated in '{os.path.join(output_dir, 'relationships')}'")
+
+def relationship_visualization_tasks(data, output_dir):
+    """Return the independent (name, func, args, sources) tasks that make up the relationship visualizations.
+
+    Each task renders its own charts, so with --jobs the PNGs are rendered on the worker pool.
+    """
     # Create relationships directory if it doesn't exist
     relationship_dir = os.path.join(output_dir, "relationships")
     if not os.path.exists(relationship_dir):
         os.makedirs(relationship_dir)
     
-    # Generate network graph
-    generate_network_graph(data, relationship_dir)
-    
-    # Generate Sankey diagram
-    generate_sankey_diagram(data, relationship_dir)
-    
-    # Generate relationship summary page
-    generate_relationship_summary(data, relationship_dir)
-    
-    # Generate specific relationship visualizations
-    generate_program_product_relationships(data, relationship_dir)
-    generate_product_material_relationships(data, relationship_dir)
-    generate_material_supplier_relationships(data, relationship_dir)
-    generate_funding_task_relationships(data, relationship_dir)
-    
-    print(f"Relationship visualizations generated in '{relationship_dir}'")
+    return [
+        # Network graph, Sankey diagram and the summary page cover the whole roadmap
+        ("network_graph", generate_network_graph, (data, relationship_dir), None),
+        ("sankey_diagram", generate_sankey_diagram, (data, relationship_dir), None),
+        ("relationship_summary", generate_relationship_summary, (data, relationship_dir), None),
+        
+        # Specific relationship visualizations
+        ("program_product", generate_program_product_relationships, (data, relationship_dir),
+         ('programs', 'products')),
+        ("product_material", generate_product_material_relationships, (data, relationship_dir),
+         ('products', 'materialSystems')),
+        ("material_supplier", generate_material_supplier_relationships, (data, relationship_dir),
+         ('materialSystems', 'printingSuppliers', 'postProcessingSuppliers')),
+        ("funding_task", generate_funding_task_relationships, (data, relationship_dir), None),
+    ]
 
-def generate_network_graph(data, relationship_dir):
-    """Generate a network graph showing relationships between all entities"""
-    print("Generating network graph...")
-    
-    # Create a directed graph
+@cached_chart
+def save_network_graph_png(path, nodes, edges, pos):
+    """Save the static network graph; nodes are (id, type, label) and edges (source, target, style)"""
     G = nx.DiGraph()
+    for node, node_type, label in nodes:
+        G.add_node(node, type=node_type, label=label)
+    for u, v, style in edges:
+        G.add_edge(u, v, style=style)
     
-    # Add program nodes
-    for program in data.get('programs', []):
-        G.add_node(program['id'], label=program['name'], type='program', layer=0)
-    
-    # Add product nodes
-    for product in data.get('products', []):
-        G.add_node(product['id'], label=product['name'], type='product', layer=1)
+    with chart_figure(path, (12, 8)) as fig:
+        ax = fig.subplots()
         
-        # Add edges from programs to products
-        for program_entry in product.get('programs', []):
-            if isinstance(program_entry, str):
-                program_id = program_entry
-            elif isinstance(program_entry, dict) and 'programID' in program_entry:
-                program_id = program_entry['programID']
-            else:
-                continue
-                
-            G.add_edge(program_id, product['id'], weight=2)
-    
-    # Add material system nodes
-    for material in data.get('materialSystems', []):
-        G.add_node(material['id'], label=material['name'], type='material', layer=2)
+        # Draw nodes with colors and sizes based on type
+        for node_type, color in [
+            ('program', '#1f77b4'),
+            ('product', '#ff7f0e'),
+            ('material', '#2ca02c'),
+            ('supplier', '#d62728'),
+            ('post-supplier', '#9467bd'),
+            ('funding', '#8c564b')
+        ]:
+            nodelist = [node for node in G.nodes() if G.nodes[node]['type'] == node_type]
+            if nodelist:
+                size = 800 if node_type == 'program' else 700 if node_type == 'product' else 600
+                nx.draw_networkx_nodes(
+                    G, pos, 
+                    nodelist=nodelist,
+                    node_size=size, 
+                    node_color=color, 
+                    alpha=0.9,
+                    edgecolors='black',
+                    linewidths=1,
+                    ax=ax
+                )
         
-        # Add edges from products to materials
-        for product in data.get('products', []):
-            for material_entry in product.get('materialSystems', []):
-                if isinstance(material_entry, str) and material_entry == material['id']:
-                    G.add_edge(product['id'], material['id'], weight=2)
-                elif isinstance(material_entry, dict) and material_entry.get('materialID') == material['id']:
-                    G.add_edge(product['id'], material['id'], weight=2)
-    
-    # Add supplier nodes (printing suppliers)
-    for supplier in data.get('printingSuppliers', []):
-        G.add_node(supplier['id'], label=supplier['name'], type='supplier', layer=3)
+        # Draw edges with different styles
+        for style, line_style in [('dashed', 'dashed'), ('dotted', 'dotted'), (None, 'solid')]:
+            edgelist = [(u, v) for u, v, d in G.edges(data=True) if d.get('style', None) == style]
+            if edgelist:
+                nx.draw_networkx_edges(
+                    G, pos, 
+                    edgelist=edgelist,
+                    width=1.2, 
+                    alpha=0.7, 
+                    edge_color='gray', 
+                    arrows=True,
+                    arrowsize=15,
+                    style=line_style,
+                    connectionstyle='arc3,rad=0.1',  # Curved edges
+                    ax=ax
+                )
         
-        # Add edges from materials to suppliers
-        if 'materialSystems' in supplier:
-            for material_entry in supplier['materialSystems']:
-                material_id = material_entry.get('materialID')
-                if material_id:
-                    G.add_edge(material_id, supplier['id'], weight=2)
-    
-    # Add supplier nodes (post-processing suppliers)
-    for supplier in data.get('postProcessingSuppliers', []):
-        G.add_node(supplier['id'], label=supplier['name'], type='post-supplier', layer=3)
+        # Draw labels with a white background
+        # Add labels with white background for better readability
+        labels = {node: G.nodes[node]['label'] for node in G.nodes()}
         
-        # Add edges from products to post-processing suppliers
-        for product in data.get('products', []):
-            if 'postProcessingSuppliers' in product:
-                for pp in product['postProcessingSuppliers']:
-                    if 'supplier' in pp and supplier['id'] in pp['supplier']:
-                        G.add_edge(product['id'], supplier['id'], weight=1, style='dashed')
+        # Draw labels with a white background
+        for node, (x, y) in pos.items():
+            ax.text(
+                x, y, 
+                labels[node],
+                fontsize=9,
+                ha='center',
+                va='center',
+                bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="gray", alpha=0.9)
+            )
+        
+        # Add title and remove axes
+        ax.set_title('Roadmap Relationships Network', fontsize=20, pad=20)
+        ax.axis('off')
+
+def generate_network_graph(data, relationship_dir):
+    """Generate a network graph showing relationships between all entities"""
+    print("Generating network graph...")
     
-    # Add funding opportunity nodes
-    if 'fundingOpportunities' in data:
-        for funding in data['fundingOpportunities']:
-            funding_name = funding.get('name', funding.get('announcementName', 'Unknown'))
-            G.add_node(funding['id'], label=funding_name, type='funding', layer=4)
-            
-            # Add edges from funding to tasks with fundingID
-            # Check program tasks
-            for program in data.get('programs', []):
-                if 'roadmap' in program and 'tasks' in program['roadmap']:
-                    for task in program['roadmap']['tasks']:
-                        if 'fundingID' in task and task['fundingID'] == funding['id']:
-                            G.add_edge(funding['id'], program['id'], weight=1, style='dotted')
-            
-            # Check product tasks
-            for product in data.get('products', []):
-                if 'roadmap' in product and 'tasks' in product['roadmap']:
-                    for task in product['roadmap']['tasks']:
-                        if 'fundingID' in task and task['fundingID'] == funding['id']:
-                            G.add_edge(funding['id'], product['id'], weight=1, style='dotted')
+    # Use the shared relationship graph (built once per run from the store indexes)
+    G = as_store(data).graph()
     
     # Use multipartite layout to organize nodes by layer
     pos = nx.multipartite_layout(G, subset_key='layer', align='vertical')
@@ -395,72 +405,16 @@ def generate_network_graph(data, relationship_dir):
     # We'll generate an HTML with instructions to save the image
     
     # Save the interactive Bokeh visualization
-    save(p)
+    save_page(p)
     
     # Create a simple static version as PNG for the dashboard
     # Use nx.draw to create a static image
-    plt.figure(figsize=(12, 8), facecolor='white')
-    
-    # Draw nodes with colors and sizes based on type
-    for node_type, color in [
-        ('program', '#1f77b4'),
-        ('product', '#ff7f0e'),
-        ('material', '#2ca02c'),
-        ('supplier', '#d62728'),
-        ('post-supplier', '#9467bd'),
-        ('funding', '#8c564b')
-    ]:
-        nodelist = [node for node in G.nodes() if G.nodes[node]['type'] == node_type]
-        if nodelist:
-            size = 800 if node_type == 'program' else 700 if node_type == 'product' else 600
-            nx.draw_networkx_nodes(
-                G, pos, 
-                nodelist=nodelist,
-                node_size=size, 
-                node_color=color, 
-                alpha=0.9,
-                edgecolors='black',
-                linewidths=1
-            )
-    
-    # Draw edges with different styles
-    for style, line_style in [('dashed', 'dashed'), ('dotted', 'dotted'), (None, 'solid')]:
-        edgelist = [(u, v) for u, v, d in G.edges(data=True) if d.get('style', None) == style]
-        if edgelist:
-            nx.draw_networkx_edges(
-                G, pos, 
-                edgelist=edgelist,
-                width=1.2, 
-                alpha=0.7, 
-                edge_color='gray', 
-                arrows=True,
-                arrowsize=15,
-                style=line_style,
-                connectionstyle='arc3,rad=0.1'  # Curved edges
-            )
-    
-    # Draw labels with a white background
-    # Add labels with white background for better readability
-    labels = {node: G.nodes[node]['label'] for node in G.nodes()}
-    
-    # Draw labels with a white background
-    for node, (x, y) in pos.items():
-        plt.text(
-            x, y, 
-            labels[node],
-            fontsize=9,
-            ha='center',
-            va='center',
-            bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="gray", alpha=0.9)
-        )
-    
-    # Add title and remove axes
-    plt.title('Roadmap Relationships Network', fontsize=20, pad=20)
-    plt.axis('off')
-    
-    # Save the static image
-    plt.savefig(os.path.join(relationship_dir, "network_graph.png"), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_network_graph_png(
+        os.path.join(relationship_dir, "network_graph.png"),
+        [(node, G.nodes[node]['type'], G.nodes[node]['label']) for node in G.nodes()],
+        [(u, v, d.get('style')) for u, v, d in G.edges(data=True)],
+        pos
+    )
     
     # Create an HTML page to display the network graph
     html_content = f"""
@@ -532,7 +486,7 @@ def generate_network_graph(data, relationship_dir):
     </html>
     """
     
-    with open(os.path.join(relationship_dir, "network_graph_viewer.html"), 'w') as f:
+    with open_output(os.path.join(relationship_dir, "network_graph_viewer.html"), 'w') as f:
         f.write(html_content)
     
     print(f"Network graph generated in '{relationship_dir}/network_graph.html'")
@@ -747,14 +701,61 @@ def generate_relationship_summary(data, relationship_dir):
     """
     
     # Write to file
-    with open(os.path.join(relationship_dir, "relationship_summary.html"), 'w') as f:
+    with open_output(os.path.join(relationship_dir, "relationship_summary.html"), 'w') as f:
         f.write(html_content)
     
     print(f"Relationship summary page generated in '{relationship_dir}/relationship_summary.html'")
 
+@cached_chart
+def save_relationship_heatmap(path, matrix, column_names, row_names, cmap, title, xlabel, ylabel):
+    """Save a 0/1 relationship matrix as a heatmap PNG"""
+    with chart_figure(path, (12, 10)) as fig:
+        ax = fig.subplots()
+        image = ax.imshow(matrix, cmap=cmap, aspect='auto')
+        
+        # Add labels
+        ax.set_xticks(range(len(column_names)), column_names, rotation=90)
+        ax.set_yticks(range(len(row_names)), row_names)
+        
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        
+        # Add a colorbar
+        cbar = fig.colorbar(image, ax=ax)
+        cbar.set_ticks([0, 1])
+        cbar.set_ticklabels(['No Relationship', 'Related'])
+        
+        # Adjust layout
+        fig.tight_layout()
+
+@cached_chart
+def save_count_bar_chart(path, names, counts, color, title, xlabel, ylabel):
+    """Save a bar chart of counts per entity, with the value on top of each bar, as a PNG"""
+    with chart_figure(path, (12, 8)) as fig:
+        ax = fig.subplots()
+        bars = ax.bar(names, counts, color=color)
+        
+        # Add labels
+        ax.set_title(title)
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        for label in ax.get_xticklabels():
+            label.set(rotation=45, horizontalalignment='right')
+        
+        # Add value labels on top of bars
+        for bar in bars:
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                    f'{height:.0f}', ha='center', va='bottom')
+        
+        # Adjust layout
+        fig.tight_layout()
+
 def generate_program_product_relationships(data, relationship_dir):
     """Generate visualizations for program-product relationships"""
     print("Generating program-product relationship visualizations...")
+    data = as_store(data)
     
     # Create a matrix of program-product relationships
     programs = data.get('programs', [])
@@ -774,46 +775,19 @@ def generate_program_product_relationships(data, relationship_dir):
         product_names.append(f"{product['name']} ({product['id']})")
     
     # Create the matrix
+    product_program_ids = [{entry_id(entry, 'programID') for entry in product.get('programs', [])}
+                           for product in products]
     for program in programs:
         row = []
-        for product in products:
+        for program_ids in product_program_ids:
             # Check if this program is associated with this product
-            is_associated = False
-            for program_entry in product.get('programs', []):
-                if isinstance(program_entry, str) and program_entry == program['id']:
-                    is_associated = True
-                    break
-                elif isinstance(program_entry, dict) and program_entry.get('programID') == program['id']:
-                    is_associated = True
-                    break
-            
-            row.append(1 if is_associated else 0)
+            row.append(1 if program['id'] in program_ids else 0)
         
         matrix.append(row)
     
-    # Create a heatmap using matplotlib
-    plt.figure(figsize=(12, 10))
-    plt.imshow(matrix, cmap='Blues', aspect='auto')
-    
-    # Add labels
-    plt.xticks(range(len(product_names)), product_names, rotation=90)
-    plt.yticks(range(len(program_names)), program_names)
-    
-    plt.title('Program-Product Relationships')
-    plt.xlabel('Products')
-    plt.ylabel('Programs')
-    
-    # Add a colorbar
-    cbar = plt.colorbar()
-    cbar.set_ticks([0, 1])
-    cbar.set_ticklabels(['No Relationship', 'Related'])
-    
-    # Adjust layout
-    plt.tight_layout()
-    
-    # Save the figure
-    plt.savefig(os.path.join(relationship_dir, "program_product_chart.png"), dpi=300, bbox_inches='tight')
-    plt.close()
+    # Create a heatmap of the relationship matrix
+    save_relationship_heatmap(os.path.join(relationship_dir, "program_product_chart.png"), matrix, product_names, program_names, 'Blues',
+                              'Program-Product Relationships', 'Products', 'Programs')
     
     # Create a bar chart showing the number of products per program
     products_per_program = {}
@@ -832,7 +806,7 @@ def generate_program_product_relationships(data, relationship_dir):
     product_counts = []
     
     for program_id, count in products_per_program.items():
-        program = next((p for p in programs if p['id'] == program_id), None)
+        program = data.program(program_id)
         if program:
             program_names.append(f"{program['name']} ({program_id})")
             product_counts.append(count)
@@ -843,27 +817,8 @@ def generate_program_product_relationships(data, relationship_dir):
     product_counts = [product_counts[i] for i in sorted_indices]
     
     # Create the bar chart
-    plt.figure(figsize=(12, 8))
-    bars = plt.bar(program_names, product_counts, color='#1f77b4')
-    
-    # Add labels
-    plt.title('Number of Products per Program')
-    plt.xlabel('Programs')
-    plt.ylabel('Number of Products')
-    plt.xticks(rotation=45, ha='right')
-    
-    # Add value labels on top of bars
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                 f'{height:.0f}', ha='center', va='bottom')
-    
-    # Adjust layout
-    plt.tight_layout()
-    
-    # Save the figure
-    plt.savefig(os.path.join(relationship_dir, "products_per_program.png"), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_count_bar_chart(os.path.join(relationship_dir, "products_per_program.png"), program_names, product_counts, '#1f77b4',
+                         'Number of Products per Program', 'Programs', 'Number of Products')
     
     # Create a bar chart showing the number of programs per product
     programs_per_product = {}
@@ -876,7 +831,7 @@ def generate_program_product_relationships(data, relationship_dir):
     program_counts = []
     
     for product_id, count in programs_per_product.items():
-        product = next((p for p in products if p['id'] == product_id), None)
+        product = data.product(product_id)
         if product:
             product_names.append(f"{product['name']} ({product_id})")
             program_counts.append(count)
@@ -887,27 +842,8 @@ def generate_program_product_relationships(data, relationship_dir):
     program_counts = [program_counts[i] for i in sorted_indices]
     
     # Create the bar chart
-    plt.figure(figsize=(12, 8))
-    bars = plt.bar(product_names, program_counts, color='#ff7f0e')
-    
-    # Add labels
-    plt.title('Number of Programs per Product')
-    plt.xlabel('Products')
-    plt.ylabel('Number of Programs')
-    plt.xticks(rotation=45, ha='right')
-    
-    # Add value labels on top of bars
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                 f'{height:.0f}', ha='center', va='bottom')
-    
-    # Adjust layout
-    plt.tight_layout()
-    
-    # Save the figure
-    plt.savefig(os.path.join(relationship_dir, "programs_per_product.png"), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_count_bar_chart(os.path.join(relationship_dir, "programs_per_product.png"), product_names, program_counts, '#ff7f0e',
+                         'Number of Programs per Product', 'Products', 'Number of Programs')
     
     # Create an HTML page to display the visualizations
     html_content = f"""
@@ -1013,7 +949,7 @@ def generate_program_product_relationships(data, relationship_dir):
     """
     
     # Write to file
-    with open(os.path.join(relationship_dir, "program_product_relationships.html"), 'w') as f:
+    with open_output(os.path.join(relationship_dir, "program_product_relationships.html"), 'w') as f:
         f.write(html_content)
     
     print(f"Program-product relationship visualizations generated in '{relationship_dir}/program_product_relationships.html'")
@@ -1021,6 +957,7 @@ def generate_program_product_relationships(data, relationship_dir):
 def generate_product_material_relationships(data, relationship_dir):
     """Generate visualizations for product-material relationships"""
     print("Generating product-material relationship visualizations...")
+    data = as_store(data)
     
     # Create a matrix of product-material relationships
     products = data.get('products', [])
@@ -1042,44 +979,16 @@ def generate_product_material_relationships(data, relationship_dir):
     # Create the matrix
     for product in products:
         row = []
+        material_ids = {entry_id(entry, 'materialID') for entry in product.get('materialSystems', [])}
         for material in materials:
             # Check if this product is associated with this material
-            is_associated = False
-            for material_entry in product.get('materialSystems', []):
-                if isinstance(material_entry, str) and material_entry == material['id']:
-                    is_associated = True
-                    break
-                elif isinstance(material_entry, dict) and material_entry.get('materialID') == material['id']:
-                    is_associated = True
-                    break
-            
-            row.append(1 if is_associated else 0)
+            row.append(1 if material['id'] in material_ids else 0)
         
         matrix.append(row)
     
-    # Create a heatmap using matplotlib
-    plt.figure(figsize=(12, 10))
-    plt.imshow(matrix, cmap='Greens', aspect='auto')
-    
-    # Add labels
-    plt.xticks(range(len(material_names)), material_names, rotation=90)
-    plt.yticks(range(len(product_names)), product_names)
-    
-    plt.title('Product-Material Relationships')
-    plt.xlabel('Material Systems')
-    plt.ylabel('Products')
-    
-    # Add a colorbar
-    cbar = plt.colorbar()
-    cbar.set_ticks([0, 1])
-    cbar.set_ticklabels(['No Relationship', 'Related'])
-    
-    # Adjust layout
-    plt.tight_layout()
-    
-    # Save the figure
-    plt.savefig(os.path.join(relationship_dir, "product_material_chart.png"), dpi=300, bbox_inches='tight')
-    plt.close()
+    # Create a heatmap of the relationship matrix
+    save_relationship_heatmap(os.path.join(relationship_dir, "product_material_chart.png"), matrix, material_names, product_names, 'Greens',
+                              'Product-Material Relationships', 'Material Systems', 'Products')
     
     # Create a bar chart showing the number of materials per product
     materials_per_product = {}
@@ -1092,7 +1001,7 @@ def generate_product_material_relationships(data, relationship_dir):
     material_counts = []
     
     for product_id, count in materials_per_product.items():
-        product = next((p for p in products if p['id'] == product_id), None)
+        product = data.product(product_id)
         if product:
             product_names.append(f"{product['name']} ({product_id})")
             material_counts.append(count)
@@ -1103,27 +1012,8 @@ def generate_product_material_relationships(data, relationship_dir):
     material_counts = [material_counts[i] for i in sorted_indices]
     
     # Create the bar chart
-    plt.figure(figsize=(12, 8))
-    bars = plt.bar(product_names, material_counts, color='#2ca02c')
-    
-    # Add labels
-    plt.title('Number of Material Systems per Product')
-    plt.xlabel('Products')
-    plt.ylabel('Number of Material Systems')
-    plt.xticks(rotation=45, ha='right')
-    
-    # Add value labels on top of bars
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                 f'{height:.0f}', ha='center', va='bottom')
-    
-    # Adjust layout
-    plt.tight_layout()
-    
-    # Save the figure
-    plt.savefig(os.path.join(relationship_dir, "materials_per_product.png"), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_count_bar_chart(os.path.join(relationship_dir, "materials_per_product.png"), product_names, material_counts, '#2ca02c',
+                         'Number of Material Systems per Product', 'Products', 'Number of Material Systems')
     
     # Create a bar chart showing the number of products per material
     products_per_material = {}
@@ -1143,7 +1033,7 @@ def generate_product_material_relationships(data, relationship_dir):
     product_counts = []
     
     for material_id, count in products_per_material.items():
-        material = next((m for m in materials if m['id'] == material_id), None)
+        material = data.material(material_id)
         if material:
             material_names.append(f"{material['name']} ({material_id})")
             product_counts.append(count)
@@ -1154,27 +1044,8 @@ def generate_product_material_relationships(data, relationship_dir):
     product_counts = [product_counts[i] for i in sorted_indices]
     
     # Create the bar chart
-    plt.figure(figsize=(12, 8))
-    bars = plt.bar(material_names, product_counts, color='#ff7f0e')
-    
-    # Add labels
-    plt.title('Number of Products per Material System')
-    plt.xlabel('Material Systems')
-    plt.ylabel('Number of Products')
-    plt.xticks(rotation=45, ha='right')
-    
-    # Add value labels on top of bars
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                 f'{height:.0f}', ha='center', va='bottom')
-    
-    # Adjust layout
-    plt.tight_layout()
-    
-    # Save the figure
-    plt.savefig(os.path.join(relationship_dir, "products_per_material.png"), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_count_bar_chart(os.path.join(relationship_dir, "products_per_material.png"), material_names, product_counts, '#ff7f0e',
+                         'Number of Products per Material System', 'Material Systems', 'Number of Products')
     
     # Create an HTML page to display the visualizations
     html_content = f"""
@@ -1251,7 +1122,7 @@ def generate_product_material_relationships(data, relationship_dir):
                 material_id = material_entry['materialID']
                 
             if material_id:
-                material = next((m for m in materials if m['id'] == material_id), None)
+                material = data.material(material_id)
                 if material:
                     related_materials.append((material, material_entry))
         
@@ -1290,7 +1161,7 @@ def generate_product_material_relationships(data, relationship_dir):
     """
     
     # Write to file
-    with open(os.path.join(relationship_dir, "product_material_relationships.html"), 'w') as f:
+    with open_output(os.path.join(relationship_dir, "product_material_relationships.html"), 'w') as f:
         f.write(html_content)
     
     print(f"Product-material relationship visualizations generated in '{relationship_dir}/product_material_relationships.html'")
@@ -1298,6 +1169,7 @@ def generate_product_material_relationships(data, relationship_dir):
 def generate_material_supplier_relationships(data, relationship_dir):
     """Generate visualizations for material-supplier relationships"""
     print("Generating material-supplier relationship visualizations...")
+    data = as_store(data)
     
     # Create a matrix of material-supplier relationships
     materials = data.get('materialSystems', [])
@@ -1319,62 +1191,29 @@ def generate_material_supplier_relationships(data, relationship_dir):
     # Create the matrix
     for material in materials:
         row = []
+        supplier_ids = {supplier['id'] for supplier in data.suppliers_for_material(material['id'])}
         for supplier in printing_suppliers:
             # Check if this material is associated with this supplier
-            is_associated = False
-            if 'materialSystems' in supplier:
-                for material_entry in supplier['materialSystems']:
-                    if material_entry.get('materialID') == material['id']:
-                        is_associated = True
-                        break
-            
-            row.append(1 if is_associated else 0)
+            row.append(1 if supplier['id'] in supplier_ids else 0)
         
         matrix.append(row)
     
-    # Create a heatmap using matplotlib
-    plt.figure(figsize=(12, 10))
-    plt.imshow(matrix, cmap='Reds', aspect='auto')
-    
-    # Add labels
-    plt.xticks(range(len(supplier_names)), supplier_names, rotation=90)
-    plt.yticks(range(len(material_names)), material_names)
-    
-    plt.title('Material-Supplier Relationships')
-    plt.xlabel('Printing Suppliers')
-    plt.ylabel('Material Systems')
-    
-    # Add a colorbar
-    cbar = plt.colorbar()
-    cbar.set_ticks([0, 1])
-    cbar.set_ticklabels(['No Relationship', 'Related'])
-    
-    # Adjust layout
-    plt.tight_layout()
-    
-    # Save the figure
-    plt.savefig(os.path.join(relationship_dir, "material_supplier_chart.png"), dpi=300, bbox_inches='tight')
-    plt.close()
+    # Create a heatmap of the relationship matrix
+    save_relationship_heatmap(os.path.join(relationship_dir, "material_supplier_chart.png"), matrix, supplier_names, material_names, 'Reds',
+                              'Material-Supplier Relationships', 'Printing Suppliers', 'Material Systems')
     
     # Create a bar chart showing the number of suppliers per material
     suppliers_per_material = {}
     for material in materials:
         material_id = material['id']
-        suppliers_per_material[material_id] = 0
-        
-        for supplier in printing_suppliers:
-            if 'materialSystems' in supplier:
-                for material_entry in supplier['materialSystems']:
-                    if material_entry.get('materialID') == material_id:
-                        suppliers_per_material[material_id] += 1
-                        break
+        suppliers_per_material[material_id] = len({supplier['id'] for supplier in data.suppliers_for_material(material_id)})
     
     # Create a figure for suppliers per material
     material_names = []
     supplier_counts = []
     
     for material_id, count in suppliers_per_material.items():
-        material = next((m for m in materials if m['id'] == material_id), None)
+        material = data.material(material_id)
         if material:
             material_names.append(f"{material['name']} ({material_id})")
             supplier_counts.append(count)
@@ -1385,27 +1224,8 @@ def generate_material_supplier_relationships(data, relationship_dir):
     supplier_counts = [supplier_counts[i] for i in sorted_indices]
     
     # Create the bar chart
-    plt.figure(figsize=(12, 8))
-    bars = plt.bar(material_names, supplier_counts, color='#d62728')
-    
-    # Add labels
-    plt.title('Number of Suppliers per Material System')
-    plt.xlabel('Material Systems')
-    plt.ylabel('Number of Suppliers')
-    plt.xticks(rotation=45, ha='right')
-    
-    # Add value labels on top of bars
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                 f'{height:.0f}', ha='center', va='bottom')
-    
-    # Adjust layout
-    plt.tight_layout()
-    
-    # Save the figure
-    plt.savefig(os.path.join(relationship_dir, "suppliers_per_material.png"), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_count_bar_chart(os.path.join(relationship_dir, "suppliers_per_material.png"), material_names, supplier_counts, '#d62728',
+                         'Number of Suppliers per Material System', 'Material Systems', 'Number of Suppliers')
     
     # Create a bar chart showing the number of materials per supplier
     materials_per_supplier = {}
@@ -1418,7 +1238,7 @@ def generate_material_supplier_relationships(data, relationship_dir):
     material_counts = []
     
     for supplier_id, count in materials_per_supplier.items():
-        supplier = next((s for s in printing_suppliers if s['id'] == supplier_id), None)
+        supplier = data.printing_supplier(supplier_id)
         if supplier:
             supplier_names.append(f"{supplier['name']} ({supplier_id})")
             material_counts.append(count)
@@ -1429,27 +1249,8 @@ def generate_material_supplier_relationships(data, relationship_dir):
     material_counts = [material_counts[i] for i in sorted_indices]
     
     # Create the bar chart
-    plt.figure(figsize=(12, 8))
-    bars = plt.bar(supplier_names, material_counts, color='#2ca02c')
-    
-    # Add labels
-    plt.title('Number of Material Systems per Supplier')
-    plt.xlabel('Suppliers')
-    plt.ylabel('Number of Material Systems')
-    plt.xticks(rotation=45, ha='right')
-    
-    # Add value labels on top of bars
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                 f'{height:.0f}', ha='center', va='bottom')
-    
-    # Adjust layout
-    plt.tight_layout()
-    
-    # Save the figure
-    plt.savefig(os.path.join(relationship_dir, "materials_per_supplier.png"), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_count_bar_chart(os.path.join(relationship_dir, "materials_per_supplier.png"), supplier_names, material_counts, '#2ca02c',
+                         'Number of Material Systems per Supplier', 'Suppliers', 'Number of Material Systems')
     
     # Create an HTML page to display the visualizations
     html_content = f"""
@@ -1568,14 +1369,34 @@ def generate_material_supplier_relationships(data, relationship_dir):
     """
     
     # Write to file
-    with open(os.path.join(relationship_dir, "material_supplier_relationships.html"), 'w') as f:
+    with open_output(os.path.join(relationship_dir, "material_supplier_relationships.html"), 'w') as f:
         f.write(html_content)
     
     print(f"Material-supplier relationship visualizations generated in '{relationship_dir}/material_supplier_relationships.html'")
 
+@cached_chart
+def save_placeholder_chart(path, message):
+    """Save a PNG showing only a message, used when there is nothing to chart"""
+    with chart_figure(path, (8, 6)) as fig:
+        ax = fig.subplots()
+        ax.text(0.5, 0.5, message, 
+                horizontalalignment='center', verticalalignment='center', fontsize=14)
+        ax.axis('off')
+
+@cached_chart
+def save_task_type_pie(path, task_types):
+    """Save a pie chart of funded task counts by task type as a PNG"""
+    with chart_figure(path, (10, 8)) as fig:
+        ax = fig.subplots()
+        ax.pie(task_types.values(), labels=task_types.keys(), autopct='%1.1f%%', 
+               startangle=90, colors=colormaps['Paired'](range(len(task_types))))
+        ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
+        ax.set_title('Distribution of Funded Task Types')
+
 def generate_funding_task_relationships(data, relationship_dir):
     """Generate visualizations for funding-task relationships"""
     print("Generating funding-task relationship visualizations...")
+    data = as_store(data)
     
     # Get funding opportunities
     funding_opportunities = data.get('fundingOpportunities', [])
@@ -1657,16 +1478,11 @@ def generate_funding_task_relationships(data, relationship_dir):
         </html>
         """
         
-        with open(os.path.join(relationship_dir, "funding_task_relationships.html"), 'w') as f:
+        with open_output(os.path.join(relationship_dir, "funding_task_relationships.html"), 'w') as f:
             f.write(html_content)
         
         # Create a placeholder image
-        plt.figure(figsize=(8, 6))
-        plt.text(0.5, 0.5, "No funding-task relationships found", 
-                 horizontalalignment='center', verticalalignment='center', fontsize=14)
-        plt.axis('off')
-        plt.savefig(os.path.join(relationship_dir, "funding_task_chart.png"), dpi=300, bbox_inches='tight')
-        plt.close()
+        save_placeholder_chart(os.path.join(relationship_dir, "funding_task_chart.png"), "No funding-task relationships found")
         
         print(f"No funding-task relationships found. Created placeholder in '{relationship_dir}/funding_task_relationships.html'")
         return
@@ -1686,7 +1502,7 @@ def generate_funding_task_relationships(data, relationship_dir):
     task_counts = []
     
     for funding_id, count in tasks_per_funding.items():
-        funding = next((f for f in funding_opportunities if f['id'] == funding_id), None)
+        funding = data.funding(funding_id)
         if funding:
             funding_name = funding.get('name', funding.get('announcementName', 'Unknown'))
             funding_names.append(f"{funding_name} ({funding_id})")
@@ -1698,27 +1514,8 @@ def generate_funding_task_relationships(data, relationship_dir):
     task_counts = [task_counts[i] for i in sorted_indices]
     
     # Create the bar chart
-    plt.figure(figsize=(12, 8))
-    bars = plt.bar(funding_names, task_counts, color='#8c564b')
-    
-    # Add labels
-    plt.title('Number of Tasks per Funding Opportunity')
-    plt.xlabel('Funding Opportunities')
-    plt.ylabel('Number of Tasks')
-    plt.xticks(rotation=45, ha='right')
-    
-    # Add value labels on top of bars
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                 f'{height:.0f}', ha='center', va='bottom')
-    
-    # Adjust layout
-    plt.tight_layout()
-    
-    # Save the figure
-    plt.savefig(os.path.join(relationship_dir, "tasks_per_funding.png"), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_count_bar_chart(os.path.join(relationship_dir, "tasks_per_funding.png"), funding_names, task_counts, '#8c564b',
+                         'Number of Tasks per Funding Opportunity', 'Funding Opportunities', 'Number of Tasks')
     
     # Create a pie chart showing the distribution of task types
     task_types = {}
@@ -1729,15 +1526,7 @@ def generate_funding_task_relationships(data, relationship_dir):
         task_types[task_type] += 1
     
     # Create the pie chart
-    plt.figure(figsize=(10, 8))
-    plt.pie(task_types.values(), labels=task_types.keys(), autopct='%1.1f%%', 
-            startangle=90, colors=plt.cm.Paired(range(len(task_types))))
-    plt.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
-    plt.title('Distribution of Funded Task Types')
-    
-    # Save the figure
-    plt.savefig(os.path.join(relationship_dir, "funded_task_types.png"), dpi=300, bbox_inches='tight')
-    plt.close()
+    save_task_type_pie(os.path.join(relationship_dir, "funded_task_types.png"), task_types)
     
     # Create an HTML page to display the visualizations
     html_content = f"""
@@ -1837,7 +1626,7 @@ def generate_funding_task_relationships(data, relationship_dir):
     """
     
     # Write to file
-    with open(os.path.join(relationship_dir, "funding_task_relationships.html"), 'w') as f:
+    with open_output(os.path.join(relationship_dir, "funding_task_relationships.html"), 'w') as f:
         f.write(html_content)
     
     print(f"Funding-task relationship visualizations generated in '{relationship_dir}/funding_task_relationships.html'") 
@@ -1,14 +1,22 @@
 import os
 import json
-import matplotlib.pyplot as plt
+from modules.chart_renderer import chart_figure
+from modules.build_manifest import open_output
+from modules.chart_cache import cached_chart
+
+@cached_chart
+def save_sankey_thumbnail(path):
+    """Save the dashboard thumbnail that points to the interactive Sankey diagram"""
+    with chart_figure(path, (15, 8), dpi=100) as fig:
+        ax = fig.subplots()
+        ax.text(0.5, 0.5, "Interactive Sankey Diagram\n(Open HTML file to view)", 
+                ha='center', va='center', fontsize=20)
+        ax.axis('off')
 
 def generate_sankey_diagram(data, relationship_dir):
     """Generate a Sankey diagram showing flows between different entities with aligned columns"""
     print("Generating Sankey diagram...")
     
-    # Create a figure with a larger size for better visibility
-    plt.figure(figsize=(20, 12), facecolor='white')
-    
     # Count flows between entities
     supplier_to_material_count = {}
     material_to_product_count = {}
@@ -330,15 +338,10 @@ def generate_sankey_diagram(data, relationship_dir):
     """
     
     # Write the HTML file
-    with open(os.path.join(relationship_dir, "sankey_diagram.html"), 'w', encoding='utf-8') as f:
+    with open_output(os.path.join(relationship_dir, "sankey_diagram.html"), 'w', encoding='utf-8') as f:
         f.write(html_content)
     
     # Create a static image version using matplotlib for thumbnails
-    plt.figure(figsize=(15, 8))
-    plt.text(0.5, 0.5, "Interactive Sankey Diagram\n(Open HTML file to view)", 
-             ha='center', va='center', fontsize=20)
-    plt.axis('off')
-    plt.savefig(os.path.join(relationship_dir, "sankey_diagram.png"), dpi=100, bbox_inches='tight')
-    plt.close()
+    save_sankey_thumbnail(os.path.join(relationship_dir, "sankey_diagram.png"))
     
     print(f"Sankey diagram generated in '{relationship_dir}/sankey_diagram.html'") 
\ No newline at end of file
@@ -8,6 +8,7 @@ from bokeh.layouts import column, row, layout, gridplot
 from bokeh.palettes import Category10, Spectral6
 from bokeh.transform import factor_cmap
 import numpy as np
+from modules.roadmap_store import as_store
 
 def generate_relationship_visualizations(data, output_dir):
     """Generate visualizations for relationships between different entities"""
@@ -39,82 +40,8 @@ def generate_network_graph(data, relationship_dir):
     """Generate a network graph showing relationships between all entities"""
     print("Generating network graph...")
     
-    # Create a directed graph
-    G = nx.DiGraph()
-    
-    # Add program nodes
-    for program in data.get('programs', []):
-        G.add_node(program['id'], label=program['name'], type='program', layer=0)
-    
-    # Add product nodes
-    for product in data.get('products', []):
-        G.add_node(product['id'], label=product['name'], type='product', layer=1)
-        
-        # Add edges from programs to products
-        for program_entry in product.get('programs', []):
-            if isinstance(program_entry, str):
-                program_id = program_entry
-            elif isinstance(program_entry, dict) and 'programID' in program_entry:
-                program_id = program_entry['programID']
-            else:
-                continue
-                
-            G.add_edge(program_id, product['id'], weight=2)
-    
-    # Add material system nodes
-    for material in data.get('materialSystems', []):
-        G.add_node(material['id'], label=material['name'], type='material', layer=2)
-        
-        # Add edges from products to materials
-        for product in data.get('products', []):
-            for material_entry in product.get('materialSystems', []):
-                if isinstance(material_entry, str) and material_entry == material['id']:
-                    G.add_edge(product['id'], material['id'], weight=2)
-                elif isinstance(material_entry, dict) and material_entry.get('materialID') == material['id']:
-                    G.add_edge(product['id'], material['id'], weight=2)
-    
-    # Add supplier nodes (printing suppliers)
-    for supplier in data.get('printingSuppliers', []):
-        G.add_node(supplier['id'], label=supplier['name'], type='supplier', layer=3)
-        
-        # Add edges from materials to suppliers
-        if 'materialSystems' in supplier:
-            for material_entry in supplier['materialSystems']:
-                material_id = material_entry.get('materialID')
-                if material_id:
-                    G.add_edge(material_id, supplier['id'], weight=2)
-    
-    # Add supplier nodes (post-processing suppliers)
-    for supplier in data.get('postProcessingSuppliers', []):
-        G.add_node(supplier['id'], label=supplier['name'], type='post-supplier', layer=3)
-        
-        # Add edges from products to post-processing suppliers
-        for product in data.get('products', []):
-            if 'postProcessingSuppliers' in product:
-                for pp in product['postProcessingSuppliers']:
-                    if 'supplier' in pp and supplier['id'] in pp['supplier']:
-                        G.add_edge(product['id'], supplier['id'], weight=1, style='dashed')
-    
-    # Add funding opportunity nodes
-    if 'fundingOpportunities' in data:
-        for funding in data['fundingOpportunities']:
-            funding_name = funding.get('name', funding.get('announcementName', 'Unknown'))
-            G.add_node(funding['id'], label=funding_name, type='funding', layer=4)
-            
-            # Add edges from funding to tasks with fundingID
-            # Check program tasks
-            for program in data.get('programs', []):
-                if 'roadmap' in program and 'tasks' in program['roadmap']:
-                    for task in program['roadmap']['tasks']:
-                        if 'fundingID' in task and task['fundingID'] == funding['id']:
-                            G.add_edge(funding['id'], program['id'], weight=1, style='dotted')
-            
-            # Check product tasks
-            for product in data.get('products', []):
-                if 'roadmap' in product and 'tasks' in product['roadmap']:
-                    for task in product['roadmap']['tasks']:
-                        if 'fundingID' in task and task['fundingID'] == funding['id']:
-                            G.add_edge(funding['id'], product['id'], weight=1, style='dotted')
+    # Use the shared relationship graph (built once per run from the store indexes)
+    G = as_store(data).graph()
     
     # Create the figure with a white background
     # Scale figure size based on number of nodes
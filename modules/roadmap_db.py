@@ -0,0 +1,363 @@
+"""
+Roadmap Database Module for Roadmap Visualizations
+
+This module stores the roadmap in SQLite as an alternative to roadmap.json including:
+1. One table per entity collection, plus tables for roadmap tasks, funding pursuits
+   and program product-material combinations, indexed on their foreign keys
+2. Lossless conversion between the roadmap dict and the database
+3. Targeted queries (e.g. all tasks of one lane across products) without scanning nested dicts
+"""
+
+import os
+import json
+import sqlite3
+import tempfile
+
+from .roadmap_loader import load_roadmap
+
+# File extensions that select the SQLite backend instead of JSON
+SQLITE_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+
+SCHEMA_VERSION = 1
+
+# Top-level roadmap collection -> (table, owner type used by the child tables)
+ENTITY_TABLES = {
+    'programs': ('programs', 'program'),
+    'products': ('products', 'product'),
+    'materialSystems': ('material_systems', 'materialSystem'),
+    'printingSuppliers': ('printing_suppliers', 'printingSupplier'),
+    'postProcessingSuppliers': ('post_processing_suppliers', 'postProcessingSupplier'),
+    'fundingOpps': ('funding_opps', 'fundingOpp'),
+}
+
+# Lists nested in entities that are stored as rows of their own table: the key
+# path to the list inside the entity, and the child table. A list in the entity
+# document is replaced by {ROWS_MARKER: <list name>} so it can be put back in place.
+CHILD_LISTS = {
+    'programs': [(('roadmap',), 'roadmap_tasks'), (('roadmap', 'tasks'), 'roadmap_tasks'),
+                 (('productMaterialCombinations',), 'product_material_combinations')],
+    'products': [(('roadmap',), 'roadmap_tasks'), (('roadmap', 'tasks'), 'roadmap_tasks')],
+    'materialSystems': [(('roadmap',), 'roadmap_tasks')],
+    'printingSuppliers': [(('supplierRoadmap', 'tasks'), 'roadmap_tasks')],
+    'postProcessingSuppliers': [(('supplierRoadmap', 'tasks'), 'roadmap_tasks')],
+    'fundingOpps': [(('pursuits',), 'pursuits')],
+}
+
+ROWS_MARKER = '$rows'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS roadmap_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS roadmap_keys (
+    position INTEGER PRIMARY KEY,
+    key TEXT NOT NULL,
+    entity_table TEXT,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS programs (
+    position INTEGER PRIMARY KEY,
+    id TEXT, name TEXT, sector TEXT, division TEXT, customer_name TEXT,
+    doc TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS products (
+    position INTEGER PRIMARY KEY,
+    id TEXT, name TEXT, trl TEXT,
+    doc TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS material_systems (
+    position INTEGER PRIMARY KEY,
+    id TEXT, name TEXT, process TEXT, material TEXT, mrl TEXT,
+    doc TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS printing_suppliers (
+    position INTEGER PRIMARY KEY,
+    id TEXT, name TEXT, supplier_number TEXT,
+    doc TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS post_processing_suppliers (
+    position INTEGER PRIMARY KEY,
+    id TEXT, name TEXT, supplier_number TEXT,
+    doc TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS funding_opps (
+    position INTEGER PRIMARY KEY,
+    id TEXT, announcement_name TEXT, customer TEXT, status TEXT, close_date TEXT,
+    doc TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS roadmap_tasks (
+    owner_type TEXT NOT NULL, owner_position INTEGER NOT NULL, owner_id TEXT,
+    list_name TEXT NOT NULL, position INTEGER NOT NULL,
+    task TEXT, lane TEXT, status TEXT, start TEXT, "end" TEXT, funding_type TEXT,
+    doc TEXT NOT NULL,
+    PRIMARY KEY (owner_type, owner_position, list_name, position)
+);
+CREATE TABLE IF NOT EXISTS pursuits (
+    owner_type TEXT NOT NULL, owner_position INTEGER NOT NULL, owner_id TEXT,
+    list_name TEXT NOT NULL, position INTEGER NOT NULL,
+    pursuit_id TEXT, pursuit_name TEXT, targeted_submission_date TEXT,
+    doc TEXT NOT NULL,
+    PRIMARY KEY (owner_type, owner_position, list_name, position)
+);
+CREATE TABLE IF NOT EXISTS product_material_combinations (
+    owner_type TEXT NOT NULL, owner_position INTEGER NOT NULL, owner_id TEXT,
+    list_name TEXT NOT NULL, position INTEGER NOT NULL,
+    product_id TEXT, material_id TEXT, part_number TEXT, adoption_status TEXT,
+    doc TEXT NOT NULL,
+    PRIMARY KEY (owner_type, owner_position, list_name, position)
+);
+CREATE INDEX IF NOT EXISTS idx_programs_id ON programs (id);
+CREATE INDEX IF NOT EXISTS idx_products_id ON products (id);
+CREATE INDEX IF NOT EXISTS idx_material_systems_id ON material_systems (id);
+CREATE INDEX IF NOT EXISTS idx_printing_suppliers_id ON printing_suppliers (id);
+CREATE INDEX IF NOT EXISTS idx_post_processing_suppliers_id ON post_processing_suppliers (id);
+CREATE INDEX IF NOT EXISTS idx_funding_opps_id ON funding_opps (id);
+CREATE INDEX IF NOT EXISTS idx_roadmap_tasks_owner ON roadmap_tasks (owner_type, owner_id);
+CREATE INDEX IF NOT EXISTS idx_roadmap_tasks_lane ON roadmap_tasks (lane);
+CREATE INDEX IF NOT EXISTS idx_pursuits_owner ON pursuits (owner_id);
+CREATE INDEX IF NOT EXISTS idx_pursuits_pursuit_id ON pursuits (pursuit_id);
+CREATE INDEX IF NOT EXISTS idx_pmc_program ON product_material_combinations (owner_id);
+CREATE INDEX IF NOT EXISTS idx_pmc_product ON product_material_combinations (product_id);
+CREATE INDEX IF NOT EXISTS idx_pmc_material ON product_material_combinations (material_id);
+"""
+
+# Indexed columns of each table, filled from the entity's JSON keys
+ENTITY_COLUMNS = {
+    'programs': {'id': 'id', 'name': 'name', 'sector': 'sector', 'division': 'division',
+                 'customer_name': 'customerName'},
+    'products': {'id': 'id', 'name': 'name', 'trl': 'trl'},
+    'material_systems': {'id': 'id', 'name': 'name', 'process': 'process', 'material': 'material',
+                         'mrl': 'mrl'},
+    'printing_suppliers': {'id': 'id', 'name': 'name', 'supplier_number': 'supplierNumber'},
+    'post_processing_suppliers': {'id': 'id', 'name': 'name', 'supplier_number': 'supplierNumber'},
+    'funding_opps': {'id': 'id', 'announcement_name': 'announcementName', 'customer': 'customer',
+                     'status': 'status', 'close_date': 'closeDate'},
+    'roadmap_tasks': {'task': 'task', 'lane': ('lane', 'category'), 'status': 'status',
+                      'start': ('start', 'startDate'), 'end': ('end', 'endDate'),
+                      'funding_type': 'fundingType'},
+    'pursuits': {'pursuit_id': 'pursuitID', 'pursuit_name': 'pursuitName',
+                 'targeted_submission_date': 'targetedSubmissionDate'},
+    'product_material_combinations': {'product_id': 'productID', 'material_id': 'materialID',
+                                      'part_number': 'partNumber', 'adoption_status': 'adoptionStatus'},
+}
+
+def is_sqlite_path(file_path):
+    """Return True if file_path names a SQLite roadmap database rather than a JSON file"""
+    return os.path.splitext(str(file_path))[1].lower() in SQLITE_EXTENSIONS
+
+def connect(db_path):
+    """Open a roadmap database, creating the schema if needed"""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+def _dumps(value):
+    """Serialise a value for a doc/value column"""
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+def _column_value(entity, keys):
+    """Return an indexed column value from the first present key, stored as text"""
+    for key in (keys if isinstance(keys, tuple) else (keys,)):
+        if isinstance(entity, dict) and key in entity:
+            value = entity[key]
+            if isinstance(value, (dict, list)):
+                return _dumps(value)
+            return None if value is None else str(value)
+    return None
+
+def _row_values(table, entity):
+    """Return the indexed column values of an entity for its table"""
+    return [_column_value(entity, keys) for keys in ENTITY_COLUMNS[table].values()]
+
+def _detach_child_lists(collection, entity):
+    """Return a copy of entity with its child lists replaced by markers, and the lists removed"""
+    detached = []
+    if not isinstance(entity, dict):
+        return entity, detached
+    doc = dict(entity)
+    for path, table in CHILD_LISTS.get(collection, []):
+        parent = doc
+        for key in path[:-1]:
+            if not isinstance(parent.get(key), dict):
+                parent = None
+                break
+            # Copy nested dicts on the way down so the caller's entity is untouched
+            parent[key] = dict(parent[key])
+            parent = parent[key]
+        if parent is None or not isinstance(parent.get(path[-1]), list):
+            continue
+        list_name = '.'.join(path)
+        detached.append((table, list_name, parent[path[-1]]))
+        parent[path[-1]] = {ROWS_MARKER: list_name}
+    return doc, detached
+
+def _attach_child_lists(doc, children):
+    """Put the child lists loaded from their tables back in place of their markers"""
+    if isinstance(doc, dict):
+        for key, value in doc.items():
+            if isinstance(value, dict):
+                if set(value) == {ROWS_MARKER}:
+                    doc[key] = children.get(value[ROWS_MARKER], [])
+                else:
+                    _attach_child_lists(value, children)
+    return doc
+
+def write_roadmap_db(conn, data):
+    """Replace the contents of an open roadmap database with the roadmap dict"""
+    with conn:
+        for table in ('roadmap_keys', 'roadmap_tasks', 'pursuits', 'product_material_combinations'):
+            conn.execute(f"DELETE FROM {table}")
+        for table, _ in ENTITY_TABLES.values():
+            conn.execute(f"DELETE FROM {table}")
+        conn.execute("INSERT OR REPLACE INTO roadmap_meta (key, value) VALUES ('schema_version', ?)",
+                     (str(SCHEMA_VERSION),))
+
+        for key_position, (key, value) in enumerate(data.items()):
+            if key not in ENTITY_TABLES or not isinstance(value, list):
+                # Other top-level values are kept as JSON
+                conn.execute("INSERT INTO roadmap_keys (position, key, entity_table, value) VALUES (?, ?, NULL, ?)",
+                             (key_position, key, _dumps(value)))
+                continue
+
+            table, owner_type = ENTITY_TABLES[key]
+            conn.execute("INSERT INTO roadmap_keys (position, key, entity_table, value) VALUES (?, ?, ?, NULL)",
+                         (key_position, key, table))
+            columns = list(ENTITY_COLUMNS[table])
+            insert = (f"INSERT INTO {table} (position, {', '.join(columns)}, doc) "
+                      f"VALUES ({', '.join('?' * (len(columns) + 2))})")
+            for position, entity in enumerate(value):
+                doc, detached = _detach_child_lists(key, entity)
+                conn.execute(insert, [position] + _row_values(table, entity) + [_dumps(doc)])
+                owner_id = _column_value(entity, 'id')
+                for child_table, list_name, items in detached:
+                    _insert_children(conn, child_table, owner_type, position, owner_id, list_name, items)
+
+def _insert_children(conn, table, owner_type, owner_position, owner_id, list_name, items):
+    """Insert the items of one nested list as rows of a child table"""
+    columns = list(ENTITY_COLUMNS[table])
+    quoted = ', '.join(f'"{column}"' for column in columns)
+    insert = (f"INSERT INTO {table} (owner_type, owner_position, owner_id, list_name, position, {quoted}, doc) "
+              f"VALUES ({', '.join('?' * (len(columns) + 6))})")
+    conn.executemany(insert, (
+        [owner_type, owner_position, owner_id, list_name, position] + _row_values(table, item) + [_dumps(item)]
+        for position, item in enumerate(items)
+    ))
+
+def read_roadmap_db(conn):
+    """Rebuild the roadmap dict from an open roadmap database"""
+    owner_types = {table: owner_type for table, owner_type in ENTITY_TABLES.values()}
+
+    # Child rows grouped by owner and list, in their original order
+    children = {}
+    for table in ('roadmap_tasks', 'pursuits', 'product_material_combinations'):
+        rows = conn.execute(f"SELECT owner_type, owner_position, list_name, doc FROM {table} "
+                            "ORDER BY owner_type, owner_position, list_name, position")
+        for row in rows:
+            key = (row['owner_type'], row['owner_position'])
+            children.setdefault(key, {}).setdefault(row['list_name'], []).append(json.loads(row['doc']))
+
+    data = {}
+    for row in conn.execute("SELECT key, entity_table, value FROM roadmap_keys ORDER BY position"):
+        if row['entity_table'] is None:
+            data[row['key']] = json.loads(row['value'])
+            continue
+        table = row['entity_table']
+        owner_type = owner_types[table]
+        entities = []
+        for entity_row in conn.execute(f"SELECT position, doc FROM {table} ORDER BY position"):
+            doc = json.loads(entity_row['doc'])
+            entities.append(_attach_child_lists(doc, children.get((owner_type, entity_row['position']), {})))
+        data[row['key']] = entities
+    return data
+
+def load_roadmap_db(db_path):
+    """Load a roadmap database into the same dict structure as roadmap.json"""
+    if not os.path.exists(db_path):
+        raise FileNotFoundError(f"Roadmap database not found: {db_path}")
+    conn = connect(db_path)
+    try:
+        return read_roadmap_db(conn)
+    finally:
+        conn.close()
+
+def save_roadmap_db(db_path, data):
+    """Write the roadmap dict to a database file, replacing it in a single step"""
+    db_path = os.path.abspath(db_path)
+    directory = os.path.dirname(db_path)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(db_path) + ".", suffix=".tmp")
+    os.close(fd)
+    try:
+        conn = connect(temp_path)
+        try:
+            write_roadmap_db(conn, data)
+        finally:
+            conn.close()
+        os.replace(temp_path, db_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def load_roadmap_file(file_path, collections=None):
+    """Load roadmap data from either a JSON file or a SQLite database"""
+    if is_sqlite_path(file_path):
+        data = load_roadmap_db(file_path)
+        if collections is not None:
+            for key in ENTITY_TABLES:
+                if key not in collections:
+                    data.pop(key, None)
+        return data
+    if collections is None:
+        # json.load is faster than the streaming loader when the whole document is needed
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return load_roadmap(file_path, collections)
+
+# Targeted queries
+
+def query_tasks(conn, lane=None, owner_type=None, owner_id=None, status=None):
+    """Return the roadmap tasks matching the given filters as (owner_type, owner_id, task) tuples.
+
+    owner_type is 'program', 'product', 'materialSystem', 'printingSupplier' or
+    'postProcessingSupplier'. Supplier tasks have a category instead of a lane,
+    which the lane filter also matches.
+    """
+    conditions = []
+    params = []
+    for column, value in (('lane', lane), ('owner_type', owner_type), ('owner_id', owner_id), ('status', status)):
+        if value is not None:
+            conditions.append(f"{column} = ?")
+            params.append(value)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    rows = conn.execute(f"SELECT owner_type, owner_id, doc FROM roadmap_tasks {where} "
+                        "ORDER BY owner_type, owner_position, list_name, position", params)
+    return [(row['owner_type'], row['owner_id'], json.loads(row['doc'])) for row in rows]
+
+def lanes(conn, owner_type=None):
+    """Return the distinct task lanes (or supplier task categories), optionally for one owner type"""
+    if owner_type is None:
+        rows = conn.execute("SELECT DISTINCT lane FROM roadmap_tasks WHERE lane IS NOT NULL ORDER BY lane")
+    else:
+        rows = conn.execute("SELECT DISTINCT lane FROM roadmap_tasks WHERE lane IS NOT NULL AND owner_type = ? "
+                            "ORDER BY lane", (owner_type,))
+    return [row['lane'] for row in rows]
+
+def pursuits_for_funding(conn, funding_id):
+    """Return the pursuits of one funding opportunity"""
+    rows = conn.execute("SELECT doc FROM pursuits WHERE owner_id = ? ORDER BY owner_position, position",
+                        (funding_id,))
+    return [json.loads(row['doc']) for row in rows]
+
+def combinations_for_product(conn, product_id):
+    """Return (program ID, combination) for every program combination that uses a product"""
+    rows = conn.execute("SELECT owner_id, doc FROM product_material_combinations WHERE product_id = ? "
+                        "ORDER BY owner_position, position", (product_id,))
+    return [(row['owner_id'], json.loads(row['doc'])) for row in rows]
+
+def combinations_for_material(conn, material_id):
+    """Return (program ID, combination) for every program combination that uses a material system"""
+    rows = conn.execute("SELECT owner_id, doc FROM product_material_combinations WHERE material_id = ? "
+                        "ORDER BY owner_position, position", (material_id,))
+    return [(row['owner_id'], json.loads(row['doc'])) for row in rows]
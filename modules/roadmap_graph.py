@@ -0,0 +1,166 @@
+"""
+Roadmap Graph Module for Roadmap Visualizations
+
+This module builds the entity relationship graph shared by the network pages including:
+1. One networkx DiGraph of programs, products, material systems, suppliers and funding opportunities
+2. Edge construction from the RoadmapStore reverse indexes, linear in the number of entities and references
+3. The two funding link rules used by the pages (tasks carrying a fundingID, or a fundingType matching
+   the opportunity's pursuitType)
+4. An optional pickle cache of built graphs keyed by the hash of the roadmap collections
+
+Graphs are built once per run through RoadmapStore.graph() and shared by every caller,
+so callers must not modify them.
+"""
+
+import os
+import json
+import pickle
+import hashlib
+from collections import defaultdict
+
+import networkx as nx
+
+from modules.roadmap_store import ENTITY_COLLECTIONS, as_store, entry_id
+
+# Bump when the graph layout changes so older cached graphs are never loaded
+GRAPH_VERSION = 1
+
+GRAPH_CACHE_ENV = "ROADMAP_GRAPH_CACHE"
+
+# Funding link rules: tasks whose fundingID names the opportunity, or whose fundingType matches its pursuitType
+FUNDING_LINKS = ('funding_id', 'pursuit_type')
+
+_stats = {'built': 0, 'loaded': 0}
+
+def _add_entity_nodes(G, store):
+    """Add the program, product, material and supplier nodes with the edges between them"""
+    # Add program nodes
+    for program in store.get('programs', []):
+        G.add_node(program['id'], label=program['name'], type='program', layer=0)
+
+    # Add product nodes with the edges from their programs
+    for product in store.get('products', []):
+        G.add_node(product['id'], label=product['name'], type='product', layer=1)
+        for program_entry in product.get('programs', []):
+            program_id = entry_id(program_entry, 'programID')
+            if program_id:
+                G.add_edge(program_id, product['id'], weight=2, relationship_type='uses')
+
+    # Add material system nodes with the edges from the products that use them
+    for material in store.get('materialSystems', []):
+        G.add_node(material['id'], label=material['name'], type='material', layer=2)
+        for product in store.products_for_material(material['id']):
+            G.add_edge(product['id'], material['id'], weight=2, relationship_type='uses_material')
+
+    # Add printing supplier nodes with the edges from the materials they offer
+    for supplier in store.get('printingSuppliers', []):
+        G.add_node(supplier['id'], label=supplier['name'], type='supplier', layer=3)
+        for material_entry in supplier.get('materialSystems', []):
+            material_id = entry_id(material_entry, 'materialID')
+            if material_id:
+                G.add_edge(material_id, supplier['id'], weight=2, relationship_type='supplied_by')
+
+    # Add post-processing supplier nodes with the edges from the products they finish
+    for supplier in store.get('postProcessingSuppliers', []):
+        G.add_node(supplier['id'], label=supplier['name'], type='post-supplier', layer=3)
+        for product in store.products_for_post_processing_supplier(supplier['id']):
+            G.add_edge(product['id'], supplier['id'], weight=1, style='dashed',
+                       relationship_type='post_processed_by')
+
+def _task_lists(roadmap, include_dict):
+    """Return the task lists of a roadmap stored as a list, or as a dict with 'tasks' when include_dict is set"""
+    if isinstance(roadmap, list):
+        return [roadmap]
+    if include_dict and isinstance(roadmap, dict) and 'tasks' in roadmap:
+        return [roadmap['tasks']]
+    return []
+
+def _pursuit_type_owners(store):
+    """Map each task fundingType to the programs, then products, with a roadmap task of that type"""
+    owners = defaultdict(list)
+    # Program roadmaps may be task lists or dicts with a 'tasks' list; product roadmaps only count as lists
+    for collection, include_dict in (('programs', True), ('products', False)):
+        for entity in store.get(collection, []):
+            for tasks in _task_lists(entity.get('roadmap'), include_dict):
+                for task in tasks:
+                    funding_type = task.get('fundingType')
+                    if funding_type is not None:
+                        owners[funding_type].append(entity)
+    return owners
+
+def _add_funding_nodes(G, store, funding_links):
+    """Add the funding opportunity nodes with the edges to the programs and products they fund"""
+    if 'fundingOpportunities' not in store:
+        return
+
+    if funding_links == 'pursuit_type':
+        owners = _pursuit_type_owners(store)
+
+    for funding in store['fundingOpportunities']:
+        funding_name = funding.get('name', funding.get('announcementName', 'Unknown'))
+        G.add_node(funding['id'], label=funding_name, type='funding', layer=4)
+
+        if funding_links == 'pursuit_type':
+            funded = owners.get(funding.get('pursuitType'), [])
+        else:
+            funded = [owner for owner_type, owner, _ in store.tasks_for_funding(funding['id'])
+                      if owner_type in ('program', 'product')]
+        for owner in funded:
+            G.add_edge(funding['id'], owner['id'], weight=1, style='dotted', relationship_type='funds')
+
+def build_roadmap_graph(data, funding_links='funding_id'):
+    """Build the relationship graph: programs -> products -> materials -> suppliers, plus funding links.
+
+    Nodes carry 'label', 'type' and 'layer' (0-4) attributes; edges carry 'weight',
+    'relationship_type' and, for post-processing and funding links, a 'style'.
+    """
+    if funding_links not in FUNDING_LINKS:
+        raise ValueError(f"Unknown funding link rule {funding_links!r}; expected one of {', '.join(FUNDING_LINKS)}")
+    store = as_store(data)
+    G = nx.DiGraph()
+    _add_entity_nodes(G, store)
+    _add_funding_nodes(G, store, funding_links)
+    return G
+
+def dataset_hash(data):
+    """Return the content hash of the collections the graph is built from"""
+    collections = {name: data.get(name) for name in ENTITY_COLLECTIONS}
+    text = json.dumps([GRAPH_VERSION, collections], sort_keys=True, default=str)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+def configure_graph_cache(directory):
+    """Keep built graphs as pickles in directory (shared with worker processes); None disables it"""
+    if directory is None:
+        os.environ.pop(GRAPH_CACHE_ENV, None)
+    else:
+        os.environ[GRAPH_CACHE_ENV] = os.path.abspath(directory)
+
+def load_roadmap_graph(data, funding_links='funding_id'):
+    """Return the graph from the pickle cache when one is configured, building (and storing) it otherwise"""
+    directory = os.environ.get(GRAPH_CACHE_ENV)
+    if not directory:
+        _stats['built'] += 1
+        return build_roadmap_graph(data, funding_links)
+
+    path = os.path.join(directory, f"graph_{dataset_hash(data)}_{funding_links}.pickle")
+    if os.path.exists(path):
+        try:
+            with open(path, 'rb') as f:
+                G = pickle.load(f)
+            _stats['loaded'] += 1
+            return G
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+    G = build_roadmap_graph(data, funding_links)
+    _stats['built'] += 1
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(G, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return G
+
+def graph_stats():
+    """Return how many graphs this process built and loaded from the pickle cache"""
+    return dict(_stats)
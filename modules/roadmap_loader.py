@@ -0,0 +1,157 @@
+"""
+Roadmap Loader Module for Roadmap Visualizations
+
+This module reads roadmap.json incrementally including:
+1. Streaming the items of one top-level collection without loading the rest of the file
+2. Loading only the collections a generator needs
+3. Loading the whole roadmap without first reading the full file text into memory (slower than json.load)
+"""
+
+import json
+
+# Top-level collections of roadmap.json that hold lists of entities
+ROADMAP_COLLECTIONS = (
+    'programs',
+    'products',
+    'materialSystems',
+    'printingSuppliers',
+    'postProcessingSuppliers',
+    'fundingOpps',
+)
+
+# Characters read from the file at a time
+CHUNK_SIZE = 1 << 20
+
+_WHITESPACE = ' \t\n\r'
+_NUMBER_CHARS = '0123456789.eE+-'
+
+class _StreamDecoder:
+    """Decode JSON values one at a time from a text file, keeping only a window of the text"""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _read_more(self, size=None):
+        """Drop the consumed text and append the next chunk; return False at end of file"""
+        if self.eof:
+            return False
+        chunk = self.f.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character without consuming it ('' at end of file)"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._read_more():
+                return ''
+
+    def expect(self, char):
+        """Consume the next non-whitespace character, which must be char"""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in roadmap JSON but found '{found or 'end of file'}'")
+        self.pos += 1
+
+    def value(self):
+        """Decode and return the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Most likely the value continues past the buffer; read a larger
+                # window each time so very large values are not re-parsed too often
+                if not self._read_more(max(self.chunk_size, len(self.buf))):
+                    raise
+                continue
+            # A value ending at the buffer edge (or a number followed by a partial
+            # fraction/exponent) may still continue in the file
+            cut = end == len(self.buf) or (isinstance(value, (int, float)) and self.buf[end] in _NUMBER_CHARS)
+            if cut and self._read_more():
+                continue
+            self.pos = end
+            return value
+
+    def items(self):
+        """Yield the elements of the JSON array starting at the current position"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ',':
+                self.pos += 1
+                continue
+            self.expect(']')
+            return
+
+    def members(self):
+        """Yield the keys of the JSON object starting at the current position.
+
+        After each key the caller must consume its value (value(), items() or skip()).
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(':')
+            yield key
+            if self.peek() == ',':
+                self.pos += 1
+                continue
+            self.expect('}')
+            return
+
+    def skip(self):
+        """Consume the next value, decoding arrays one element at a time"""
+        if self.peek() == '[':
+            for _ in self.items():
+                pass
+        else:
+            self.value()
+
+def iter_collection(file_path, collection, chunk_size=CHUNK_SIZE):
+    """Yield the items of one top-level collection of a roadmap file, one at a time"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        stream = _StreamDecoder(f, chunk_size)
+        for key in stream.members():
+            if key == collection and stream.peek() == '[':
+                yield from stream.items()
+            else:
+                stream.skip()
+
+def load_roadmap(file_path, collections=None, chunk_size=CHUNK_SIZE):
+    """Load a roadmap file, keeping only the given top-level collections if provided.
+
+    Roadmap collections (ROADMAP_COLLECTIONS) that are not requested are skipped
+    item by item, so they are never held in memory as a whole; other top-level
+    values are always kept.
+    Unlike json.load, the full file text is never held in memory either.
+    """
+    data = {}
+    with open(file_path, 'r', encoding='utf-8') as f:
+        stream = _StreamDecoder(f, chunk_size)
+        for key in stream.members():
+            if collections is not None and key in ROADMAP_COLLECTIONS and key not in collections:
+                stream.skip()
+            elif stream.peek() == '[':
+                data[key] = list(stream.items())
+            else:
+                data[key] = stream.value()
+    return data
@@ -0,0 +1,214 @@
+"""
+Roadmap Store Module for Roadmap Visualizations
+
+This module provides an indexed, in-memory view of the roadmap data including:
+1. ID lookups for programs, products, material systems, suppliers and funding opportunities
+2. Reverse indexes (product -> programs, material -> products, material -> suppliers, funding -> tasks)
+3. Helpers to resolve the mixed string/dict references used throughout roadmap.json
+4. The normalized task and milestone tables, built on first use and shared by every generator
+5. The entity relationship graphs (see modules.roadmap_graph), built on first use and shared the same way
+"""
+
+from collections import defaultdict
+
+from modules.task_table import build_task_table, build_milestone_table
+
+# Top-level collections that hold entities with an 'id' field
+ENTITY_COLLECTIONS = (
+    'programs',
+    'products',
+    'materialSystems',
+    'printingSuppliers',
+    'postProcessingSuppliers',
+    'fundingOpportunities',
+)
+
+def entry_id(entry, key):
+    """Return the referenced ID from a plain string entry or a dict entry such as {'materialID': 'MS1'}"""
+    if isinstance(entry, str):
+        return entry
+    if isinstance(entry, dict):
+        return entry.get(key)
+    return None
+
+def as_store(data):
+    """Return data as a RoadmapStore, building the indexes only if needed"""
+    if isinstance(data, RoadmapStore):
+        return data
+    return RoadmapStore(data)
+
+def _index_by_id(items):
+    """Map each item's ID to the item, keeping the first occurrence like a linear scan would"""
+    index = {}
+    for item in items:
+        if isinstance(item, dict) and 'id' in item:
+            index.setdefault(item['id'], item)
+    return index
+
+class RoadmapStore(dict):
+    """Roadmap data with ID and reverse indexes built once per run.
+
+    The store is a dict holding the same top-level collections as the loaded
+    roadmap.json, so existing ``data['products']`` style access keeps working.
+    The entity objects are shared with the original data, not copied.
+    """
+
+    def __init__(self, data):
+        super().__init__(data)
+
+        # Map fundingOpps to fundingOpportunities for compatibility
+        if 'fundingOpps' in self and 'fundingOpportunities' not in self:
+            self['fundingOpportunities'] = self['fundingOpps']
+
+        self.reindex()
+
+    def reindex(self):
+        """Rebuild all indexes from the current collections"""
+        self._task_table = None
+        self._milestone_table = None
+        self._graphs = {}
+
+        self.programs_by_id = _index_by_id(self.get('programs', []))
+        self.products_by_id = _index_by_id(self.get('products', []))
+        self.materials_by_id = _index_by_id(self.get('materialSystems', []))
+        self.printing_suppliers_by_id = _index_by_id(self.get('printingSuppliers', []))
+        self.post_processing_suppliers_by_id = _index_by_id(self.get('postProcessingSuppliers', []))
+        self.funding_by_id = _index_by_id(self.get('fundingOpportunities', []))
+
+        # product ID -> [(program, combo)] in program order
+        self.product_combinations = defaultdict(list)
+        # product ID -> [program] (each program once)
+        self.product_programs = defaultdict(list)
+        for program in self.get('programs', []):
+            seen_products = set()
+            for combo in program.get('productMaterialCombinations', []):
+                product_id = combo.get('productID')
+                if not product_id:
+                    continue
+                self.product_combinations[product_id].append((program, combo))
+                if product_id not in seen_products:
+                    seen_products.add(product_id)
+                    self.product_programs[product_id].append(program)
+
+        # material ID -> [product] and post-processing supplier ID -> [product]
+        self.material_products = defaultdict(list)
+        self.post_processing_supplier_products = defaultdict(list)
+        for product in self.get('products', []):
+            for material_entry in product.get('materialSystems', []):
+                material_id = entry_id(material_entry, 'materialID')
+                if material_id:
+                    self.material_products[material_id].append(product)
+            for pp in product.get('postProcessingSuppliers', []):
+                if not isinstance(pp, dict):
+                    continue
+                supplier_ids = pp.get('supplier', [])
+                if isinstance(supplier_ids, str):
+                    supplier_ids = [supplier_ids]
+                for supplier_id in supplier_ids:
+                    self.post_processing_supplier_products[supplier_id].append(product)
+
+        # material ID -> [printing supplier]
+        self.material_suppliers = defaultdict(list)
+        for supplier in self.get('printingSuppliers', []):
+            for material_entry in supplier.get('materialSystems', []):
+                material_id = entry_id(material_entry, 'materialID')
+                if material_id:
+                    self.material_suppliers[material_id].append(supplier)
+
+        # funding ID -> [(owner type, owner, task)] for roadmap tasks carrying a fundingID
+        self.funding_tasks = defaultdict(list)
+        owners = (
+            ('program', self.get('programs', []), 'roadmap'),
+            ('product', self.get('products', []), 'roadmap'),
+            ('supplier', self.get('printingSuppliers', []), 'supplierRoadmap'),
+        )
+        for owner_type, entities, roadmap_key in owners:
+            for entity in entities:
+                roadmap = entity.get(roadmap_key)
+                if not isinstance(roadmap, dict):
+                    continue
+                for task in roadmap.get('tasks', []):
+                    if 'fundingID' in task:
+                        self.funding_tasks[task['fundingID']].append((owner_type, entity, task))
+
+    # ID lookups
+
+    def program(self, program_id):
+        """Return the program with the given ID, or None"""
+        return self.programs_by_id.get(program_id)
+
+    def product(self, product_id):
+        """Return the product with the given ID, or None"""
+        return self.products_by_id.get(product_id)
+
+    def material(self, material_id):
+        """Return the material system with the given ID, or None"""
+        return self.materials_by_id.get(material_id)
+
+    def printing_supplier(self, supplier_id):
+        """Return the printing supplier with the given ID, or None"""
+        return self.printing_suppliers_by_id.get(supplier_id)
+
+    def post_processing_supplier(self, supplier_id):
+        """Return the post-processing supplier with the given ID, or None"""
+        return self.post_processing_suppliers_by_id.get(supplier_id)
+
+    def funding(self, funding_id):
+        """Return the funding opportunity with the given ID, or None"""
+        return self.funding_by_id.get(funding_id)
+
+    # Normalized tables
+
+    def task_table(self):
+        """Return the task table of every program, product and material task (see modules.task_table)"""
+        if self._task_table is None:
+            self._task_table = build_task_table(self)
+        return self._task_table
+
+    def milestone_table(self):
+        """Return the milestone table of every program, product and material milestone"""
+        if self._milestone_table is None:
+            self._milestone_table = build_milestone_table(self)
+        return self._milestone_table
+
+    def graph(self, funding_links='funding_id'):
+        """Return the shared relationship graph for a funding link rule (see modules.roadmap_graph)"""
+        if funding_links not in self._graphs:
+            from modules.roadmap_graph import load_roadmap_graph
+            self._graphs[funding_links] = load_roadmap_graph(self, funding_links)
+        return self._graphs[funding_links]
+
+    # Reverse lookups
+
+    def materials_for_product(self, product):
+        """Return the material systems referenced by a product, skipping unknown IDs"""
+        materials = []
+        for material_entry in product.get('materialSystems', []):
+            material = self.materials_by_id.get(entry_id(material_entry, 'materialID'))
+            if material:
+                materials.append(material)
+        return materials
+
+    def programs_for_product(self, product_id):
+        """Return the programs whose productMaterialCombinations mention the product"""
+        return self.product_programs.get(product_id, [])
+
+    def combinations_for_product(self, product_id):
+        """Return (program, combo) pairs for every productMaterialCombination of the product"""
+        return self.product_combinations.get(product_id, [])
+
+    def products_for_material(self, material_id):
+        """Return the products that use a material system (once per reference)"""
+        return self.material_products.get(material_id, [])
+
+    def suppliers_for_material(self, material_id):
+        """Return the printing suppliers that offer a material system (once per reference)"""
+        return self.material_suppliers.get(material_id, [])
+
+    def products_for_post_processing_supplier(self, supplier_id):
+        """Return the products that list a post-processing supplier (once per reference)"""
+        return self.post_processing_supplier_products.get(supplier_id, [])
+
+    def tasks_for_funding(self, funding_id):
+        """Return (owner type, owner, task) tuples for tasks funded by an opportunity"""
+        return self.funding_tasks.get(funding_id, [])
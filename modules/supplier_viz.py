@@ -1,146 +1,109 @@
 import os
 from datetime import datetime, timedelta
-from bokeh.plotting import figure, save, output_file
+from bokeh.plotting import figure, output_file
 from bokeh.models import ColumnDataSource, HoverTool, Label, Range1d, Span, Legend, LegendItem, Div, Tabs, Panel
 from bokeh.layouts import column, row, layout, gridplot
 from bokeh.palettes import Category10, Spectral6
 from bokeh.transform import factor_cmap
 import matplotlib.pyplot as plt
 import numpy as np
+from modules.roadmap_store import as_store
+from modules.bokeh_resources import save_page
+from modules.build_manifest import open_output
+from modules.date_parsing import parse_date
+from modules.gantt import TASK_TOOLTIPS, gantt_task, gantt_figure, gantt_layout, draw_gantt
+
+# Roadmap task colors by status
+SUPPLIER_STATUS_COLORS = {
+    'Complete': '#43a047',
+    'In Progress': '#ff9800',
+    'Planned': '#4a89ff'
+}
 
 def generate_supplier_visualizations(data, output_dir):
     """Generate visualizations for suppliers"""
     print("Generating supplier visualizations...")
     
+    for _, func, args, _ in supplier_visualization_tasks(as_store(data), output_dir):
+        func(*args)
+    
+    print(f"Supplier visualizations generated in '{os.path.join(output_dir, 'suppliers')}'")
+
+def supplier_visualization_tasks(data, output_dir):
+    """Return the independent (name, func, args, sources) tasks that make up the supplier visualizations"""
     # Create suppliers directory if it doesn't exist
     supplier_dir = os.path.join(output_dir, "suppliers")
     if not os.path.exists(supplier_dir):
         os.makedirs(supplier_dir)
     
-    # Generate individual supplier pages for printing suppliers
+    tasks = []
+    
+    # Individual supplier pages for printing suppliers
     if 'printingSuppliers' in data:
         for supplier in data['printingSuppliers']:
-            generate_printing_supplier_page(supplier, data, supplier_dir)
+            tasks.append((f"supplier_{supplier['id']}", generate_printing_supplier_page,
+                          (supplier, data, supplier_dir), printing_supplier_page_sources(supplier, data)))
     
-    # Generate individual supplier pages for post-processing suppliers
+    # Individual supplier pages for post-processing suppliers
     if 'postProcessingSuppliers' in data:
         for supplier in data['postProcessingSuppliers']:
-            generate_postprocessing_supplier_page(supplier, data, supplier_dir)
-    
-    # Generate supplier summary page
-    generate_supplier_summary(data, supplier_dir)
-    
-    # Generate supplier distribution charts
-    generate_supplier_distribution_charts(data, supplier_dir)
-    
-    print(f"Supplier visualizations generated in '{supplier_dir}'")
+            # The page lists the products that use the supplier
+            related = [('products', product['id'])
+                       for product in data.products_for_post_processing_supplier(supplier['id'])]
+            tasks.append((f"supplier_{supplier['id']}", generate_postprocessing_supplier_page,
+                          (supplier, data, supplier_dir), related))
+    
+    # Supplier summary page and distribution charts
+    tasks.append(("supplier_summary", generate_supplier_summary, (data, supplier_dir),
+                  ('printingSuppliers', 'postProcessingSuppliers')))
+    tasks.append(("supplier_distribution", generate_supplier_distribution_charts, (data, supplier_dir),
+                  ('printingSuppliers', 'postProcessingSuppliers', 'products')))
+    
+    return tasks
+
+def printing_supplier_page_sources(supplier, data):
+    """Return the entities a printing supplier page reads: its material systems and their products"""
+    sources = []
+    for material_entry in supplier.get('materialSystems', []):
+        material_id = material_entry.get('materialID')
+        sources.append(('materialSystems', material_id))
+        sources.extend(('products', product['id']) for product in data.products_for_material(material_id))
+    return sources
+
+def supplier_gantt_tasks(supplier):
+    """Return the normalized Gantt tasks of a printing supplier's roadmap, grouped by status"""
+    tasks = []
+    for task in supplier['supplierRoadmap']['tasks']:
+        if not task.get('start') or not task.get('end'):
+            tasks.append(gantt_task(None, None, task.get('task', ''), task.get('status')))
+            continue
+        
+        # Add funding type and category if available
+        funding = f" ({task.get('fundingType', '')})" if 'fundingType' in task else ""
+        category = f" [{task.get('category', '')}]" if 'category' in task else ""
+        task_name = f"{task['task']}{funding}{category}"
+        tasks.append(gantt_task(parse_date(task['start']), parse_date(task['end']), task_name, task['status'],
+                                task=task_name, status=task['status']))
+    return tasks
 
 def generate_printing_supplier_page(supplier, data, supplier_dir):
     """Generate a detailed page for a single printing supplier"""
     supplier_id = supplier['id']
+    data = as_store(data)
     
     # Create a figure for the supplier roadmap if available
     roadmap_section = ""
     if 'supplierRoadmap' in supplier and 'tasks' in supplier['supplierRoadmap']:
-        p = figure(
-            title=f"Roadmap for {supplier['name']} ({supplier_id})",
-            x_axis_type="datetime",
-            width=1200,
-            height=400,
-            toolbar_location="above",
-            tools="pan,wheel_zoom,box_zoom,reset,save",
-        )
-        
-        # Customize appearance
-        p.title.text_font_size = '16pt'
-        p.xaxis.axis_label = "Timeline"
-        p.yaxis.axis_label = "Tasks"
-        p.grid.grid_line_alpha = 0.3
-        p.background_fill_color = "#f8f9fa"
+        p = gantt_figure(title=f"Roadmap for {supplier['name']} ({supplier_id})")
         
-        # Process roadmap tasks
-        y_pos = 0
-        all_dates = []
+        # Roadmap task bars colored by status, labelled at their start
+        tasks = supplier_gantt_tasks(supplier)
         
-        # Add roadmap tasks
-        for task in supplier['supplierRoadmap']['tasks']:
-            y_pos -= 1
-            
-            if not task.get('start') or not task.get('end'):
-                continue
-                
-            start_date = datetime.strptime(task['start'], "%Y-%m-%d")
-            end_date = datetime.strptime(task['end'], "%Y-%m-%d")
-            all_dates.extend([start_date, end_date])
-            
-            # Add funding type if available
-            funding = f" ({task.get('fundingType', '')})" if 'fundingType' in task else ""
-            category = f" [{task.get('category', '')}]" if 'category' in task else ""
-            task_name = f"{task['task']}{funding}{category}"
-            
-            # Create data source for the task bar
-            bar_source = ColumnDataSource(data=dict(
-                y=[y_pos],
-                left=[start_date],
-                right=[end_date],
-                task=[task_name],
-                start=[start_date],
-                end=[end_date],
-                status=[task['status']]
-            ))
-            
-            # Add task bar
-            color_map = {
-                'Complete': '#43a047',
-                'In Progress': '#ff9800',
-                'Planned': '#4a89ff'
-            }
-            color = color_map.get(task['status'], '#95a5a6')
-            p.hbar(y='y', left='left', right='right', height=0.6, 
-                   color=color, alpha=0.8, source=bar_source)
-            
-            # Create data source for the task label
-            label_source = ColumnDataSource(data=dict(
-                x=[start_date],
-                y=[y_pos],
-                text=[task_name]
-            ))
-            
-            # Add task label with offset to prevent overlap
-            p.text(x='x', y='y', text='text', source=label_source,
-                   text_font_size="9pt", text_baseline="middle", 
-                   x_offset=5, text_align="left")
-        
-        # Add hover tool
-        hover = HoverTool()
-        hover.tooltips = [
-            ("Task", "@task"),
-            ("Start", "@start{%F}"),
-            ("End", "@end{%F}"),
-            ("Status", "@status")
-        ]
-        hover.formatters = {
-            "@start": "datetime",
-            "@end": "datetime"
-        }
-        p.add_tools(hover)
-        
-        # Set y-range with padding
-        p.y_range = Range1d(y_pos - 1, 1)
-        
-        # Set x-range based on all dates
-        if all_dates:
-            min_date = min(all_dates)
-            max_date = max(all_dates)
-            # Add some padding (3 months before and after)
-            min_date = min_date - timedelta(days=90)
-            max_date = max_date + timedelta(days=90)
-            p.x_range.start = min_date
-            p.x_range.end = max_date
+        draw_gantt(p, gantt_layout(tasks), SUPPLIER_STATUS_COLORS, TASK_TOOLTIPS)
         
         # Output to file
         output_file(os.path.join(supplier_dir, f"supplier_roadmap_{supplier_id}.html"))
-        save(p)
+        save_page(p)
         
         roadmap_section = f"""
         <div style="margin-top: 20px;">
@@ -190,7 +153,7 @@ def generate_printing_supplier_page(supplier, data, supplier_dir):
     if 'materialSystems' in supplier:
         for material_entry in supplier['materialSystems']:
             material_id = material_entry.get('materialID')
-            material = next((m for m in data['materialSystems'] if m['id'] == material_id), None)
+            material = data.material(material_id)
             
             if material:
                 material_systems_section += f"""
@@ -249,17 +212,13 @@ def generate_printing_supplier_page(supplier, data, supplier_dir):
         for material_entry in supplier['materialSystems']:
             material_id = material_entry.get('materialID')
             
-            for product in data['products']:
-                for product_material in product.get('materialSystems', []):
-                    if isinstance(product_material, str) and product_material == material_id:
-                        related_products.add(product['id'])
-                    elif isinstance(product_material, dict) and product_material.get('materialID') == material_id:
-                        related_products.add(product['id'])
+            for product in data.products_for_material(material_id):
+                related_products.add(product['id'])
     
     if related_products:
         products_section += "<ul>"
         for product_id in related_products:
-            product = next((p for p in data['products'] if p['id'] == product_id), None)
+            product = data.product(product_id)
             if product:
                 products_section += f"<li><a href='../products/product_{product_id}.html'>{product['name']} ({product_id})</a></li>"
         products_section += "</ul>"
@@ -305,12 +264,13 @@ def generate_printing_supplier_page(supplier, data, supplier_dir):
     """
     
     # Write to file
-    with open(os.path.join(supplier_dir, f"supplier_{supplier_id}.html"), 'w') as f:
+    with open_output(os.path.join(supplier_dir, f"supplier_{supplier_id}.html"), 'w') as f:
         f.write(html_content)
 
 def generate_postprocessing_supplier_page(supplier, data, supplier_dir):
     """Generate a detailed page for a single post-processing supplier"""
     supplier_id = supplier['id']
+    data = as_store(data)
     
     # Create supplier info section
     supplier_info = f"""
@@ -370,16 +330,13 @@ def generate_postprocessing_supplier_page(supplier, data, supplier_dir):
     
     # Find products that use this post-processing supplier
     related_products = set()
-    for product in data['products']:
-        if 'postProcessingSuppliers' in product:
-            for pp in product['postProcessingSuppliers']:
-                if 'supplier' in pp and supplier_id in pp['supplier']:
-                    related_products.add(product['id'])
+    for product in data.products_for_post_processing_supplier(supplier_id):
+        related_products.add(product['id'])
     
     if related_products:
         products_section += "<ul>"
         for product_id in related_products:
-            product = next((p for p in data['products'] if p['id'] == product_id), None)
+            product = data.product(product_id)
             if product:
                 products_section += f"<li><a href='../products/product_{product_id}.html'>{product['name']} ({product_id})</a></li>"
         products_section += "</ul>"
@@ -425,11 +382,12 @@ def generate_postprocessing_supplier_page(supplier, data, supplier_dir):
     """
     
     # Write to file
-    with open(os.path.join(supplier_dir, f"supplier_{supplier_id}.html"), 'w') as f:
+    with open_output(os.path.join(supplier_dir, f"supplier_{supplier_id}.html"), 'w') as f:
         f.write(html_content)
 
 def generate_supplier_summary(data, supplier_dir):
     """Generate a summary page for all suppliers"""
+    data = as_store(data)
     # Create a figure for supplier distribution by type
     supplier_types = {
         'Printing Suppliers': len(data.get('printingSuppliers', [])),
@@ -473,7 +431,7 @@ def generate_supplier_summary(data, supplier_dir):
         material_counts = []
         
         for supplier_id, count in materials_per_supplier.items():
-            supplier = next((s for s in data['printingSuppliers'] if s['id'] == supplier_id), None)
+            supplier = data.printing_supplier(supplier_id)
             if supplier:
                 supplier_names.append(f"{supplier['name']} ({supplier_id})")
                 material_counts.append(count)
@@ -654,10 +612,12 @@ def generate_supplier_summary(data, supplier_dir):
     
     # Output to file
     output_file(os.path.join(supplier_dir, "supplier_summary.html"))
-    save(layout_obj)
+    save_page(layout_obj)
 
 def generate_supplier_distribution_charts(data, supplier_dir):
     """Generate distribution charts for suppliers"""
+    data = as_store(data)
+    
     # Count products per supplier
     products_per_supplier = {}
     
@@ -684,12 +644,8 @@ def generate_supplier_distribution_charts(data, supplier_dir):
             
             if material_id:
                 # Find suppliers that provide this material
-                if 'printingSuppliers' in data:
-                    for supplier in data['printingSuppliers']:
-                        if 'materialSystems' in supplier:
-                            for supplier_material in supplier['materialSystems']:
-                                if supplier_material.get('materialID') == material_id:
-                                    products_per_supplier[supplier['id']] = products_per_supplier.get(supplier['id'], 0) + 1
+                for supplier in data.suppliers_for_material(material_id):
+                    products_per_supplier[supplier['id']] = products_per_supplier.get(supplier['id'], 0) + 1
     
     # Count products for post-processing suppliers directly
     for product in data['products']:
@@ -707,7 +663,7 @@ def generate_supplier_distribution_charts(data, supplier_dir):
     
     for supplier_id, count in products_per_supplier.items():
         # Check if it's a printing supplier
-        printing_supplier = next((s for s in data.get('printingSuppliers', []) if s['id'] == supplier_id), None)
+        printing_supplier = data.printing_supplier(supplier_id)
         if printing_supplier:
             supplier_names.append(f"{printing_supplier['name']} ({supplier_id})")
             product_counts.append(count)
@@ -715,7 +671,7 @@ def generate_supplier_distribution_charts(data, supplier_dir):
             continue
         
         # Check if it's a post-processing supplier
-        postproc_supplier = next((s for s in data.get('postProcessingSuppliers', []) if s['id'] == supplier_id), None)
+        postproc_supplier = data.post_processing_supplier(supplier_id)
         if postproc_supplier:
             supplier_names.append(f"{postproc_supplier['name']} ({supplier_id})")
             product_counts.append(count)
@@ -781,4 +737,4 @@ def generate_supplier_distribution_charts(data, supplier_dir):
     
     # Output to file
     output_file(os.path.join(supplier_dir, "supplier_product_distribution.html"))
-    save(p) 
\ No newline at end of file
+    save_page(p) 
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""
+Task Table Module for Roadmap Visualizations
+
+This module normalizes the scheduled work in the roadmap into columnar tables including:
+1. One task table (pandas DataFrame) for program, product and material roadmap tasks
+   and the product designTools, documentation, specialNDT and partAcceptance lists
+2. Dates parsed once into datetime64 columns (NaT when missing or invalid)
+3. Status codes, float flags and funding types as plain columns for vectorized group-bys
+4. A milestone table with the same entity columns
+"""
+
+import numpy as np
+import pandas as pd
+
+# Status values in display order; status_code is the position in this tuple, or -1
+STATUS_ORDER = ('Complete', 'In Progress', 'Planned', 'Not Started', 'On Hold', 'Delayed')
+
+# Product task lists: (section, entity type, ID prefix, name key, start key, end key)
+PRODUCT_SECTIONS = (
+    ('roadmap', 'Product', '_T', 'task', 'start', 'end'),
+    ('designTools', 'Design Tool', '_DT_', 'name', 'start', 'end'),
+    ('documentation', 'Documentation', '_DOC_', 'name', 'start', 'end'),
+    ('specialNDT', 'Special NDT', '_NDT_', 'name', 'startDate', 'endDate'),
+    ('partAcceptance', 'Part Acceptance', '_PA_', 'name', 'startDate', 'endDate'),
+)
+
+# Columns of the task table, in order
+TASK_COLUMNS = (
+    'id', 'name', 'entity_type', 'entity_name', 'entity_id', 'owner', 'section', 'lane',
+    'start', 'end', 'status', 'float', 'float_date_text', 'funding_type', 'additionalDetails',
+)
+
+def parse_dates(values):
+    """Parse YYYY-MM-DD strings into a datetime64 array (NaT for blank or invalid dates)"""
+    return pd.to_datetime(pd.Series(values, dtype=object), format='%Y-%m-%d', errors='coerce')
+
+def _task_row(task, item_id, entity_type, entity, owner, section, name_key, start_key, end_key):
+    """Return the task table row of one task"""
+    return (
+        item_id,
+        task.get(name_key, 'Unknown'),
+        entity_type,
+        entity.get('name', 'Unknown'),
+        entity.get('id', 'Unknown'),
+        owner,
+        section,
+        task.get('lane', ''),
+        task.get(start_key, ''),
+        task.get(end_key, ''),
+        task.get('status', 'Unknown'),
+        task.get('float', False),
+        task.get('floatDate', ''),
+        task.get('fundingType', task.get('funding', '')),
+        task.get('additionalDetails', ''),
+    )
+
+def build_task_table(data):
+    """Collect every scheduled task of the roadmap into one DataFrame (one row per task, in data order)"""
+    rows = []
+
+    # Program roadmap tasks
+    for program in data.get('programs', []):
+        roadmap = program.get('roadmap')
+        if isinstance(roadmap, dict):
+            for task in roadmap.get('tasks', []):
+                if isinstance(task, dict):
+                    item_id = f"P{program['id']}_T{task.get('task', 'Unknown')}"
+                    rows.append(_task_row(task, item_id, 'Program', program, 'program', 'roadmap', 'task', 'start', 'end'))
+
+    # Product roadmap tasks and the product task lists
+    for product in data.get('products', []):
+        for section, entity_type, id_prefix, name_key, start_key, end_key in PRODUCT_SECTIONS:
+            items = product.get(section)
+            if not isinstance(items, list):
+                continue
+            for item in items:
+                if isinstance(item, dict):
+                    item_id = f"P{product['id']}{id_prefix}{item.get(name_key, 'Unknown')}"
+                    rows.append(_task_row(item, item_id, entity_type, product, 'product', section, name_key, start_key, end_key))
+
+    # Material system roadmap tasks
+    for material in data.get('materialSystems', []):
+        roadmap = material.get('roadmap')
+        if isinstance(roadmap, list):
+            for task in roadmap:
+                if isinstance(task, dict):
+                    item_id = f"M{material['id']}_T{task.get('task', 'Unknown')}"
+                    rows.append(_task_row(task, item_id, 'Material', material, 'material', 'roadmap', 'task', 'startDate', 'endDate'))
+
+    table = pd.DataFrame.from_records(rows, columns=TASK_COLUMNS)
+
+    # Parsed dates and numeric status codes
+    table['start_date'] = parse_dates(table['start'])
+    table['end_date'] = parse_dates(table['end'])
+    table['float_date'] = parse_dates(table['float_date_text'])
+    status_codes = {status: code for code, status in enumerate(STATUS_ORDER)}
+    table['status_code'] = np.fromiter((status_codes.get(s, -1) for s in table['status']), dtype=np.int8, count=len(table))
+    return table
+
+def build_milestone_table(data):
+    """Collect the program, product and material milestones into one DataFrame with parsed dates"""
+    rows = []
+    owners = (('programs', 'Program', 'P'), ('products', 'Product', 'P'), ('materialSystems', 'Material', 'M'))
+    for collection, entity_type, id_prefix in owners:
+        for entity in data.get(collection, []):
+            for milestone in entity.get('milestones', []):
+                rows.append((
+                    f"{id_prefix}{entity['id']}_M{milestone.get('name', 'Unknown')}",
+                    milestone.get('name', 'Unknown'),
+                    entity_type,
+                    entity.get('name', 'Unknown'),
+                    entity.get('id', 'Unknown'),
+                    milestone.get('date', ''),
+                    milestone.get('description', ''),
+                ))
+
+    table = pd.DataFrame.from_records(
+        rows, columns=('id', 'name', 'entity_type', 'entity_name', 'entity_id', 'date', 'description'))
+    table['date_value'] = parse_dates(table['date'])
+    return table
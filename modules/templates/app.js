@@ -0,0 +1,412 @@
+// Roadmap viewer: decodes the data bundle once and renders each page from it on hash change.
+// Routes: #/, #/list/<collection>, #/product/<id>, #/material/<id>, #/program/<id>,
+// #/supplier/<id> and #/funding/<id>.
+"use strict";
+
+const app = document.getElementById("app");
+let B = null;
+const byId = {};
+
+const COLLECTIONS = [
+    ["programs", "Programs", "program"],
+    ["products", "Products", "product"],
+    ["materialSystems", "Material Systems", "material"],
+    ["printingSuppliers", "Printing Suppliers", "supplier"],
+    ["postProcessingSuppliers", "Post-Processing Suppliers", "supplier"],
+    ["fundingOpportunities", "Funding Opportunities", "funding"],
+];
+const DAY_MS = 86400000;
+
+// Loading
+
+async function loadBundle() {
+    const encoded = window[BUNDLE_GLOBAL];
+    if (!encoded) throw new Error("The data bundle script did not load.");
+    const bytes = Uint8Array.from(atob(encoded), c => c.charCodeAt(0));
+    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+    const bundle = JSON.parse(await new Response(stream).text());
+    if (bundle.format !== BUNDLE_FORMAT) throw new Error(`Unsupported bundle format ${bundle.format}.`);
+    return bundle;
+}
+
+function indexEntities() {
+    for (const [name] of COLLECTIONS) {
+        byId[name] = new Map();
+        for (const entity of B.entities[name] || []) byId[name].set(entity.id, entity);
+    }
+}
+
+// HTML helpers; every roadmap value goes through esc()
+
+function esc(value) {
+    return String(value ?? "").replace(/[&<>"']/g, c => `&#${c.charCodeAt(0)};`);
+}
+
+function href(kind, id) {
+    return `#/${kind}/${encodeURIComponent(id)}`;
+}
+
+function link(kind, id, text) {
+    return `<a href="${href(kind, id)}">${esc(text ?? id)}</a>`;
+}
+
+function entityLink(kind, collection, id) {
+    const entity = byId[collection].get(id);
+    return entity ? link(kind, id, `${entity.name} (${id})`) : esc(id);
+}
+
+function supplierLink(id) {
+    return byId.printingSuppliers.has(id) ? entityLink("supplier", "printingSuppliers", id)
+                                          : entityLink("supplier", "postProcessingSuppliers", id);
+}
+
+function entryId(entry, key) {
+    return typeof entry === "string" ? entry : (entry && typeof entry === "object" ? entry[key] : null);
+}
+
+function badge(status) {
+    const cls = B.meta.statusClasses[String(status).toLowerCase()] || "status-planned";
+    return `<span class="status-badge ${cls}">${esc(status)}</span>`;
+}
+
+function header(title, links) {
+    const nav = [["#/", "Home"], ...links].map(([url, text]) => `<a href="${url}" class="nav-link">${esc(text)}</a>`);
+    return `<div class="header header-bar"><h1>${esc(title)}</h1><div class="nav-links">${nav.join("")}</div></div>`;
+}
+
+function card(title, body) {
+    return `<div class="summary-card"><h2>${esc(title)}</h2>${body}</div>`;
+}
+
+function table(head, rows) {
+    const th = head.map(h => `<th>${esc(h)}</th>`).join("");
+    return `<table><thead><tr>${th}</tr></thead><tbody>${rows.map(r => `<tr>${r.map(c => `<td>${c}</td>`).join("")}</tr>`).join("\n")}</tbody></table>`;
+}
+
+function isScalar(value) {
+    return value === null || typeof value !== "object";
+}
+
+function scalarText(value) {
+    if (isScalar(value)) return esc(value);
+    if (Array.isArray(value) && value.every(isScalar)) return esc(value.join(", "));
+    return esc(JSON.stringify(value));
+}
+
+// Key/value table of an entity's plain fields, then one table per list of records
+function fieldsSection(entity, skip) {
+    const rows = [];
+    const lists = [];
+    for (const [key, value] of Object.entries(entity)) {
+        if (skip.includes(key)) continue;
+        if (Array.isArray(value) && value.length && value.every(v => v && typeof v === "object" && !Array.isArray(v))) {
+            lists.push([key, value]);
+        } else {
+            rows.push([`<strong>${esc(key)}</strong>`, scalarText(value)]);
+        }
+    }
+    let html = rows.length ? card("Details", table(["Field", "Value"], rows)) : "";
+    for (const [key, items] of lists) html += card(key, recordsTable(items));
+    return html;
+}
+
+function recordsTable(items) {
+    const keys = [];
+    for (const item of items) for (const key of Object.keys(item)) if (!keys.includes(key)) keys.push(key);
+    return table(keys, items.map(item => keys.map(key => scalarText(item[key]))));
+}
+
+// Charts
+
+function day(value) {
+    return value ? Date.parse(value + "T00:00:00Z") : NaN;
+}
+
+function formatDay(time) {
+    return new Date(time).toISOString().slice(0, 10);
+}
+
+// Gantt chart of [start, end, label, group, lane, status] rows as SVG; rows without dates keep their slot
+function gantt(rows, colors, options = {}) {
+    const markers = options.markers || [];
+    const times = [];
+    for (const [start, end] of rows) if (start && end) times.push(day(start), day(end));
+    for (const [date] of markers) times.push(day(date));
+    if (options.today) times.push(Date.now());
+    if (!times.length) return "<p>No dated tasks.</p>";
+
+    // Rows, lane by lane when lanes are given
+    const ordered = [];
+    if (options.lanes) {
+        for (const lane of options.lanes) {
+            const laneRows = rows.filter(r => (r[4] || "Other") === lane);
+            if (!laneRows.length) continue;
+            ordered.push({lane});
+            for (const r of laneRows) ordered.push({row: r});
+        }
+    } else {
+        for (const r of rows) ordered.push({row: r});
+    }
+
+    const rowHeight = 22, labelWidth = 300, width = 1150, top = 30;
+    const height = top + ordered.length * rowHeight + 10;
+    const min = Math.min(...times) - 30 * DAY_MS, max = Math.max(...times) + 30 * DAY_MS;
+    const x = t => labelWidth + (t - min) / (max - min) * (width - labelWidth - 10);
+    const parts = [];
+
+    // Year gridlines
+    for (let year = new Date(min).getUTCFullYear() + 1; year <= new Date(max).getUTCFullYear(); year++) {
+        const px = x(Date.UTC(year, 0, 1));
+        parts.push(`<line x1="${px}" x2="${px}" y1="${top - 5}" y2="${height}" stroke="#ddd"/>`,
+                   `<text x="${px}" y="${top - 10}" text-anchor="middle" fill="#555">${year}</text>`);
+    }
+
+    // Lane headers and task bars
+    const used = new Map();
+    ordered.forEach((item, i) => {
+        const y = top + i * rowHeight;
+        if (item.lane) {
+            parts.push(`<rect x="0" y="${y}" width="${width}" height="${rowHeight}" fill="#ecf0f1"/>`,
+                       `<text x="5" y="${y + 15}" font-weight="bold">${esc(item.lane)}</text>`);
+            return;
+        }
+        const [start, end, label, group, , status] = item.row;
+        parts.push(`<text x="${labelWidth - 6}" y="${y + 15}" text-anchor="end">${esc(String(label).slice(0, 48))}</text>`);
+        if (!start || !end) return;
+        const color = colors[group] || options.defaultColor || "#95a5a6";
+        used.set(group, color);
+        const x0 = x(day(start)), x1 = Math.max(x(day(end)), x0 + 2);
+        const tip = `${label}\n${start} to ${end}` + (status && status !== group ? `\nStatus: ${status}` : "") + (group ? `\n${group}` : "");
+        parts.push(`<rect x="${x0}" y="${y + 3}" width="${x1 - x0}" height="${rowHeight - 6}" rx="3" fill="${esc(color)}"><title>${esc(tip)}</title></rect>`);
+    });
+
+    // Need dates, milestones and today
+    for (const [date, label, color] of markers) {
+        const px = x(day(date));
+        parts.push(`<line x1="${px}" x2="${px}" y1="${top}" y2="${height}" stroke="${color}" stroke-width="2"><title>${esc(date + "\n" + label)}</title></line>`);
+    }
+    if (options.today) {
+        const px = x(Date.now());
+        parts.push(`<line x1="${px}" x2="${px}" y1="${top}" y2="${height}" stroke="#3498db" stroke-width="2" stroke-dasharray="6 4"><title>Today ${formatDay(Date.now())}</title></line>`);
+    }
+
+    const legend = [...used].map(([group, color]) =>
+        `<span class="legend-item"><span class="color-box" style="background-color:${esc(color)}"></span>${esc(group ?? "None")}</span>`).join("");
+    return `<div class="funding-legend">${legend}</div><div class="app-gantt"><svg width="${width}" height="${height}">${parts.join("")}</svg></div>`;
+}
+
+function barChart(labels, values) {
+    const width = 600, height = 260, bottom = 30, top = 25;
+    const max = Math.max(...values, 1), step = (width - 20) / labels.length;
+    const bars = labels.map((label, i) => {
+        const h = values[i] / max * (height - bottom - top), px = 10 + i * step;
+        return `<rect x="${px + step * 0.15}" y="${height - bottom - h}" width="${step * 0.7}" height="${h}" fill="#1f77b4"/>` +
+               `<text x="${px + step / 2}" y="${height - bottom - h - 5}" text-anchor="middle">$${esc(values[i].toLocaleString())}</text>` +
+               `<text x="${px + step / 2}" y="${height - 10}" text-anchor="middle">${esc(label)}</text>`;
+    });
+    return `<div class="app-gantt"><svg width="${width}" height="${height}">${bars.join("")}</svg></div>`;
+}
+
+// Pages
+
+function homePage() {
+    const stats = COLLECTIONS.map(([name, title]) =>
+        `<div class="metric-item"><div class="metric-value">${(B.entities[name] || []).length}</div><div class="metric-label"><a href="#/list/${name}">${esc(title)}</a></div></div>`);
+    const pursuits = (B.entities.fundingOpportunities || []).reduce((n, f) => n + (f.pursuits || []).length, 0);
+    stats.push(`<div class="metric-item"><div class="metric-value">${pursuits}</div><div class="metric-label">Pursuits</div></div>`);
+    return header("Additive Manufacturing Roadmap", COLLECTIONS.map(([name, title]) => [`#/list/${name}`, title])) +
+           card("Overview", `<div class="metrics-grid">${stats.join("")}</div><p>Data generated ${esc(B.generated)}.</p>`);
+}
+
+function listPage(name) {
+    const collection = COLLECTIONS.find(c => c[0] === name);
+    if (!collection) return notFound();
+    const [, title, kind] = collection;
+    const rows = (B.entities[name] || []).map(e =>
+        `<tr data-search="${esc(`${e.id} ${e.name || e.announcementName || ""}`.toLowerCase())}"><td>${link(kind, e.id)}</td><td>${esc(e.name || e.announcementName || "")}</td></tr>`);
+    return header(title, []) +
+           card(`${rows.length} ${title}`, `<input class="app-filter" placeholder="Filter by ID or name" oninput="filterRows(this)">` +
+                `<table><thead><tr><th>ID</th><th>Name</th></tr></thead><tbody>${rows.join("\n")}</tbody></table>`);
+}
+
+function filterRows(input) {
+    const needle = input.value.toLowerCase();
+    for (const row of input.parentNode.querySelectorAll("tbody tr")) {
+        row.style.display = row.dataset.search.includes(needle) ? "" : "none";
+    }
+}
+
+function productPage(id) {
+    const product = byId.products.get(id);
+    if (!product) return notFound();
+    const materials = (B.indexes.productMaterials[id] || []).map(m => byId.materialSystems.get(m));
+    const programs = B.indexes.productPrograms[id] || [];
+    const tasks = B.series.productGantt[id] || [];
+
+    const metrics = [["TRL", product.trl ?? "N/A"], ["Material Systems", materials.length],
+                     ["Associated Programs", programs.length], ["Tasks", tasks.length]]
+        .map(([label, value]) => `<div class="metric-item"><div class="metric-value">${esc(value)}</div><div class="metric-label">${label}</div></div>`);
+
+    // Requirements and business case drivers
+    const requirements = Object.entries(product.requirements || {}).map(([k, v]) => [esc(k), scalarText(v)]);
+    const businessCase = product.businessCase || {};
+    const drivers = B.meta.businessCaseGroups
+        .map(([heading, keys]) => [heading, keys.filter(k => businessCase[k] === true)])
+        .filter(([, items]) => items.length)
+        .map(([heading, items]) => `<h3>${esc(heading)}</h3><ul>${items.map(i => `<li>${esc(i)}</li>`).join("")}</ul>`);
+
+    // One table per program using the product
+    const programTables = programs.map(([programId, programName, rows]) =>
+        `<div class="program-card"><h4>${link("program", programId, `${programName} (${programId})`)}</h4>` +
+        table(["Material System", "Part Name", "Part Number", "Need Date", "Adoption Status"],
+              rows.map(([mId, mName, part, pn, need, status]) => [link("material", mId, `${mName} (${mId})`), esc(part), esc(pn), esc(need), badge(status)])) +
+        "</div>");
+
+    // Swimlane contents
+    const statusList = items => (items || []).filter(i => i && typeof i === "object")
+        .map(i => `<li>${esc(i.name || "Unknown")} ${badge(i.status || "Planned")}</li>`).join("");
+    const mpTasks = (product.roadmap || []).filter(t => (t.lane || "Other") === "M&P");
+    const materialLane = materials.map(m => {
+        const fields = B.meta.materialFields.map(([label, key]) => `<li>${esc(label)}: ${esc(m[key] ?? "N/A")}</li>`).join("");
+        const own = (m.roadmap || []).filter(t => (t.lane || "M&P") === "M&P");
+        const items = [...mpTasks, ...own].map(t => `<li>${esc(t.task || "Unknown")} ${badge(t.status || "Planned")}</li>`).join("");
+        return `<h4>${link("material", m.id, `${m.name} (${m.id})`)}</h4><ul>${fields}</ul>${items ? `<ul>${items}</ul>` : ""}`;
+    }).join("");
+    const manufacturing = materials.map(m => {
+        const machines = (m.qualifiedMachines || []).filter(i => i && typeof i === "object")
+            .map(i => `<li>${esc(i.machine || "Unknown Machine")}: ${[].concat(i.Supplier || []).map(supplierLink).join(", ")}</li>`);
+        return machines.length ? `<h4>${esc(m.name)}</h4><ul>${machines.join("")}</ul>` : "";
+    }).join("");
+    const postProcessing = (product.postProcessingSuppliers || []).filter(i => i && typeof i === "object")
+        .map(i => `<li>${esc(i.process || "Unknown Process")}: ${[].concat(i.supplier || []).map(supplierLink).join(", ")}</li>`).join("");
+    const lanes = [
+        ["Design", `<h4>Design Tools</h4><ul>${statusList(product.designTools)}</ul><h4>Documentation</h4><ul>${statusList(product.documentation)}</ul>`],
+        ["Manufacturing", manufacturing + (postProcessing ? `<h4>Post-Processing</h4><ul>${postProcessing}</ul>` : "")],
+        ["M&P", materialLane],
+        ["Quality", `<h4>Special NDT</h4><ul>${statusList(product.specialNDT)}</ul><h4>Part Acceptance</h4><ul>${statusList(product.partAcceptance)}</ul>`],
+    ].map(([lane, body]) => `<div class="quad-item"><h3>${lane}</h3>${body || "<p>None listed.</p>"}</div>`).join("");
+
+    const needDates = (B.series.productNeedDates[id] || []).map(([date, label]) => [date, label, "#e74c3c"]);
+    return header(`Product: ${product.name} (${id})`, [["#/list/products", "All Products"]]) +
+           `<div class="metrics-grid">${metrics.join("")}</div>` +
+           `<div class="flex-container"><div class="flex-item">${card("Requirements", requirements.length ? table(["Requirement", "Value"], requirements) : "<p>No requirements listed.</p>")}</div>` +
+           `<div class="flex-item">${card("Business Case", drivers.join("") || "<p>No business case drivers set.</p>")}</div></div>` +
+           card("Programs", programTables.join("") || "<p>No associated programs.</p>") +
+           card("Product Roadmap", gantt(tasks, B.meta.fundingColors, {lanes: B.meta.productLanes, markers: needDates, today: true, defaultColor: "#999999"})) +
+           `<div class="quad-container">${lanes}</div>`;
+}
+
+function materialPage(id) {
+    const material = byId.materialSystems.get(id);
+    if (!material) return notFound();
+    const products = (B.indexes.materialProducts[id] || []).map(p => entityLink("product", "products", p));
+    const suppliers = (B.indexes.materialSuppliers[id] || []).map(s => entityLink("supplier", "printingSuppliers", s));
+    const milestones = (B.series.materialMilestones[id] || []).map(([date, label]) => [date, label, "red"]);
+    return header(`Material System: ${material.name} (${id})`, [["#/list/materialSystems", "All Materials"]]) +
+           card("Roadmap", gantt(B.series.materialGantt[id] || [], B.meta.statusColors, {markers: milestones})) +
+           `<div class="flex-container"><div class="flex-item">${card("Products", products.length ? `<ul><li>${products.join("</li><li>")}</li></ul>` : "<p>No products use this material system.</p>")}</div>` +
+           `<div class="flex-item">${card("Printing Suppliers", suppliers.length ? `<ul><li>${suppliers.join("</li><li>")}</li></ul>` : "<p>No suppliers offer this material system.</p>")}</div></div>` +
+           fieldsSection(material, ["roadmap", "milestones"]);
+}
+
+function programPage(id) {
+    const program = byId.programs.get(id);
+    if (!program) return notFound();
+    const combos = (program.productMaterialCombinations || []).map(c =>
+        [entityLink("product", "products", c.productID), entityLink("material", "materialSystems", c.materialID),
+         esc(c.partName ?? "N/A"), esc(c.partNumber ?? "N/A"), esc(c.needDate ?? "N/A"), badge(c.adoptionStatus ?? "N/A")]);
+    const needDates = (program.productMaterialCombinations || []).filter(c => c.needDate && !isNaN(day(c.needDate)))
+        .map(c => [c.needDate, `${c.productID} (${c.materialID}) ${c.partName || ""}`, "#e74c3c"]);
+    return header(`Program: ${program.name} (${id})`, [["#/list/programs", "All Programs"]]) +
+           card("Need Dates", gantt([], {}, {markers: needDates, today: true})) +
+           card("Products and Material Systems", combos.length ? table(["Product", "Material System", "Part Name", "Part Number", "Need Date", "Adoption Status"], combos) : "<p>No product/material combinations.</p>") +
+           fieldsSection(program, ["productMaterialCombinations", "roadmap"]);
+}
+
+function supplierPage(id) {
+    const printing = byId.printingSuppliers.get(id);
+    const supplier = printing || byId.postProcessingSuppliers.get(id);
+    if (!supplier) return notFound();
+    let html = header(`${printing ? "Printing" : "Post-Processing"} Supplier: ${supplier.name} (${id})`,
+                      [[`#/list/${printing ? "printingSuppliers" : "postProcessingSuppliers"}`, "All Suppliers"]]);
+    if (printing) {
+        const materials = (printing.materialSystems || []).map(m => entityLink("material", "materialSystems", entryId(m, "materialID")));
+        html += card("Material Systems", materials.length ? `<ul><li>${materials.join("</li><li>")}</li></ul>` : "<p>None listed.</p>");
+        if (B.series.supplierGantt[id]) html += card("Supplier Roadmap", gantt(B.series.supplierGantt[id], B.meta.supplierStatusColors));
+    } else {
+        const products = (B.indexes.postProcessingSupplierProducts[id] || []).map(p => entityLink("product", "products", p));
+        html += card("Products", products.length ? `<ul><li>${products.join("</li><li>")}</li></ul>` : "<p>No products use this supplier.</p>");
+    }
+    return html + fieldsSection(supplier, ["materialSystems", "supplierRoadmap"]);
+}
+
+function fundingPage(id) {
+    const funding = byId.fundingOpportunities.get(id);
+    if (!funding) return notFound();
+    const name = funding.name || funding.announcementName || "Unknown";
+    const details = (B.indexes.fundingDetails[id] || []).map(([label, value]) => [`<strong>${esc(label)}:</strong>`, esc(value)]);
+    if (funding.status) {
+        const cls = B.meta.fundingStatusClasses[funding.status] || "funding-status-other";
+        details.push(["<strong>Status:</strong>", `<span class="status-pill ${cls}">${esc(funding.status)}</span>`]);
+    }
+    if (funding.periodOfPerformance) details.push(["<strong>Period of Performance:</strong>", esc(funding.periodOfPerformance)]);
+
+    // Funded tasks, linked to their owners
+    const ownerCollections = {program: "programs", product: "products", supplier: "printingSuppliers"};
+    const tasks = (B.indexes.fundingTasks[id] || []).map(([type, ownerId, owner, task, start, end, status]) =>
+        [esc(task), esc(`${type[0].toUpperCase()}${type.slice(1)} Task`), byId[ownerCollections[type]].has(ownerId) ? link(type, ownerId, owner) : esc(owner),
+         esc(start), esc(end), `<span class="status-pill ${B.meta.taskStatusClasses[status] || "task-status-other"}">${esc(status)}</span>`]);
+
+    // Pursuits
+    const pursuits = (funding.pursuits || []).map(pursuit => {
+        const pid = pursuit.pursuitID;
+        const rows = B.meta.pursuitFields.filter(([key]) => pursuit[key]).map(([key, label]) => [`<strong>${esc(label)}:</strong>`, scalarText(pursuit[key])]);
+        const related = B.indexes.pursuitProducts[id][pid];
+        const [years, values] = B.series.pursuitValues[id][pid];
+        return `<div class="pursuit-box"><h3>Pursuit: ${esc(pursuit.pursuitName || "Unnamed Pursuit")} (${esc(pid)})</h3>` +
+               `<table class="details-table">${rows.map(r => `<tr><td class="field">${r[0]}</td><td>${r[1]}</td></tr>`).join("")}</table>` +
+               (related ? `<div class="subsection"><h4>Related Products and Materials</h4>${table(["Product", "Material System"],
+                   related.map(([productId, productName, materialId, materialName]) => [link("product", productId, `${productName} (${productId})`), link("material", materialId, `${materialName} (${materialId})`)]))}</div>` : "") +
+               (years.length ? `<div class="subsection"><h4>Potential Value by Fiscal Year</h4>${barChart(years, values)}</div>` : "") +
+               "</div>";
+    });
+
+    const timeline = B.series.fundingTimeline[id];
+    return header(`Funding Opportunity: ${name}`, [["#/list/fundingOpportunities", "All Funding"]]) +
+           card("Details", `<table class="details-table">${details.map(r => `<tr><td class="field">${r[0]}</td><td>${r[1]}</td></tr>`).join("")}</table>`) +
+           (funding.description ? card("Description", `<p>${esc(funding.description)}</p>`) : "") +
+           (timeline ? card("Funding Timeline", gantt([[timeline[0], timeline[1], name, null, null, null]], {}, {defaultColor: "#1f77b4"})) : "") +
+           pursuits.join("") +
+           card("Related Tasks", tasks.length ? table(["Task", "Type", "Owner", "Start", "End", "Status"], tasks) : "<p>No tasks use this funding opportunity.</p>");
+}
+
+function notFound() {
+    return header("Not Found", []) + `<p class="app-message">No such page in this roadmap.</p>`;
+}
+
+// Routing
+
+const PAGES = {
+    list: listPage,
+    product: productPage,
+    material: materialPage,
+    program: programPage,
+    supplier: supplierPage,
+    funding: fundingPage,
+};
+
+function route() {
+    const [kind, id] = location.hash.replace(/^#\/?/, "").split("/").map(decodeURIComponent);
+    const page = kind ? PAGES[kind] : homePage;
+    app.innerHTML = page ? page(id) : notFound();
+    window.scrollTo(0, 0);
+}
+
+loadBundle().then(bundle => {
+    B = bundle;
+    indexEntities();
+    window.addEventListener("hashchange", route);
+    route();
+}).catch(error => {
+    app.innerHTML = `<p class="app-message">Could not load the roadmap data: ${esc(error.message)}</p>`;
+});
@@ -4,6 +4,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 from datetime import datetime, timedelta
 import re
+import time
+from roadmap_manager.utils import save_json_data
 # Removing tkcalendar dependency
 # from tkcalendar import DateEntry  # You'll need to install this: pip install tkcalendar
 
@@ -181,13 +183,13 @@ class RoadmapManager:
         self.status_var.set("Data reloaded successfully")
 
     def save_data(self):
-        try:
-            with open(self.data_file, 'w') as f:
-                json.dump(self.data, f, indent=2)
-            self.status_var.set(f"Data saved to {self.data_file}")
+        started = time.perf_counter()
+        success, error = save_json_data(self.data_file, self.data, indent=2)
+        if success:
+            self.status_var.set(f"Data saved to {self.data_file} in {time.perf_counter() - started:.2f}s")
             messagebox.showinfo("Success", "Data saved successfully")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save data: {str(e)}")
+        else:
+            messagebox.showerror("Error", f"Failed to save data: {error}")
 
     def create_programs_tab(self):
         programs_frame = ttk.Frame(self.notebook)
@@ -0,0 +1,154 @@
+import json
+import os
+import tempfile
+from datetime import datetime
+
+# Number of journaled changes after which the manager compacts them into roadmap.json
+COMPACT_AFTER_ENTRIES = 50
+
+# Top-level key of the roadmap data holding the sequence number of the last journal entry it contains
+SEQUENCE_KEY = "journalSequence"
+
+class RoadmapJournal:
+    """Append-only change log (JSON Lines) kept next to the roadmap data file.
+
+    Each form save appends one entity-level patch instead of rewriting the whole
+    roadmap. Patches are replayed on top of the data file when it is loaded, and
+    dropped once a full save has written them into the data file. Every entry
+    carries a sequence number and a full save stores the last one under
+    SEQUENCE_KEY, so replay skips the entries the data file already contains
+    and a crash between a save and the journal compaction loses nothing.
+    """
+
+    def __init__(self, data_file):
+        self.path = os.path.abspath(data_file) + ".journal"
+        self.entries = 0
+        self.sequence = 0
+
+    def size(self):
+        """Return the journal size in bytes, used as the offset of the next entry"""
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
+
+    def _append(self, entry):
+        """Append one entry and force it to disk"""
+        entry["seq"] = self.sequence + 1
+        entry["time"] = datetime.now().isoformat(timespec="seconds")
+        line = json.dumps(entry, separators=(',', ':')) + "\n"
+        with open(self.path, 'ab') as f:
+            f.write(line.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        self.sequence = entry["seq"]
+        self.entries += 1
+
+    def record_upsert(self, collection, entity, previous_id=None):
+        """Journal an added or updated entity; previous_id is its ID before an edit renamed it"""
+        entry = {"op": "upsert", "collection": collection, "id": entity.get("id"), "entity": entity}
+        if previous_id is not None and previous_id != entity.get("id"):
+            entry["replaces"] = previous_id
+        self._append(entry)
+
+    def record_delete(self, collection, entity_id):
+        """Journal a deleted entity"""
+        self._append({"op": "delete", "collection": collection, "id": entity_id})
+
+    def mark_saved(self, data):
+        """Record in data, about to be saved in full, that it contains every entry journaled so far"""
+        data[SEQUENCE_KEY] = self.sequence
+
+    def replay(self, data):
+        """Apply the journaled changes that data does not contain yet, in place, and return how many were applied"""
+        saved = data.get(SEQUENCE_KEY, 0)
+        self.sequence = saved
+        try:
+            with open(self.path, 'rb') as f:
+                lines = f.readlines()
+        except OSError:
+            self.entries = 0
+            return 0
+
+        applied = 0
+        entries = 0
+        valid_bytes = 0
+        for line in lines:
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("incomplete entry")
+                entry = json.loads(line)
+            except ValueError:
+                # A crash while appending leaves a partial last line; drop it so new
+                # entries are not appended onto it
+                with open(self.path, 'r+b') as f:
+                    f.truncate(valid_bytes)
+                break
+            valid_bytes += len(line)
+            entries += 1
+            # Entries without a sequence number predate it and are always applied
+            seq = entry.get("seq")
+            if seq is not None:
+                self.sequence = max(self.sequence, seq)
+                if seq <= saved:
+                    continue
+            _apply_entry(data, entry)
+            applied += 1
+
+        self.entries = entries
+        return applied
+
+    def discard_before(self, offset):
+        """Drop the entries written before offset, which a full save has already persisted"""
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                remaining = f.read()
+        except OSError:
+            return
+
+        if not remaining:
+            os.remove(self.path)
+            self.entries = 0
+            return
+
+        # Keep the entries written while the save was running
+        directory = os.path.dirname(self.path)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.path) + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(remaining)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self.entries = remaining.count(b"\n")
+
+def _find_entity(entities, entity_id):
+    """Return the index of the first entity with the given ID, or None"""
+    for i, entity in enumerate(entities):
+        if isinstance(entity, dict) and entity.get("id") == entity_id:
+            return i
+    return None
+
+def _apply_entry(data, entry):
+    """Apply one journal entry to the roadmap data"""
+    entities = data.setdefault(entry["collection"], [])
+    if entry["op"] == "upsert":
+        index = None
+        if "replaces" in entry:
+            index = _find_entity(entities, entry["replaces"])
+        if index is None:
+            # Also matches a renamed entity whose rename is already in the data file
+            index = _find_entity(entities, entry["id"])
+        if index is None:
+            entities.append(entry["entity"])
+        else:
+            entities[index] = entry["entity"]
+    elif entry["op"] == "delete":
+        index = _find_entity(entities, entry["id"])
+        if index is not None:
+            del entities[index]
@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import os
 import sys
+import time
 
 # Add the parent directory to the path so we can import our modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -11,10 +12,11 @@ from roadmap_manager.models.material import MaterialModel
 from roadmap_manager.models.supplier import SupplierModel
 from roadmap_manager.models.funding import FundingModel
 from roadmap_manager.models.product import ProductModel
-from roadmap_manager.utils import load_json_data, save_json_data
+from roadmap_manager.utils import load_json_data, save_json_data_async
+from roadmap_manager.journal import RoadmapJournal, COMPACT_AFTER_ENTRIES
 
 class RoadmapManager:
-    def __init__(self, root):
+    def __init__(self, root, data_file=None):
         self.root = root
         self.root.title("Roadmap Manager")
         self.root.geometry("1200x800")
@@ -24,9 +26,18 @@ class RoadmapManager:
         self.status_var = tk.StringVar()
         self.status_var.set("Ready")
         
+        # Save options and the save currently running in the background
+        self.compact_save_var = tk.BooleanVar(value=False)
+        self.pending_save = None
+        
+        # Bumped on every edit so the tabs' cached row values are recomputed
+        self.data_version = 0
+        
         # Load data - use absolute path to ensure file can be found
+        # (a .db path uses the SQLite backend instead of roadmap.json)
         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        self.data_file = os.path.join(base_dir, "roadmap.json")
+        self.data_file = os.path.abspath(data_file) if data_file else os.path.join(base_dir, "roadmap.json")
+        self.journal = RoadmapJournal(self.data_file)
         self.load_data()
         
         # Initialize models
@@ -57,6 +68,10 @@ class RoadmapManager:
         self.reload_button = ttk.Button(self.bottom_frame, text="Reload Data", command=self.reload_data)
         self.reload_button.pack(side=tk.RIGHT, padx=5)
         
+        self.compact_check = ttk.Checkbutton(self.bottom_frame, text="Compact JSON (faster save)",
+                                             variable=self.compact_save_var)
+        self.compact_check.pack(side=tk.RIGHT, padx=5)
+        
         # Status bar
         self.status_bar = ttk.Label(root, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X)
@@ -66,9 +81,42 @@ class RoadmapManager:
         self.data, error = load_json_data(self.data_file)
         if error:
             messagebox.showerror("Error", error)
+            return
+        
+        # Apply the edits journaled since the last full save
+        try:
+            recovered = self.journal.replay(self.data)
+        except Exception as e:
+            messagebox.showerror("Error", f"Error replaying change journal: {str(e)}")
+            recovered = 0
+        if recovered:
+            self.status_var.set(f"Data loaded from {self.data_file} "
+                                f"with {recovered} journaled changes not yet saved")
         else:
             self.status_var.set(f"Data loaded from {self.data_file}")
 
+    def record_change(self, collection, entity, previous_id=None):
+        """Append an added or updated entity to the change journal"""
+        self._journal(self.journal.record_upsert, collection, entity, previous_id)
+
+    def record_delete(self, collection, entity_id):
+        """Append a deleted entity to the change journal"""
+        self._journal(self.journal.record_delete, collection, entity_id)
+
+    def _journal(self, record, *args):
+        """Write a journal entry and compact the journal into the data file once it grows"""
+        self.data_version += 1
+        try:
+            record(*args)
+        except Exception as e:
+            messagebox.showerror("Error", f"Error writing change journal: {str(e)}\n"
+                                 "Use Save Changes to keep your edits.")
+            return
+        
+        # Periodically fold the journal back into roadmap.json in the background
+        if self.journal.entries >= COMPACT_AFTER_ENTRIES and self.pending_save is None:
+            self.save_data(quiet=True)
+
     def reload_data(self):
         """Reload data and refresh all tabs"""
         self.load_data()
@@ -78,13 +126,46 @@ class RoadmapManager:
         self.create_tabs()
         self.status_var.set("Data reloaded successfully")
 
-    def save_data(self):
-        """Save data to the JSON file"""
-        success, error = save_json_data(self.data_file, self.data)
+    def save_data(self, quiet=False):
+        """Save data to the JSON file on a background thread so the UI stays responsive"""
+        started = time.perf_counter()
+        # Journal entries before this offset are included in the snapshot being saved
+        journal_offset = self.journal.size()
+        self.journal.mark_saved(self.data)
+        future = save_json_data_async(self.data_file, self.data, compact=self.compact_save_var.get())
+        blocked = time.perf_counter() - started
+        
+        # Only the latest save reports back; earlier ones are written first by the same worker
+        self.pending_save = future
+        self.status_var.set("Saving...")
+        self.root.after(50, self._check_save, future, started, blocked, journal_offset, quiet)
+
+    def _check_save(self, future, started, blocked, journal_offset=0, quiet=False):
+        """Poll a background save and report its result and latency once it finishes"""
+        if not future.done():
+            self.root.after(50, self._check_save, future, started, blocked, journal_offset, quiet)
+            return
+        success, error = future.result()
+        if future is not self.pending_save:
+            # A newer save supersedes this one; only surface its failure
+            if not success:
+                messagebox.showerror("Error", error)
+            return
+        self.pending_save = None
+        
+        elapsed = time.perf_counter() - started
         if success:
-            self.status_var.set(f"Data saved to {self.data_file}")
-            messagebox.showinfo("Success", "Data saved successfully")
+            # The saved file now contains the journaled changes up to the snapshot
+            try:
+                self.journal.discard_before(journal_offset)
+            except Exception as e:
+                messagebox.showerror("Error", f"Error compacting change journal: {str(e)}")
+            self.status_var.set(f"Data saved to {self.data_file} in {elapsed:.2f}s "
+                                f"(UI blocked {blocked * 1000:.0f} ms)")
+            if not quiet:
+                messagebox.showinfo("Success", "Data saved successfully")
         else:
+            self.status_var.set(f"Save failed after {elapsed:.2f}s")
             messagebox.showerror("Error", error)
 
     def create_tabs(self):
@@ -114,8 +195,9 @@ def main():
         # Set up the Tkinter root window
         root = tk.Tk()
         
-        # Create the application
-        app = RoadmapManager(root)
+        # Create the application, optionally for a data file given on the command line
+        data_file = sys.argv[1] if len(sys.argv) > 1 else None
+        app = RoadmapManager(root, data_file)
         
         # Start the main event loop
         root.mainloop()
@@ -1,5 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+from roadmap_manager.virtual_tree import VirtualTree
+from roadmap_manager.search_index import SearchIndex, SEARCH_DELAY_MS
 
 class BaseModel:
     """Base class for all models with common functionality"""
@@ -8,11 +10,59 @@ class BaseModel:
         self.manager = manager
         self.data = manager.data
         self.status_var = manager.status_var
+        self.search_indexes = {}
+        self._search_index_versions = {}
     
     def update_status(self, message):
         """Update the status bar message"""
         self.status_var.set(message)
     
+    def create_virtual_tree(self, tree, scrollbar, make_values):
+        """Wrap a treeview so only its visible rows are materialized; cached rows refresh after each edit"""
+        return VirtualTree(tree, scrollbar, make_values, version=lambda: self.manager.data_version)
+    
+    def create_search_index(self, collection, fields):
+        """Build the search index of a collection; fields maps field names to functions returning their text"""
+        self.search_indexes[collection] = SearchIndex(fields)
+        self.sync_search_index(collection)
+    
+    def sync_search_index(self, collection):
+        """Bring a collection's search index up to date with the data after edits"""
+        if self._search_index_versions.get(collection) != self.manager.data_version:
+            self.search_indexes[collection].sync(self.data.get(collection, []))
+            self._search_index_versions[collection] = self.manager.data_version
+    
+    def search_collection(self, collection, query):
+        """Return the entities of a collection matching a search query, in collection order"""
+        self.sync_search_index(collection)
+        return self.search_indexes[collection].search(query)
+    
+    def bind_incremental_search(self, entry, search):
+        """Run search shortly after the user stops typing in entry"""
+        pending = {}
+        
+        def run():
+            pending.pop("id", None)
+            search()
+        
+        def schedule(event):
+            if "id" in pending:
+                self.manager.root.after_cancel(pending["id"])
+            pending["id"] = self.manager.root.after(SEARCH_DELAY_MS, run)
+        
+        entry.bind("<KeyRelease>", schedule, add="+")
+    
+    def record_change(self, collection, entity, previous_id=None):
+        """Journal an added or updated entity so the edit is persisted without a full save"""
+        self.manager.record_change(collection, entity, previous_id)
+        # Entities edited in place keep their identity, so re-index them explicitly
+        if collection in self.search_indexes:
+            self.search_indexes[collection].update(entity)
+    
+    def record_delete(self, collection, entity_id):
+        """Journal a deleted entity so the deletion is persisted without a full save"""
+        self.manager.record_delete(collection, entity_id)
+    
     def show_error(self, title, message):
         """Show an error message dialog"""
         messagebox.showerror(title, message)
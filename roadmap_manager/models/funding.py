@@ -10,6 +10,7 @@ class FundingModel(BaseModel):
     def __init__(self, manager):
         super().__init__(manager)
         self.funding_opps_tree = None
+        self.funding_opps_view = None
     
     def create_funding_opps_tab(self, notebook):
         """Create the Funding Opportunities tab in the notebook"""
@@ -37,6 +38,7 @@ class FundingModel(BaseModel):
         
         # Bind the Enter key to the search function
         search_entry.bind("<Return>", lambda event: self.search_funding_opps())
+        self.bind_incremental_search(search_entry, self.search_funding_opps)
         
         # Create treeview
         columns = ("ID", "Announcement Name", "Pursuit Type", "Close Date", "Solicitation Number", "Customer")
@@ -51,9 +53,9 @@ class FundingModel(BaseModel):
         self.funding_opps_tree.column("Announcement Name", width=200)
         self.funding_opps_tree.column("Solicitation Number", width=150)
         
-        # Add a scrollbar
-        scrollbar = ttk.Scrollbar(funding_frame, orient=tk.VERTICAL, command=self.funding_opps_tree.yview)
-        self.funding_opps_tree.configure(yscroll=scrollbar.set)
+        # Add a scrollbar (driven by the virtual tree, which only materializes the visible rows)
+        scrollbar = ttk.Scrollbar(funding_frame, orient=tk.VERTICAL)
+        self.funding_opps_view = self.create_virtual_tree(self.funding_opps_tree, scrollbar, self.funding_opp_row_values)
         
         # Pack the treeview and scrollbar
         self.funding_opps_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -62,26 +64,32 @@ class FundingModel(BaseModel):
         # Bind double-click event
         self.funding_opps_tree.bind("<Double-1>", self.edit_funding_opp)
         
+        # Index the opportunities for the search box
+        self.create_search_index("fundingOpps", {
+            "id": lambda o: o.get("id", ""),
+            "name": lambda o: o.get("announcementName", ""),
+            "type": lambda o: o.get("pursuitType", ""),
+            "solicitation": lambda o: o.get("solicitationNumber", ""),
+            "customer": lambda o: o.get("customer", ""),
+        })
+        
         # Populate treeview
         self.populate_funding_opps_tree()
     
     def populate_funding_opps_tree(self):
         """Populate the funding opportunities treeview with data"""
-        # Clear existing items
-        for item in self.funding_opps_tree.get_children():
-            self.funding_opps_tree.delete(item)
-        
-        # Add opportunities to treeview
-        for opp in self.data["fundingOpps"]:
-            values = (
-                opp["id"],
-                opp.get("announcementName", ""),
-                opp.get("pursuitType", ""),
-                opp.get("closeDate", ""),
-                opp.get("solicitationNumber", ""),
-                opp.get("customer", "")
-            )
-            self.funding_opps_tree.insert("", tk.END, values=values)
+        self.funding_opps_view.set_entities(self.data["fundingOpps"])
+    
+    def funding_opp_row_values(self, opp):
+        """Return the treeview values of a funding opportunity"""
+        return (
+            opp["id"],
+            opp.get("announcementName", ""),
+            opp.get("pursuitType", ""),
+            opp.get("closeDate", ""),
+            opp.get("solicitationNumber", ""),
+            opp.get("customer", "")
+        )
     
     def add_funding_opp(self):
         """Open a window to add a new funding opportunity"""
@@ -142,40 +150,20 @@ class FundingModel(BaseModel):
         FundingForm(self, opp, is_new=False)
     
     def search_funding_opps(self):
-        """Search funding opportunities based on the search term"""
-        search_term = self.search_var.get().lower()
-        
-        # Clear existing items
-        for item in self.funding_opps_tree.get_children():
-            self.funding_opps_tree.delete(item)
+        """Search funding opportunities based on the search term (e.g. "sbir" or "customer:afrl")"""
+        search_term = self.search_var.get()
         
         # If search term is empty, show all opportunities
-        if not search_term:
+        if not search_term.strip():
             self.populate_funding_opps_tree()
             return
         
-        # Add matching opportunities to treeview
-        for opp in self.data["fundingOpps"]:
-            # Check if search term is in ID, name, or other fields
-            if (search_term in opp["id"].lower() or 
-                search_term in opp.get("announcementName", "").lower() or 
-                search_term in opp.get("pursuitType", "").lower() or
-                search_term in opp.get("solicitationNumber", "").lower() or
-                search_term in opp.get("customer", "").lower()):
-                
-                values = (
-                    opp["id"],
-                    opp.get("announcementName", ""),
-                    opp.get("pursuitType", ""),
-                    opp.get("closeDate", ""),
-                    opp.get("solicitationNumber", ""),
-                    opp.get("customer", "")
-                )
-                self.funding_opps_tree.insert("", tk.END, values=values)
+        # Show only the matching opportunities
+        matches = self.search_collection("fundingOpps", search_term)
+        self.funding_opps_view.set_entities(matches)
         
         # Update status
-        count = len(self.funding_opps_tree.get_children())
-        self.update_status(f"Found {count} matching funding opportunities")
+        self.update_status(f"Found {len(matches)} matching funding opportunities")
     
     def clear_search(self):
         """Clear the search field and show all opportunities"""
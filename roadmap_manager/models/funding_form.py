@@ -826,12 +826,14 @@ class FundingForm:
         # Save the opportunity
         if self.is_new:
             self.model.data["fundingOpps"].append(self.opportunity)
+            self.model.record_change("fundingOpps", self.opportunity)
             self.model.update_status(f"Added funding opportunity: {self.opportunity['announcementName']}")
         else:
             # Find and update the existing opportunity
             for i, opp in enumerate(self.model.data["fundingOpps"]):
                 if opp["id"] == self.opportunity["id"]:
                     self.model.data["fundingOpps"][i] = self.opportunity
+                    self.model.record_change("fundingOpps", self.opportunity)
                     break
             self.model.update_status(f"Updated funding opportunity: {self.opportunity['announcementName']}")
         
@@ -846,6 +848,7 @@ class FundingForm:
         if self.model.confirm_delete(self.opportunity['announcementName']):
             # Remove opportunity from data
             self.model.data["fundingOpps"].remove(self.opportunity)
+            self.model.record_delete("fundingOpps", self.opportunity["id"])
             
             # Refresh treeview
             self.model.populate_funding_opps_tree()
@@ -10,6 +10,9 @@ class MaterialModel(BaseModel):
     def __init__(self, manager):
         super().__init__(manager)
         self.materials_tree = None
+        self.materials_view = None
+        self._funding_id_to_name = {}
+        self._funding_names_version = None
     
     def create_materials_tab(self, notebook):
         """Create the Material Systems tab in the notebook"""
@@ -38,6 +41,7 @@ class MaterialModel(BaseModel):
         
         # Bind the Enter key to the search function
         search_entry.bind("<Return>", lambda event: self.search_materials())
+        self.bind_incremental_search(search_entry, self.search_materials)
         
         # Create treeview
         columns = ("ID", "Name", "Process", "Material", "MRL", "Qualification", "Post-Processing", "Qualified Machines", "Funding Opportunities")
@@ -64,9 +68,9 @@ class MaterialModel(BaseModel):
         self.materials_tree.column("Qualified Machines", width=200, minwidth=150)
         self.materials_tree.column("Funding Opportunities", width=200, minwidth=150)
         
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(materials_frame, orient=tk.VERTICAL, command=self.materials_tree.yview)
-        self.materials_tree.configure(yscroll=scrollbar.set)
+        # Add scrollbar (driven by the virtual tree, which only materializes the visible rows)
+        scrollbar = ttk.Scrollbar(materials_frame, orient=tk.VERTICAL)
+        self.materials_view = self.create_virtual_tree(self.materials_tree, scrollbar, self.material_row_values)
         
         # Pack treeview and scrollbar
         self.materials_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
@@ -75,105 +79,119 @@ class MaterialModel(BaseModel):
         # Bind double-click event
         self.materials_tree.bind("<Double-1>", lambda event: self.edit_material())
         
+        # Index the material systems for the search box
+        self.create_search_index(self.materials_key(), {
+            "id": lambda m: m.get("id", ""),
+            "name": lambda m: m.get("name", ""),
+            "process": lambda m: m.get("process", ""),
+            "material": lambda m: m.get("material", ""),
+            "mrl": lambda m: m.get("mrl", ""),
+            "qualification": lambda m: m.get("qualification", ""),
+        })
+        
         # Populate treeview
         self.populate_materials_tree()
     
+    def materials_key(self):
+        """Return the key holding the material systems (handle both "materials" and "materialSystems")"""
+        return "materials" if "materials" in self.data else "materialSystems"
+    
     def populate_materials_tree(self):
         """Populate the materials treeview with data"""
-        # Clear existing items
-        for item in self.materials_tree.get_children():
-            self.materials_tree.delete(item)
-        
         # Get the materials data (handle both "materials" and "materialSystems" keys)
         materials_data = self.data.get("materials", self.data.get("materialSystems", []))
-        
-        # Create a mapping of funding opportunity IDs to names
-        funding_id_to_name = {}
-        for opp in self.data.get("fundingOpps", []):
-            if "id" in opp and "announcementName" in opp:
-                funding_id_to_name[opp["id"]] = opp["announcementName"]
-        
-        # Add materials to the tree
-        for material in materials_data:
-            # Get process and material values
-            process = material.get("process", "")
-            material_name = material.get("material", "")
-            
-            # Get post-processing methods
-            post_processing = []
-            for pp in material.get("postProcessing", []):
-                if "name" in pp:
-                    post_processing.append(pp["name"])
-                elif "process" in pp:
-                    post_processing.append(pp["process"])
-            
-            # Get qualified machines
-            qualified_machines = []
-            for qm in material.get("qualifiedMachines", []):
-                if "machine" in qm:
-                    qualified_machines.append(qm["machine"])
-            
-            # Get funding opportunities (display names instead of IDs)
-            funding_opps = []
-            for opp_data in material.get("relatedFundingOpps", []):
-                if isinstance(opp_data, dict) and "opportunityID" in opp_data:
-                    opp_id = opp_data["opportunityID"]
-                    if opp_id in funding_id_to_name:
-                        # Add opportunity name and pursuit name if available
-                        opp_name = funding_id_to_name[opp_id]
-                        if "pursuitID" in opp_data:
-                            # Try to find the pursuit name
-                            pursuit_name = self.get_pursuit_name(opp_id, opp_data["pursuitID"])
-                            if pursuit_name:
-                                funding_opps.append(f"{opp_name} - {pursuit_name}")
-                            else:
-                                funding_opps.append(opp_name)
+        self.materials_view.set_entities(materials_data)
+    
+    def get_funding_id_to_name(self):
+        """Return a mapping of funding opportunity IDs to names, rebuilt after each edit"""
+        if self._funding_names_version != self.manager.data_version:
+            self._funding_id_to_name = {}
+            for opp in self.data.get("fundingOpps", []):
+                if "id" in opp and "announcementName" in opp:
+                    self._funding_id_to_name[opp["id"]] = opp["announcementName"]
+            self._funding_names_version = self.manager.data_version
+        return self._funding_id_to_name
+    
+    def material_row_values(self, material):
+        """Return the treeview values of a material system"""
+        funding_id_to_name = self.get_funding_id_to_name()
+        
+        # Get process and material values
+        process = material.get("process", "")
+        material_name = material.get("material", "")
+        
+        # Get post-processing methods
+        post_processing = []
+        for pp in material.get("postProcessing", []):
+            if "name" in pp:
+                post_processing.append(pp["name"])
+            elif "process" in pp:
+                post_processing.append(pp["process"])
+        
+        # Get qualified machines
+        qualified_machines = []
+        for qm in material.get("qualifiedMachines", []):
+            if "machine" in qm:
+                qualified_machines.append(qm["machine"])
+        
+        # Get funding opportunities (display names instead of IDs)
+        funding_opps = []
+        for opp_data in material.get("relatedFundingOpps", []):
+            if isinstance(opp_data, dict) and "opportunityID" in opp_data:
+                opp_id = opp_data["opportunityID"]
+                if opp_id in funding_id_to_name:
+                    # Add opportunity name and pursuit name if available
+                    opp_name = funding_id_to_name[opp_id]
+                    if "pursuitID" in opp_data:
+                        # Try to find the pursuit name
+                        pursuit_name = self.get_pursuit_name(opp_id, opp_data["pursuitID"])
+                        if pursuit_name:
+                            funding_opps.append(f"{opp_name} - {pursuit_name}")
                         else:
                             funding_opps.append(opp_name)
                     else:
-                        # Opportunity not found, just use the ID
-                        if "pursuitID" in opp_data:
-                            funding_opps.append(f"{opp_id} - {opp_data['pursuitID']}")
-                        else:
-                            funding_opps.append(opp_id)
-                elif isinstance(opp_data, str):
-                    # Handle string IDs for backward compatibility
-                    opp_id = opp_data
-                    if opp_id in funding_id_to_name:
-                        opp_name = funding_id_to_name[opp_id]
-                        
-                        # Try to find the first pursuit for this opportunity
-                        for opp in self.data.get("fundingOpps", []):
-                            if opp.get("id") == opp_id and opp.get("pursuits"):
-                                first_pursuit = opp["pursuits"][0]
-                                if "pursuitName" in first_pursuit:
-                                    funding_opps.append(f"{opp_name} - {first_pursuit['pursuitName']}")
-                                    break
-                        else:
-                            # No pursuit found, just use the opportunity name
-                            funding_opps.append(opp_name)
+                        funding_opps.append(opp_name)
+                else:
+                    # Opportunity not found, just use the ID
+                    if "pursuitID" in opp_data:
+                        funding_opps.append(f"{opp_id} - {opp_data['pursuitID']}")
                     else:
-                        funding_opps.append(opp_id)  # Fallback to ID if name not found
-            
-            # Format for display
-            pp_display = ", ".join(post_processing) if post_processing else ""
-            qm_display = ", ".join(qualified_machines) if qualified_machines else ""
-            funding_display = ", ".join(funding_opps) if funding_opps else ""
-            
-            # Add to tree
-            self.materials_tree.insert(
-                "", "end",
-                values=(
-                    material.get("id", ""),
-                    material.get("name", ""),
-                    process,
-                    material_name,
-                    material.get("mrl", ""),
-                    material.get("qualification", ""),
-                    pp_display,
-                    qm_display,
-                    funding_display
-                ))
+                        funding_opps.append(opp_id)
+            elif isinstance(opp_data, str):
+                # Handle string IDs for backward compatibility
+                opp_id = opp_data
+                if opp_id in funding_id_to_name:
+                    opp_name = funding_id_to_name[opp_id]
+                    
+                    # Try to find the first pursuit for this opportunity
+                    for opp in self.data.get("fundingOpps", []):
+                        if opp.get("id") == opp_id and opp.get("pursuits"):
+                            first_pursuit = opp["pursuits"][0]
+                            if "pursuitName" in first_pursuit:
+                                funding_opps.append(f"{opp_name} - {first_pursuit['pursuitName']}")
+                                break
+                    else:
+                        # No pursuit found, just use the opportunity name
+                        funding_opps.append(opp_name)
+                else:
+                    funding_opps.append(opp_id)  # Fallback to ID if name not found
+        
+        # Format for display
+        pp_display = ", ".join(post_processing) if post_processing else ""
+        qm_display = ", ".join(qualified_machines) if qualified_machines else ""
+        funding_display = ", ".join(funding_opps) if funding_opps else ""
+        
+        return (
+            material.get("id", ""),
+            material.get("name", ""),
+            process,
+            material_name,
+            material.get("mrl", ""),
+            material.get("qualification", ""),
+            pp_display,
+            qm_display,
+            funding_display
+        )
     
     def add_material(self, material=None):
         """Open a window to add a new material system"""
@@ -1126,14 +1144,17 @@ class MaterialModel(BaseModel):
                 else:
                     # Material not found, add as new
                     self.data[materials_key].append(new_material)
+                
+                # Journal the change, which may have renamed the material
+                self.record_change(materials_key, new_material, previous_id=material["id"])
             else:
                 # Add new material
                 if materials_key not in self.data:
                     self.data[materials_key] = []
                 self.data[materials_key].append(new_material)
-            
-            # Save data
-            self.manager.save_data()
+                
+                # Journal the change
+                self.record_change(materials_key, new_material)
             
             # Refresh treeview
             self.populate_materials_tree()
@@ -1208,8 +1229,8 @@ class MaterialModel(BaseModel):
             # Delete material
             del self.data[materials_key][material_index]
             
-            # Save data
-            self.manager.save_data()
+            # Journal the change
+            self.record_delete(materials_key, material_id)
             
             # Refresh treeview
             self.populate_materials_tree()
@@ -1252,120 +1273,20 @@ class MaterialModel(BaseModel):
         return ""
     
     def search_materials(self):
-        """Search material systems based on the search term"""
-        search_term = self.search_var.get().lower()
-        
-        # Clear existing items
-        for item in self.materials_tree.get_children():
-            self.materials_tree.delete(item)
+        """Search material systems based on the search term (e.g. "ti64" or "process:laser")"""
+        search_term = self.search_var.get()
         
         # If search term is empty, show all materials
-        if not search_term:
+        if not search_term.strip():
             self.populate_materials_tree()
             return
         
-        # Get the materials data (handle both "materials" and "materialSystems" keys)
-        materials_data = self.data.get("materials", self.data.get("materialSystems", []))
-        
-        # Create a mapping of funding opportunity IDs to names
-        funding_id_to_name = {}
-        for opp in self.data.get("fundingOpps", []):
-            if "id" in opp and "announcementName" in opp:
-                funding_id_to_name[opp["id"]] = opp["announcementName"]
-        
-        # Add matching materials to the tree
-        for material in materials_data:
-            # Check if search term is in any of the fields
-            if (search_term in material.get("id", "").lower() or
-                search_term in material.get("name", "").lower() or
-                search_term in material.get("process", "").lower() or
-                search_term in material.get("material", "").lower() or
-                search_term in str(material.get("mrl", "")).lower() or
-                search_term in material.get("qualification", "").lower()):
-                
-                # Get process and material values
-                process = material.get("process", "")
-                material_name = material.get("material", "")
-                
-                # Get post-processing methods
-                post_processing = []
-                for pp in material.get("postProcessing", []):
-                    if "name" in pp:
-                        post_processing.append(pp["name"])
-                    elif "process" in pp:
-                        post_processing.append(pp["process"])
-                
-                # Get qualified machines
-                qualified_machines = []
-                for qm in material.get("qualifiedMachines", []):
-                    if "machine" in qm:
-                        qualified_machines.append(qm["machine"])
-                
-                # Get funding opportunities (display names instead of IDs)
-                funding_opps = []
-                for opp_data in material.get("relatedFundingOpps", []):
-                    if isinstance(opp_data, dict) and "opportunityID" in opp_data:
-                        opp_id = opp_data["opportunityID"]
-                        if opp_id in funding_id_to_name:
-                            # Add opportunity name and pursuit name if available
-                            opp_name = funding_id_to_name[opp_id]
-                            if "pursuitID" in opp_data:
-                                # Try to find the pursuit name
-                                pursuit_name = self.get_pursuit_name(opp_id, opp_data["pursuitID"])
-                                if pursuit_name:
-                                    funding_opps.append(f"{opp_name} - {pursuit_name}")
-                                else:
-                                    funding_opps.append(opp_name)
-                            else:
-                                funding_opps.append(opp_name)
-                        else:
-                            # Opportunity not found, just use the ID
-                            if "pursuitID" in opp_data:
-                                funding_opps.append(f"{opp_id} - {opp_data['pursuitID']}")
-                            else:
-                                funding_opps.append(opp_id)
-                    elif isinstance(opp_data, str):
-                        # Handle string IDs for backward compatibility
-                        opp_id = opp_data
-                        if opp_id in funding_id_to_name:
-                            opp_name = funding_id_to_name[opp_id]
-                            
-                            # Try to find the first pursuit for this opportunity
-                            for opp in self.data.get("fundingOpps", []):
-                                if opp.get("id") == opp_id and opp.get("pursuits"):
-                                    first_pursuit = opp["pursuits"][0]
-                                    if "pursuitName" in first_pursuit:
-                                        funding_opps.append(f"{opp_name} - {first_pursuit['pursuitName']}")
-                                        break
-                            else:
-                                # No pursuit found, just use the opportunity name
-                                funding_opps.append(opp_name)
-                        else:
-                            funding_opps.append(opp_id)  # Fallback to ID if name not found
-                
-                # Format for display
-                pp_display = ", ".join(post_processing) if post_processing else ""
-                qm_display = ", ".join(qualified_machines) if qualified_machines else ""
-                funding_display = ", ".join(funding_opps) if funding_opps else ""
-                
-                # Add to tree
-                self.materials_tree.insert(
-                    "", "end",
-                    values=(
-                        material.get("id", ""),
-                        material.get("name", ""),
-                        process,
-                        material_name,
-                        material.get("mrl", ""),
-                        material.get("qualification", ""),
-                        pp_display,
-                        qm_display,
-                        funding_display
-                    ))
+        # Show only the matching materials
+        matches = self.search_collection(self.materials_key(), search_term)
+        self.materials_view.set_entities(matches)
         
         # Update status
-        count = len(self.materials_tree.get_children())
-        self.update_status(f"Found {count} matching material systems")
+        self.update_status(f"Found {len(matches)} matching material systems")
     
     def clear_search(self):
         """Clear the search field and show all material systems"""
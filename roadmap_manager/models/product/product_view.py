@@ -7,6 +7,7 @@ class ProductView:
     def __init__(self, model):
         self.model = model
         self.products_tree = None
+        self.products_view = None
         self.search_entry = None
     
     def create_products_tab(self, notebook):
@@ -28,6 +29,7 @@ class ProductView:
         self.search_entry = ttk.Entry(top_frame, width=20)
         self.search_entry.pack(side=tk.LEFT, padx=5)
         self.search_entry.bind("<Return>", lambda event: self.model.search_products())
+        self.model.bind_incremental_search(self.search_entry, self.model.search_products)
         
         search_button = ttk.Button(top_frame, text="Search", command=self.model.search_products)
         search_button.pack(side=tk.LEFT, padx=5)
@@ -49,9 +51,9 @@ class ProductView:
         self.products_tree.column("Programs", width=150)
         self.products_tree.column("Material Systems", width=150)
         
-        # Add a scrollbar
-        scrollbar = ttk.Scrollbar(products_frame, orient=tk.VERTICAL, command=self.products_tree.yview)
-        self.products_tree.configure(yscroll=scrollbar.set)
+        # Add a scrollbar (driven by the virtual tree, which only materializes the visible rows)
+        scrollbar = ttk.Scrollbar(products_frame, orient=tk.VERTICAL)
+        self.products_view = self.model.create_virtual_tree(self.products_tree, scrollbar, self.product_row_values)
         
         # Pack the treeview and scrollbar
         self.products_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -60,40 +62,42 @@ class ProductView:
         # Bind double-click event
         self.products_tree.bind("<Double-1>", self.model.edit_product)
         
+        # Index the products for the search box
+        self.model.create_search_index("products", {
+            "id": lambda p: p.get("id", ""),
+            "name": lambda p: p.get("name", ""),
+            "trl": lambda p: p.get("trl", ""),
+            "program": lambda p: self.entry_ids(p.get("programs", []), "programID"),
+            "material": lambda p: self.entry_ids(p.get("materialSystems", []), "materialID"),
+        })
+        
         # Populate treeview
         self.populate_products_tree()
     
-    def populate_products_tree(self):
-        """Populate the products treeview with data"""
-        # Clear existing items
-        for item in self.products_tree.get_children():
-            self.products_tree.delete(item)
+    def populate_products_tree(self, products=None):
+        """Populate the products treeview with data (or only the given products)"""
+        self.products_view.set_entities(self.model.data["products"] if products is None else products)
+    
+    def entry_ids(self, entries, key):
+        """Return the IDs of a product's program or material entries (dicts with key, or plain IDs)"""
+        ids = []
+        for entry in entries:
+            if isinstance(entry, dict) and key in entry:
+                ids.append(entry[key])
+            elif isinstance(entry, str):
+                ids.append(entry)
+        return ids
+    
+    def product_row_values(self, product):
+        """Return the treeview values of a product"""
+        # Format program and material system IDs
+        programs = ", ".join(self.entry_ids(product.get("programs", []), "programID"))
+        materials = ", ".join(self.entry_ids(product.get("materialSystems", []), "materialID"))
         
-        # Add products to treeview
-        for product in self.model.data["products"]:
-            # Format program IDs
-            program_ids = []
-            for program_entry in product.get("programs", []):
-                if isinstance(program_entry, dict) and "programID" in program_entry:
-                    program_ids.append(program_entry["programID"])
-                elif isinstance(program_entry, str):
-                    program_ids.append(program_entry)
-            programs = ", ".join(program_ids)
-            
-            # Format material system IDs
-            material_ids = []
-            for material_entry in product.get("materialSystems", []):
-                if isinstance(material_entry, dict) and "materialID" in material_entry:
-                    material_ids.append(material_entry["materialID"])
-                elif isinstance(material_entry, str):
-                    material_ids.append(material_entry)
-            materials = ", ".join(material_ids)
-            
-            values = (
-                product["id"],
-                product["name"],
-                product.get("trl", ""),
-                programs,
-                materials
-            )
-            self.products_tree.insert("", tk.END, values=values) 
\ No newline at end of file
+        return (
+            product["id"],
+            product["name"],
+            product.get("trl", ""),
+            programs,
+            materials
+        )
\ No newline at end of file
@@ -9,6 +9,7 @@ class ProgramModel(BaseModel):
     def __init__(self, manager):
         super().__init__(manager)
         self.programs_tree = None
+        self.programs_view = None
         self.search_entry = None
         
         # Create product ID to name mapping
@@ -58,6 +59,7 @@ class ProgramModel(BaseModel):
         self.search_entry = ttk.Entry(top_frame, width=20)
         self.search_entry.pack(side=tk.LEFT, padx=5)
         self.search_entry.bind("<Return>", lambda event: self.search_programs())
+        self.bind_incremental_search(self.search_entry, self.search_programs)
         
         search_button = ttk.Button(top_frame, text="Search", command=self.search_programs)
         search_button.pack(side=tk.LEFT, padx=5)
@@ -79,9 +81,9 @@ class ProgramModel(BaseModel):
         self.programs_tree.column("Name", width=150)
         self.programs_tree.column("Product-Material Combinations", width=250)
         
-        # Add a scrollbar
-        scrollbar = ttk.Scrollbar(programs_frame, orient=tk.VERTICAL, command=self.programs_tree.yview)
-        self.programs_tree.configure(yscroll=scrollbar.set)
+        # Add a scrollbar (driven by the virtual tree, which only materializes the visible rows)
+        scrollbar = ttk.Scrollbar(programs_frame, orient=tk.VERTICAL)
+        self.programs_view = self.create_virtual_tree(self.programs_tree, scrollbar, self.program_row_values)
         
         # Pack the treeview and scrollbar
         self.programs_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -90,101 +92,59 @@ class ProgramModel(BaseModel):
         # Bind double-click event
         self.programs_tree.bind("<Double-1>", self.edit_program)
         
+        # Index the programs for the search box
+        self.create_search_index("programs", {
+            "id": lambda p: p.get("id", ""),
+            "name": lambda p: p.get("name", ""),
+            "sector": lambda p: p.get("sector", ""),
+            "division": lambda p: p.get("division", ""),
+            "customer": lambda p: p.get("customerName", ""),
+            "mission": lambda p: p.get("missionClass", ""),
+            "product": self.program_product_terms,
+            "material": self.program_material_terms,
+            "part": self.program_part_terms,
+        })
+        
         # Populate treeview
         self.populate_programs_tree()
     
+    def program_combinations(self, program):
+        """Return the product-material combinations of a program"""
+        combinations = program.get("productMaterialCombinations")
+        return combinations if isinstance(combinations, list) else []
+    
+    def program_product_terms(self, program):
+        """Return the searchable product IDs and names of a program's combinations"""
+        terms = []
+        for combo in self.program_combinations(program):
+            product_id = combo.get("productID", "")
+            terms += [product_id, self.product_id_to_name.get(product_id, product_id)]
+        return terms
+    
+    def program_material_terms(self, program):
+        """Return the searchable material system IDs and names of a program's combinations"""
+        terms = []
+        for combo in self.program_combinations(program):
+            material_id = combo.get("materialID", "")
+            terms += [material_id, self.material_id_to_name.get(material_id, material_id)]
+        return terms
+    
+    def program_part_terms(self, program):
+        """Return the searchable part names and numbers of a program's combinations"""
+        terms = []
+        for combo in self.program_combinations(program):
+            terms += [combo.get("partName", ""), combo.get("partNumber", "")]
+        return terms
+    
     def search_programs(self):
-        """Search programs based on the search term"""
-        search_term = self.search_entry.get().lower()
-        if not search_term:
+        """Search programs based on the search term (e.g. "lpbf" or "customer:nasa")"""
+        search_term = self.search_entry.get()
+        if not search_term.strip():
             self.clear_search()
             return
         
-        # Clear existing items
-        for item in self.programs_tree.get_children():
-            self.programs_tree.delete(item)
-        
-        # Add matching programs to treeview
-        for program in self.data["programs"]:
-            # Check if search term is in any of the program attributes
-            if (search_term in program["id"].lower() or
-                search_term in program["name"].lower() or
-                search_term in program.get("sector", "").lower() or
-                search_term in program.get("division", "").lower() or
-                search_term in program.get("customerName", "").lower() or
-                search_term in program.get("missionClass", "").lower()):
-                
-                # Get product-material combinations
-                product_material_info = ""
-                if "productMaterialCombinations" in program and isinstance(program["productMaterialCombinations"], list):
-                    combinations = []
-                    for combo in program["productMaterialCombinations"]:
-                        product_id = combo.get("productID", "")
-                        material_id = combo.get("materialID", "")
-                        
-                        # Find product and material names
-                        product_name = self.product_id_to_name.get(product_id, product_id)
-                        material_name = self.material_id_to_name.get(material_id, material_id)
-                        
-                        combinations.append(f"{product_name} | {material_name}")
-                    
-                    product_material_info = "; ".join(combinations)
-                
-                values = (
-                    program["id"],
-                    program["name"],
-                    program.get("sector", ""),
-                    program.get("division", ""),
-                    program.get("customerName", ""),
-                    program.get("missionClass", ""),
-                    product_material_info
-                )
-                self.programs_tree.insert("", tk.END, values=values)
-            # Also search in product-material combinations
-            elif "productMaterialCombinations" in program and isinstance(program["productMaterialCombinations"], list):
-                for combo in program["productMaterialCombinations"]:
-                    product_id = combo.get("productID", "")
-                    material_id = combo.get("materialID", "")
-                    part_name = combo.get("partName", "")
-                    part_number = combo.get("partNumber", "")
-                    
-                    # Find product and material names
-                    product_name = self.product_id_to_name.get(product_id, product_id)
-                    material_name = self.material_id_to_name.get(material_id, material_id)
-                    
-                    # Check if search term is in any of the product-material attributes
-                    if (search_term in product_id.lower() or
-                        search_term in product_name.lower() or
-                        search_term in material_id.lower() or
-                        search_term in material_name.lower() or
-                        search_term in part_name.lower() or
-                        search_term in part_number.lower()):
-                        
-                        # Get all product-material combinations
-                        combinations = []
-                        for c in program["productMaterialCombinations"]:
-                            p_id = c.get("productID", "")
-                            m_id = c.get("materialID", "")
-                            
-                            # Find product and material names
-                            p_name = self.product_id_to_name.get(p_id, p_id)
-                            m_name = self.material_id_to_name.get(m_id, m_id)
-                            
-                            combinations.append(f"{p_name} | {m_name}")
-                        
-                        product_material_info = "; ".join(combinations)
-                        
-                        values = (
-                            program["id"],
-                            program["name"],
-                            program.get("sector", ""),
-                            program.get("division", ""),
-                            program.get("customerName", ""),
-                            program.get("missionClass", ""),
-                            product_material_info
-                        )
-                        self.programs_tree.insert("", tk.END, values=values)
-                        break  # Only add the program once
+        # Show only the matching programs
+        self.programs_view.set_entities(self.search_collection("programs", search_term))
     
     def clear_search(self):
         """Clear search and show all programs"""
@@ -193,38 +153,35 @@ class ProgramModel(BaseModel):
     
     def populate_programs_tree(self):
         """Populate the programs treeview with data"""
-        # Clear existing items
-        for item in self.programs_tree.get_children():
-            self.programs_tree.delete(item)
-        
-        # Add programs to treeview
-        for program in self.data["programs"]:
-            # Get product-material combinations
-            product_material_info = ""
-            if "productMaterialCombinations" in program and isinstance(program["productMaterialCombinations"], list):
-                combinations = []
-                for combo in program["productMaterialCombinations"]:
-                    product_id = combo.get("productID", "")
-                    material_id = combo.get("materialID", "")
-                    
-                    # Find product and material names
-                    product_name = self.product_id_to_name.get(product_id, product_id)
-                    material_name = self.material_id_to_name.get(material_id, material_id)
-                    
-                    combinations.append(f"{product_name} | {material_name}")
+        self.programs_view.set_entities(self.data["programs"])
+    
+    def program_row_values(self, program):
+        """Return the treeview values of a program"""
+        # Get product-material combinations
+        product_material_info = ""
+        if "productMaterialCombinations" in program and isinstance(program["productMaterialCombinations"], list):
+            combinations = []
+            for combo in program["productMaterialCombinations"]:
+                product_id = combo.get("productID", "")
+                material_id = combo.get("materialID", "")
+                
+                # Find product and material names
+                product_name = self.product_id_to_name.get(product_id, product_id)
+                material_name = self.material_id_to_name.get(material_id, material_id)
                 
-                product_material_info = "; ".join(combinations)
+                combinations.append(f"{product_name} | {material_name}")
             
-            values = (
-                program["id"],
-                program["name"],
-                program.get("sector", ""),
-                program.get("division", ""),
-                program.get("customerName", ""),
-                program.get("missionClass", ""),
-                product_material_info
-            )
-            self.programs_tree.insert("", tk.END, values=values)
+            product_material_info = "; ".join(combinations)
+        
+        return (
+            program["id"],
+            program["name"],
+            program.get("sector", ""),
+            program.get("division", ""),
+            program.get("customerName", ""),
+            program.get("missionClass", ""),
+            product_material_info
+        )
     
     def get_next_program_id(self):
         """Generate the next available program ID"""
@@ -310,8 +267,8 @@ class ProgramModel(BaseModel):
             # Refresh treeview
             self.populate_programs_tree()
             
-            # Save data to file
-            self.manager.save_data()
+            # Journal the change
+            self.record_change("programs", new_program)
             
             # Close window
             add_window.destroy()
@@ -748,8 +705,8 @@ class ProgramModel(BaseModel):
             # Refresh treeview
             self.populate_programs_tree()
             
-            # Save data to file
-            self.manager.save_data()
+            # Journal the change
+            self.record_change("programs", program)
             
             # Close window
             edit_window.destroy()
@@ -763,8 +720,8 @@ class ProgramModel(BaseModel):
                 # Refresh treeview
                 self.populate_programs_tree()
                 
-                # Save data to file
-                self.manager.save_data()
+                # Journal the change
+                self.record_delete("programs", program["id"])
                 
                 # Close window
                 edit_window.destroy()
@@ -9,6 +9,8 @@ class SupplierModel(BaseModel):
         super().__init__(manager)
         self.printing_suppliers_tree = None
         self.post_processing_suppliers_tree = None
+        self.printing_suppliers_view = None
+        self.post_processing_suppliers_view = None
         self.printing_search_var = None
         self.post_processing_search_var = None
     
@@ -32,6 +34,7 @@ class SupplierModel(BaseModel):
         search_entry = ttk.Entry(top_frame, textvariable=self.printing_search_var, width=20)
         search_entry.pack(side=tk.LEFT, padx=5)
         search_entry.bind("<Return>", lambda event: self.search_printing_suppliers())
+        self.bind_incremental_search(search_entry, self.search_printing_suppliers)
         
         search_button = ttk.Button(top_frame, text="Search", command=self.search_printing_suppliers)
         search_button.pack(side=tk.LEFT, padx=5)
@@ -53,9 +56,10 @@ class SupplierModel(BaseModel):
         self.printing_suppliers_tree.column("Material Systems", width=200)
         self.printing_suppliers_tree.column("Additional Capabilities", width=300)
         
-        # Add a scrollbar
-        scrollbar = ttk.Scrollbar(suppliers_frame, orient=tk.VERTICAL, command=self.printing_suppliers_tree.yview)
-        self.printing_suppliers_tree.configure(yscroll=scrollbar.set)
+        # Add a scrollbar (driven by the virtual tree, which only materializes the visible rows)
+        scrollbar = ttk.Scrollbar(suppliers_frame, orient=tk.VERTICAL)
+        self.printing_suppliers_view = self.create_virtual_tree(
+            self.printing_suppliers_tree, scrollbar, self.printing_supplier_row_values)
         
         # Pack the treeview and scrollbar
         self.printing_suppliers_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -64,49 +68,56 @@ class SupplierModel(BaseModel):
         # Bind double-click event
         self.printing_suppliers_tree.bind("<Double-1>", self.edit_printing_supplier)
         
+        # Index the suppliers for the search box
+        self.create_search_index("printingSuppliers", {
+            "id": lambda s: s.get("id", ""),
+            "name": lambda s: s.get("name", ""),
+            "number": lambda s: s.get("supplierNumber", ""),
+            "material": self.get_material_names,
+            "capability": lambda s: s.get("additionalCapabilities", []),
+        })
+        
         # Populate treeview
         self.populate_printing_suppliers_tree()
     
     def populate_printing_suppliers_tree(self):
         """Populate the printing suppliers treeview with data"""
-        # Clear existing items
-        for item in self.printing_suppliers_tree.get_children():
-            self.printing_suppliers_tree.delete(item)
-        
-        # Add suppliers to treeview
-        for supplier in self.data["printingSuppliers"]:
-            # Extract material systems
-            material_systems = []
-            if "materialSystems" in supplier:
-                for ms in supplier["materialSystems"]:
-                    material_id = ms.get("materialID", "")
-                    # Find material name from ID
-                    material_name = self.get_material_name_by_id(material_id)
-                    if material_name:
-                        material_systems.append(material_name)
-            
-            # Format additional capabilities
-            capabilities = ", ".join(supplier.get("additionalCapabilities", []))
-            
-            # Format NDA status
-            nda_status = "None"
-            if "ndaStatus" in supplier:
-                status = supplier["ndaStatus"].get("status", "")
-                date = supplier["ndaStatus"].get("date", "")
-                if status and date:
-                    nda_status = f"{status} ({date})"
-                elif status:
-                    nda_status = status
-            
-            values = (
-                supplier["id"],
-                supplier["name"],
-                supplier.get("supplierNumber", ""),
-                nda_status,
-                ", ".join(material_systems),
-                capabilities
-            )
-            self.printing_suppliers_tree.insert("", tk.END, values=values)
+        self.printing_suppliers_view.set_entities(self.data["printingSuppliers"])
+    
+    def format_nda_status(self, supplier):
+        """Return the NDA status of a supplier for display"""
+        nda_status = "None"
+        if "ndaStatus" in supplier:
+            status = supplier["ndaStatus"].get("status", "")
+            date = supplier["ndaStatus"].get("date", "")
+            if status and date:
+                nda_status = f"{status} ({date})"
+            elif status:
+                nda_status = status
+        return nda_status
+    
+    def get_material_names(self, supplier):
+        """Return the names of the material systems a printing supplier offers"""
+        material_systems = []
+        if "materialSystems" in supplier:
+            for ms in supplier["materialSystems"]:
+                material_id = ms.get("materialID", "")
+                # Find material name from ID
+                material_name = self.get_material_name_by_id(material_id)
+                if material_name:
+                    material_systems.append(material_name)
+        return material_systems
+    
+    def printing_supplier_row_values(self, supplier):
+        """Return the treeview values of a printing supplier"""
+        return (
+            supplier["id"],
+            supplier["name"],
+            supplier.get("supplierNumber", ""),
+            self.format_nda_status(supplier),
+            ", ".join(self.get_material_names(supplier)),
+            ", ".join(supplier.get("additionalCapabilities", []))
+        )
     
     def get_material_name_by_id(self, material_id):
         """Get material name from material ID"""
@@ -135,6 +146,7 @@ class SupplierModel(BaseModel):
         search_entry = ttk.Entry(top_frame, textvariable=self.post_processing_search_var, width=20)
         search_entry.pack(side=tk.LEFT, padx=5)
         search_entry.bind("<Return>", lambda event: self.search_post_processing_suppliers())
+        self.bind_incremental_search(search_entry, self.search_post_processing_suppliers)
         
         search_button = ttk.Button(top_frame, text="Search", command=self.search_post_processing_suppliers)
         search_button.pack(side=tk.LEFT, padx=5)
@@ -155,9 +167,10 @@ class SupplierModel(BaseModel):
         self.post_processing_suppliers_tree.column("Name", width=150)
         self.post_processing_suppliers_tree.column("Processes", width=300)
         
-        # Add a scrollbar
-        scrollbar = ttk.Scrollbar(suppliers_frame, orient=tk.VERTICAL, command=self.post_processing_suppliers_tree.yview)
-        self.post_processing_suppliers_tree.configure(yscroll=scrollbar.set)
+        # Add a scrollbar (driven by the virtual tree, which only materializes the visible rows)
+        scrollbar = ttk.Scrollbar(suppliers_frame, orient=tk.VERTICAL)
+        self.post_processing_suppliers_view = self.create_virtual_tree(
+            self.post_processing_suppliers_tree, scrollbar, self.post_processing_supplier_row_values)
         
         # Pack the treeview and scrollbar
         self.post_processing_suppliers_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -166,38 +179,30 @@ class SupplierModel(BaseModel):
         # Bind double-click event
         self.post_processing_suppliers_tree.bind("<Double-1>", self.edit_post_processing_supplier)
         
+        # Index the suppliers for the search box
+        self.create_search_index("postProcessingSuppliers", {
+            "id": lambda s: s.get("id", ""),
+            "name": lambda s: s.get("name", ""),
+            "number": lambda s: s.get("supplierNumber", ""),
+            "process": lambda s: s.get("processs", []),
+        })
+        
         # Populate treeview
         self.populate_post_processing_suppliers_tree()
     
     def populate_post_processing_suppliers_tree(self):
         """Populate the post-processing suppliers treeview with data"""
-        # Clear existing items
-        for item in self.post_processing_suppliers_tree.get_children():
-            self.post_processing_suppliers_tree.delete(item)
-        
-        # Add suppliers to treeview
-        for supplier in self.data["postProcessingSuppliers"]:
-            # Format processes
-            processes = ", ".join(supplier.get("processs", []))
-            
-            # Format NDA status
-            nda_status = "None"
-            if "ndaStatus" in supplier:
-                status = supplier["ndaStatus"].get("status", "")
-                date = supplier["ndaStatus"].get("date", "")
-                if status and date:
-                    nda_status = f"{status} ({date})"
-                elif status:
-                    nda_status = status
-            
-            values = (
-                supplier["id"],
-                supplier["name"],
-                supplier.get("supplierNumber", ""),
-                nda_status,
-                processes
-            )
-            self.post_processing_suppliers_tree.insert("", tk.END, values=values)
+        self.post_processing_suppliers_view.set_entities(self.data["postProcessingSuppliers"])
+    
+    def post_processing_supplier_row_values(self, supplier):
+        """Return the treeview values of a post-processing supplier"""
+        return (
+            supplier["id"],
+            supplier["name"],
+            supplier.get("supplierNumber", ""),
+            self.format_nda_status(supplier),
+            ", ".join(supplier.get("processs", []))
+        )
     
     def get_next_supplier_id(self, supplier_type="printing"):
         """Get the next available supplier ID"""
@@ -477,6 +482,7 @@ class SupplierModel(BaseModel):
             for i, s in enumerate(self.data["printingSuppliers"]):
                 if s["id"] == supplier_id:
                     self.data["printingSuppliers"][i] = new_supplier
+                    self.record_change("printingSuppliers", new_supplier, previous_id=supplier_id)
                     break
             
             # Refresh treeview
@@ -760,6 +766,7 @@ class SupplierModel(BaseModel):
             for i, s in enumerate(self.data["printingSuppliers"]):
                 if s["id"] == supplier_id:
                     self.data["printingSuppliers"][i] = new_supplier
+                    self.record_change("printingSuppliers", new_supplier, previous_id=supplier_id)
                     break
             
             # Refresh treeview
@@ -775,6 +782,7 @@ class SupplierModel(BaseModel):
             if self.confirm_delete(supplier['name']):
                 # Remove supplier from data
                 self.data["printingSuppliers"].remove(supplier)
+                self.record_delete("printingSuppliers", supplier["id"])
                 
                 # Refresh treeview
                 self.populate_printing_suppliers_tree()
@@ -900,6 +908,7 @@ class SupplierModel(BaseModel):
             
             # Add to data
             self.data["postProcessingSuppliers"].append(new_supplier)
+            self.record_change("postProcessingSuppliers", new_supplier)
             
             # Refresh treeview
             self.populate_post_processing_suppliers_tree()
@@ -1044,6 +1053,9 @@ class SupplierModel(BaseModel):
             elif "ndaStatus" in supplier:
                 del supplier["ndaStatus"]
             
+            # Journal the change
+            self.record_change("postProcessingSuppliers", supplier)
+            
             # Refresh treeview
             self.populate_post_processing_suppliers_tree()
             
@@ -1057,6 +1069,7 @@ class SupplierModel(BaseModel):
             if self.confirm_delete(supplier['name']):
                 # Remove supplier from data
                 self.data["postProcessingSuppliers"].remove(supplier)
+                self.record_delete("postProcessingSuppliers", supplier["id"])
                 
                 # Refresh treeview
                 self.populate_post_processing_suppliers_tree()
@@ -1090,79 +1103,19 @@ class SupplierModel(BaseModel):
         
         if supplier:
             supplier["supplierRoadmap"] = roadmap_data
+            self.record_change("printingSuppliers" if supplier_type == "printing" else "postProcessingSuppliers", supplier)
             return True
         return False
     
     def search_printing_suppliers(self):
-        """Search printing suppliers based on the search term"""
-        search_term = self.printing_search_var.get().lower()
-        if not search_term:
+        """Search printing suppliers based on the search term (e.g. "inconel" or "capability:hip")"""
+        search_term = self.printing_search_var.get()
+        if not search_term.strip():
             self.clear_printing_search()
             return
         
-        # Clear existing items
-        for item in self.printing_suppliers_tree.get_children():
-            self.printing_suppliers_tree.delete(item)
-        
-        # Add matching suppliers to treeview
-        for supplier in self.data["printingSuppliers"]:
-            # Check if search term is in any of the supplier attributes
-            if (search_term in supplier["id"].lower() or
-                search_term in supplier["name"].lower() or
-                search_term in supplier.get("supplierNumber", "").lower()):
-                
-                # Also check in material systems
-                material_systems = []
-                if "materialSystems" in supplier:
-                    for ms in supplier["materialSystems"]:
-                        material_id = ms.get("materialID", "")
-                        # Find material name from ID
-                        material_name = self.get_material_name_by_id(material_id)
-                        if material_name:
-                            material_systems.append(material_name)
-                
-                # Check if search term is in material systems
-                material_match = False
-                for ms_name in material_systems:
-                    if search_term in ms_name.lower():
-                        material_match = True
-                        break
-                
-                # Check if search term is in additional capabilities
-                capability_match = False
-                for capability in supplier.get("additionalCapabilities", []):
-                    if search_term in capability.lower():
-                        capability_match = True
-                        break
-                
-                # If any match, add to treeview
-                if (search_term in supplier["id"].lower() or
-                    search_term in supplier["name"].lower() or
-                    search_term in supplier.get("supplierNumber", "").lower() or
-                    material_match or capability_match):
-                    
-                    # Format NDA status
-                    nda_status = "None"
-                    if "ndaStatus" in supplier:
-                        status = supplier["ndaStatus"].get("status", "")
-                        date = supplier["ndaStatus"].get("date", "")
-                        if status and date:
-                            nda_status = f"{status} ({date})"
-                        elif status:
-                            nda_status = status
-                    
-                    # Format additional capabilities
-                    capabilities = ", ".join(supplier.get("additionalCapabilities", []))
-                    
-                    values = (
-                        supplier["id"],
-                        supplier["name"],
-                        supplier.get("supplierNumber", ""),
-                        nda_status,
-                        ", ".join(material_systems),
-                        capabilities
-                    )
-                    self.printing_suppliers_tree.insert("", tk.END, values=values)
+        # Show only the matching suppliers
+        self.printing_suppliers_view.set_entities(self.search_collection("printingSuppliers", search_term))
     
     def clear_printing_search(self):
         """Clear search and show all printing suppliers"""
@@ -1170,69 +1123,14 @@ class SupplierModel(BaseModel):
         self.populate_printing_suppliers_tree()
     
     def search_post_processing_suppliers(self):
-        """Search post-processing suppliers based on the search term"""
-        search_term = self.post_processing_search_var.get().lower()
-        if not search_term:
+        """Search post-processing suppliers based on the search term (e.g. "process:hip")"""
+        search_term = self.post_processing_search_var.get()
+        if not search_term.strip():
             self.clear_post_processing_search()
             return
         
-        # Clear existing items
-        for item in self.post_processing_suppliers_tree.get_children():
-            self.post_processing_suppliers_tree.delete(item)
-        
-        # Add matching suppliers to treeview
-        for supplier in self.data["postProcessingSuppliers"]:
-            # Check if search term is in any of the supplier attributes
-            if (search_term in supplier["id"].lower() or
-                search_term in supplier["name"].lower() or
-                search_term in supplier.get("supplierNumber", "").lower()):
-                
-                # Format NDA status
-                nda_status = "None"
-                if "ndaStatus" in supplier:
-                    status = supplier["ndaStatus"].get("status", "")
-                    date = supplier["ndaStatus"].get("date", "")
-                    if status and date:
-                        nda_status = f"{status} ({date})"
-                    elif status:
-                        nda_status = status
-                
-                values = (
-                    supplier["id"],
-                    supplier["name"],
-                    supplier.get("supplierNumber", ""),
-                    nda_status,
-                    ", ".join(supplier.get("processs", []))
-                )
-                self.post_processing_suppliers_tree.insert("", tk.END, values=values)
-                continue  # Skip further checks if already matched
-            
-            # Check if search term is in processes
-            process_match = False
-            for process in supplier.get("processs", []):
-                if search_term in process.lower():
-                    process_match = True
-                    break
-            
-            if process_match:
-                # Format NDA status
-                nda_status = "None"
-                if "ndaStatus" in supplier:
-                    status = supplier["ndaStatus"].get("status", "")
-                    date = supplier["ndaStatus"].get("date", "")
-                    if status and date:
-                        nda_status = f"{status} ({date})"
-                    elif status:
-                        nda_status = status
-                
-                values = (
-                    supplier["id"],
-                    supplier["name"],
-                    supplier.get("supplierNumber", ""),
-                    nda_status,
-                    ", ".join(supplier.get("processs", []))
-                )
-                self.post_processing_suppliers_tree.insert("", tk.END, values=values)
+        # Show only the matching suppliers
+        self.post_processing_suppliers_view.set_entities(self.search_collection("postProcessingSuppliers", search_term))
     
     def clear_post_processing_search(self):
         """Clear search and show all post-processing suppliers"""
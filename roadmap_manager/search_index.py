@@ -0,0 +1,319 @@
+import re
+from bisect import bisect_left, insort
+
+# Delay after the last keystroke before an as-you-type search runs
+SEARCH_DELAY_MS = 150
+
+# Words whose tokens' row lists add up to more than 1/SCAN_FRACTION of the entities are not
+# merged; a single token's row list is used as is however long it is
+SCAN_FRACTION = 2
+
+# Intersections look rows of the shorter list up by bisection when the other is this many times longer
+BISECT_RATIO = 8
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Key of the joined text of all fields in an entity's field texts
+_ALL_FIELDS = "\x00all"
+
+def tokenize(text):
+    """Split lowercased text into word tokens"""
+    return _TOKEN_RE.findall(text)
+
+def trigrams(token):
+    """Return the set of three-character substrings of a token"""
+    return {token[i:i + 3] for i in range(len(token) - 2)}
+
+def grams(token):
+    """Return the set of two- and three-character substrings of a token"""
+    return {token[i:i + n] for n in (2, 3) for i in range(len(token) - n + 1)}
+
+def intersect_rows(a, b):
+    """Return the rows in both sorted row lists, sorted"""
+    if len(a) > len(b):
+        a, b = b, a
+    if not a:
+        return []
+    if len(b) > BISECT_RATIO * len(a):
+        rows = []
+        for row in a:
+            i = bisect_left(b, row)
+            if i < len(b) and b[i] == row:
+                rows.append(row)
+        return rows
+    members = set(a)
+    return [row for row in b if row in members]
+
+def parse_query(query):
+    """Split a query into (field, term, prefix) triples.
+
+    Terms are separated by whitespace and must all match. 'field:term' limits a
+    term to one field, and a trailing '*' matches only at the start of a word
+    instead of anywhere in the text.
+    """
+    terms = []
+    for part in query.lower().split():
+        field = None
+        if ":" in part:
+            name, _, rest = part.partition(":")
+            if name and rest:
+                field, part = name, rest
+        prefix = part.endswith("*")
+        part = part.rstrip("*")
+        if part:
+            terms.append((field, part, prefix))
+    return terms
+
+class SearchIndex:
+    """Inverted token index over the searchable fields of one entity collection.
+
+    fields maps a field name to a function returning the text (or list of texts)
+    of that field for an entity. Query terms are matched against the vocabulary
+    through an index of its two- and three-character substrings, so substring and
+    prefix queries only touch the tokens that can contain them; the candidate
+    entities are then checked against the field text itself, so results are the
+    same as a plain substring scan.
+    Each token's posting list holds the sorted row positions of its entities, so
+    candidates are merged and returned in collection order without sorting.
+    """
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.entities = []          # indexed entities in collection order
+        self._docs = {}             # id(entity) -> (entity, {field: text}, tokens)
+        self._position = {}         # id(entity) -> position in the collection
+        self._columns = {}          # field -> text of each entity, in collection order
+        self._counts = {}           # token -> number of indexed entities holding it
+        self._rows = {}             # token -> sorted positions of the entities holding it
+        self._grams = {}            # two- or three-character substring -> set of tokens
+        self._vocabulary = []       # sorted tokens, for prefix lookups
+        self._vocabulary_dirty = False
+
+    # Maintenance
+
+    def _field_texts(self, entity):
+        """Return the lowercased text of every field of an entity"""
+        texts = {}
+        for name, extract in self.fields.items():
+            value = extract(entity)
+            if isinstance(value, (list, tuple)):
+                value = "\n".join(str(v) for v in value if v is not None)
+            texts[name] = str(value if value is not None else "").lower()
+        texts[_ALL_FIELDS] = "\x1f".join(texts.values())
+        return texts
+
+    def _add(self, entity):
+        """Index an entity that is not indexed yet"""
+        texts = self._field_texts(entity)
+        tokens = set(tokenize(texts[_ALL_FIELDS]))
+        self._docs[id(entity)] = (entity, texts, tokens)
+        for token in tokens:
+            count = self._counts.get(token, 0)
+            if not count:
+                for gram in grams(token):
+                    self._grams.setdefault(gram, set()).add(token)
+                self._vocabulary_dirty = True
+            self._counts[token] = count + 1
+
+    def _remove(self, key):
+        """Drop an entity from the index"""
+        _, _, tokens = self._docs.pop(key)
+        for token in tokens:
+            count = self._counts[token] - 1
+            if count:
+                self._counts[token] = count
+            else:
+                del self._counts[token]
+                for gram in grams(token):
+                    holding = self._grams[gram]
+                    holding.discard(token)
+                    if not holding:
+                        del self._grams[gram]
+                self._vocabulary_dirty = True
+
+    def sync(self, entities):
+        """Match the index to the collection: index new entities, drop removed ones, keep the order"""
+        entities = list(entities)
+        previous = self.entities
+        # Appending keeps every row where it was, so only the new rows are added to the posting lists
+        appended = len(entities) >= len(previous) and all(a is b for a, b in zip(previous, entities))
+        keys = set()
+        for entity in entities:
+            key = id(entity)
+            keys.add(key)
+            doc = self._docs.get(key)
+            if doc is not None and doc[0] is not entity:
+                self._remove(key)
+                doc = None
+            if doc is None:
+                self._add(entity)
+        for key in [key for key in self._docs if key not in keys]:
+            self._remove(key)
+        if appended and self._columns:
+            start = len(previous)
+        else:
+            start = 0
+            self._position = {}
+            self._rows = {}
+            self._columns = {name: [] for name in (*self.fields, _ALL_FIELDS)}
+        rows = self._rows
+        columns = list(self._columns.items())
+        for i in range(start, len(entities)):
+            key = id(entities[i])
+            self._position[key] = i
+            _, texts, tokens = self._docs[key]
+            for token in tokens:
+                token_rows = rows.get(token)
+                if token_rows is None:
+                    rows[token] = [i]
+                else:
+                    token_rows.append(i)
+            for name, column in columns:
+                column.append(texts[name])
+        self.entities = entities
+        self._sort_vocabulary()
+
+    def _sort_vocabulary(self):
+        """Sort the vocabulary for prefix lookups if tokens were added or removed"""
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._counts)
+            self._vocabulary_dirty = False
+
+    def update(self, entity):
+        """Re-index an entity whose fields were edited in place"""
+        key = id(entity)
+        if key in self._docs:
+            old_tokens = self._docs[key][2]
+            self._remove(key)
+            self._add(entity)
+            _, texts, tokens = self._docs[key]
+            position = self._position[key]
+            for token in old_tokens - tokens:
+                token_rows = self._rows[token]
+                token_rows.remove(position)
+                if not token_rows:
+                    del self._rows[token]
+            for token in tokens - old_tokens:
+                insort(self._rows.setdefault(token, []), position)
+            for name, column in self._columns.items():
+                column[position] = texts[name]
+
+    # Queries
+
+    def _tokens_matching(self, part, starts=False, ends=False):
+        """Return the vocabulary tokens that contain part, or start and/or end with it"""
+        if starts and ends:
+            return [part] if part in self._counts else []
+        if starts:
+            self._sort_vocabulary()
+            # Tokens starting with part sort between part and part followed by the highest character
+            start = bisect_left(self._vocabulary, part)
+            end = bisect_left(self._vocabulary, part + "\U0010ffff", start)
+            return self._vocabulary[start:end]
+        if len(part) < 2:
+            tokens = [token for token in self._counts if part in token]
+        elif len(part) == 2:
+            tokens = list(self._grams.get(part, ()))
+        else:
+            candidates = None
+            for gram in sorted(trigrams(part), key=lambda g: len(self._grams.get(g, ()))):
+                holding = self._grams.get(gram)
+                if not holding:
+                    return []
+                candidates = set(holding) if candidates is None else candidates & holding
+            tokens = [token for token in candidates if part in token]
+        if ends:
+            return [token for token in tokens if token.endswith(part)]
+        return tokens
+
+    def _candidates(self, field, term, prefix):
+        """Return (sorted rows of the entities that can match term, whether they all do).
+
+        The rows are None when the index cannot narrow the term down cheaply: it
+        has no word that is looked up by its start or has two or more characters,
+        or its words match so many tokens that merging their posting lists costs
+        more than scanning. A word after a separator in the term has to start a
+        token, and one before a separator has to end one. A term that is a single
+        word and not limited to a field matches exactly the entities holding a token
+        that contains (or starts with) it, so those need no further check.
+        """
+        parts = tokenize(term)
+        exact = field is None and parts == [term]
+        limit = len(self.entities) // SCAN_FRACTION
+        candidates = None
+        for i, part in enumerate(parts):
+            starts = prefix or i > 0 or not term.startswith(part)
+            ends = i < len(parts) - 1 or not term.endswith(part)
+            if len(part) < 2 and not starts:
+                exact = False
+                continue
+            postings = [self._rows[token] for token in self._tokens_matching(part, starts, ends)]
+            if len(postings) == 1:
+                rows = postings[0]
+            elif sum(map(len, postings)) > limit:
+                exact = False
+                continue
+            else:
+                rows = sorted(set().union(*postings))
+            candidates = rows if candidates is None else self._intersect(candidates, rows)
+            if not candidates:
+                break
+        return candidates, exact and candidates is not None
+
+    def _intersect(self, a, b):
+        """Return the rows in both sorted row lists; a list holding every row leaves the other as is"""
+        if len(a) == len(self.entities):
+            return b
+        if len(b) == len(self.entities):
+            return a
+        return intersect_rows(a, b)
+
+    def _filter(self, rows, field, term, prefix):
+        """Return the rows (all of them if rows is None) whose entity matches one term"""
+        # Without a field, check the joined text of all fields (joined with a separator no term contains)
+        column = self._columns[_ALL_FIELDS if field is None else field]
+        if rows is None:
+            rows = [i for i, text in enumerate(column) if term in text]
+        else:
+            rows = [i for i in rows if term in column[i]]
+        if prefix:
+            # The plain substring test above rejects most entities before the regular expression runs
+            search = re.compile(r"(?<!\w)" + re.escape(term)).search
+            rows = [i for i in rows if search(column[i])]
+        return rows
+
+    def search(self, query):
+        """Return the entities matching every term of the query, in collection order"""
+        terms = parse_query(query)
+        if not terms:
+            return list(self.entities)
+
+        # Unknown field names are searched as plain text ("a:b" anywhere)
+        terms = [(field, term, prefix) if field is None or field in self.fields
+                 else (None, f"{field}:{term}", prefix)
+                 for field, term, prefix in terms]
+
+        # Narrow down with the selective terms (None means every row)
+        rows = None
+        unchecked = []
+        for field, term, prefix in terms:
+            docs, exact = self._candidates(field, term, prefix)
+            if not exact:
+                unchecked.append((field, term, prefix))
+            if docs is not None:
+                rows = docs if rows is None else self._intersect(rows, docs)
+                if not rows:
+                    return []
+
+        # Check the remaining terms on what is left (rows are plain ints, so
+        # large result sets do not allocate objects the garbage collector has to track)
+        for field, term, prefix in unchecked:
+            rows = self._filter(rows, field, term, prefix)
+        entities = self.entities
+        if rows is None or len(rows) == len(entities):
+            return list(entities)
+        return list(map(entities.__getitem__, rows))
+
+    def field_names(self):
+        """Return the names usable in field:term queries"""
+        return list(self.fields)
@@ -1,9 +1,14 @@
 import json
 import os
+import shutil
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from modules.roadmap_db import is_sqlite_path, load_roadmap_db, save_roadmap_db
+from modules.date_parsing import parse_date_or_none
 
 def load_json_data(file_path, default_data=None):
-    """Load JSON data from a file, with fallback to default data"""
+    """Load roadmap data from a JSON file or SQLite database (.db), with fallback to default data"""
     if default_data is None:
         default_data = {
             "programs": [], 
@@ -19,8 +24,11 @@ def load_json_data(file_path, default_data=None):
         file_path = os.path.abspath(file_path)
         
         if os.path.exists(file_path):
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if is_sqlite_path(file_path):
+                data = load_roadmap_db(file_path)
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             
             # Ensure all required sections exist
             for key in default_data.keys():
@@ -35,8 +43,41 @@ def load_json_data(file_path, default_data=None):
     except Exception as e:
         return default_data, f"Error loading data: {str(e)}"
 
-def save_json_data(file_path, data):
-    """Save JSON data to a file"""
+def serialize_json_data(data, compact=False, indent=4):
+    """Serialize roadmap data to JSON text, either indented or compact"""
+    if compact:
+        # Compact output is produced by the C encoder and is several times faster
+        return json.dumps(data, separators=(',', ':'))
+    return json.dumps(data, indent=indent)
+
+def write_text_atomic(file_path, text):
+    """Write text to file_path via a temp file, fsync and rename so a crash never leaves a partial file"""
+    directory = os.path.dirname(file_path)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(file_path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        # Keep the permissions of the file being replaced
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temp_path)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    
+    # Make the rename itself durable where directories can be fsynced
+    if hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+def _save_text(file_path, make_text):
+    """Write the JSON text returned by make_text() atomically, returning (success, error)"""
     try:
         # Ensure file_path is absolute
         file_path = os.path.abspath(file_path)
@@ -44,12 +85,48 @@ def save_json_data(file_path, data):
         # Ensure the directory exists
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+        write_text_atomic(file_path, make_text())
+        return True, None
+    except Exception as e:
+        return False, f"Error saving data: {str(e)}"
+
+def _save_db(file_path, data):
+    """Write roadmap data to a SQLite database atomically, returning (success, error)"""
+    try:
+        save_roadmap_db(os.path.abspath(file_path), data)
         return True, None
     except Exception as e:
         return False, f"Error saving data: {str(e)}"
 
+def save_json_data(file_path, data, compact=False, indent=4):
+    """Save roadmap data to a JSON file or SQLite database (.db) atomically"""
+    if is_sqlite_path(file_path):
+        return _save_db(file_path, data)
+    return _save_text(file_path, lambda: serialize_json_data(data, compact, indent))
+
+# Single worker so background saves are written in the order they were requested
+_save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="roadmap-save")
+
+def save_json_data_async(file_path, data, compact=False, indent=4):
+    """Save JSON data on a background thread and return a Future of (success, error).
+
+    The data is snapshotted with the fast compact encoder before returning, so the
+    caller may keep editing it while the worker formats and writes the file.
+    """
+    try:
+        snapshot = json.dumps(data, separators=(',', ':'))
+    except Exception as e:
+        future = Future()
+        future.set_result((False, f"Error saving data: {str(e)}"))
+        return future
+    
+    if is_sqlite_path(file_path):
+        return _save_executor.submit(lambda: _save_db(file_path, json.loads(snapshot)))
+    if compact:
+        return _save_executor.submit(_save_text, file_path, lambda: snapshot)
+    return _save_executor.submit(_save_text, file_path,
+                                 lambda: serialize_json_data(json.loads(snapshot), indent=indent))
+
 def format_date(date_obj):
     """Format a date object as YYYY-MM-DD"""
     if isinstance(date_obj, datetime):
@@ -57,11 +134,8 @@ def format_date(date_obj):
     return date_obj
 
 def parse_date(date_str):
-    """Parse a date string into a datetime object"""
-    try:
-        return datetime.strptime(date_str, "%Y-%m-%d")
-    except (ValueError, TypeError):
-        return datetime.now()
+    """Parse a YYYY-MM-DD date string into a datetime object, or None if it is blank or invalid"""
+    return parse_date_or_none(date_str)
 
 def parse_comma_separated_list(text):
     """Parse a comma-separated list into a list of strings"""
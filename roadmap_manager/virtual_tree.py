@@ -0,0 +1,188 @@
+import tkinter as tk
+
+# Row height used until the first row has been drawn and can be measured
+DEFAULT_ROW_HEIGHT = 20
+
+class VirtualTree:
+    """Show a long list of entities in a ttk.Treeview by materializing only the visible rows.
+
+    The treeview holds one item per visible row. Scrolling moves a window over the
+    entity list and rewrites those items in place, so populating or filtering the
+    tree costs the same for fifty entities as for fifty thousand. Display tuples
+    come from make_values(entity) and are cached per entity until version()
+    changes (the manager bumps it on every journaled edit).
+    """
+
+    def __init__(self, tree, scrollbar, make_values, version=None):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.make_values = make_values
+        self.version = version or (lambda: 0)
+        self.entities = []
+        self.offset = 0
+        self.slots = []
+        self.slot_values = []
+        self.selected = None
+        self._cache = {}
+        self._cache_version = None
+        self._row_height = None
+        self._header_height = None
+        self._rendering = False
+
+        # The scrollbar drives the window over the entity list instead of the treeview
+        self.tree.configure(yscrollcommand="")
+        self.scrollbar.configure(command=self.yview)
+
+        self.tree.bind("<Configure>", lambda event: self.render(), add="+")
+        self.tree.bind("<<TreeviewSelect>>", self._on_select, add="+")
+        self.tree.bind("<MouseWheel>", lambda event: self._scroll(-1 if event.delta > 0 else 1, "wheel"))
+        self.tree.bind("<Button-4>", lambda event: self._scroll(-1, "wheel"))
+        self.tree.bind("<Button-5>", lambda event: self._scroll(1, "wheel"))
+        self.tree.bind("<Up>", lambda event: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda event: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda event: self._move_selection(-self.visible_rows()))
+        self.tree.bind("<Next>", lambda event: self._move_selection(self.visible_rows()))
+        self.tree.bind("<Home>", lambda event: self._move_selection(-len(self.entities)))
+        self.tree.bind("<End>", lambda event: self._move_selection(len(self.entities)))
+
+    def set_entities(self, entities):
+        """Show the given entities (the whole collection or a search result)"""
+        self.entities = list(entities)
+        if self.selected is not None and not any(e is self.selected for e in self.entities):
+            self.selected = None
+        self.render()
+
+    def values_for(self, entity):
+        """Return the cached display tuple of an entity"""
+        version = self.version()
+        if version != self._cache_version:
+            self._cache.clear()
+            self._cache_version = version
+        cached = self._cache.get(id(entity))
+        # Keep the entity in the cache entry so its id() cannot be reused by another object
+        if cached is None or cached[0] is not entity:
+            cached = (entity, tuple(self.make_values(entity)))
+            self._cache[id(entity)] = cached
+        return cached[1]
+
+    def invalidate(self, entity=None):
+        """Drop the cached display tuple of one entity (or all) and redraw"""
+        if entity is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(id(entity), None)
+        self.render()
+
+    def entity_for_item(self, item):
+        """Return the entity shown in a treeview item, or None"""
+        if item in self.slots:
+            index = self.offset + self.slots.index(item)
+            if index < len(self.entities):
+                return self.entities[index]
+        return None
+
+    def selected_entity(self):
+        """Return the selected entity, or None"""
+        return self.selected
+
+    def visible_rows(self):
+        """Return how many rows fit in the treeview"""
+        height = self.tree.winfo_height()
+        if height <= 1:
+            # Not mapped yet; use the requested height in rows
+            return max(1, int(self.tree.cget("height")))
+        if self._row_height is None and self.slots:
+            bbox = self.tree.bbox(self.slots[0])
+            if bbox:
+                self._header_height = bbox[1]
+                self._row_height = bbox[3]
+        row_height = self._row_height or DEFAULT_ROW_HEIGHT
+        header_height = self._header_height if self._header_height is not None else row_height
+        return max(1, (height - header_height) // row_height)
+
+    def render(self):
+        """Write the window of entities starting at offset into the treeview items"""
+        rows = self.visible_rows()
+        self.offset = max(0, min(self.offset, len(self.entities) - rows))
+        count = min(rows, len(self.entities) - self.offset)
+
+        self._rendering = True
+        try:
+            # Add or remove items so there is exactly one per visible row
+            while len(self.slots) < count:
+                self.slots.append(self.tree.insert("", tk.END, values=()))
+                self.slot_values.append(None)
+            while len(self.slots) > count:
+                self.tree.delete(self.slots.pop())
+                self.slot_values.pop()
+
+            # Rewrite only the items whose values changed
+            selected_slot = None
+            for i, slot in enumerate(self.slots):
+                entity = self.entities[self.offset + i]
+                values = self.values_for(entity)
+                if values != self.slot_values[i]:
+                    self.tree.item(slot, values=values)
+                    self.slot_values[i] = values
+                if entity is self.selected:
+                    selected_slot = slot
+
+            if selected_slot is None:
+                if self.tree.selection():
+                    self.tree.selection_set(())
+            elif self.tree.selection() != (selected_slot,):
+                self.tree.selection_set(selected_slot)
+                self.tree.focus(selected_slot)
+        finally:
+            self._rendering = False
+
+        # Scrollbar position as fractions of the whole list
+        total = len(self.entities)
+        if total:
+            self.scrollbar.set(self.offset / total, (self.offset + count) / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def yview(self, *args):
+        """Scrollbar command: 'moveto fraction' or 'scroll n units|pages'"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.offset = int(float(args[1]) * len(self.entities))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            self.offset += amount * self.visible_rows() if args[2] == "pages" else amount
+        self.render()
+
+    def _scroll(self, rows, source=None):
+        """Scroll the window by a number of rows"""
+        self.offset += rows * (3 if source == "wheel" else 1)
+        self.render()
+        return "break"
+
+    def _on_select(self, event):
+        """Remember the selected entity so the selection follows it while scrolling"""
+        selection = self.tree.selection()
+        # Selections cleared by render() when the entity scrolls out of view are not user changes
+        if self._rendering or not selection:
+            return
+        self.selected = self.entity_for_item(selection[0])
+
+    def _move_selection(self, delta):
+        """Move the selection by delta rows, scrolling to keep it visible"""
+        if not self.entities:
+            return "break"
+        index = next((i for i, e in enumerate(self.entities) if e is self.selected), None)
+        if index is None:
+            index = self.offset
+        else:
+            index = max(0, min(len(self.entities) - 1, index + delta))
+        self.selected = self.entities[index]
+
+        rows = self.visible_rows()
+        if index < self.offset:
+            self.offset = index
+        elif index >= self.offset + rows:
+            self.offset = index - rows + 1
+        self.render()
+        return "break"
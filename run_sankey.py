@@ -1,10 +1,10 @@
-import json
 import os
 from modules.relationship_viz_aligned import generate_sankey_diagram
+from modules.roadmap_db import load_roadmap_file
 
-# Load the data
-with open('roadmap.json', 'r') as f:
-    data = json.load(f)
+# Load only the collections the Sankey diagram links; the funding opportunities are skipped
+data = load_roadmap_file('roadmap.json', collections=(
+    'programs', 'products', 'materialSystems', 'printingSuppliers', 'postProcessingSuppliers'))
 
 # Create the output directory if it doesn't exist
 output_dir = 'roadmap_visualizations/relationships'
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
-import json
 from modules.material_viz import generate_material_visualizations
+from modules.roadmap_db import load_roadmap_file
 
 # Define status colors
 status_colors = {
@@ -13,9 +13,8 @@ status_colors = {
     'Targeting': '#7f8c8d'    # dark gray
 }
 
-# Load data from roadmap.json
-with open('roadmap.json', 'r') as f:
-    data = json.load(f)
+# Load the material systems and the products that use them; the other collections are skipped
+data = load_roadmap_file('roadmap.json', collections=('materialSystems', 'products'))
 
 # Generate material visualizations
 print("Generating material visualizations...")
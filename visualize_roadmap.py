@@ -1,5 +1,5 @@
 import json
-from bokeh.plotting import figure, save, output_file
+from bokeh.plotting import figure, output_file
 from bokeh.models import ColumnDataSource, HoverTool, Label, LabelSet, Range1d, Span, Legend, LegendItem
 from bokeh.palettes import Category10, Spectral6
 from bokeh.layouts import column
@@ -9,6 +9,10 @@ import os
 import networkx as nx
 import matplotlib.pyplot as plt
 from matplotlib.sankey import Sankey
+from modules.bokeh_resources import save_page, write_static_resources
+from modules.roadmap_store import as_store
+from modules.date_parsing import parse_date
+from modules.gantt import TASK_TOOLTIPS, gantt_task, gantt_figure, gantt_layout, draw_gantt, add_milestone_markers
 
 # Load the roadmap data
 with open('roadmap.json', 'r') as f:
@@ -27,200 +31,47 @@ def generate_product_roadmap(product_id):
     if not product:
         return None
     
-    # Collect all tasks to determine height
-    all_tasks = []
-    for lane in ['Design', 'Manufacturing', 'M&P', 'Quality', 'Other']:
-        lane_tasks = [t for t in product.get('roadmap', []) if t.get('lane', 'Other') == lane]
-        all_tasks.extend(lane_tasks)
-        
-        # Also add material system tasks
-        for material_id in product.get('materialSystems', []):
-            material = next((m for m in data['materialSystems'] if m['id'] == material_id), None)
-            if material and 'roadmap' in material:
-                material_tasks = [t for t in material['roadmap'] if t.get('lane', 'M&P') == lane]
-                all_tasks.extend(material_tasks)
-    
-    # Calculate appropriate height based on number of tasks
-    height = max(400, len(all_tasks) * 50 + 100)
-    
-    # Create a figure with date x-axis
-    p = figure(
-        title=f"Roadmap for {product['name']} ({product['id']})",
-        x_axis_type="datetime",
-        width=1200,
-        height=height,
-        toolbar_location="above",
-        tools="pan,wheel_zoom,box_zoom,reset,save",
-    )
-    
-    # Customize appearance
-    p.title.text_font_size = '16pt'
-    p.xaxis.axis_label = "Timeline"
-    p.yaxis.axis_label = "Tasks"
-    p.grid.grid_line_alpha = 0.3
-    p.background_fill_color = "#f8f9fa"
-    
-    # Process tasks by lane
+    # Collect the tasks lane by lane, with the tasks of the product's material systems
     lanes = ['Design', 'Manufacturing', 'M&P', 'Quality', 'Other']
-    y_pos = 0
-    legend_items = []
-    
+    tasks = []
     for lane in lanes:
-        # Add lane label using ColumnDataSource
-        lane_source = ColumnDataSource(data=dict(
-            x=[datetime.now()],
-            y=[y_pos],
-            text=[f"--- {lane} ---"]
-        ))
-        
-        # Add lane label
-        p.text(x='x', y='y', text='text', source=lane_source,
-               text_font_style="bold", text_align="right", text_baseline="middle")
-        
-        # Add lane tasks from product roadmap
-        lane_tasks = [t for t in product.get('roadmap', []) if t.get('lane', 'Other') == lane]
-        
-        # Also add material system tasks
+        lane_tasks = [(t, None) for t in product.get('roadmap', []) if t.get('lane', 'Other') == lane]
         for material_id in product.get('materialSystems', []):
             material = next((m for m in data['materialSystems'] if m['id'] == material_id), None)
             if material and 'roadmap' in material:
-                for task in material['roadmap']:
-                    if task.get('lane', 'M&P') == lane:
-                        task['material'] = material['name']
-                        lane_tasks.append(task)
-        
-        # Sort tasks by start date
-        lane_tasks.sort(key=lambda x: datetime.strptime(x.get('start', '2025-01-01'), "%Y-%m-%d") if x.get('start') else datetime.now())
-        
-        for task in lane_tasks:
-            y_pos -= 1
-            start_date = datetime.strptime(task.get('start', '2025-01-01'), "%Y-%m-%d") if task.get('start') else datetime.now()
-            end_date = datetime.strptime(task.get('end', '2025-12-31'), "%Y-%m-%d") if task.get('end') else start_date + timedelta(days=30)
+                lane_tasks.extend((t, material['name']) for t in material['roadmap'] if t.get('lane', 'M&P') == lane)
+        
+        for task, material_name in lane_tasks:
+            start_date = parse_date(task.get('start', '2025-01-01')) if task.get('start') else datetime.now()
+            end_date = parse_date(task.get('end', '2025-12-31')) if task.get('end') else start_date + timedelta(days=30)
             
-            # Add funding type if available
+            # Add funding type and material if available
             funding = f" ({task.get('fundingType', '')})" if 'fundingType' in task else ""
-            material_info = f" [Material: {task.get('material', '')}]" if 'material' in task else ""
+            material_info = f" [Material: {material_name}]" if material_name else ""
             task_name = f"{task['task']}{funding}{material_info}"
-            
-            # Create data source for the task bar
-            bar_source = ColumnDataSource(data=dict(
-                y=[y_pos],
-                left=[start_date],
-                right=[end_date],
-                task=[task_name],
-                start=[start_date],
-                end=[end_date],
-                status=[task['status']]
-            ))
-            
-            # Add task bar
-            color = STATUS_COLORS.get(task['status'], '#95a5a6')
-            p.hbar(y='y', left='left', right='right', height=0.6, 
-                   color=color, alpha=0.8, source=bar_source)
-            
-            # Create data source for the task label
-            label_source = ColumnDataSource(data=dict(
-                x=[start_date],
-                y=[y_pos],
-                text=[task_name]
-            ))
-            
-            # Add task label with offset to prevent overlap
-            p.text(x='x', y='y', text='text', source=label_source,
-                   text_font_size="9pt", text_baseline="middle", 
-                   x_offset=5, text_align="left")  # Add offset to prevent overlap
-    
-    # Add hover tool
-    hover = HoverTool()
-    hover.tooltips = [
-        ("Task", "@task"),
-        ("Start", "@start{%F}"),
-        ("End", "@end{%F}"),
-        ("Status", "@status")
-    ]
-    hover.formatters = {
-        "@start": "datetime",
-        "@end": "datetime"
-    }
-    p.add_tools(hover)
+            tasks.append(gantt_task(start_date, end_date, task_name, task['status'], lane,
+                                    task=task_name, status=task['status']))
     
-    # Add milestones as vertical lines
-    for milestone in product.get('milestones', []):
-        if not milestone.get('date'):
-            continue
-        milestone_date = datetime.strptime(milestone['date'], "%Y-%m-%d")
-        milestone_line = Span(location=milestone_date, dimension='height', 
-                             line_color='red', line_dash='dashed', line_width=2)
-        p.add_layout(milestone_line)
-        
-        # Add milestone label
-        milestone_label = Label(x=milestone_date, y=0, 
-                               text=milestone['name'],
-                               text_color='red',
-                               text_font_style='bold',
-                               text_font_size='10pt',
-                               angle=90,
-                               angle_units='deg',
-                               x_offset=10)
-        p.add_layout(milestone_label)
-    
-    # Add program need dates as vertical lines
-    for program_id in product.get('programs', []):
-        program = next((p for p in data['programs'] if p['id'] == program_id), None)
-        if program and 'needDate' in program:
-            need_date = datetime.strptime(program['needDate'], "%Y-%m-%d")
-            program_line = Span(location=need_date, dimension='height', 
-                               line_color='purple', line_width=2)
-            p.add_layout(program_line)
-            
-            # Add program label
-            program_label = Label(x=need_date, y=0, 
-                                 text=f"{program['name']} Need Date",
-                                 text_color='purple',
-                                 text_font_style='italic',
-                                 text_font_size='10pt',
-                                 angle=90,
-                                 angle_units='deg',
-                                 x_offset=5)
-            p.add_layout(program_label)
-    
-    # Add legend for status colors
-    for status, color in STATUS_COLORS.items():
-        legend_items.append(LegendItem(label=status, renderers=[p.hbar(y=0, left=0, right=0, height=0, color=color)]))
-    
-    legend = Legend(items=legend_items, location="top_right")
-    p.add_layout(legend)
+    # Calculate appropriate height based on number of tasks
+    height = max(400, len(tasks) * 50 + 100)
     
-    # Set y-range with padding
-    p.y_range = Range1d(y_pos - 1, 1)
+    # Create a figure with date x-axis
+    p = gantt_figure(title=f"Roadmap for {product['name']} ({product['id']})", height=height)
     
-    # Find date range for x-axis
-    all_dates = []
-    for task in all_tasks:
-        if task.get('start'):
-            all_dates.append(datetime.strptime(task['start'], "%Y-%m-%d"))
-        if task.get('end'):
-            all_dates.append(datetime.strptime(task['end'], "%Y-%m-%d"))
-
-    # Add program need dates
+    # Milestones and program need dates as vertical lines
+    milestones = [(parse_date(milestone['date']), milestone['name'])
+                  for milestone in product.get('milestones', []) if milestone.get('date')]
+    add_milestone_markers(p, milestones)
+    need_dates = []
     for program_id in product.get('programs', []):
         program = next((prog for prog in data['programs'] if prog['id'] == program_id), None)
         if program and program.get('needDate'):
-            all_dates.append(datetime.strptime(program['needDate'], "%Y-%m-%d"))
-
-    # Add milestone dates
-    for milestone in product.get('milestones', []):
-        if milestone.get('date'):
-            all_dates.append(datetime.strptime(milestone['date'], "%Y-%m-%d"))
-
-    if all_dates:
-        min_date = min(all_dates)
-        max_date = max(all_dates)
-        # Add some padding (3 months before and after)
-        min_date = min_date - timedelta(days=90)
-        max_date = max_date + timedelta(days=90)
-        p.x_range.start = min_date
-        p.x_range.end = max_date
+            need_dates.append((parse_date(program['needDate']), f"{program['name']} Need Date"))
+    add_milestone_markers(p, need_dates, color='purple', line_dash='solid', font_style='italic', x_offset=5)
+    
+    # Task bars colored by status, with lane labels and a legend of every status
+    draw_gantt(p, gantt_layout(tasks, lanes), STATUS_COLORS, TASK_TOOLTIPS, legend='colors',
+               extra_dates=[date for date, _ in milestones + need_dates])
     
     # Output to file
     output_file(os.path.join("roadmap_visualizations", f"bokeh_product_{product_id}.html"))
@@ -303,11 +154,14 @@ output_dir = "roadmap_visualizations"
 if not os.path.exists(output_dir):
     os.makedirs(output_dir)
 
+# Copy BokehJS once so the product pages reference it instead of loading it from the CDN
+write_static_resources(output_dir)
+
 # Generate roadmaps for each product
 for product in data['products']:
     p = generate_product_roadmap(product['id'])
     if p:
-        save(p)
+        save_page(p)
 
 # Generate index page
 index_html = generate_index_page()
@@ -440,33 +294,11 @@ def create_simple_sankey():
 
 def create_network_graph():
     try:
-        # Create a directed graph
-        G = nx.DiGraph()
-        
-        # Add program nodes
-        for program in data['programs']:
-            G.add_node(program['id'], label=program['name'], type='program', layer=0)
-        
-        # Add product nodes
-        for product in data['products']:
-            G.add_node(product['id'], label=product['name'], type='product', layer=1)
-            
-            # Add edges from programs to products
-            for program_id in product.get('programs', []):
-                G.add_edge(program_id, product['id'], weight=2)
-        
-        # Add material system nodes
-        for material in data['materialSystems']:
-            G.add_node(material['id'], label=material['name'], type='material', layer=2)
-            
-            # Add edges from products to materials
-            for product in data['products']:
-                for ms in product.get('materialSystems', []):
-                    # Handle both string and dict formats for material systems
-                    if isinstance(ms, str) and ms == material['id']:
-                        G.add_edge(product['id'], material['id'], weight=2)
-                    elif isinstance(ms, dict) and ms.get('materialID') == material['id']:
-                        G.add_edge(product['id'], material['id'], weight=2)
+        # Start from the programs, products and material systems of the shared relationship graph
+        shared = as_store(data).graph()
+        G = nx.DiGraph(shared.subgraph(
+            node for node, node_type in shared.nodes(data='type') if node_type in ('program', 'product', 'material')
+        ))
         
         # Add supplier nodes if available
         if 'suppliers' in data: